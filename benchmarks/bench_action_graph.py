@@ -0,0 +1,120 @@
+"""
+Benchmark ``induce_action_graph()`` against the version it replaced, which copied the
+full graph and then removed each non-action node, joining all of its predecessors to
+all of its successors.
+
+Usage:
+
+    python benchmarks/bench_action_graph.py [NUM_OBJECTS ...]
+
+Each size is measured on two graphs:
+
+* A synthetic bundle (see ``synthetic.py``), converted with ``bundle_to_networkx()``.
+* A "fan-in" graph, where half of the objects are actions that point to the first of a
+  chain of operators, and the other half are that chain. Eliminating the operators one
+  by one moves every action's edge down the chain, so the old version takes quadratic
+  time.
+
+The old version is skipped for fan-in graphs larger than ``--max-old`` objects.
+"""
+
+import argparse
+import sys
+import time
+
+import networkx as nx
+
+from attack_flow.graph import bundle_to_networkx, induce_action_graph
+import synthetic
+
+REPEAT = 3
+DEFAULT_SIZES = (1_000, 4_000, 16_000, 64_000)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("sizes", nargs="*", type=int, default=DEFAULT_SIZES)
+    parser.add_argument("--max-old", type=int, default=1_000)
+    args = parser.parse_args()
+
+    print(f"best of {REPEAT} runs")
+    print(
+        f"{'graph':>8} {'objects':>8} {'edges':>8} {'old (s)':>9} {'new (s)':>9} "
+        f"{'speedup':>8}"
+    )
+    for size in args.sizes:
+        graphs = [
+            ("bundle", bundle_to_networkx(synthetic.make_bundle(size))),
+            ("fan-in", make_fan_in_graph(size)),
+        ]
+        for label, full_graph in graphs:
+            skip_old = label == "fan-in" and size > args.max_old
+            if not skip_old:
+                # Check that both versions agree before timing them.
+                expected = induce_action_graph_by_elimination(full_graph)
+                assert set(induce_action_graph(full_graph).edges) == set(expected.edges)
+            new_time = _best_of(lambda: induce_action_graph(full_graph))
+            if skip_old:
+                old_time, speedup = f"{'-':>9}", f"{'-':>8}"
+            else:
+                seconds = _best_of(
+                    lambda: induce_action_graph_by_elimination(full_graph)
+                )
+                old_time, speedup = f"{seconds:>9.3f}", f"{seconds / new_time:>7.1f}x"
+            print(
+                f"{label:>8} {size:>8} {full_graph.number_of_edges():>8} {old_time} "
+                f"{new_time:>9.3f} {speedup}"
+            )
+    return 0
+
+
+def make_fan_in_graph(num_objects):
+    """
+    Make a graph where half of the nodes are actions that point to a chain of
+    operators, and the chain ends at the last action.
+
+    :param int num_objects:
+    :rtype: nx.DiGraph
+    """
+    graph = nx.DiGraph()
+    num_operators = num_objects // 2
+    operators = [f"attack-operator--{i}" for i in range(num_operators)]
+    actions = [f"attack-action--{i}" for i in range(num_objects - num_operators)]
+    for action in actions:
+        graph.add_node(action, type="attack-action")
+    for operator in operators:
+        graph.add_node(operator, type="attack-operator", operator="OR")
+    for action in actions[:-1]:
+        graph.add_edge(action, operators[0], type="effect")
+    for source, target in zip(operators, operators[1:]):
+        graph.add_edge(source, target, type="effect")
+    graph.add_edge(operators[-1], actions[-1], type="effect")
+    return graph
+
+
+def induce_action_graph_by_elimination(full_graph):
+    """The version of ``induce_action_graph()`` before the linear-time rewrite."""
+    graph = full_graph.copy()
+    remove_nodes = [id for id in graph.nodes() if not id.startswith("attack-action")]
+
+    for node in remove_nodes:
+        for source, _ in graph.in_edges(node):
+            for _, target in graph.out_edges(node):
+                graph.add_edge(source, target, type="effect")
+        graph.remove_node(node)
+
+    return graph
+
+
+def _best_of(fn):
+    """Return the best wall time (in seconds) of ``REPEAT`` calls to ``fn``."""
+    times = list()
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
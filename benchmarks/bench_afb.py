@@ -0,0 +1,58 @@
+"""
+Benchmark exporting Attack Flow Builder files to STIX with the Python exporter.
+
+Usage:
+
+    python benchmarks/bench_afb.py [AFB_FILE ...]
+
+If no paths are given, all ``.afb`` files in ``corpus/`` are used. Bundles are
+converted in memory and are not written to disk.
+"""
+
+from pathlib import Path
+import sys
+import time
+
+from attack_flow.afb import (
+    convert_afb_to_stix,
+    dumps_stix,
+    load_afb,
+    load_builder_enums,
+)
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+REPEAT = 3
+
+
+def main():
+    paths = [Path(p) for p in sys.argv[1:]] or sorted(ROOT_DIR.glob("corpus/*.afb"))
+    if not paths:
+        sys.stderr.write("No .afb files found.\n")
+        return 1
+
+    start = time.perf_counter()
+    enums = load_builder_enums()
+    enums_time = time.perf_counter() - start
+
+    print(f"{len(paths)} flows, best of {REPEAT} runs")
+    print(f"load builder enums (once): {enums_time:.3f}s")
+    export_time = _best_of(
+        lambda: [dumps_stix(convert_afb_to_stix(load_afb(p), enums)) for p in paths]
+    )
+    print(f"export corpus:             {export_time:.3f}s")
+    print(f"per flow:                  {export_time / len(paths) * 1000:.1f}ms")
+    return 0
+
+
+def _best_of(fn):
+    """Return the best wall time (in seconds) of ``REPEAT`` calls to ``fn``."""
+    times = list()
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""
+Benchmark loading Attack Flow bundles with the STIX library versus the parse cache.
+
+Usage:
+
+    python benchmarks/bench_cache.py [NUM_OBJECTS ...]
+
+Each size is a synthetic bundle (see ``synthetic.py``). The cache lives in a temporary
+directory that is deleted afterwards.
+"""
+
+from pathlib import Path
+import sys
+from tempfile import TemporaryDirectory
+import time
+
+from attack_flow.cache import BundleCache
+from attack_flow.model import load_attack_flow_bundle
+import synthetic
+
+REPEAT = 3
+DEFAULT_SIZES = (100, 1_000, 10_000)
+
+
+def main():
+    sizes = [int(n) for n in sys.argv[1:]] or DEFAULT_SIZES
+    print(f"best of {REPEAT} runs")
+    print(f"{'objects':>10} {'parse (s)':>10} {'cache hit (s)':>14} {'speedup':>8}")
+    with TemporaryDirectory() as temp_dir:
+        temp_dir = Path(temp_dir)
+        cache = BundleCache(temp_dir / "cache")
+        for size in sizes:
+            path = temp_dir / f"flow-{size}.json"
+            synthetic.write_bundle(path, size)
+            parse_time = _best_of(lambda: load_attack_flow_bundle(path))
+            load_attack_flow_bundle(path, cache=cache)
+            cache_time = _best_of(lambda: load_attack_flow_bundle(path, cache=cache))
+            speedup = parse_time / cache_time
+            print(
+                f"{size:>10} {parse_time:>10.3f} {cache_time:>14.3f} {speedup:>7.1f}x"
+            )
+    return 0
+
+
+def _best_of(fn):
+    """Return the best wall time (in seconds) of ``REPEAT`` calls to ``fn``."""
+    times = list()
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
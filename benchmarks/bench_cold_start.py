@@ -0,0 +1,85 @@
+"""
+Benchmark the first ``validate_doc()`` call in a fresh process, which pays for loading
+the schemas, against later calls that reuse them.
+
+Usage:
+
+    python benchmarks/bench_cold_start.py
+
+Each scenario runs in a fresh interpreter. The "invalid" scenario removes the names
+from every object in the example flow, so that schema errors are reported with the
+generic validators, which resolve ``$ref`` against the schema registry. Compile the
+package first (``python -m compileall src/attack_flow``) if ``PYTHONDONTWRITEBYTECODE``
+is set, or else the first call also pays for compiling the generated validators.
+"""
+
+import json
+from pathlib import Path
+import subprocess
+import sys
+from tempfile import TemporaryDirectory
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+EXAMPLE_PATH = ROOT_DIR / "stix" / "attack-flow-example.json"
+REPEAT = 3
+SCRIPT = """
+import json
+from pathlib import Path
+import sys
+import time
+
+from attack_flow.schema import validate_doc
+
+path = Path(sys.argv[1])
+start = time.perf_counter()
+validate_doc(path)
+first = time.perf_counter() - start
+start = time.perf_counter()
+validate_doc(path)
+warm = time.perf_counter() - start
+print(json.dumps([first, warm]))
+"""
+
+
+def main():
+    with TemporaryDirectory() as temp_dir:
+        invalid_path = Path(temp_dir) / "invalid.json"
+        bundle = json.loads(EXAMPLE_PATH.read_text())
+        for obj in bundle["objects"]:
+            obj.pop("name", None)
+        invalid_path.write_text(json.dumps(bundle))
+
+        print(f"best of {REPEAT} runs")
+        print(
+            f"{'flow':<10} {'first (ms)':>11} {'warm (ms)':>10} "
+            f"{'overhead (ms)':>14}"
+        )
+        for name, path in (("valid", EXAMPLE_PATH), ("invalid", invalid_path)):
+            runs = [run_once(path) for _ in range(REPEAT)]
+            first = min(run[0] for run in runs)
+            warm = min(run[1] for run in runs)
+            print(
+                f"{name:<10} {first * 1000:>11.1f} {warm * 1000:>10.1f} "
+                f"{(first - warm) * 1000:>14.1f}"
+            )
+    return 0
+
+
+def run_once(path):
+    """
+    Validate ``path`` twice in a fresh interpreter.
+
+    :param Path path:
+    :returns: the first and second validation times, in seconds
+    """
+    process = subprocess.run(
+        [sys.executable, "-c", SCRIPT, str(path)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(process.stdout)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""
+Compare the memory use and build time of ``bundle_to_compact()`` with
+``bundle_to_networkx()``.
+
+Usage:
+
+    python benchmarks/bench_compact_graph.py [NUM_OBJECTS ...]
+
+The first row is all of the flows in ``corpus/`` together, and each other size is a
+synthetic bundle (see ``synthetic.py``). The memory is what the finished graphs hold on
+to, not counting the bundles, and is measured with ``tracemalloc`` in a separate run,
+because tracing slows down the timed runs.
+"""
+
+import json
+from pathlib import Path
+import sys
+import time
+import tracemalloc
+
+from attack_flow.graph import bundle_to_compact, bundle_to_networkx
+from attack_flow.model import FlowIndex
+import synthetic
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+REPEAT = 3
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+
+
+def main():
+    sizes = [int(n) for n in sys.argv[1:]] or DEFAULT_SIZES
+    corpus = [
+        json.loads(path.read_text()) for path in sorted(ROOT_DIR.glob("corpus/*.json"))
+    ]
+    rows = [(f"corpus ({len(corpus)})", corpus)]
+    rows.extend((str(size), [synthetic.make_bundle(size)]) for size in sizes)
+
+    print(f"best of {REPEAT} runs")
+    print(
+        f"{'objects':>12} {'networkx (s)':>13} {'compact (s)':>12} "
+        f"{'networkx (MiB)':>15} {'compact (MiB)':>14} {'ratio':>6}"
+    )
+    for label, bundles in rows:
+        indexes = [FlowIndex(bundle) for bundle in bundles]
+        build_networkx = lambda: [
+            bundle_to_networkx(bundle, index) for bundle, index in zip(bundles, indexes)
+        ]
+        build_compact = lambda: [
+            bundle_to_compact(bundle, index) for bundle, index in zip(bundles, indexes)
+        ]
+        old_time = _best_of(build_networkx)
+        new_time = _best_of(build_compact)
+        old_size = _retained_memory(build_networkx)
+        new_size = _retained_memory(build_compact)
+        print(
+            f"{label:>12} {old_time:>13.3f} {new_time:>12.3f} "
+            f"{old_size / 2**20:>15.2f} {new_size / 2**20:>14.2f} "
+            f"{old_size / new_size:>5.1f}x"
+        )
+    return 0
+
+
+def _best_of(fn):
+    """Return the best wall time (in seconds) of ``REPEAT`` calls to ``fn``."""
+    times = list()
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def _retained_memory(fn):
+    """Return the memory (in bytes) allocated by ``fn`` that its result holds on to."""
+    tracemalloc.start()
+    try:
+        result = fn()  # noqa: F841
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
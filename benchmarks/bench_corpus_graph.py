@@ -0,0 +1,115 @@
+"""
+Benchmark loading many flows into a ``CorpusGraph``, and adding and removing one flow.
+
+Usage:
+
+    python benchmarks/bench_corpus_graph.py [--flow-size N] [NUM_FLOWS ...]
+
+The first row is the flows in ``corpus/``, and each other row is that many synthetic
+flows (see ``synthetic.py``) of ``--flow-size`` objects, written to a temporary
+directory. The load time includes reading the files. It is compared with converting
+each flow with ``bundle_to_networkx()`` and ``induce_action_graph()`` and keeping the
+action graphs, which is how the corpus was analyzed before. The memory is what the
+loaded graphs hold on to, measured with ``tracemalloc`` in a separate run.
+"""
+
+import argparse
+from pathlib import Path
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from attack_flow.graph import bundle_to_networkx, induce_action_graph, load_corpus_graph
+from attack_flow.model import load_attack_flow_bundle
+import synthetic
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+REPEAT = 3
+DEFAULT_SIZES = (1_000, 5_000)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--flow-size", type=int, default=100)
+    parser.add_argument("sizes", nargs="*", type=int, default=DEFAULT_SIZES)
+    args = parser.parse_args()
+
+    print(f"best of {REPEAT} runs")
+    print(
+        f"{'flows':>12} {'networkx (s)':>13} {'corpus (s)':>11} "
+        f"{'networkx (MiB)':>15} {'corpus (MiB)':>13} {'add (ms)':>9} "
+        f"{'remove (ms)':>12}"
+    )
+    corpus_paths = sorted(ROOT_DIR.glob("corpus/*.json"))
+    _report(f"corpus ({len(corpus_paths)})", corpus_paths)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = list()
+        for size in args.sizes:
+            for seed in range(len(paths), size):
+                path = Path(tmp_dir) / f"flow-{seed}.json"
+                synthetic.write_bundle(path, args.flow_size, seed)
+                paths.append(path)
+            _report(str(size), paths[:size])
+    return 0
+
+
+def _report(label, paths):
+    old_time = _best_of(lambda: _load_networkx(paths))
+    new_time = _best_of(lambda: load_corpus_graph(paths))
+    old_size = _retained_memory(lambda: _load_networkx(paths))
+    new_size = _retained_memory(lambda: load_corpus_graph(paths))
+
+    add_time, remove_time = _time_add_remove(
+        load_corpus_graph(paths), load_attack_flow_bundle(paths[0], raw=True)
+    )
+    print(
+        f"{label:>12} {old_time:>13.3f} {new_time:>11.3f} "
+        f"{old_size / 2**20:>15.1f} {new_size / 2**20:>13.1f} "
+        f"{add_time * 1000:>9.2f} {remove_time * 1000:>12.2f}"
+    )
+
+
+def _time_add_remove(corpus, bundle):
+    """Return the best times (in seconds) to add ``bundle`` and to remove it again."""
+    add_times = list()
+    remove_times = list()
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        corpus.add_flow(bundle, flow_id="new")
+        add_times.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        corpus.remove_flow("new")
+        remove_times.append(time.perf_counter() - start)
+    return min(add_times), min(remove_times)
+
+
+def _load_networkx(paths):
+    return [
+        induce_action_graph(bundle_to_networkx(load_attack_flow_bundle(path, raw=True)))
+        for path in paths
+    ]
+
+
+def _best_of(fn):
+    """Return the best wall time (in seconds) of ``REPEAT`` calls to ``fn``."""
+    times = list()
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def _retained_memory(fn):
+    """Return the memory (in bytes) allocated by ``fn`` that its result holds on to."""
+    tracemalloc.start()
+    try:
+        result = fn()  # noqa: F841
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""
+Benchmark the early-stopping validation modes against a full ``validate_doc()``.
+
+Usage:
+
+    python benchmarks/bench_fail_fast.py [NUM_OBJECTS ...]
+
+Each size is a synthetic bundle (see ``synthetic.py``) in two versions: a valid one, and
+one where every tenth object is missing its name. Fail-fast validation of the invalid
+bundle stops at the first schema error, while a valid bundle is checked in full by every
+mode except structural-only.
+"""
+
+import json
+from pathlib import Path
+import sys
+from tempfile import TemporaryDirectory
+import time
+
+from attack_flow.schema import validate_doc, warm_validator_cache
+import synthetic
+
+REPEAT = 3
+DEFAULT_SIZES = (1_000, 10_000)
+MODES = (
+    ("full", dict()),
+    ("structural", dict(structural_only=True)),
+    ("fail-fast", dict(max_errors=1)),
+)
+
+
+def main():
+    sizes = [int(n) for n in sys.argv[1:]] or DEFAULT_SIZES
+    warm_validator_cache()
+    print(f"best of {REPEAT} runs")
+    print(
+        f"{'objects':>10} {'bundle':>8} "
+        + " ".join(f"{name + ' (s)':>15}" for name, _ in MODES)
+        + f" {'fail-fast speedup':>18}"
+    )
+    with TemporaryDirectory() as temp_dir:
+        for size in sizes:
+            bundle = synthetic.make_bundle(size)
+            valid_path = Path(temp_dir) / f"valid-{size}.json"
+            valid_path.write_text(json.dumps(bundle))
+            for item in bundle["objects"][::10]:
+                item.pop("name", None)
+            invalid_path = Path(temp_dir) / f"invalid-{size}.json"
+            invalid_path.write_text(json.dumps(bundle))
+
+            for name, path in (("valid", valid_path), ("invalid", invalid_path)):
+                times = [
+                    _best_of(lambda: validate_doc(path, **options))
+                    for _, options in MODES
+                ]
+                print(
+                    f"{size:>10} {name:>8} "
+                    + " ".join(f"{t:>15.3f}" for t in times)
+                    + f" {times[0] / times[-1]:>17.1f}x"
+                )
+    return 0
+
+
+def _best_of(fn):
+    """Return the best wall time (in seconds) of ``REPEAT`` calls to ``fn``."""
+    times = list()
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+Benchmark ``check_flow_graph()`` against the NetworkX pipeline it replaced, which built
+the graph with ``bundle_to_networkx()`` and searched it from every seed.
+
+Usage:
+
+    python benchmarks/bench_graph_check.py [NUM_OBJECTS ...]
+
+Each size is a synthetic bundle (see ``synthetic.py``) that is fully connected, like
+most real flows. The bundle's ``FlowIndex`` is built beforehand, because
+``validate_doc()`` already has one. The NetworkX times include building the graph. Peak
+memory is measured with ``tracemalloc`` in a separate run, because tracing slows down
+the timed runs. The largest size needs a few GiB of memory.
+"""
+
+import sys
+import time
+import tracemalloc
+
+from attack_flow.graph import bundle_to_networkx
+from attack_flow.model import FlowIndex
+from attack_flow.schema import (
+    check_best_practices,
+    check_flow_graph,
+    check_graph,
+    ValidationResult,
+)
+import synthetic
+
+REPEAT = 3
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+
+
+def main():
+    sizes = [int(n) for n in sys.argv[1:]] or DEFAULT_SIZES
+    print(f"best of {REPEAT} runs")
+    print(
+        f"{'objects':>10} {'networkx (s)':>13} {'union-find (s)':>15} "
+        f"{'speedup':>8} {'networkx (MiB)':>15} {'union-find (MiB)':>17}"
+    )
+    for size in sizes:
+        bundle = synthetic.make_bundle(size)
+        index = FlowIndex(bundle)
+        # Check that both implementations agree before timing them.
+        expected = sorted(str(m) for m in _check_networkx(bundle, index).messages)
+        result = _check_union_find(index)
+        assert sorted(str(m) for m in result.messages) == expected
+
+        old_time = _best_of(lambda: _check_networkx(bundle, index))
+        new_time = _best_of(lambda: _check_union_find(index))
+        old_peak = _peak_memory(lambda: _check_networkx(bundle, index))
+        new_peak = _peak_memory(lambda: _check_union_find(index))
+        print(
+            f"{size:>10} {old_time:>13.3f} {new_time:>15.3f} "
+            f"{old_time / new_time:>7.1f}x "
+            f"{old_peak / 2**20:>15.1f} {new_peak / 2**20:>17.1f}"
+        )
+    return 0
+
+
+def _check_networkx(bundle, index):
+    """The graph checks before they stopped using NetworkX."""
+    result = ValidationResult()
+    graph = bundle_to_networkx(bundle, index).to_undirected(as_view=True)
+    check_graph(graph, result)
+    check_best_practices(graph, result)
+    return result
+
+
+def _check_union_find(index):
+    result = ValidationResult()
+    check_flow_graph(index, result)
+    return result
+
+
+def _best_of(fn):
+    """Return the best wall time (in seconds) of ``REPEAT`` calls to ``fn``."""
+    times = list()
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def _peak_memory(fn):
+    """Return the peak memory (in bytes) allocated while calling ``fn``."""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""
+Benchmark how long each ``af`` subcommand spends importing modules.
+
+Usage:
+
+    python benchmarks/bench_import.py
+
+Each subcommand runs in a fresh interpreter with ``python -X importtime``, and the
+reported time is the sum of all top-level imports (including the interpreter's own
+startup imports, which are listed separately as a baseline).
+"""
+
+from pathlib import Path
+import re
+import shutil
+import subprocess
+import sys
+from tempfile import TemporaryDirectory
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+FLOW_JSON = ROOT_DIR / "tests" / "fixtures" / "flow1.json"
+FLOW_AFB = ROOT_DIR / "corpus" / "Tesla Kubernetes Breach.afb"
+IMPORT_TIME_RE = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \| (\s*)(\S+)$")
+REPEAT = 3
+
+
+def main():
+    with TemporaryDirectory() as temp_dir:
+        temp_dir = Path(temp_dir)
+        afb_path = temp_dir / FLOW_AFB.name
+        shutil.copy(FLOW_AFB, afb_path)
+        scenarios = [
+            ("python", ["-c", "pass"]),
+            ("import attack_flow.cli", ["-c", "import attack_flow.cli"]),
+            ("af version", ["-m", "attack_flow.cli", "version"]),
+            ("af export-stix", ["-m", "attack_flow.cli", "export-stix", afb_path]),
+            (
+                "af mermaid --raw",
+                [
+                    "-m",
+                    "attack_flow.cli",
+                    "mermaid",
+                    "--raw",
+                    FLOW_JSON,
+                    temp_dir / "a",
+                ],
+            ),
+            (
+                "af graphviz",
+                ["-m", "attack_flow.cli", "graphviz", FLOW_JSON, temp_dir / "b"],
+            ),
+            ("af validate", ["-m", "attack_flow.cli", "validate", FLOW_JSON]),
+        ]
+
+        print(f"best of {REPEAT} runs")
+        print(f"{'command':<24} {'imports (ms)':>12}")
+        for name, args in scenarios:
+            best = min(get_import_time(args) for _ in range(REPEAT))
+            print(f"{name:<24} {best / 1000:>12.1f}")
+    return 0
+
+
+def get_import_time(args):
+    """
+    Run Python with ``-X importtime`` and return the sum of the cumulative times of all
+    top-level imports, in microseconds.
+
+    :param list args: arguments for the Python interpreter
+    :rtype: int
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", *map(str, args)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    for line in process.stderr.splitlines():
+        if (match := IMPORT_TIME_RE.match(line)) and not match.group(2):
+            total += int(match.group(1))
+    return total
+
+
+if __name__ == "__main__":
+    sys.exit(main())
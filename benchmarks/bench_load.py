@@ -0,0 +1,67 @@
+"""
+Benchmark loading Attack Flow bundles with the STIX library versus raw mode.
+
+Usage:
+
+    python benchmarks/bench_load.py [FLOW_JSON ...]
+
+If no paths are given, ``NUM_FLOWS`` synthetic flows (see ``synthetic.py``) of about
+the same size as the corpus flows are used. The exported corpus can't be used here:
+the builder sets ``spec_version`` on each bundle, which the STIX library rejects.
+"""
+
+from pathlib import Path
+import sys
+from tempfile import TemporaryDirectory
+import time
+
+from attack_flow.graphviz import convert_attack_flow
+from attack_flow.model import load_attack_flow_bundle
+import synthetic
+
+REPEAT = 3
+NUM_FLOWS = 40
+FLOW_SIZE = 100
+
+
+def main():
+    if len(sys.argv) > 1:
+        return _report([Path(p) for p in sys.argv[1:]])
+    with TemporaryDirectory() as temp_dir:
+        paths = list()
+        for seed in range(NUM_FLOWS):
+            path = Path(temp_dir) / f"flow-{seed}.json"
+            synthetic.write_bundle(path, FLOW_SIZE, seed)
+            paths.append(path)
+        return _report(paths)
+
+
+def _report(paths):
+    print(f"{len(paths)} flows, best of {REPEAT} runs")
+    print(f"{'mode':<8} {'load (s)':>10} {'load+graphviz (s)':>18}")
+    for raw in (False, True):
+        load_time = _best_of(
+            lambda: [load_attack_flow_bundle(p, raw=raw) for p in paths]
+        )
+        convert_time = _best_of(
+            lambda: [
+                convert_attack_flow(load_attack_flow_bundle(p, raw=raw)) for p in paths
+            ]
+        )
+        mode = "raw" if raw else "stix2"
+        print(f"{mode:<8} {load_time:>10.3f} {convert_time:>18.3f}")
+    return 0
+
+
+def _best_of(fn):
+    """Return the best wall time (in seconds) of ``REPEAT`` calls to ``fn``."""
+    times = list()
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""
+Benchmark checking objects against the schema with and without the object memo.
+
+Usage:
+
+    python benchmarks/bench_object_memo.py [JSON_FILE ...]
+
+If no paths are given, all ``.json`` files in ``corpus/`` are used. The documents are
+checked with ``check_schema()`` three ways: without a memo, with a new memo (which only
+helps with objects that repeat across the documents), and again with the memo filled
+by the previous run.
+
+The memo only stores objects that need the generic validator, so the documents are also
+checked with the ``name`` property removed from every object, which makes most of them
+invalid.
+"""
+
+import json
+from pathlib import Path
+import sys
+import time
+
+from attack_flow.schema import (
+    check_schema,
+    ObjectMemo,
+    ValidationResult,
+    warm_validator_cache,
+)
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+REPEAT = 3
+
+
+def main():
+    paths = [Path(p) for p in sys.argv[1:]] or sorted(ROOT_DIR.glob("corpus/*.json"))
+    if not paths:
+        sys.stderr.write("No .json files found.\n")
+        return 1
+
+    docs = [json.loads(path.read_text()) for path in paths]
+    invalid_docs = json.loads(json.dumps(docs))
+    for doc in invalid_docs:
+        for obj in doc.get("objects", []):
+            obj.pop("name", None)
+    count = sum(len(doc.get("objects", [])) for doc in docs)
+    warm_validator_cache()
+
+    print(f"{len(paths)} flows, {count} objects, best of {REPEAT} runs")
+    print(
+        f"{'objects':<9} {'memo':<7} {'time (s)':>9} {'speedup':>8} {'hits':>6} "
+        f"{'misses':>7}"
+    )
+    for name, scenario in (("valid", docs), ("invalid", invalid_docs)):
+        no_memo_time = _best_of(lambda: _check_all(scenario, None))
+        cold_memo_time = _best_of(lambda: _check_all(scenario, ObjectMemo()))
+        memo = ObjectMemo()
+        _check_all(scenario, memo)
+        cold_counts = (memo.hits, memo.misses)
+        warm_memo_time = _best_of(lambda: _check_all(scenario, memo))
+        warm_counts = (memo.hits - cold_counts[0], memo.misses - cold_counts[1])
+        warm_counts = tuple(n // REPEAT for n in warm_counts)
+        for memo_name, elapsed, (hits, misses) in (
+            ("none", no_memo_time, (0, 0)),
+            ("new", cold_memo_time, cold_counts),
+            ("filled", warm_memo_time, warm_counts),
+        ):
+            print(
+                f"{name:<9} {memo_name:<7} {elapsed:>9.3f} "
+                f"{no_memo_time / elapsed:>7.1f}x {hits:>6} {misses:>7}"
+            )
+    return 0
+
+
+def _check_all(docs, memo):
+    check_object = None if memo is None else memo.check_object
+    for doc in docs:
+        check_schema(doc, ValidationResult(), check_object)
+
+
+def _best_of(fn):
+    """Return the best wall time (in seconds) of ``REPEAT`` calls to ``fn``."""
+    times = list()
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""
+Benchmark ``PathEnumerator`` on flows with heavy branching.
+
+Usage:
+
+    python benchmarks/bench_paths.py [NUM_FORKS ...]
+
+Each flow is a chain of ``NUM_FORKS`` conditions, where both outcomes of each condition
+lead to their own action and both actions lead to the next condition, so the flow has
+``2 ** NUM_FORKS`` paths. "count" is ``count_paths()``, "first 1000" is the time to
+generate the first 1,000 paths, and "all" is the time to generate every path, with and
+without memoization. Generating every path is skipped for more than ``--max-all``
+forks.
+"""
+
+import argparse
+import sys
+import time
+
+from attack_flow.paths import PathEnumerator
+
+REPEAT = 3
+DEFAULT_FORKS = (10, 14, 18, 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("forks", nargs="*", type=int, default=DEFAULT_FORKS)
+    parser.add_argument("--max-all", type=int, default=18)
+    args = parser.parse_args()
+
+    print(f"best of {REPEAT} runs")
+    print(
+        f"{'forks':>6} {'paths':>20} {'setup (ms)':>11} {'count (ms)':>11} "
+        f"{'first 1000 (ms)':>16} {'all (s)':>8} {'all, no memo (s)':>17}"
+    )
+    for num_forks in args.forks:
+        bundle = make_forking_bundle(num_forks)
+        setup_time = _best_of(lambda: PathEnumerator(bundle))
+        enumerator = PathEnumerator(bundle)
+        count_time = _best_of(enumerator.count_paths)
+        first_time = _best_of(
+            lambda: _consume(PathEnumerator(bundle).iter_paths(max_paths=1000))
+        )
+        if num_forks > args.max_all:
+            all_time = no_memo_time = "-"
+        else:
+            all_time = _best_of(lambda: _consume(PathEnumerator(bundle).iter_paths()))
+            no_memo_time = _best_of(
+                lambda: _consume(PathEnumerator(bundle, memo_limit=0).iter_paths())
+            )
+            all_time = f"{all_time:.3f}"
+            no_memo_time = f"{no_memo_time:.3f}"
+        print(
+            f"{num_forks:>6} {enumerator.count_paths():>20} "
+            f"{setup_time * 1000:>11.2f} {count_time * 1000:>11.3f} "
+            f"{first_time * 1000:>16.2f} {all_time:>8} {no_memo_time:>17}"
+        )
+    return 0
+
+
+def make_forking_bundle(num_forks):
+    """
+    Make a flow that is a chain of conditions, each with two actions after it.
+
+    :param int num_forks:
+    :rtype: dict
+    """
+    objects = [
+        {
+            "type": "attack-flow",
+            "id": "attack-flow--0",
+            "start_refs": ["attack-condition--0"],
+        }
+    ]
+    for i in range(num_forks):
+        next_refs = [f"attack-condition--{i + 1}"] if i + 1 < num_forks else []
+        objects.append(
+            {
+                "type": "attack-condition",
+                "id": f"attack-condition--{i}",
+                "on_true_refs": [f"attack-action--{i}-true"],
+                "on_false_refs": [f"attack-action--{i}-false"],
+            }
+        )
+        for outcome in ("true", "false"):
+            objects.append(
+                {
+                    "type": "attack-action",
+                    "id": f"attack-action--{i}-{outcome}",
+                    "effect_refs": next_refs,
+                }
+            )
+    return {"type": "bundle", "id": "bundle--0", "objects": objects}
+
+
+def _consume(paths):
+    for _ in paths:
+        pass
+
+
+def _best_of(fn):
+    """Return the best wall time (in seconds) of ``REPEAT`` calls to ``fn``."""
+    times = list()
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
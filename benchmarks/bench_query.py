@@ -0,0 +1,111 @@
+"""
+Benchmark building, saving, and loading a ``TechniqueIndex``, and querying it.
+
+Usage:
+
+    python benchmarks/bench_query.py [--flow-size N] [NUM_FLOWS ...]
+
+Each size is that many synthetic flows (see ``synthetic.py``) of ``--flow-size``
+objects, written to a temporary directory. "build" is the time to read the files and
+add them to the index, and "load" is the time to load the saved index instead. For
+each query, "indexed" is the time of ``query()``, which intersects the posting lists
+before following any action graphs, and "scan" is the time to follow the action graph
+of every flow instead.
+"""
+
+import argparse
+import json
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+from attack_flow.query import TechniqueIndex, parse_query
+import synthetic
+
+REPEAT = 3
+DEFAULT_SIZES = (1_000, 5_000)
+QUERIES = (
+    "T1000",
+    "T1000 -> T1001",
+    "T1000 ->2 T1001",
+    "T1000 ->* T1001",
+    "T1000 ->* T1001 ->* T1002",
+    "T1000.001 ->* T1001.002",
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--flow-size", type=int, default=100)
+    parser.add_argument("sizes", nargs="*", type=int, default=DEFAULT_SIZES)
+    args = parser.parse_args()
+
+    print(f"best of {REPEAT} runs")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        paths = list()
+        for size in args.sizes:
+            for seed in range(len(paths), size):
+                path = tmp_dir / f"flow-{seed}.json"
+                synthetic.write_bundle(path, args.flow_size, seed)
+                paths.append(path)
+            _report(paths[:size], tmp_dir)
+    return 0
+
+
+def _report(paths, tmp_dir):
+    build_time = _best_of(lambda: _build(paths))
+    index = _build(paths)
+    index_path = tmp_dir / "index.json"
+    save_time = _best_of(lambda: index.save(index_path))
+    load_time = _best_of(lambda: TechniqueIndex.load(index_path))
+    print()
+    print(
+        f"{len(paths)} flows, {len(index.action_ids)} actions, "
+        f"{len(index.targets)} edges: build {build_time:.2f} s, "
+        f"save {save_time * 1000:.0f} ms, load {load_time * 1000:.0f} ms, "
+        f"file {index_path.stat().st_size / 2**20:.1f} MiB"
+    )
+    print(f"{'query':>28} {'flows':>6} {'indexed (ms)':>13} {'scan (ms)':>10}")
+    for query in QUERIES:
+        steps = parse_query(query)
+        query_time = _best_of(lambda: index.query(steps))
+        scan_time = _best_of(lambda: _scan(index, steps))
+        print(
+            f"{query:>28} {len(index.query(steps)):>6} "
+            f"{query_time * 1000:>13.3f} {scan_time * 1000:>10.2f}"
+        )
+
+
+def _build(paths):
+    index = TechniqueIndex()
+    for path in paths:
+        with path.open("rb") as f:
+            index.add_flow(json.load(f), flow_id=str(path))
+    return index
+
+
+def _scan(index, steps):
+    """Follow the action graph of every flow, without intersecting posting lists."""
+    if any(step.technique_id not in index.postings for step in steps):
+        return []
+    return [
+        flow_number
+        for flow_number in range(len(index))
+        if index._match_flow(flow_number, steps) is not None
+    ]
+
+
+def _best_of(fn):
+    """Return the best wall time (in seconds) of ``REPEAT`` calls to ``fn``."""
+    times = list()
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+"""
+Benchmark ``af validate`` on unchanged files with and without the result cache.
+
+Usage:
+
+    python benchmarks/bench_result_cache.py [JSON_FILE ...]
+
+If no paths are given, all ``.json`` files in ``corpus/`` are used. Each run is a fresh
+``af validate`` process, so the times include interpreter startup and imports. The cache
+lives in a temporary directory that is filled before the cached runs are timed.
+"""
+
+from pathlib import Path
+import subprocess
+import sys
+from tempfile import TemporaryDirectory
+import time
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+REPEAT = 3
+
+
+def main():
+    paths = [Path(p) for p in sys.argv[1:]] or sorted(ROOT_DIR.glob("corpus/*.json"))
+    if not paths:
+        sys.stderr.write("No .json files found.\n")
+        return 1
+
+    with TemporaryDirectory() as temp_dir:
+        uncached = ["validate", "--no-cache", *paths]
+        cached = ["--cache-dir", temp_dir, "validate", *paths]
+        run_af(cached)
+        uncached_time = _best_of(lambda: run_af(uncached))
+        cached_time = _best_of(lambda: run_af(cached))
+
+    print(f"{len(paths)} flows, best of {REPEAT} runs")
+    print(f"{'no cache (s)':>13} {'cache hits (s)':>15} {'speedup':>8}")
+    print(
+        f"{uncached_time:>13.3f} {cached_time:>15.3f} "
+        f"{uncached_time / cached_time:>7.1f}x"
+    )
+    return 0
+
+
+def run_af(args):
+    subprocess.run(
+        [sys.executable, "-m", "attack_flow.cli", *map(str, args)],
+        capture_output=True,
+    )
+
+
+def _best_of(fn):
+    """Return the best wall time (in seconds) of ``REPEAT`` calls to ``fn``."""
+    times = list()
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
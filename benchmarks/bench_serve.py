@@ -0,0 +1,144 @@
+"""
+Load test ``af serve``, and compare it with running ``af validate`` once per document.
+
+Usage:
+
+    python benchmarks/bench_serve.py [--clients N] [--requests N] [--jobs N]
+        [--url URL] [JSON_FILE]
+
+Unless ``--url`` points to a running server, an ``af serve`` process is started on a
+free port with ``--jobs`` worker processes. Each client thread sends its share of the
+requests over one keep-alive connection. The default document is the example flow.
+"""
+
+import argparse
+import http.client
+import json
+from pathlib import Path
+import subprocess
+import sys
+import threading
+import time
+import urllib.parse
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+EXAMPLE_PATH = ROOT_DIR / "stix" / "attack-flow-example.json"
+REPEAT = 3
+WARMUP_REQUESTS = 10
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--jobs", type=int, default=1)
+    parser.add_argument("--url")
+    parser.add_argument("json_file", nargs="?", type=Path, default=EXAMPLE_PATH)
+    args = parser.parse_args()
+    data = args.json_file.read_bytes()
+
+    server = None
+    url = args.url
+    if url is None:
+        server = subprocess.Popen(
+            [sys.executable, "-m", "attack_flow.cli", "serve", "--port", "0"]
+            + ["--jobs", str(args.jobs)],
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        # "Serving on http://127.0.0.1:PORT. Press Ctrl+C to stop."
+        url = server.stdout.readline().split()[2].rstrip(".")
+    try:
+        address = urllib.parse.urlsplit(url)
+        connect = lambda: http.client.HTTPConnection(address.hostname, address.port)
+        for _ in range(WARMUP_REQUESTS):
+            send(connect(), data)
+        latencies, elapsed = run_clients(connect, data, args.clients, args.requests)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    per_process = _best_of(
+        lambda: subprocess.run(
+            [sys.executable, "-m", "attack_flow.cli", "validate", "--no-cache"]
+            + [str(args.json_file)],
+            capture_output=True,
+        )
+    )
+    latencies.sort()
+    print(f"{args.json_file.name}: {len(data)} bytes")
+    print(f"{len(latencies)} requests from {args.clients} clients in {elapsed:.2f}s")
+    print(
+        f"{'requests/s':>11} {'p50 (ms)':>9} {'p99 (ms)':>9} {'af validate (ms)':>17}"
+    )
+    print(
+        f"{len(latencies) / elapsed:>11.1f} "
+        f"{_percentile(latencies, 50) * 1000:>9.1f} "
+        f"{_percentile(latencies, 99) * 1000:>9.1f} "
+        f"{per_process * 1000:>17.1f}"
+    )
+    return 0
+
+
+def run_clients(connect, data, num_clients, num_requests):
+    """
+    Send ``num_requests`` requests, split between ``num_clients`` threads.
+
+    :returns: a tuple of the latency of each request and the total time, in seconds
+    """
+    latencies = list()
+    errors = list()
+
+    def client(count):
+        connection = connect()
+        try:
+            for _ in range(count):
+                start = time.perf_counter()
+                send(connection, data)
+                latencies.append(time.perf_counter() - start)
+        except Exception as e:
+            errors.append(e)
+
+    counts = [num_requests // num_clients] * num_clients
+    for i in range(num_requests % num_clients):
+        counts[i] += 1
+    threads = [threading.Thread(target=client, args=(count,)) for count in counts]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    if errors:
+        raise errors[0]
+    return latencies, elapsed
+
+
+def send(connection, data):
+    """Validate ``data`` and check that the server responded with a result."""
+    connection.request("POST", "/validate", data)
+    response = connection.getresponse()
+    body = response.read()
+    if response.status != 200:
+        raise RuntimeError(f"HTTP {response.status}: {body.decode()}")
+    return json.loads(body)
+
+
+def _percentile(sorted_values, percent):
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * percent / 100))
+    return sorted_values[index]
+
+
+def _best_of(fn):
+    """Return the best wall time (in seconds) of ``REPEAT`` calls to ``fn``."""
+    times = list()
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
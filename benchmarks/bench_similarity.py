@@ -0,0 +1,151 @@
+"""
+Benchmark ``SimilarityIndex`` queries, and their recall against the exact top 5.
+
+Usage:
+
+    python benchmarks/bench_similarity.py [--configs BANDSxROWS ...] [NUM_FLOWS ...]
+
+The flows in ``corpus/`` are from unrelated incidents, so they are used to make
+templates of campaigns, with one campaign for every ``CAMPAIGN_SIZE`` flows. A template
+is half of the features of a random corpus flow, and as many random features from the
+other flows. Each indexed flow is a variant of a random template, which keeps each of
+the template's features with a probability of 0.8 and adds a few random features, and
+each query is a new variant. "recall" is the share of the exact top 5 (from ``query_exact()``) that ``query()`` finds, and the times are
+the mean time per query. The index of each size is built with each of ``--configs``,
+which are numbers of bands and rows per band, where the number of bins is their
+product.
+
+The first table is the flows in ``corpus/`` themselves, with each flow queried against
+the others, where the most similar flows are not very similar, to show what the index
+misses when there are no near duplicates.
+"""
+
+import argparse
+import json
+from pathlib import Path
+import random
+import sys
+import tempfile
+import time
+
+from attack_flow.similarity import SimilarityIndex, get_flow_features
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+DEFAULT_SIZES = (1_000, 10_000)
+DEFAULT_CONFIGS = ("32x4", "40x3", "64x2")
+NUM_QUERIES = 200
+CAMPAIGN_SIZE = 10
+K = 5
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--configs", nargs="+", default=DEFAULT_CONFIGS)
+    parser.add_argument("sizes", nargs="*", type=int, default=DEFAULT_SIZES)
+    args = parser.parse_args()
+    configs = [tuple(map(int, config.split("x"))) for config in args.configs]
+
+    templates = dict()
+    for path in sorted(ROOT_DIR.glob("corpus/*.json")):
+        with path.open("rb") as f:
+            features = get_flow_features(json.load(f))
+        if features:
+            templates[path.name] = features
+
+    print(f"corpus ({len(templates)} flows, each queried against the others)")
+    _print_header()
+    for num_bands, rows in configs:
+        index = SimilarityIndex(num_bands * rows, num_bands)
+        for flow_id, features in templates.items():
+            index.add(flow_id, features)
+        _report(index, [(features, flow_id) for flow_id, features in templates.items()])
+
+    rng = random.Random(0)
+    vocabulary = sorted({feature for f in templates.values() for feature in f})
+    corpus = list(templates.values())
+    for size in args.sizes:
+        templates = [
+            _make_variant(rng, rng.choice(corpus), vocabulary, keep=0.5, add=0.5)
+            for _ in range(max(1, size // CAMPAIGN_SIZE))
+        ]
+        queries = [
+            (_make_variant(rng, rng.choice(templates), vocabulary), None)
+            for _ in range(NUM_QUERIES)
+        ]
+        flows = {
+            f"flow-{i}": _make_variant(rng, rng.choice(templates), vocabulary)
+            for i in range(size)
+        }
+        print()
+        print(f"{size} flows")
+        _print_header()
+        for num_bands, rows in configs:
+            index = SimilarityIndex(num_bands * rows, num_bands)
+            start = time.perf_counter()
+            for flow_id, features in flows.items():
+                index.add(flow_id, features)
+            build_time = time.perf_counter() - start
+            _report(index, queries, build_time)
+    return 0
+
+
+def _make_variant(rng, template, vocabulary, keep=0.8, add=0.1):
+    """
+    Keep each feature of ``template`` with probability ``keep``, and add ``add`` times
+    as many random features from ``vocabulary``.
+    """
+    features = {feature for feature in template if rng.random() < keep}
+    features.update(rng.sample(vocabulary, 1 + int(len(template) * add)))
+    return frozenset(features)
+
+
+def _print_header():
+    print(
+        f"{'bands':>6} {'rows':>5} {'threshold':>10} {'build (s)':>10} "
+        f"{'save (ms)':>10} {'load (ms)':>10} {'exact (ms)':>11} {'query (ms)':>11} "
+        f"{f'recall@{K}':>9}"
+    )
+
+
+def _report(index, queries, build_time=None):
+    """
+    Query the index, and print the times and the recall.
+
+    :param SimilarityIndex index:
+    :param list queries: ``(features, flow ID to exclude)`` for each query
+    :param float build_time:
+    """
+    start = time.perf_counter()
+    exact = [index.query_exact(f, K, exclude=[e] if e else ()) for f, e in queries]
+    exact_time = (time.perf_counter() - start) / len(queries)
+    start = time.perf_counter()
+    approximate = [index.query(f, K, exclude=[e] if e else ()) for f, e in queries]
+    query_time = (time.perf_counter() - start) / len(queries)
+
+    found = 0
+    total = 0
+    for exact_results, approximate_results in zip(exact, approximate):
+        expected = {flow_id for flow_id, _ in exact_results}
+        found += len(expected.intersection(f for f, _ in approximate_results))
+        total += len(expected)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        index_path = Path(tmp_dir) / "index.json"
+        start = time.perf_counter()
+        index.save(index_path)
+        save_time = time.perf_counter() - start
+        start = time.perf_counter()
+        SimilarityIndex.load(index_path)
+        load_time = time.perf_counter() - start
+
+    build = "-" if build_time is None else f"{build_time:.2f}"
+    print(
+        f"{index.num_bands:>6} {index.num_perm // index.num_bands:>5} "
+        f"{index.threshold:>10.2f} {build:>10} {save_time * 1000:>10.1f} "
+        f"{load_time * 1000:>10.1f} {exact_time * 1000:>11.3f} "
+        f"{query_time * 1000:>11.3f} {found / total:>9.3f}"
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""
+Benchmark peak memory of reading a bundle with ``json.load`` versus the streaming reader,
+and of validating a bundle with and without ``stream=True``.
+
+Usage:
+
+    python benchmarks/bench_stream.py [NUM_OBJECTS ...]
+
+Each measurement runs in a fresh subprocess so that peak RSS is not shared between
+runs. Synthetic bundles are generated in a temporary directory.
+"""
+
+from pathlib import Path
+import resource
+import subprocess
+import sys
+from tempfile import TemporaryDirectory
+import time
+
+import synthetic
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+MODES = ("json", "stream", "validate", "validate-stream")
+
+
+def main():
+    if sys.argv[1:2] == ["--child"]:
+        return _child(sys.argv[2], Path(sys.argv[3]))
+
+    sizes = [int(n) for n in sys.argv[1:]] or DEFAULT_SIZES
+    print(
+        f"{'objects':>10} {'size (MB)':>10} {'mode':>15} {'time (s)':>10} {'peak RSS (MB)':>14}"
+    )
+    with TemporaryDirectory() as tmp_dir:
+        for size in sizes:
+            path = Path(tmp_dir) / f"bundle-{size}.json"
+            synthetic.write_bundle(path, size)
+            megabytes = path.stat().st_size / 1024**2
+            for mode in MODES:
+                output = subprocess.check_output(
+                    [sys.executable, __file__, "--child", mode, str(path)], text=True
+                )
+                elapsed, rss = output.split()
+                print(
+                    f"{size:>10} {megabytes:>10.1f} {mode:>15} {float(elapsed):>10.3f} "
+                    f"{int(rss) / 1024:>14.1f}"
+                )
+    return 0
+
+
+def _child(mode, path):
+    """
+    Count actions in the bundle, or validate it, and print elapsed time and peak RSS
+    (KiB).
+    """
+    start = time.perf_counter()
+    if mode.startswith("validate"):
+        from attack_flow.schema import validate_doc
+
+        validate_doc(path, stream=mode == "validate-stream")
+    else:
+        assert _count_actions(mode, path) > 0
+    elapsed = time.perf_counter() - start
+    print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+    return 0
+
+
+def _count_actions(mode, path):
+    with path.open() as flow_file:
+        if mode == "json":
+            import json
+
+            objects = json.load(flow_file)["objects"]
+            actions = sum(1 for o in objects if o["type"] == "attack-action")
+        else:
+            from attack_flow.stream import iter_bundle_objects
+
+            actions = sum(1 for _ in iter_bundle_objects(flow_file, {"attack-action"}))
+    return actions
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""
+Benchmark building, saving, and loading a ``TransitionMatrix``, and ``predict_next()``.
+
+Usage:
+
+    python benchmarks/bench_transitions.py [--flow-size N] [NUM_FLOWS ...]
+
+The first row is the flows in ``corpus/``, and each other row is that many synthetic
+flows (see ``synthetic.py``) of ``--flow-size`` objects, written to a temporary
+directory. "corpus" is the time to read the flows and build the matrix, which the API
+would pay on every start without a saved matrix, and "load" is the time to load the
+saved one instead. "predict" is the mean time of ``predict_next(technique_id, k=5)``
+over every technique.
+"""
+
+import argparse
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+from attack_flow.graph import load_corpus_graph
+from attack_flow.transitions import TransitionMatrix
+import synthetic
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+REPEAT = 3
+DEFAULT_SIZES = (1_000,)
+PREDICT_ROUNDS = 100
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--flow-size", type=int, default=100)
+    parser.add_argument("sizes", nargs="*", type=int, default=DEFAULT_SIZES)
+    args = parser.parse_args()
+
+    print(f"best of {REPEAT} runs")
+    print(
+        f"{'flows':>12} {'techniques':>11} {'transitions':>12} {'corpus (s)':>11} "
+        f"{'save (ms)':>10} {'load (ms)':>10} {'file (KiB)':>11} {'predict (us)':>13}"
+    )
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        corpus_paths = sorted(ROOT_DIR.glob("corpus/*.json"))
+        _report(f"corpus ({len(corpus_paths)})", corpus_paths, tmp_dir)
+        paths = list()
+        for size in args.sizes:
+            for seed in range(len(paths), size):
+                path = tmp_dir / f"flow-{seed}.json"
+                synthetic.write_bundle(path, args.flow_size, seed)
+                paths.append(path)
+            _report(str(size), paths[:size], tmp_dir)
+    return 0
+
+
+def _report(label, paths, tmp_dir):
+    build_time = _best_of(
+        lambda: TransitionMatrix.from_corpus(load_corpus_graph(paths))
+    )
+    matrix = TransitionMatrix.from_corpus(load_corpus_graph(paths))
+    matrix_path = tmp_dir / "transitions.json"
+    save_time = _best_of(lambda: matrix.save(matrix_path))
+    load_time = _best_of(lambda: TransitionMatrix.load(matrix_path))
+
+    technique_ids = matrix.technique_ids
+    start = time.perf_counter()
+    for _ in range(PREDICT_ROUNDS):
+        for technique_id in technique_ids:
+            matrix.predict_next(technique_id, k=5)
+    predict_time = (time.perf_counter() - start) / PREDICT_ROUNDS / len(technique_ids)
+
+    print(
+        f"{label:>12} {len(matrix):>11} {len(matrix.columns):>12} "
+        f"{build_time:>11.3f} {save_time * 1000:>10.2f} {load_time * 1000:>10.2f} "
+        f"{matrix_path.stat().st_size / 1024:>11.1f} {predict_time * 1e6:>13.2f}"
+    )
+
+
+def _best_of(fn):
+    """Return the best wall time (in seconds) of ``REPEAT`` calls to ``fn``."""
+    times = list()
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""
+Benchmark ``validate_doc()`` against the pipeline it replaced, which read and parsed
+each document twice and copied the graph to make it undirected.
+
+Usage:
+
+    python benchmarks/bench_validate.py [NUM_OBJECTS ...]
+
+Each size is a synthetic bundle (see ``synthetic.py``). Peak memory is measured with
+``tracemalloc`` in a separate run, because tracing slows down the timed runs.
+"""
+
+import json
+from pathlib import Path
+import sys
+from tempfile import TemporaryDirectory
+import time
+import tracemalloc
+
+from attack_flow.graph import bundle_to_networkx
+from attack_flow.model import FlowIndex, load_attack_flow_bundle
+from attack_flow.schema import (
+    check_best_practices,
+    check_graph,
+    check_objects,
+    check_schema,
+    validate_doc,
+    warm_validator_cache,
+    ValidationResult,
+)
+import synthetic
+
+REPEAT = 3
+DEFAULT_SIZES = (100, 1_000, 10_000)
+
+
+def main():
+    sizes = [int(n) for n in sys.argv[1:]] or DEFAULT_SIZES
+    warm_validator_cache()
+    print(f"best of {REPEAT} runs")
+    print(
+        f"{'objects':>10} {'two-pass (s)':>13} {'single (s)':>11} {'speedup':>8} "
+        f"{'two-pass (MiB)':>15} {'single (MiB)':>13}"
+    )
+    with TemporaryDirectory() as temp_dir:
+        for size in sizes:
+            path = Path(temp_dir) / f"flow-{size}.json"
+            synthetic.write_bundle(path, size)
+            # Check that both pipelines agree before timing them.
+            expected = [str(m) for m in _validate_doc_two_pass(path).messages]
+            assert [str(m) for m in validate_doc(path).messages] == expected
+
+            old_time = _best_of(lambda: _validate_doc_two_pass(path))
+            new_time = _best_of(lambda: validate_doc(path))
+            old_peak = _peak_memory(lambda: _validate_doc_two_pass(path))
+            new_peak = _peak_memory(lambda: validate_doc(path))
+            print(
+                f"{size:>10} {old_time:>13.3f} {new_time:>11.3f} "
+                f"{old_time / new_time:>7.1f}x "
+                f"{old_peak / 2**20:>15.1f} {new_peak / 2**20:>13.1f}"
+            )
+    return 0
+
+
+def _validate_doc_two_pass(flow_path):
+    """The validation pipeline before the file was only read and parsed once."""
+    with flow_path.open() as flow_file:
+        flow_json = json.load(flow_file)
+
+    result = ValidationResult()
+    check_objects(flow_json, result, FlowIndex(flow_json))
+    check_schema(flow_json, result)
+    bundle = load_attack_flow_bundle(flow_path)
+    graph = bundle_to_networkx(bundle).to_undirected()
+    check_graph(graph, result)
+    check_best_practices(graph, result)
+    return result
+
+
+def _best_of(fn):
+    """Return the best wall time (in seconds) of ``REPEAT`` calls to ``fn``."""
+    times = list()
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def _peak_memory(fn):
+    """Return the peak memory (in bytes) allocated while calling ``fn``."""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+Benchmark schema validation of individual objects with the generic JSON schema
+validator versus the generated validators.
+
+Usage:
+
+    python benchmarks/bench_validators.py [JSON_FILE ...]
+
+If no paths are given, all ``.json`` files in ``corpus/`` are used. Each object is
+validated with ``check_object_schema()``, once with the generated validators disabled
+and once with them enabled, and the time per object is reported for each type.
+"""
+
+from collections import defaultdict
+import json
+from pathlib import Path
+import sys
+import time
+from unittest.mock import patch
+
+from attack_flow.schema import (
+    check_object_schema,
+    get_compiled_validators,
+    get_validator_for_object,
+    ValidationResult,
+)
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+REPEAT = 3
+
+
+def main():
+    paths = [Path(p) for p in sys.argv[1:]] or sorted(ROOT_DIR.glob("corpus/*.json"))
+    if not paths:
+        sys.stderr.write("No .json files found.\n")
+        return 1
+
+    objects_by_type = defaultdict(list)
+    for path in paths:
+        for obj in json.loads(path.read_text())["objects"]:
+            objects_by_type[obj["type"]].append(obj)
+            # Load schemas up front so that only validation is timed.
+            get_validator_for_object(obj["type"])
+    compiled = get_compiled_validators()
+
+    print(f"{len(paths)} flows, best of {REPEAT} runs")
+    print(
+        f"{'type':<32} {'objects':>8} {'generic (us)':>13} "
+        f"{'generated (us)':>15} {'speedup':>8}"
+    )
+    total_generic = total_generated = 0
+    for obj_type, objects in sorted(
+        objects_by_type.items(), key=lambda item: -len(item[1])
+    ):
+        with patch("attack_flow.schema.get_compiled_validators", return_value={}):
+            generic_time = _best_of(lambda: _check_all(objects))
+        generated_time = _best_of(lambda: _check_all(objects))
+        total_generic += generic_time
+        total_generated += generated_time
+        name = obj_type if obj_type in compiled else f"{obj_type} (generic)"
+        print(
+            f"{name:<32} {len(objects):>8} "
+            f"{generic_time / len(objects) * 1e6:>13.1f} "
+            f"{generated_time / len(objects) * 1e6:>15.1f} "
+            f"{generic_time / generated_time:>7.1f}x"
+        )
+    count = sum(len(objects) for objects in objects_by_type.values())
+    print(
+        f"{'all':<32} {count:>8} {total_generic / count * 1e6:>13.1f} "
+        f"{total_generated / count * 1e6:>15.1f} "
+        f"{total_generic / total_generated:>7.1f}x"
+    )
+    return 0
+
+
+def _check_all(objects):
+    result = ValidationResult()
+    for obj in objects:
+        check_object_schema(obj, result)
+
+
+def _best_of(fn):
+    """Return the best wall time (in seconds) of ``REPEAT`` calls to ``fn``."""
+    times = list()
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,199 @@
+"""
+Generate synthetic Attack Flow bundles of arbitrary size for benchmarking.
+
+The bundles are schema-valid and fully connected: a long chain of actions, with every
+few actions branching through a condition or an operator, and some actions pointing to
+assets that reference infrastructure objects.
+"""
+
+import json
+import random
+import uuid
+
+from attack_flow.model import ATTACK_FLOW_EXTENSION_ID
+
+TIMESTAMP = "2022-08-02T19:34:35.143Z"
+EXTENSIONS = {ATTACK_FLOW_EXTENSION_ID: {"extension_type": "new-sdo"}}
+TECHNIQUE_IDS = [f"T{1000 + i}" for i in range(200)] + [
+    f"T{1000 + i}.00{j}" for i in range(50) for j in range(1, 4)
+]
+EXTENSION_CREATOR_ID = "identity--d673f8cb-c168-42da-8ed4-0cb26725f86c"
+
+
+def iter_bundle_objects(num_objects, seed=0):
+    """
+    Yield roughly ``num_objects`` STIX objects that make up a single Attack Flow.
+
+    :param int num_objects:
+    :param int seed: random seed, so that runs are reproducible
+    :rtype: Iterator[dict]
+    """
+    rng = random.Random(seed)
+
+    def make_id(type_):
+        return f"{type_}--{uuid.UUID(int=rng.getrandbits(128), version=4)}"
+
+    def sdo(type_, id_, **properties):
+        obj = {
+            "type": type_,
+            "spec_version": "2.1",
+            "id": id_,
+            "created": TIMESTAMP,
+            "modified": TIMESTAMP,
+        }
+        obj.update(properties)
+        return obj
+
+    author_id = make_id("identity")
+    flow_id = make_id("attack-flow")
+    yield _extension_definition()
+    yield sdo(
+        "identity",
+        EXTENSION_CREATOR_ID,
+        created_by_ref=EXTENSION_CREATOR_ID,
+        name="MITRE Center for Threat-Informed Defense",
+        identity_class="organization",
+    )
+    yield sdo("identity", author_id, name="Synthetic Author")
+
+    action_id = make_id("attack-action")
+    yield sdo(
+        "attack-flow",
+        flow_id,
+        created_by_ref=author_id,
+        name=f"Synthetic Flow ({num_objects} objects)",
+        description="A synthetic flow for benchmarking.",
+        scope="incident",
+        start_refs=[action_id],
+        extensions=EXTENSIONS,
+    )
+
+    count = 4
+    while count < num_objects:
+        next_id = make_id("attack-action")
+        action = sdo(
+            "attack-action",
+            action_id,
+            technique_id=rng.choice(TECHNIQUE_IDS),
+            name=f"Action {count}",
+            description="A synthetic action.",
+            extensions=EXTENSIONS,
+        )
+        extra = []
+        roll = rng.random()
+        if roll < 0.1:
+            # Branch through a condition.
+            condition_id = make_id("attack-condition")
+            side_id = make_id("attack-action")
+            action["effect_refs"] = [condition_id]
+            extra.append(
+                sdo(
+                    "attack-condition",
+                    condition_id,
+                    description="A synthetic condition.",
+                    on_true_refs=[next_id],
+                    on_false_refs=[side_id],
+                    extensions=EXTENSIONS,
+                )
+            )
+            extra.append(
+                sdo(
+                    "attack-action",
+                    side_id,
+                    technique_id=rng.choice(TECHNIQUE_IDS),
+                    name="Side action",
+                    extensions=EXTENSIONS,
+                )
+            )
+        elif roll < 0.2:
+            # Join through an operator.
+            operator_id = make_id("attack-operator")
+            action["effect_refs"] = [operator_id]
+            extra.append(
+                sdo(
+                    "attack-operator",
+                    operator_id,
+                    operator=rng.choice(["AND", "OR"]),
+                    effect_refs=[next_id],
+                    extensions=EXTENSIONS,
+                )
+            )
+        else:
+            action["effect_refs"] = [next_id]
+        if roll > 0.75:
+            asset_id = make_id("attack-asset")
+            infra_id = make_id("infrastructure")
+            action["asset_refs"] = [asset_id]
+            extra.append(
+                sdo(
+                    "attack-asset",
+                    asset_id,
+                    name="Synthetic asset",
+                    object_ref=infra_id,
+                    extensions=EXTENSIONS,
+                )
+            )
+            extra.append(sdo("infrastructure", infra_id, name="Synthetic infra"))
+        yield action
+        yield from extra
+        count += 1 + len(extra)
+        action_id = next_id
+
+    yield sdo(
+        "attack-action",
+        action_id,
+        technique_id=rng.choice(TECHNIQUE_IDS),
+        name="Final action",
+        extensions=EXTENSIONS,
+    )
+
+
+def make_bundle(num_objects, seed=0):
+    """
+    Return a synthetic Attack Flow bundle as a ``dict``.
+
+    :param int num_objects:
+    :param int seed:
+    :rtype: dict
+    """
+    return {
+        "type": "bundle",
+        "id": "bundle--00000000-0000-4000-8000-000000000000",
+        "objects": list(iter_bundle_objects(num_objects, seed)),
+    }
+
+
+def write_bundle(path, num_objects, seed=0):
+    """
+    Write a synthetic Attack Flow bundle to ``path`` one object at a time, so that even
+    very large bundles can be generated with little memory.
+
+    :param pathlib.Path path:
+    :param int num_objects:
+    :param int seed:
+    """
+    with path.open("w") as out:
+        out.write('{"type": "bundle", ')
+        out.write('"id": "bundle--00000000-0000-4000-8000-000000000000", ')
+        out.write('"objects": [\n')
+        for index, obj in enumerate(iter_bundle_objects(num_objects, seed)):
+            if index:
+                out.write(",\n")
+            json.dump(obj, out)
+        out.write("\n]}\n")
+
+
+def _extension_definition():
+    return {
+        "type": "extension-definition",
+        "id": ATTACK_FLOW_EXTENSION_ID,
+        "spec_version": "2.1",
+        "name": "Attack Flow",
+        "description": "Extends STIX 2.1 with features to create Attack Flows.",
+        "created": TIMESTAMP,
+        "modified": TIMESTAMP,
+        "created_by_ref": EXTENSION_CREATOR_ID,
+        "schema": "https://center-for-threat-informed-defense.github.io/attack-flow/stix/attack-flow-schema-2.0.0.json",
+        "version": "2.0.0",
+        "extension_types": ["new-sdo"],
+    }
@@ -0,0 +1,966 @@
+"""
+Read Attack Flow Builder (``.afb``) files and export them to STIX bundles.
+
+This is a Python port of the builder's STIX publisher, so that ``.afb`` files can be
+converted without building and starting the Node.js command line tool. The exported
+bundle has the same objects and properties as the builder's ``export-stix`` command,
+except for the randomly generated identifiers and timestamps.
+"""
+
+from datetime import datetime, timezone
+import functools
+import json
+import math
+from pathlib import Path
+import re
+import uuid
+
+BUILDER_TEMPLATES_DIR = (
+    Path(__file__).resolve().parents[1]
+    / "attack_flow_builder"
+    / "src"
+    / "assets"
+    / "configuration"
+    / "AttackFlowTemplates"
+)
+
+# The builder merges these enumerations in order, and earlier sources take priority.
+BUILDER_ENUM_SOURCES = ("MitreAttack", "MitreAtlas", "MitreDefend", "MitreF3")
+
+AFB_SCHEMA = "attack_flow_v2"
+CANVAS_TEMPLATE = "flow"
+
+EXTENSION_ID = "fb9c968a-745b-4ade-9b25-c324172197f4"
+EXTENSION_SCHEMA_URL = "https://center-for-threat-informed-defense.github.io/attack-flow/stix/attack-flow-schema-2.0.0.json"
+EXTENSION_SCHEMA_VERSION = "2.0.0"
+EXTENSION_CREATED = "2022-08-02T19:34:35.143Z"
+EXTENSION_CREATOR_NAME = "MITRE Center for Threat-Informed Defense"
+EXTENSION_EXTERNAL_REFERENCES = [
+    {
+        "source_name": "Documentation",
+        "description": "Documentation for Attack Flow",
+        "url": "https://center-for-threat-informed-defense.github.io/attack-flow",
+    },
+    {
+        "source_name": "GitHub",
+        "description": "Source code repository for Attack Flow",
+        "url": "https://github.com/center-for-threat-informed-defense/attack-flow",
+    },
+]
+
+ATTACK_FLOW_SDOS = {
+    "attack-flow",
+    "attack-action",
+    "attack-asset",
+    "attack-condition",
+    "attack-operator",
+}
+
+TEMPLATE_TYPES = {
+    "flow": "attack-flow",
+    "action": "attack-action",
+    "asset": "attack-asset",
+    "condition": "attack-condition",
+    "OR_operator": "attack-operator",
+    "AND_operator": "attack-operator",
+    "email_address": "email-addr",
+}
+
+# Marks a date property that defaults to the time the file is opened.
+CURRENT_TIME = object()
+
+# The builder's template sources, in order. A source can refer to the constants that
+# the sources before it export.
+BUILDER_TEMPLATE_SOURCES = (
+    "BoolEnum",
+    "TacticTechniqueProperty",
+    "AttackFlow",
+    "AttackFlowObjects",
+    "StixObjects",
+    "StixObservables",
+)
+PROPERTY_TYPES = {
+    "PropertyType.String": "string",
+    "PropertyType.Int": "int",
+    "PropertyType.Float": "float",
+    "PropertyType.Date": "date",
+    "PropertyType.Enum": "enum",
+    "PropertyType.Dictionary": "dict",
+    "PropertyType.List": "list",
+    "PropertyType.Tuple": "tuple",
+}
+TS_TOKEN_RE = re.compile(r'\s*("(?:[^"\\]|\\.)*"|-?\d+(?:\.\d+)?|[\w$]+|\.\.\.|\S)')
+TS_BRACKETS = {"(": 1, "[": 1, "{": 1, "<": 1, ")": -1, "]": -1, "}": -1, ">": -1}
+
+INT_PREFIX_RE = re.compile(r"\s*[+-]?\d+")
+FLOAT_PREFIX_RE = re.compile(r"\s*[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?")
+
+
+class BuilderEnums:
+    """
+    The MITRE ATT&CK, ATLAS, D3FEND, and F3 enumerations used by the builder.
+
+    :param dict stix_ids: maps tactic and technique IDs to STIX IDs
+    :param dict technique_tactics: maps each technique ID to a set of tactic IDs
+    """
+
+    def __init__(self, stix_ids, technique_tactics):
+        self.stix_ids = stix_ids
+        self.technique_tactics = technique_tactics
+        self.tactics = set().union(*technique_tactics.values())
+
+
+@functools.lru_cache
+def load_builder_enums(templates_dir=BUILDER_TEMPLATES_DIR):
+    """
+    Load the builder's enumerations from its TypeScript sources.
+
+    Each source file contains a single JSON object literal, so it can be read without a
+    TypeScript compiler.
+
+    :param Path templates_dir: directory containing the builder templates
+    :rtype: BuilderEnums
+    """
+    stix_ids = dict()
+    technique_tactics = dict()
+    for source in BUILDER_ENUM_SOURCES:
+        text = (Path(templates_dir) / f"{source}.ts").read_text(encoding="utf8")
+        enums = json.loads(text[text.index("{") : text.rindex("}") + 1])
+        for key, stix_id in enums["stixIds"].items():
+            stix_ids.setdefault(key, stix_id)
+        for _, tactic, _, technique in enums["relationships"]:
+            technique_tactics.setdefault(technique, set()).add(tactic)
+    return BuilderEnums(stix_ids, technique_tactics)
+
+
+@functools.lru_cache
+def load_builder_templates(templates_dir=BUILDER_TEMPLATES_DIR):
+    """
+    Load the builder's object templates from its TypeScript sources.
+
+    Only the details that affect the exported STIX are kept for each property: its
+    type, its default value, the options of an enum, the range of a number, and the
+    representative key that decides if a dictionary is set.
+
+    :param Path templates_dir: directory containing the builder templates
+    :returns: maps each template name to a dict of its property descriptors
+    :rtype: dict
+    """
+    constants = dict()
+    for source in BUILDER_TEMPLATE_SOURCES:
+        text = (Path(templates_dir) / f"{source}.ts").read_text(encoding="utf8")
+        constants.update(_TsReader(text, constants).read_exports())
+    templates = dict()
+    for value in constants.values():
+        for template in value if isinstance(value, list) else [value]:
+            if "properties" in template:
+                templates[template["name"]] = {
+                    key: _to_descriptor(prop)
+                    for key, prop in template["properties"].items()
+                }
+    return templates
+
+
+def load_afb(path):
+    """
+    Load an Attack Flow Builder file.
+
+    :param Path path: the ``.afb`` file to load
+    :rtype: dict
+    """
+    with open(path, encoding="utf8") as afb_file:
+        afb_json = json.load(afb_file)
+    if "version" in afb_json:
+        raise ValueError("appears to be a v2 file (expected v3)")
+    if afb_json.get("schema") != AFB_SCHEMA:
+        raise ValueError("not an Attack Flow Builder file")
+    return afb_json
+
+
+def convert_afb_to_stix(afb_json, enums=None):
+    """
+    Convert an Attack Flow Builder diagram to a STIX bundle.
+
+    :param dict afb_json: the diagram, as returned by :func:`load_afb`
+    :param BuilderEnums enums: tactic and technique data (loaded from the builder's
+        sources by default)
+    :rtype: dict
+    """
+    if enums is None:
+        enums = load_builder_enums()
+    templates = load_builder_templates()
+    publisher = _Publisher(enums, templates)
+    return publisher.publish(_Diagram(afb_json, enums, templates))
+
+
+def dumps_stix(bundle):
+    """
+    Serialize a STIX bundle in the same format as the builder.
+
+    :param dict bundle:
+    :rtype: str
+    """
+    return json.dumps(bundle, indent=2, ensure_ascii=False)
+
+
+def export_stix(afb_path, stix_path=None, enums=None):
+    """
+    Convert an Attack Flow Builder file to a STIX bundle file.
+
+    :param Path afb_path: the ``.afb`` file to convert
+    :param Path stix_path: the file to write (by default, the ``.afb`` path with a
+        ``.json`` suffix)
+    :param BuilderEnums enums: tactic and technique data
+    :returns: the path that was written
+    :rtype: Path
+    """
+    afb_path = Path(afb_path)
+    if stix_path is None:
+        stix_path = afb_path.with_suffix(".json")
+    bundle = convert_afb_to_stix(load_afb(afb_path), enums)
+    Path(stix_path).write_text(dumps_stix(bundle), encoding="utf8")
+    return Path(stix_path)
+
+
+def _to_descriptor(prop):
+    """Convert a property from a builder template to a property descriptor."""
+    kind = PROPERTY_TYPES[prop["type"]]
+    descriptor = {"type": kind}
+    if kind == "enum":
+        # Maps each option to its value, e.g. a label or a confidence score
+        descriptor["options"] = dict(prop["options"]["default"])
+    elif kind in ("int", "float"):
+        descriptor["min"] = prop.get("min", -math.inf)
+        descriptor["max"] = prop.get("max", math.inf)
+    elif kind == "list":
+        descriptor["form"] = _to_descriptor(prop["form"])
+    elif kind in ("dict", "tuple"):
+        form = prop["form"]
+        descriptor["form"] = {key: _to_descriptor(sub) for key, sub in form.items()}
+        if kind == "dict":
+            descriptor["representative"] = next(
+                (key for key, sub in form.items() if sub.get("is_representative")),
+                None,
+            )
+        elif "validValueCombinations" in prop:
+            descriptor["combinations"] = "ttp"
+    if "default" in prop:
+        default = prop["default"]
+        descriptor["default"] = CURRENT_TIME if default == "new Date()" else default
+    return descriptor
+
+
+class _TsReader:
+    """
+    Read the constants that a builder template source exports.
+
+    This only handles what the template sources use: object and array literals,
+    strings, numbers, computed keys, spreads of constants from earlier sources, and
+    type casts. Any other expression, like ``PropertyType.String``, is read as its
+    source text.
+
+    :param str text: the TypeScript source
+    :param dict constants: the constants exported by earlier sources
+    """
+
+    def __init__(self, text, constants):
+        self.tokens = TS_TOKEN_RE.findall(text)
+        self.pos = 0
+        self.constants = constants
+
+    def read_exports(self):
+        """
+        Read each ``export const`` in the source.
+
+        :returns: maps each constant's name to its value
+        :rtype: dict
+        """
+        exports = dict()
+        while self.pos < len(self.tokens) - 2:
+            if self.tokens[self.pos : self.pos + 2] != ["export", "const"]:
+                self.pos += 1
+                continue
+            name = self.tokens[self.pos + 2]
+            # Skip the type annotation.
+            self.pos = self.tokens.index("=", self.pos) + 1
+            exports[name] = self.read_value()
+        return exports
+
+    def read_value(self):
+        value = self._read_expression()
+        if self._peek() == "as":
+            self._skip_type()
+        return value
+
+    def _read_expression(self):
+        token = self._next()
+        if token == "{":
+            return self._read_object()
+        elif token == "[":
+            return self._read_array()
+        elif token.startswith('"'):
+            return json.loads(token)
+        elif token[0].isdigit() or token[0] == "-":
+            return json.loads(token)
+        elif token in ("true", "false", "null"):
+            return json.loads(token)
+        elif token == "new":
+            return f"new {self._read_expression()}"
+        name = token
+        while self._peek() == ".":
+            name += self._next() + self._next()
+        if self._peek() == "(":
+            self._next()
+            args = list()
+            while self._peek() != ")":
+                args.append(json.dumps(self.read_value()))
+                if self._peek() == ",":
+                    self._next()
+            self._next()
+            return f"{name}({', '.join(args)})"
+        return self.constants.get(name, name)
+
+    def _read_object(self):
+        obj = dict()
+        while (token := self._next()) != "}":
+            if token == ",":
+                continue
+            elif token == "...":
+                obj.update(self.read_value())
+                continue
+            elif token == "[":
+                key = str(self.read_value())
+                self._expect("]")
+            elif token.startswith('"'):
+                key = json.loads(token)
+            else:
+                key = token
+            self._expect(":")
+            obj[key] = self.read_value()
+        return obj
+
+    def _read_array(self):
+        items = list()
+        while self._peek() != "]":
+            items.append(self.read_value())
+            if self._peek() == ",":
+                self._next()
+        self._next()
+        return items
+
+    def _skip_type(self):
+        self._next()
+        depth = 0
+        while depth or self._peek() not in (",", ";", ")", "]", "}"):
+            depth += TS_BRACKETS.get(self._next(), 0)
+
+    def _peek(self):
+        return self.tokens[self.pos]
+
+    def _next(self):
+        self.pos += 1
+        return self.tokens[self.pos - 1]
+
+    def _expect(self, expected):
+        if (token := self._next()) != expected:
+            raise ValueError(f"Expected '{expected}' but found '{token}'.")
+
+
+class _Diagram:
+    """
+    The semantic graph of a builder diagram.
+
+    Blocks become nodes and lines become edges. A line is attached to a block when one
+    of the line's latches is listed in one of the block's anchors, and the position of
+    that anchor (e.g. ``branch:True`` on a condition) is recorded on the edge.
+
+    :param dict afb_json: the diagram
+    :param BuilderEnums enums: tactic and technique data
+    :param dict templates: the templates from :func:`load_builder_templates`
+    """
+
+    def __init__(self, afb_json, enums, templates):
+        self.enums = enums
+        self.templates = templates
+        objects = {obj["instance"]: obj for obj in afb_json["objects"]}
+        canvas = next(
+            (o for o in afb_json["objects"] if o["id"] == CANVAS_TEMPLATE), None
+        )
+        if canvas is None:
+            raise ValueError("Page object missing from export.")
+        self.page_instance = canvas["instance"]
+        self.page_props = self._resolve_props(canvas)
+
+        blocks = list()
+        lines = list()
+        stack = [canvas]
+        while stack:
+            obj = stack.pop()
+            if "anchors" in obj:
+                blocks.append(obj)
+            elif "handles" in obj:
+                lines.append(obj)
+            children = [objects[i] for i in obj.get("objects", []) if i in objects]
+            stack.extend(reversed(children))
+
+        # Node instance -> (template, properties)
+        self.nodes = {
+            block["instance"]: (block["id"], self._resolve_props(block))
+            for block in blocks
+        }
+        # Line instance -> [source instance, source anchor position, target instance]
+        self.edges = {line["instance"]: [None, None, None] for line in lines}
+
+        latch_lines = dict()
+        for line in lines:
+            for end in ("source", "target"):
+                if line.get(end) is not None:
+                    latch_lines[line[end]] = line
+        for block in blocks:
+            for position, anchor_instance in block["anchors"].items():
+                anchor = objects.get(anchor_instance)
+                if anchor is None:
+                    continue
+                for latch in anchor.get("latches", []):
+                    line = latch_lines.get(latch)
+                    if line is None:
+                        continue
+                    edge = self.edges[line["instance"]]
+                    if line.get("source") == latch:
+                        edge[0] = block["instance"]
+                        edge[1] = position
+                    if line.get("target") == latch:
+                        edge[2] = block["instance"]
+
+    def iter_links(self):
+        """
+        Yield ``(source, via, target)`` for each line connected at both ends.
+
+        :rtype: Iterator[tuple]
+        """
+        for source, via, target in self.edges.values():
+            if source is not None and target is not None:
+                yield source, via, target
+
+    def _resolve_props(self, obj):
+        template = self.templates.get(obj["id"])
+        if template is None:
+            raise ValueError(f"Unknown template '{obj['id']}'.")
+        values = _entries(obj.get("properties"))
+        return {
+            key: self._resolve(descriptor, values.get(key, _UNDEFINED))
+            for key, descriptor in template.items()
+        }
+
+    def _resolve(self, descriptor, value):
+        """
+        Convert a saved property value to the value the builder would hold in memory.
+
+        Saved values are checked and coerced the same way that the builder does when it
+        opens a file, e.g. enum values that are not valid options are discarded.
+        """
+        kind = descriptor["type"]
+        if kind == "list":
+            if value is _UNDEFINED or value is None:
+                return []
+            return [
+                self._resolve(descriptor["form"], item)
+                for item in _entries(value).values()
+            ]
+        elif kind == "dict":
+            values = {} if value is _UNDEFINED or value is None else _entries(value)
+            return {
+                key: self._resolve(sub, values.get(key, _UNDEFINED))
+                for key, sub in descriptor["form"].items()
+            }
+        elif kind == "tuple":
+            resolved = {
+                key: self._resolve(sub, _UNDEFINED)
+                for key, sub in descriptor["form"].items()
+            }
+            if value is not _UNDEFINED and value is not None:
+                for key, item in _entries(value).items():
+                    if key in resolved:
+                        resolved[key] = self._resolve(descriptor["form"][key], item)
+            if descriptor.get("combinations") == "ttp":
+                self._align_ttp(resolved)
+            return resolved
+
+        if value is _UNDEFINED:
+            value = descriptor.get("default")
+        if value is None:
+            return None
+        elif kind == "string":
+            return _to_js_string(value)
+        elif kind == "enum":
+            return value if value in descriptor["options"] else None
+        elif kind == "date":
+            return _to_utc_iso(value)
+        else:
+            return _to_number(value, descriptor)
+
+    def _align_ttp(self, ttp):
+        """
+        Fill in the tactic when the technique is only valid under one tactic.
+
+        The builder restricts a tactic/technique pair to known combinations, and when
+        only one tactic is possible for the selected technique, it selects that tactic.
+        """
+        tactics = self.enums.technique_tactics.get(ttp["technique"])
+        if tactics is None or len(tactics) != 1:
+            return
+        if ttp["tactic"] is None or ttp["tactic"] in self.enums.tactics:
+            (ttp["tactic"],) = tactics
+
+
+class _Undefined:
+    """Marker for a property that is missing from a file."""
+
+
+_UNDEFINED = _Undefined()
+
+
+def _entries(value):
+    """Convert a saved collection (a list of pairs or an object) to a dict."""
+    if isinstance(value, dict):
+        return value
+    return {key: item for key, item in value}
+
+
+def _to_js_string(value):
+    if isinstance(value, str):
+        return value
+    elif isinstance(value, bool):
+        return "true" if value else "false"
+    elif isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _to_number(value, descriptor):
+    """Parse, clamp, and round a number the same way as the builder."""
+    if isinstance(value, str):
+        pattern = INT_PREFIX_RE if descriptor["type"] == "int" else FLOAT_PREFIX_RE
+        match = pattern.match(value)
+        if not match:
+            return None
+        value = float(match.group(0))
+    elif isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    value = min(
+        max(value, descriptor.get("min", -math.inf)), descriptor.get("max", math.inf)
+    )
+    if math.isinf(value) or math.isnan(value):
+        return None
+    return math.floor(value + 0.5)
+
+
+def _to_utc_iso(value):
+    """
+    Convert a saved date to an ISO 8601 UTC timestamp with millisecond precision.
+
+    Dates are saved either as an ISO string or as an object with ``time`` and ``zone``
+    keys, where ``time`` includes its UTC offset. Times without an offset are treated
+    as UTC. Any other value (e.g. :data:`CURRENT_TIME`) is the current time.
+    """
+    if isinstance(value, str):
+        moment = _parse_iso(value)
+    elif isinstance(value, dict) and "time" in value and "zone" in value:
+        moment = _parse_iso(value["time"])
+    else:
+        moment = datetime.now(timezone.utc)
+    if moment is None:
+        return None
+    return _format_timestamp(moment)
+
+
+def _parse_iso(value):
+    try:
+        moment = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment
+
+
+def _format_timestamp(moment):
+    moment = moment.astimezone(timezone.utc)
+    millis = moment.microsecond // 1000
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.") + f"{millis:03d}Z"
+
+
+def _is_defined(descriptor, value):
+    kind = descriptor["type"]
+    if kind == "list":
+        return len(value) > 0
+    elif kind == "dict":
+        key = descriptor.get("representative")
+        return key is not None and _is_defined(descriptor["form"][key], value[key])
+    elif kind == "tuple":
+        return any(_is_defined(descriptor["form"][k], v) for k, v in value.items())
+    return value is not None
+
+
+class _Publisher:
+    """
+    Convert a diagram to a STIX bundle, following the builder's publisher.
+
+    :param BuilderEnums enums: tactic and technique data
+    :param dict templates: the templates from :func:`load_builder_templates`
+    """
+
+    def __init__(self, enums, templates):
+        self.enums = enums
+        self.templates = templates
+        self.now = _format_timestamp(datetime.now(timezone.utc))
+
+    def publish(self, diagram):
+        """
+        Create a STIX bundle from a diagram.
+
+        :param _Diagram diagram:
+        :rtype: dict
+        """
+        bundle = self._create_stix_bundle()
+        author = self._create_flow_author_sdo(diagram.page_props)
+        start_refs = self._compute_start_refs(diagram)
+        flow = self._create_flow_sdo(
+            diagram.page_instance, diagram.page_props, author["id"], start_refs
+        )
+        bundle["objects"].append(flow)
+        bundle["objects"].append(author)
+
+        stix_nodes = dict()
+        stix_children = dict()
+        for instance, (template, props) in diagram.nodes.items():
+            stix_node = self._to_stix_node(template, instance, props)
+            bundle["objects"].append(stix_node)
+            stix_nodes[instance] = stix_node
+            stix_children[instance] = list()
+
+        for source, via, target in diagram.iter_links():
+            stix_children[source].append((stix_nodes[target], via))
+
+        for instance, children in stix_children.items():
+            bundle["objects"].extend(self._try_embed(stix_nodes[instance], children))
+
+        return bundle
+
+    # Node creation
+
+    def _to_stix_node(self, template, instance, props):
+        obj = self._create_sdo(template, instance)
+        descriptors = self.templates[template]
+        if obj["type"] == "attack-action":
+            self._merge_action_props(obj, descriptors, props)
+        else:
+            self._merge_basic_dict(obj, descriptors, props)
+        return obj
+
+    def _merge_action_props(self, node, descriptors, props):
+        for key, value in props.items():
+            descriptor = descriptors[key]
+            if key == "ttp":
+                tactic = value["tactic"]
+                if tactic:
+                    node["tactic_id"] = tactic
+                    if tactic in self.enums.stix_ids:
+                        node["tactic_ref"] = self.enums.stix_ids[tactic]
+                technique = value["technique"]
+                if technique:
+                    node["technique_id"] = technique
+                    if technique in self.enums.stix_ids:
+                        node["technique_ref"] = self.enums.stix_ids[technique]
+            elif key == "confidence":
+                if value is not None:
+                    node[key] = descriptor["options"][value]["value"]
+            elif descriptor["type"] == "string":
+                if value is not None:
+                    node[key] = value.strip()
+            elif _is_defined(descriptor, value):
+                node[key] = value
+
+    def _merge_basic_dict(self, node, descriptors, props):
+        for key, value in props.items():
+            descriptor = descriptors[key]
+            kind = descriptor["type"]
+            if not _is_defined(descriptor, value):
+                continue
+            if kind in ("dict", "tuple"):
+                raise ValueError("Basic dictionaries cannot contain dictionaries.")
+            elif kind == "enum":
+                if value in ("true", "false"):
+                    node[key] = value == "true"
+                else:
+                    node[key] = value
+            elif kind == "list":
+                if key == "hashes":
+                    self._merge_hashes(node, key, descriptor, value)
+                    # The builder stops merging properties after the hashes.
+                    break
+                self._merge_basic_list(node, key, descriptor, value)
+            elif kind == "string":
+                node[key] = value.strip()
+            elif node.get("type") == "mac-addr":
+                node[key] = str(value).lower()
+                break
+            else:
+                node[key] = value
+
+    def _merge_basic_list(self, node, key, descriptor, values):
+        form = descriptor["form"]
+        items = node[key] = list()
+        for value in values:
+            if not _is_defined(form, value):
+                continue
+            elif form["type"] == "dict":
+                obj = dict()
+                self._merge_basic_dict(obj, form["form"], value)
+                items.append(obj)
+            elif form["type"] in ("list", "tuple"):
+                raise ValueError("Basic lists cannot contain lists.")
+            elif form["type"] == "enum":
+                raise ValueError("Basic lists cannot contain enums.")
+            elif form["type"] == "string":
+                items.append(value.strip())
+            else:
+                items.append(value)
+
+    def _merge_hashes(self, node, key, descriptor, values):
+        form = descriptor["form"]
+        hashes = [value for value in values if _is_defined(form, value)]
+        if hashes:
+            node[key] = {_to_js_key(h["hash_type"]): h["hash_value"] for h in hashes}
+
+    # Relationship embedding
+
+    def _try_embed(self, parent, children):
+        sros = list()
+        for child, via in children:
+            sro = None
+            parent_type = parent["type"]
+            if parent_type == "attack-action":
+                sro = self._try_embed_in_action(parent, child)
+            elif parent_type == "attack-asset":
+                sro = self._try_embed_in_asset(parent, child)
+            elif parent_type == "attack-condition":
+                sro = self._try_embed_in_condition(parent, child, via)
+            elif parent_type == "attack-operator":
+                sro = self._try_embed_in_operator(parent, child)
+            elif parent_type in ("ipv4-addr", "ipv6-addr", "mac-addr", "domain-name"):
+                # The parent of a network traffic object can be embedded in the
+                # network traffic object.
+                if child["type"] == "network-traffic":
+                    sro = self._try_embed_in_network_traffic(parent, child)
+                else:
+                    sro = self._create_sro(parent, child)
+            elif parent_type in (
+                "grouping",
+                "note",
+                "observed-data",
+                "opinion",
+                "report",
+            ):
+                parent.setdefault("object_refs", []).append(child["id"])
+            elif parent_type == "malware-analysis":
+                parent.setdefault("analysis_sco_refs", []).append(child["id"])
+            elif parent_type == "network-traffic":
+                sro = self._try_embed_in_network_traffic(parent, child)
+            else:
+                sro = self._create_sro(parent, child)
+            if sro:
+                sros.append(sro)
+        return sros
+
+    def _try_embed_in_action(self, parent, child):
+        child_type = child["type"]
+        if child_type == "process":
+            if "command_ref" in parent:
+                return self._create_sro(parent, child)
+            parent["command_ref"] = child["id"]
+        elif child_type == "attack-asset":
+            parent.setdefault("asset_refs", []).append(child["id"])
+        elif child_type in ("attack-action", "attack-operator", "attack-condition"):
+            parent.setdefault("effect_refs", []).append(child["id"])
+        else:
+            return self._create_sro(parent, child)
+
+    def _try_embed_in_asset(self, parent, child):
+        if "object_ref" in parent:
+            return self._create_sro(parent, child)
+        parent["object_ref"] = child["id"]
+
+    def _try_embed_in_condition(self, parent, child, via):
+        if child["type"] not in (
+            "attack-action",
+            "attack-operator",
+            "attack-condition",
+        ):
+            return self._create_sro(parent, child)
+        if via == "true_anchor":
+            parent.setdefault("on_true_refs", []).append(child["id"])
+        elif via == "false_anchor":
+            parent.setdefault("on_false_refs", []).append(child["id"])
+        else:
+            return self._create_sro(parent, child)
+
+    def _try_embed_in_network_traffic(self, parent, child):
+        if parent["type"] == "network-traffic" and not parent.get("dst_ref"):
+            parent["dst_ref"] = child["id"]
+        elif child["type"] == "network-traffic" and not child.get("src_ref"):
+            child["src_ref"] = parent["id"]
+        else:
+            return self._create_sro(parent, child)
+
+    def _try_embed_in_operator(self, parent, child):
+        if child["type"] in ("attack-action", "attack-operator", "attack-condition"):
+            parent.setdefault("effect_refs", []).append(child["id"])
+        else:
+            return self._create_sro(parent, child)
+
+    # Bundle
+
+    def _create_stix_bundle(self):
+        author = self._create_sdo("identity", EXTENSION_ID)
+        author.update(
+            {
+                "created_by_ref": author["id"],
+                "name": EXTENSION_CREATOR_NAME,
+                "identity_class": "organization",
+                "created": EXTENSION_CREATED,
+                "modified": EXTENSION_CREATED,
+            }
+        )
+        extension = self._create_sdo("extension-definition", EXTENSION_ID)
+        extension.update(
+            {
+                "name": "Attack Flow",
+                "description": "Extends STIX 2.1 with features to create Attack Flows.",
+                "created": EXTENSION_CREATED,
+                "modified": EXTENSION_CREATED,
+                "created_by_ref": author["id"],
+                "schema": EXTENSION_SCHEMA_URL,
+                "version": EXTENSION_SCHEMA_VERSION,
+                "extension_types": ["new-sdo"],
+                "external_references": [
+                    dict(ref) for ref in EXTENSION_EXTERNAL_REFERENCES
+                ],
+            }
+        )
+        bundle = self._create_sdo("bundle")
+        bundle["objects"] = [extension, author]
+        return bundle
+
+    def _create_flow_sdo(self, instance, props, author_id, start_refs):
+        flow = self._create_sdo(CANVAS_TEMPLATE, instance)
+        flow["created_by_ref"] = author_id
+        flow["start_refs"] = start_refs
+        descriptors = self.templates[CANVAS_TEMPLATE]
+        for key, value in props.items():
+            descriptor = descriptors[key]
+            if key == "author":
+                # The author is exported as a separate identity.
+                continue
+            elif key == "external_references":
+                refs = [
+                    {k: v for k, v in ref.items() if v is not None} for ref in value
+                ]
+                if refs:
+                    flow[key] = refs
+            elif _is_defined(descriptor, value):
+                flow[key] = value
+        return flow
+
+    def _create_flow_author_sdo(self, props):
+        author = self._create_sdo("identity")
+        descriptors = self.templates[CANVAS_TEMPLATE]["author"]["form"]
+        for key, value in props["author"].items():
+            if value is None:
+                continue
+            elif key == "identity_class":
+                label = descriptors[key]["options"][value]
+                author[key] = label.strip().lower()
+            else:
+                author[key] = value.strip()
+        return author
+
+    def _compute_start_refs(self, diagram):
+        """
+        Find the actions and conditions that no other action or condition leads to.
+
+        Paths through other kinds of nodes (e.g. operators and assets) are followed when
+        deciding which actions and conditions lead to which.
+        """
+        children = {instance: [] for instance in diagram.nodes}
+        for source, _, target in diagram.iter_links():
+            children[source].append(target)
+
+        imputed_edges = dict()
+        for instance, (template, _) in diagram.nodes.items():
+            if template not in ("action", "condition"):
+                continue
+            edges = imputed_edges[self._stix_id(template, instance)] = list()
+            stack = list(children[instance])
+            visited = set()
+            while stack:
+                descendant = stack.pop()
+                if descendant in visited:
+                    continue
+                visited.add(descendant)
+                descendant_template = diagram.nodes[descendant][0]
+                if descendant_template in ("action", "condition"):
+                    edges.append(self._stix_id(descendant_template, descendant))
+                else:
+                    stack.extend(children[descendant])
+
+        targets = {child for edges in imputed_edges.values() for child in edges}
+        start_refs = [stix_id for stix_id in imputed_edges if stix_id not in targets]
+        if not start_refs:
+            raise ValueError(
+                "Unable to compute start refs -- does the flow contain a cycle?"
+            )
+        return start_refs
+
+    # SDOs and SROs
+
+    @staticmethod
+    def _stix_type(template):
+        return TEMPLATE_TYPES.get(template, template).replace("_", "-")
+
+    def _stix_id(self, template, instance):
+        return f"{self._stix_type(template)}--{instance}"
+
+    def _create_sdo(self, template, instance=None):
+        if instance is None:
+            instance = str(uuid.uuid4())
+        stix_type = self._stix_type(template)
+        sdo = {
+            "type": stix_type,
+            "id": f"{stix_type}--{instance}",
+            "spec_version": "2.1",
+            "created": self.now,
+            "modified": self.now,
+        }
+        if stix_type in ATTACK_FLOW_SDOS:
+            sdo["extensions"] = {
+                f"extension-definition--{EXTENSION_ID}": {"extension_type": "new-sdo"}
+            }
+        return sdo
+
+    def _create_sro(self, parent, child, relationship_type="related-to"):
+        return {
+            "type": "relationship",
+            "id": f"relationship--{uuid.uuid4()}",
+            "spec_version": "2.1",
+            "created": self.now,
+            "modified": self.now,
+            "relationship_type": relationship_type,
+            "source_ref": parent["id"],
+            "target_ref": child["id"],
+        }
+
+
+def _to_js_key(value):
+    """Object keys in JavaScript are strings, so a missing hash type becomes "null"."""
+    return "null" if value is None else value
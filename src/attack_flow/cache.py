@@ -0,0 +1,405 @@
+"""
+Optional on-disk caches of parsed Attack Flow bundles and validation results.
+
+Parsing a bundle with the STIX library is slow because every object is validated as it
+is constructed. When the same files are loaded over and over (e.g. a build that runs
+``af graphviz``, ``af mermaid``, and ``af validate`` on each file in the corpus) the
+parsed bundle can be cached and reloaded without parsing it again.
+
+Entries are keyed on a hash of the file's contents along with the versions of this
+library, the STIX library, and the Attack Flow schema, so editing a file or upgrading
+either library never returns a stale bundle. Entries are pickled, so the cache
+directory must only be writable by trusted users.
+
+Validation results are cached separately (and by default) so that ``af validate`` can
+skip files that it has already validated. They are keyed on the file's contents, all
+of the schema files, and the code that validates them, and they are stored as JSON.
+"""
+
+import datetime as dt
+import functools
+import hashlib
+import importlib.metadata
+import io
+import json
+import logging
+import os
+from pathlib import Path
+import pickle
+import tempfile
+
+# The STIX library is imported when it is needed, so that ``af validate`` can load
+# cached results without it.
+
+CACHE_DIR_ENV = "AF_CACHE_DIR"
+CACHE_FORMAT_VERSION = 1
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+ENTRY_SUFFIX = ".pickle"
+RESULT_SUFFIX = ".json"
+RESULTS_DIR_NAME = "results"
+PACKAGE_DIR = Path(__file__).resolve().parent
+SCHEMA_DIR = PACKAGE_DIR.parents[1] / "stix"
+SCHEMA_PATH = SCHEMA_DIR / "attack-flow-schema-2.0.0.json"
+
+logger = logging.getLogger(__name__)
+
+
+class _DirectoryCache:
+    """
+    A directory of entries with least-recently-used eviction.
+
+    Each entry is one file. Reading an entry updates its modification time, and when
+    the total size of the directory exceeds ``max_size`` the entries with the oldest
+    modification times are deleted. Entries are written atomically, so several
+    processes can share one cache directory.
+
+    Subclasses define how entries are serialized.
+
+    :ivar int hits: the number of lookups served from the cache
+    :ivar int misses: the number of lookups that were not in the cache
+    """
+
+    entry_suffix = None
+
+    def __init__(self, cache_dir, max_size=DEFAULT_MAX_SIZE):
+        """
+        Constructor.
+
+        :param pathlib.Path cache_dir: created if it does not exist
+        :param int max_size: the maximum total size of the cache in bytes
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    def _dump_entry(self, value):
+        """Serialize a value, or raise ``ValueError`` if it cannot be cached."""
+        raise NotImplementedError()
+
+    def _load_entry(self, entry_file):
+        """Deserialize a value from a binary file."""
+        raise NotImplementedError()
+
+    def _get_entry_path(self, key):
+        return self.cache_dir / (key + self.entry_suffix)
+
+    def _read_entry(self, entry_path):
+        try:
+            with entry_path.open("rb") as entry_file:
+                value = self._load_entry(entry_file)
+            os.utime(entry_path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Discarding unreadable cache entry %s: %s", entry_path, e)
+            entry_path.unlink(missing_ok=True)
+            return None
+        return value
+
+    def _write_entry(self, entry_path, value):
+        try:
+            data = self._dump_entry(value)
+        except ValueError as e:
+            logger.debug("Not caching %s: %s", entry_path.name, e)
+            return
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as temp_file:
+                temp_file.write(data)
+            os.replace(temp_path, entry_path)
+        except OSError as e:
+            logger.warning("Cannot write cache entry %s: %s", entry_path, e)
+            return
+        self.evict()
+
+    def evict(self):
+        """Delete the least recently used entries until the cache fits in max_size."""
+        entries = list()
+        total_size = 0
+        for entry_path in self.cache_dir.glob("*" + self.entry_suffix):
+            try:
+                stat = entry_path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry_path))
+            total_size += stat.st_size
+
+        entries.sort()
+        for _, size, entry_path in entries:
+            if total_size <= self.max_size:
+                break
+            entry_path.unlink(missing_ok=True)
+            total_size -= size
+
+
+class BundleCache(_DirectoryCache):
+    """
+    A directory of parsed bundles.
+
+    :ivar int hits: the number of loads served from the cache
+    :ivar int misses: the number of loads that had to parse the file
+    """
+
+    entry_suffix = ENTRY_SUFFIX
+
+    def load(self, path, parse):
+        """
+        Load a bundle from the cache, or parse it and store the result.
+
+        :param pathlib.Path path: the bundle to load
+        :param parse: a function that takes the file's contents (``bytes``) and returns
+            a parsed bundle
+        :returns: the parsed bundle
+        """
+        return self.get(path.read_bytes(), parse)
+
+    def get(self, data, parse):
+        """
+        Load a bundle from the cache, or parse a file's contents and store the result.
+
+        This is useful if the caller has already read the file.
+
+        :param bytes data: the contents of the bundle file
+        :param parse: a function that takes ``data`` and returns a parsed bundle
+        :returns: the parsed bundle
+        """
+        entry_path = self._get_entry_path(get_cache_key(data))
+        if (bundle := self._read_entry(entry_path)) is not None:
+            self.hits += 1
+            return bundle
+
+        self.misses += 1
+        bundle = parse(data)
+        self._write_entry(entry_path, bundle)
+        return bundle
+
+    def _dump_entry(self, bundle):
+        buffer = io.BytesIO()
+        try:
+            _BundlePickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(bundle)
+        except pickle.PicklingError as e:
+            raise ValueError(str(e)) from e
+        return buffer.getvalue()
+
+    def _load_entry(self, entry_file):
+        return pickle.load(entry_file)
+
+
+class ResultCache(_DirectoryCache):
+    """
+    A directory of validation results.
+
+    Looking up and storing a result are separate steps so that the files that miss the
+    cache can be validated elsewhere, e.g. in a process pool.
+
+    :ivar int hits: the number of results served from the cache
+    :ivar int misses: the number of results that were not in the cache
+    """
+
+    entry_suffix = RESULT_SUFFIX
+
+    def get(self, key):
+        """
+        Look up a validation result.
+
+        :param str key: from ``get_result_key()``
+        :returns: a ``ValidationResult``, or ``None`` if it is not in the cache
+        """
+        if (result := self._read_entry(self._get_entry_path(key))) is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return result
+
+    def put(self, key, result):
+        """
+        Store a validation result.
+
+        :param str key: from ``get_result_key()``
+        :param attack_flow.results.ValidationResult result:
+        """
+        self._write_entry(self._get_entry_path(key), result)
+
+    def _dump_entry(self, result):
+        return json.dumps(result.to_json()).encode()
+
+    def _load_entry(self, entry_file):
+        from .results import ValidationResult
+
+        return ValidationResult.from_json(json.load(entry_file))
+
+
+def get_cache(cache_dir=None):
+    """
+    Return a cache for the given directory, or for the directory named by the
+    ``AF_CACHE_DIR`` environment variable.
+
+    :param str cache_dir:
+    :returns: a ``BundleCache``, or ``None`` if caching is not enabled
+    """
+    if cache_dir := cache_dir or os.environ.get(CACHE_DIR_ENV):
+        return BundleCache(cache_dir)
+    return None
+
+
+def get_result_cache(cache_dir=None):
+    """
+    Return a validation result cache inside the given directory, the directory named by
+    the ``AF_CACHE_DIR`` environment variable, or the user's cache directory.
+
+    :param str cache_dir:
+    :rtype: ResultCache
+    """
+    cache_dir = cache_dir or os.environ.get(CACHE_DIR_ENV) or get_user_cache_dir()
+    return ResultCache(Path(cache_dir) / RESULTS_DIR_NAME)
+
+
+def get_user_cache_dir():
+    """
+    Return the default cache directory, ``$XDG_CACHE_HOME/attack-flow`` or
+    ``~/.cache/attack-flow``.
+
+    :rtype: pathlib.Path
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "attack-flow"
+
+
+def get_cache_key(data):
+    """
+    Compute the cache key for a file's contents.
+
+    :param bytes data:
+    :rtype: str
+    """
+    digest = hashlib.sha256(_get_version_tag().encode())
+    digest.update(data)
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_version_tag():
+    """Identify everything besides the file contents that affects a parsed bundle."""
+    try:
+        version = importlib.metadata.version("attack-flow")
+    except importlib.metadata.PackageNotFoundError:
+        version = "unknown"
+    try:
+        schema_hash = hashlib.sha256(SCHEMA_PATH.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        schema_hash = "unknown"
+    return (
+        f"format={CACHE_FORMAT_VERSION};attack-flow={version};"
+        f"stix2={importlib.metadata.version('stix2')};schema={schema_hash};"
+    )
+
+
+def get_result_key(data, options=None):
+    """
+    Compute the validation result cache key for a file's contents.
+
+    :param bytes data:
+    :param dict options: the keyword arguments passed to ``validate_doc()``, which
+        change what is reported
+    :rtype: str
+    """
+    digest = hashlib.sha256(_get_result_version_tag().encode())
+    if options:
+        digest.update(repr(sorted(options.items())).encode())
+    digest.update(data)
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_result_version_tag():
+    """Identify everything besides the file contents that affects validation."""
+    # Hash the source code rather than the version so that results are not reused
+    # after editing the validation code in a development install.
+    code_digest = hashlib.sha256()
+    for path in sorted(PACKAGE_DIR.glob("*.py")):
+        code_digest.update(path.name.encode())
+        code_digest.update(path.read_bytes())
+    schema_digest = hashlib.sha256()
+    for path in sorted(SCHEMA_DIR.glob("**/*.json")):
+        schema_digest.update(path.relative_to(SCHEMA_DIR).as_posix().encode())
+        schema_digest.update(path.read_bytes())
+    versions = ";".join(
+        f"{name}={importlib.metadata.version(name)}"
+        for name in ("jsonschema", "networkx", "stix2")
+    )
+    return (
+        f"format={CACHE_FORMAT_VERSION};code={code_digest.hexdigest()};"
+        f"schemas={schema_digest.hexdigest()};{versions};"
+    )
+
+
+class _BundlePickler(pickle.Pickler):
+    """
+    Pickle STIX objects by their internal state so that they can be restored without
+    being validated again.
+
+    STIX objects are immutable and custom object classes are created inside a
+    decorator, so the default pickle protocol cannot handle them. STIX timestamps
+    carry a precision that the default protocol would drop.
+    """
+
+    def __init__(self, *args, **kwargs):
+        import stix2.base
+        import stix2.registry
+        import stix2.utils
+
+        super().__init__(*args, **kwargs)
+        self._stix_base = stix2.base._STIXBase
+        self._stix_datetime = stix2.utils.STIXdatetime
+        self._class_for_type = stix2.registry.class_for_type
+
+    def reducer_override(self, obj):
+        if isinstance(obj, self._stix_base):
+            cls = type(obj)
+            if "<locals>" in cls.__qualname__:
+                # Look up custom classes by type when restoring.
+                spec_version = obj.get("spec_version", "2.1")
+                registered = self._class_for_type(obj._type, spec_version, "objects")
+                if registered is not cls:
+                    raise pickle.PicklingError(f"Unregistered STIX class: {cls}")
+                cls = (obj._type, spec_version)
+            return _restore_stix_object, (cls, obj.__dict__)
+        elif isinstance(obj, self._stix_datetime):
+            value = dt.datetime(
+                obj.year,
+                obj.month,
+                obj.day,
+                obj.hour,
+                obj.minute,
+                obj.second,
+                obj.microsecond,
+                obj.tzinfo,
+            )
+            return _restore_stix_datetime, (
+                value,
+                obj.precision,
+                obj.precision_constraint,
+            )
+        return NotImplemented
+
+
+def _restore_stix_object(cls, state):
+    import stix2.registry
+
+    if isinstance(cls, tuple):
+        stix_type, spec_version = cls
+        cls = stix2.registry.class_for_type(stix_type, spec_version, "objects")
+    obj = cls.__new__(cls)
+    obj.__dict__.update(state)
+    return obj
+
+
+def _restore_stix_datetime(value, precision, precision_constraint):
+    import stix2.utils
+
+    return stix2.utils.STIXdatetime(
+        value, precision=precision, precision_constraint=precision_constraint
+    )
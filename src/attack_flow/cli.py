@@ -3,19 +3,18 @@ Attack Flow command line tool for validation and visualization.
 """
 
 import argparse
+import collections
+import contextlib
+import functools
+import itertools
 from pathlib import Path
 import json
 import logging
 import sys
 
-import importlib.metadata
-
-import attack_flow.docs
-import attack_flow.graphviz
-import attack_flow.matrix
-import attack_flow.mermaid
-import attack_flow.model
-import attack_flow.schema
+# Each subcommand imports the modules that it needs when it runs. Importing them all
+# here would load the STIX library, jsonschema, NetworkX, etc. on every invocation of
+# `af`, even for commands that do not use them.
 
 
 def main():
@@ -40,6 +39,8 @@ def version(args):
     :param args: argparse arguments
     :returns: exit code
     """
+    import importlib.metadata
+
     version = importlib.metadata.distribution("attack-flow").version
     print(f"Attack Flow version {version}")
     return 0
@@ -52,37 +53,406 @@ def validate(args):
     :param args: argparse arguments
     :returns: exit code
     """
-    exit_code = 0
-    suggest_verbose = False
+    import attack_flow.cache
 
-    for flow_path in args.attack_flow_docs:
-        sys.stdout.write(f"{flow_path}: ")
-        sys.stdout.flush()
-        result = attack_flow.schema.validate_doc(Path(flow_path))
-        if result.success:
-            status = "OK" + (" (with warnings)" if result.messages else "")
+    if args.jobs < 1:
+        raise RuntimeError("--jobs must be at least 1")
+    if args.profile_output and not args.profile:
+        raise RuntimeError("--profile-output requires --profile")
+    if args.max_errors is not None and args.max_errors < 1:
+        raise RuntimeError("--max-errors must be at least 1")
+    if args.time_budget is not None and args.time_budget <= 0:
+        raise RuntimeError("--time-budget must be greater than 0")
+    if args.fail_fast and args.max_errors is not None:
+        raise RuntimeError("Pass either --fail-fast or --max-errors, not both")
+
+    if args.stream and (args.ndjson is not None or args.watch):
+        raise RuntimeError("--stream cannot be used with --ndjson or --watch")
+    if args.ndjson is not None:
+        if args.watch or args.attack_flow_docs:
+            raise RuntimeError(
+                "--ndjson cannot be used with --watch or a list of files"
+            )
+        elif args.profile or args.jobs > 1:
+            raise RuntimeError("--ndjson cannot be used with --profile or --jobs")
+    elif args.watch and args.attack_flow_docs:
+        raise RuntimeError("Pass either --watch DIR or a list of files, not both")
+    elif args.watch and args.profile:
+        raise RuntimeError("--profile cannot be used with --watch")
+    elif not args.watch and not args.attack_flow_docs:
+        raise RuntimeError("No files to validate")
+
+    paths = [Path(flow_path) for flow_path in args.attack_flow_docs]
+    if args.no_cache or args.stream:
+        # The caches are keyed on each file's contents, which a stream never holds in
+        # memory at once.
+        cache = result_cache = None
+    else:
+        cache = attack_flow.cache.get_cache(args.cache_dir)
+        result_cache = attack_flow.cache.get_result_cache(args.cache_dir)
+
+    options = dict()
+    if args.fail_fast or args.max_errors is not None:
+        options["max_errors"] = 1 if args.fail_fast else args.max_errors
+    if args.structural_only:
+        options["structural_only"] = True
+    if args.stream:
+        options["stream"] = True
+    if args.time_budget is not None:
+        # Whether a file fits in the time budget depends on the machine and its load,
+        # so those results are not cached.
+        options["time_budget"] = args.time_budget
+        result_cache = None
+    if args.profile:
+        # Profile every file rather than reusing its earlier result.
+        result_cache = None
+
+    if args.watch:
+        return _watch(Path(args.watch), cache, args.interval, args.verbose, options)
+    elif args.ndjson == "-":
+        return _validate_ndjson(sys.stdin.buffer, sys.stdout, options)
+    elif args.ndjson is not None:
+        try:
+            with open(args.ndjson, "rb") as ndjson_file:
+                return _validate_ndjson(ndjson_file, sys.stdout, options)
+        except FileNotFoundError as e:
+            raise RuntimeError(f"Unable to open {args.ndjson}: {e.strerror}")
+
+    # Look up every file in the result cache first so that only the misses are sent to
+    # the worker processes.
+    cached_results = dict()
+    result_keys = dict()
+    if result_cache is not None:
+        for flow_path in paths:
+            try:
+                key = attack_flow.cache.get_result_key(flow_path.read_bytes(), options)
+            except OSError:
+                continue
+            if (result := result_cache.get(key)) is not None:
+                cached_results[flow_path] = result
+            else:
+                result_keys[flow_path] = key
+    uncached_paths = [p for p in paths if p not in cached_results]
+    if uncached_paths:
+        import attack_flow.schema
+    if args.profile:
+        import attack_flow.results
+
+        profiles = (attack_flow.results.ValidationProfile() for _ in uncached_paths)
+    else:
+        profiles = itertools.repeat(None)
+
+    with contextlib.ExitStack() as stack:
+        if args.jobs > 1 and len(uncached_paths) > 1:
+            import concurrent.futures
+
+            executor = stack.enter_context(
+                concurrent.futures.ProcessPoolExecutor(
+                    max_workers=min(args.jobs, len(uncached_paths)),
+                    initializer=attack_flow.schema.warm_validator_cache,
+                )
+            )
+            # Results are yielded in the same order as the paths. Each worker process
+            # has its own object memo.
+            new_results = executor.map(
+                functools.partial(attack_flow.schema.validate_doc_with_memo, **options),
+                uncached_paths,
+                itertools.repeat(cache),
+                profiles,
+            )
         else:
-            exit_code = 1
-            status = "FAIL"
+            new_results = (
+                attack_flow.schema.validate_doc_with_memo(p, cache, profile, **options)
+                for p, profile in zip(uncached_paths, profiles)
+            )
+        memo_counts = collections.Counter()
+        file_profiles = dict()
+        results = _merge_results(
+            paths,
+            cached_results,
+            new_results,
+            result_cache,
+            result_keys,
+            memo_counts,
+            file_profiles,
+        )
+        exit_code, suggest_verbose = _print_results(paths, results, args.verbose)
 
-        print(status)
-        for message in result.messages:
-            print(f" - {message}")
-            if message.exc:
-                if args.verbose:
-                    print(f"vvvvvvvvvv EXCEPTION vvvvvvvvvv")
-                    print(message.exc)
-                    print(f"^^^^^^^^^^ EXCEPTION ^^^^^^^^^^")
-                else:
-                    suggest_verbose = True
     if not args.verbose and suggest_verbose:
         print(
             "\nSome errors have additional information. "
             "Add --verbose for more details."
         )
+    if result_cache is not None:
+        sys.stderr.write(
+            f"Validation cache: {result_cache.hits} hits, "
+            f"{result_cache.misses} misses ({result_cache.cache_dir})\n"
+        )
+    if total := memo_counts["hits"] + memo_counts["misses"]:
+        sys.stderr.write(
+            f"Object memo: {memo_counts['hits']} of {total} object validations "
+            f"served from the memo\n"
+        )
+    if args.profile:
+        summary = json.dumps(_summarize_profiles(file_profiles), indent=2)
+        if args.profile_output:
+            Path(args.profile_output).write_text(summary + "\n")
+        else:
+            sys.stderr.write(summary + "\n")
     return exit_code
 
 
+def _validate_ndjson(lines, output, options):
+    """
+    Validate a stream of bundles with one bundle per line, and write one line of JSON
+    with the result for each bundle as soon as it is validated.
+
+    Only one bundle is held in memory at a time. A bundle that cannot be parsed or
+    validated gets a failed result, and the remaining bundles are still validated.
+
+    :param lines: an iterable of lines of JSON, e.g. a file opened in binary mode
+    :param output: a text file to write the results to
+    :param dict options: keyword arguments for ``validate_doc()``
+    :returns: exit code
+    """
+    import attack_flow.schema
+
+    memo = attack_flow.schema.get_object_memo()
+    hits, misses = memo.hits, memo.misses
+    exit_code = 0
+    for line_number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            flow_json = json.loads(line)
+            if not isinstance(flow_json, dict):
+                raise ValueError("Expected a JSON object")
+        except ValueError as e:
+            result = attack_flow.schema.ValidationResult()
+            result.add_error(f"Unable to parse JSON: {e}")
+            flow_json = dict()
+        else:
+            try:
+                result = attack_flow.schema.validate_json(
+                    flow_json, memo.check_object, **options
+                )
+            except Exception as e:
+                # Malformed bundles can make the validator fail outright (e.g. an
+                # object with no type, or a type that the STIX library cannot parse).
+                # Report it as this bundle's result and go on to the next one.
+                result = attack_flow.schema.ValidationResult()
+                result.add_exc(f"Unable to validate this document: {e}", e)
+        if not result.success:
+            exit_code = 1
+        result_json = {
+            "line": line_number,
+            "id": flow_json.get("id"),
+            "success": result.success,
+            "strict_success": result.strict_success,
+            **result.to_json(),
+        }
+        output.write(json.dumps(result_json) + "\n")
+        output.flush()
+
+    if total := memo.hits + memo.misses - hits - misses:
+        sys.stderr.write(
+            f"Object memo: {memo.hits - hits} of {total} object validations "
+            f"served from the memo\n"
+        )
+    return exit_code
+
+
+def _merge_results(
+    paths,
+    cached_results,
+    new_results,
+    result_cache,
+    result_keys,
+    memo_counts,
+    file_profiles,
+):
+    """
+    Yield a validation result for each path, either from the cache or from
+    ``new_results``, and store the new results in the cache.
+
+    :param list[Path] paths:
+    :param dict cached_results: a map of paths to cached results
+    :param new_results: an iterator of ``validate_doc_with_memo()`` return values for
+        the paths not in ``cached_results``
+    :param attack_flow.cache.ResultCache result_cache:
+    :param dict result_keys: a map of paths to the keys to store their results under
+    :param collections.Counter memo_counts: updated with the object memo's hits and
+        misses
+    :param dict file_profiles: updated with a map of paths to their profiles, if the
+        files were profiled
+    """
+    for flow_path in paths:
+        if (result := cached_results.get(flow_path)) is None:
+            result, hits, misses, profile = next(new_results)
+            memo_counts.update(hits=hits, misses=misses)
+            if profile is not None:
+                file_profiles[flow_path] = profile
+            if flow_path in result_keys:
+                result_cache.put(result_keys[flow_path], result)
+        yield result
+
+
+def serve(args):
+    """
+    Validate Attack Flow JSON documents that are sent over HTTP.
+
+    :param args: argparse arguments
+    :returns: exit code
+    """
+    import signal
+
+    import attack_flow.server
+
+    if args.jobs < 1:
+        raise RuntimeError("--jobs must be at least 1")
+    try:
+        server = attack_flow.server.make_server(
+            args.host, args.port, args.unix_socket, args.jobs
+        )
+    except OSError as e:
+        raise RuntimeError(f"Unable to start the server: {e}")
+    print(f"Serving on {server.url}. Press Ctrl+C to stop.", flush=True)
+    # Stop cleanly when a service manager stops the server.
+    sigterm_handler = signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        signal.signal(signal.SIGTERM, sigterm_handler)
+        server.server_close()
+    return 0
+
+
+def _summarize_profiles(file_profiles):
+    """
+    Combine the profiles of each file into a JSON-serializable summary.
+
+    :param dict file_profiles: a map of paths to ``ValidationProfile`` objects
+    :rtype: dict
+    """
+    files = list()
+    phases = dict()
+    counters = collections.Counter()
+    slowest = list()
+    max_slowest = 0
+    for flow_path, profile in file_profiles.items():
+        profile_json = profile.to_json()
+        files.append({"path": str(flow_path), **profile_json})
+        for name, seconds in profile.phases.items():
+            phases[name] = phases.get(name, 0.0) + seconds
+        counters.update(profile.counters)
+        slowest.extend(
+            {"path": str(flow_path), **obj} for obj in profile_json["slowest_objects"]
+        )
+        max_slowest = max(max_slowest, profile.max_slowest)
+    slowest.sort(key=lambda obj: obj["seconds"], reverse=True)
+    return {
+        "files": files,
+        "total": {
+            "phases": phases,
+            "total_seconds": sum(phases.values()),
+            "counters": dict(counters),
+            "slowest_objects": slowest[:max_slowest],
+        },
+    }
+
+
+def _print_results(paths, results, verbose):
+    """
+    Print validation results as they become available.
+
+    :param list[Path] paths:
+    :param results: an iterator of ``ValidationResult`` in the same order as ``paths``
+    :param bool verbose: print the details of each error
+    :returns: a tuple of the exit code and whether any error details were not printed
+    """
+    exit_code = 0
+    suggest_verbose = False
+    for flow_path in paths:
+        sys.stdout.write(f"{flow_path}: ")
+        sys.stdout.flush()
+        result = next(results)
+        if not result.success:
+            exit_code = 1
+        print(_get_status(result))
+        for message in result.messages:
+            suggest_verbose |= _print_message(" - ", message, verbose)
+    return exit_code, suggest_verbose
+
+
+def _get_status(result):
+    if result.success:
+        return "OK" + (" (with warnings)" if result.messages else "")
+    else:
+        return "FAIL"
+
+
+def _print_message(prefix, message, verbose):
+    """
+    Print a validation message.
+
+    :returns: whether the message has details that were not printed
+    """
+    print(f"{prefix}{message}")
+    if message.exc:
+        if verbose:
+            print(f"vvvvvvvvvv EXCEPTION vvvvvvvvvv")
+            print(message.exc)
+            print(f"^^^^^^^^^^ EXCEPTION ^^^^^^^^^^")
+        else:
+            return True
+    return False
+
+
+def _watch(flow_dir, cache, interval, verbose, options):
+    """
+    Validate the files in a directory, then poll for changes and print how the results
+    of each changed file differ from before, until interrupted.
+
+    :param Path flow_dir:
+    :param attack_flow.cache.BundleCache cache:
+    :param float interval: the number of seconds between polls
+    :param bool verbose: print the details of each new error
+    :param dict options: keyword arguments for ``validate_doc()``
+    :returns: exit code
+    """
+    import time
+
+    import attack_flow.watch
+
+    if not flow_dir.is_dir():
+        raise RuntimeError(f"Not a directory: {flow_dir}")
+    watcher = attack_flow.watch.FlowWatcher(flow_dir, cache, **options)
+    print(f"Watching {flow_dir} for changes. Press Ctrl+C to stop.")
+    try:
+        while True:
+            for flow_path, result, previous in watcher.poll():
+                if result is None:
+                    print(f"{flow_path}: deleted")
+                    continue
+                print(f"{flow_path}: {_get_status(result)}")
+                # Only print the messages that were added or removed.
+                before = {str(m) for m in previous.messages} if previous else set()
+                after = {str(m) for m in result.messages}
+                for message in result.messages:
+                    if str(message) not in before:
+                        _print_message(" + ", message, verbose)
+                for message in previous.messages if previous else ():
+                    if str(message) not in after:
+                        print(f" - {message}")
+            sys.stdout.flush()
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
 def graphviz(args):
     """
     Convert Attack Flow JSON file to GraphViz format.
@@ -90,16 +460,20 @@ def graphviz(args):
     :param args: argparse arguments
     :returns: exit code
     """
+    import attack_flow.cache
+    import attack_flow.graphviz
+    import attack_flow.model
+
     path = Path(args.attack_flow)
-    flow_bundle = attack_flow.model.load_attack_flow_bundle(path)
+    flow_bundle = attack_flow.model.load_attack_flow_bundle(
+        path, raw=args.raw, cache=attack_flow.cache.get_cache(args.cache_dir)
+    )
 
-    if (
-        flow_bundle.get("objects", "")
-        and attack_flow.model.get_flow_object(flow_bundle).scope == "attack-tree"
-    ):
-        converted = attack_flow.graphviz.convert_attack_tree(flow_bundle)
+    index = attack_flow.model.FlowIndex(flow_bundle)
+    if index.flow is not None and index.flow.get("scope") == "attack-tree":
+        converted = attack_flow.graphviz.convert_attack_tree(flow_bundle, index)
     else:
-        converted = attack_flow.graphviz.convert_attack_flow(flow_bundle)
+        converted = attack_flow.graphviz.convert_attack_flow(flow_bundle, index)
 
     with open(args.output, "w") as out:
         out.write(converted)
@@ -113,15 +487,19 @@ def mermaid(args):
     :param args: argparse arguments
     :returns: exit code
     """
+    import attack_flow.cache
+    import attack_flow.mermaid
+    import attack_flow.model
+
     path = Path(args.attack_flow)
-    flow_bundle = attack_flow.model.load_attack_flow_bundle(path)
-    if (
-        flow_bundle.get("objects", "")
-        and attack_flow.model.get_flow_object(flow_bundle).scope == "attack-tree"
-    ):
-        converted = attack_flow.mermaid.convert_attack_tree(flow_bundle)
+    flow_bundle = attack_flow.model.load_attack_flow_bundle(
+        path, raw=args.raw, cache=attack_flow.cache.get_cache(args.cache_dir)
+    )
+    index = attack_flow.model.FlowIndex(flow_bundle)
+    if index.flow is not None and index.flow.get("scope") == "attack-tree":
+        converted = attack_flow.mermaid.convert_attack_tree(flow_bundle, index)
     else:
-        converted = attack_flow.mermaid.convert_attack_flow(flow_bundle)
+        converted = attack_flow.mermaid.convert_attack_flow(flow_bundle, index)
 
     with open(args.output, "w") as out:
         out.write(converted)
@@ -135,8 +513,14 @@ def matrix(args):
     :param args: argparse arguments
     :returns: exit code
     """
+    import attack_flow.cache
+    import attack_flow.matrix
+    import attack_flow.model
+
     path = Path(args.attack_flow)
-    flow_bundle = attack_flow.model.load_attack_flow_bundle(path)
+    flow_bundle = attack_flow.model.load_attack_flow_bundle(
+        path, raw=args.raw, cache=attack_flow.cache.get_cache(args.cache_dir)
+    )
     debug = logging.getLogger().level == logging.DEBUG
     with open(args.matrix_svg) as matrix_file, open(args.output, "wb") as out_file:
         attack_flow.matrix.render(
@@ -148,6 +532,158 @@ def matrix(args):
     return 0
 
 
+def similar(args):
+    """
+    Add flows to a similarity index, or find the flows in the index that are most
+    similar to each flow.
+
+    :param args: argparse arguments
+    :returns: exit code
+    """
+    import attack_flow.similarity
+
+    index_path = Path(args.index)
+    if index_path.exists():
+        try:
+            index = attack_flow.similarity.SimilarityIndex.load(index_path)
+        except ValueError as e:
+            raise RuntimeError(str(e))
+    elif args.add:
+        index = attack_flow.similarity.SimilarityIndex()
+    else:
+        raise RuntimeError(f"{index_path} does not exist (create it with --add)")
+
+    for path in map(Path, args.attack_flows):
+        flow_id = str(path)
+        if args.add and flow_id in index:
+            continue
+        features = attack_flow.similarity.get_flow_features(_read_bundle(path))
+        if args.add:
+            index.add(flow_id, features)
+            continue
+        query = index.query_exact if args.exact else index.query
+        results = query(features, args.k, [flow_id])
+        print(flow_id)
+        for similar_id, similarity in results:
+            print(f"  {similarity:.3f}  {similar_id}")
+        if not results:
+            print("  No similar flows found.")
+
+    if args.add:
+        index.save(index_path)
+        print(f"Saved {len(index)} flows to {index_path}")
+    return 0
+
+
+def query(args):
+    """
+    Add flows to a technique index, or find the flows in the index that match a
+    query.
+
+    :param args: argparse arguments
+    :returns: exit code
+    """
+    import attack_flow.query
+
+    index_path = Path(args.index)
+    if index_path.exists():
+        try:
+            index = attack_flow.query.TechniqueIndex.load(index_path)
+        except ValueError as e:
+            raise RuntimeError(str(e))
+    elif args.add:
+        index = attack_flow.query.TechniqueIndex()
+    else:
+        raise RuntimeError(f"{index_path} does not exist (create it with --add)")
+
+    if args.add:
+        for path in map(Path, args.arguments):
+            flow_id = str(path)
+            if flow_id in index:
+                continue
+            index.add_flow(_read_bundle(path), flow_id=flow_id)
+        index.save(index_path)
+        print(f"Saved {len(index)} flows to {index_path}")
+        return 0
+
+    try:
+        matches = index.query(" ".join(args.arguments), limit=args.limit)
+    except ValueError as e:
+        raise RuntimeError(str(e))
+    for match in matches:
+        print(match.flow_id)
+        if args.verbose:
+            print(f"  {' -> '.join(match.action_ids)}")
+    return 0
+
+
+def _read_bundle(path):
+    """
+    Read a bundle to add to an index.
+
+    :param Path path:
+    :rtype: dict
+    :raises RuntimeError: if the file cannot be read or does not contain a bundle
+    """
+    try:
+        with path.open("rb") as f:
+            bundle = json.load(f)
+    except (OSError, ValueError) as e:
+        raise RuntimeError(f"Unable to read {path}: {e}")
+    if not isinstance(bundle, dict) or not isinstance(bundle.get("objects"), list):
+        raise RuntimeError(
+            f"Unable to read {path}: expected a bundle with an `objects` array"
+        )
+    # The indexes build each flow's graph without validating the flow, so check the
+    # properties that the graph uses.
+    for i, obj in enumerate(bundle["objects"]):
+        if not isinstance(obj, dict):
+            raise RuntimeError(f"Unable to read {path}: objects[{i}] is not an object")
+        if obj.get("type") == "relationship":
+            required = ("source_ref", "target_ref")
+        else:
+            required = ("type", "id")
+        for name in required:
+            if not isinstance(obj.get(name), str):
+                raise RuntimeError(
+                    f"Unable to read {path}: objects[{i}] needs a string `{name}`"
+                )
+        if not isinstance(obj.get("technique_id", ""), str):
+            raise RuntimeError(
+                f"Unable to read {path}: objects[{i}] has a `technique_id` that is "
+                f"not a string"
+            )
+    return bundle
+
+
+def export_stix(args):
+    """
+    Convert Attack Flow Builder files to STIX bundles.
+
+    :param args: argparse arguments
+    :returns: exit code
+    """
+    import attack_flow.afb
+
+    exit_code = 0
+    enums = attack_flow.afb.load_builder_enums()
+    for afb_path in map(Path, args.afb_files):
+        if afb_path.suffix != ".afb":
+            sys.stderr.write(
+                f"Skipping {afb_path}: invalid extension (should be .afb)\n"
+            )
+            continue
+        stix_path = afb_path.with_suffix(".json")
+        if args.verbose:
+            print(f"Exporting {afb_path} -> {stix_path}")
+        try:
+            attack_flow.afb.export_stix(afb_path, stix_path, enums)
+        except ValueError as e:
+            sys.stderr.write(f"Skipping {afb_path}: {e}\n")
+            exit_code = 1
+    return exit_code
+
+
 def doc_schema(args):
     """
     Generate schema documentation for Attack Flow.
@@ -155,6 +691,8 @@ def doc_schema(args):
     :param args: argparse arguments
     :returns: exit code
     """
+    import attack_flow.docs
+
     with open(args.schema_doc) as schema_file:
         schema_json = json.load(schema_file)
 
@@ -186,6 +724,8 @@ def doc_examples(args):
     :param args: argparse arguments
     :returns: exit code
     """
+    import attack_flow.docs
+
     corpus_path = Path(args.corpus_path)
     if not corpus_path.is_dir():
         raise RuntimeError("corpus_path must be a directory")
@@ -211,6 +751,12 @@ def _parse_args():
         metavar="LEVEL",
         choices=["debug", "info", "warning", "error", "critical"],
     )
+    parser.add_argument(
+        "--cache-dir",
+        help="Cache parsed flows and validation results in this directory to speed up "
+        "later commands that load the same files. (Default: $AF_CACHE_DIR, if set)",
+        metavar="DIR",
+    )
 
     # Version subcommand
     version_cmd = subparsers.add_parser(
@@ -227,7 +773,118 @@ def _parse_args():
         "--verbose", action="store_true", help="Display detailed validation errors."
     )
     validate_cmd.add_argument(
-        "attack_flow_docs", nargs="+", help="The Attack Flow document(s) to validate."
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Validate up to N files in parallel. (Default: 1)",
+    )
+    validate_cmd.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Validate every file again instead of reusing the results for unchanged "
+        "files, and do not use the cache of parsed flows.",
+    )
+    validate_cmd.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop validating each file at its first error. (Same as --max-errors 1)",
+    )
+    validate_cmd.add_argument(
+        "--max-errors",
+        type=int,
+        metavar="N",
+        help="Stop validating each file after N errors.",
+    )
+    validate_cmd.add_argument(
+        "--structural-only",
+        action="store_true",
+        help="Only check each file for the essential objects and against the JSON "
+        "schema. Skip the STIX parse, the graph checks (including dangling "
+        "references), and the best practices.",
+    )
+    validate_cmd.add_argument(
+        "--stream",
+        action="store_true",
+        help="Check each object as it is read instead of loading each file into "
+        "memory first, for bundles that are too large to load. Skips the STIX parse "
+        "and the caches.",
+    )
+    validate_cmd.add_argument(
+        "--time-budget",
+        type=float,
+        metavar="SECONDS",
+        help="Stop validating a file that takes longer than SECONDS and report it as "
+        "invalid. Checked between objects and between validation steps.",
+    )
+    validate_cmd.add_argument(
+        "--profile",
+        action="store_true",
+        help="Time each phase of validation and find the slowest objects in each "
+        "file, then write a JSON summary to stderr. Every file is validated again "
+        "rather than reusing cached results.",
+    )
+    validate_cmd.add_argument(
+        "--profile-output",
+        metavar="FILE",
+        help="Write the --profile summary to FILE instead of stderr.",
+    )
+    validate_cmd.add_argument(
+        "--ndjson",
+        metavar="FILE",
+        help="Validate a stream of bundles with one bundle per line, read from FILE "
+        "(or from stdin if FILE is -), and write one line of JSON with the result "
+        "for each bundle.",
+    )
+    validate_cmd.add_argument(
+        "--watch",
+        metavar="DIR",
+        help="Validate the .json files in DIR, then keep validating them as they "
+        "change and print only what changed in the results.",
+    )
+    validate_cmd.add_argument(
+        "--interval",
+        type=float,
+        default=1.0,
+        metavar="SECONDS",
+        help="How often to check for changes with --watch. (Default: 1)",
+    )
+    validate_cmd.add_argument(
+        "attack_flow_docs", nargs="*", help="The Attack Flow document(s) to validate."
+    )
+
+    # Serve subcommand
+    serve_cmd = subparsers.add_parser(
+        "serve",
+        help="Validate Attack Flow JSON documents that are sent over HTTP",
+        description="Keep the validators loaded and validate each document that is "
+        "sent to POST /validate. The response is the validation result as JSON.",
+    )
+    serve_cmd.set_defaults(command=serve)
+    serve_cmd.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="The address to listen on. (Default: 127.0.0.1)",
+    )
+    serve_cmd.add_argument(
+        "--port",
+        type=int,
+        default=8000,
+        help="The port to listen on, or 0 to pick a free port. (Default: 8000)",
+    )
+    serve_cmd.add_argument(
+        "--unix-socket",
+        metavar="PATH",
+        help="Listen on a Unix socket instead of a TCP port.",
+    )
+    serve_cmd.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Validate up to N documents in parallel in worker processes. (Default: 1)",
     )
 
     # GraphViz subcommand
@@ -235,6 +892,11 @@ def _parse_args():
         "graphviz", help="Convert JSON file to GraphViz format."
     )
     graphviz_cmd.set_defaults(command=graphviz)
+    graphviz_cmd.add_argument(
+        "--raw",
+        action="store_true",
+        help="Skip STIX parsing and validation for faster loading of trusted files.",
+    )
     graphviz_cmd.add_argument(
         "attack_flow", help="The Attack Flow document to convert."
     )
@@ -245,6 +907,11 @@ def _parse_args():
         "mermaid", help="Convert JSON file to Mermaid format."
     )
     mermaid_cmd.set_defaults(command=mermaid)
+    mermaid_cmd.add_argument(
+        "--raw",
+        action="store_true",
+        help="Skip STIX parsing and validation for faster loading of trusted files.",
+    )
     mermaid_cmd.add_argument("attack_flow", help="The Attack Flow document to convert.")
     mermaid_cmd.add_argument("output", help="The path to write the converted file to.")
 
@@ -253,12 +920,86 @@ def _parse_args():
         "matrix", help="Draw a flow on top of an ATT&CK matrix SVG."
     )
     matrix_cmd.set_defaults(command=matrix)
+    matrix_cmd.add_argument(
+        "--raw",
+        action="store_true",
+        help="Skip STIX parsing and validation for faster loading of trusted files.",
+    )
     matrix_cmd.add_argument(
         "matrix_svg", help="The ATT&CK matrix SVG to use as a base."
     )
     matrix_cmd.add_argument("attack_flow", help="The Attack Flow document to render.")
     matrix_cmd.add_argument("output", help="The path to write the output SVG to.")
 
+    # Similar subcommand
+    similar_cmd = subparsers.add_parser(
+        "similar", help="Find the most similar flows in a similarity index."
+    )
+    similar_cmd.set_defaults(command=similar)
+    similar_cmd.add_argument(
+        "--add",
+        action="store_true",
+        help="Add the flows to the index, creating it if needed, instead of querying.",
+    )
+    similar_cmd.add_argument(
+        "--exact",
+        action="store_true",
+        help="Compare each flow with every flow in the index, which is slower but also "
+        "finds flows that are not very similar.",
+    )
+    similar_cmd.add_argument(
+        "-k",
+        type=int,
+        default=5,
+        help="The number of similar flows to show for each flow. (Default: 5)",
+    )
+    similar_cmd.add_argument("index", help="The similarity index file.")
+    similar_cmd.add_argument(
+        "attack_flows", nargs="+", help="The Attack Flow document(s) to add or query."
+    )
+
+    # Query subcommand
+    query_cmd = subparsers.add_parser(
+        "query", help="Find the flows in a technique index that match a query."
+    )
+    query_cmd.set_defaults(command=query)
+    query_cmd.add_argument(
+        "--add",
+        action="store_true",
+        help="Add Attack Flow documents to the index, creating it if needed, instead "
+        "of querying.",
+    )
+    query_cmd.add_argument(
+        "--limit", type=int, help="Stop after this many matching flows."
+    )
+    query_cmd.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Display the actions that match the query in each flow.",
+    )
+    query_cmd.add_argument("index", help="The technique index file.")
+    query_cmd.add_argument(
+        "arguments",
+        nargs="+",
+        metavar="query",
+        help="A query in quotes, such as 'T1059 ->2 T1486', or with --add, the Attack "
+        "Flow document(s) to add.",
+    )
+
+    # Export STIX subcommand
+    export_stix_cmd = subparsers.add_parser(
+        "export-stix", help="Convert Attack Flow Builder (.afb) files to STIX bundles."
+    )
+    export_stix_cmd.set_defaults(command=export_stix)
+    export_stix_cmd.add_argument(
+        "--verbose", action="store_true", help="Display each file as it is exported."
+    )
+    export_stix_cmd.add_argument(
+        "afb_files",
+        nargs="+",
+        help="The .afb file(s) to convert. Each bundle is saved next to its .afb file.",
+    )
+
     # Schema subcommand
     doc_schema_cmd = subparsers.add_parser(
         "doc-schema", help="Generate schema documentation."
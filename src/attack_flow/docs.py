@@ -12,8 +12,6 @@ import string
 import textwrap
 from urllib.parse import quote, urljoin
 
-from attack_flow.model import get_flow_object, load_attack_flow_bundle
-
 
 NON_ALPHA = re.compile(r"[^a-zA-Z0-9]+")
 EXTRACT_ONE_TYPE_FROM_RE = re.compile(r"\^([-a-z]+)--")
@@ -279,11 +277,14 @@ def generate_example_flows(jsons, afds):
     :param set[Path] afd: set of .afd file paths
     :rtype: List[str]
     """
+    # Only this function needs the STIX library, so ``af doc-schema`` does not load it.
+    from attack_flow.model import FlowIndex, load_attack_flow_bundle
+
     reports = list()
     for path in jsons:
-        flow_bundle = load_attack_flow_bundle(path)
-        flow = get_flow_object(flow_bundle)
-        author = flow_bundle.get_obj(flow["created_by_ref"])[0]
+        index = FlowIndex(load_attack_flow_bundle(path))
+        flow = index.flow
+        author = index.by_id[flow["created_by_ref"]]
         author_name = author["name"]
         flow_name = flow["name"]
         flow_description = flow["description"]
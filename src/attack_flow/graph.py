@@ -2,40 +2,47 @@
 Convert Attack Flow to NeworkX format for standard graph analysis/manipulation.
 """
 
+from array import array
+from collections import Counter
+import json
+import sys
+
 import networkx as nx
 
+from .model import FlowIndex
+
 
-def bundle_to_networkx(flow_bundle):
+def bundle_to_networkx(flow_bundle, index=None):
     """
     Convert an Attack Flow in STIX bundle format to NetworkX format.
 
     :param stix2.Bundle flow_bundle:
+    :param FlowIndex index: an index of ``flow_bundle``, if the caller already has one
     :rtype: nx.Graph
     """
+    if index is None:
+        index = FlowIndex(flow_bundle)
     graph = nx.DiGraph()
 
     # Make a first pass to add nodes to the graph.
-    for obj in flow_bundle.get("objects", []):
+    for obj in index.objects:
         if obj["type"] == "relationship":
             continue
         else:
             graph.add_node(obj["id"], **obj)
 
     # Make a second pass to add edges to the graph.
-    for obj in flow_bundle.get("objects", []):
+    for obj in index.objects:
         if obj["type"] == "relationship":
             properties = dict(obj.items())
             del properties["source_ref"]
             del properties["target_ref"]
-            graph.add_edge(obj.source_ref, obj.target_ref, **properties)
+            graph.add_edge(obj["source_ref"], obj["target_ref"], **properties)
         else:
-            for property_name, target_ref in obj.items():
-                if property_name.endswith("_ref"):
-                    graph.add_edge(obj.id, target_ref, type=property_name[:-4])
-                elif property_name.endswith("_refs"):
-                    target_refs = target_ref
-                    for target_ref in target_refs:
-                        graph.add_edge(obj["id"], target_ref, type=property_name[:-5])
+            for property_name, target_ref in index.refs[obj["id"]]:
+                graph.add_edge(
+                    obj["id"], target_ref, type=property_name.rsplit("_", 1)[0]
+                )
 
     # Remove extension objects and creators if they are not attached to other nodes.
     ext_nodes = [id for id in graph.nodes() if id.startswith("extension-definition--")]
@@ -60,16 +67,612 @@ def induce_action_graph(full_graph):
     indirectly via other nodes such as operators and conditions. This function computes
     the induced graph consisting of only action nodes.
 
-    :param nx.Graph full_graph:
-    :rtype: nx.Graph
+    An action has an edge to another action if there is a path between them that only
+    goes through other types of nodes. These edges have ``type="effect"``. An edge
+    between two actions in ``full_graph`` keeps its attributes, but if there is also a
+    path between those actions through other nodes, its ``type`` is set to ``"effect"``.
+
+    :param nx.DiGraph full_graph:
+    :rtype: nx.DiGraph
     """
-    graph = full_graph.copy()
-    remove_nodes = [id for id in graph.nodes() if not id.startswith("attack-action")]
+    graph = full_graph.__class__()
+    graph.graph.update(full_graph.graph)
+    actions = [node for node in full_graph if node.startswith("attack-action")]
+    graph.add_nodes_from((node, full_graph.nodes[node]) for node in actions)
 
-    for node in remove_nodes:
-        for source, _ in graph.in_edges(node):
-            for _, target in graph.out_edges(node):
-                graph.add_edge(source, target, type="effect")
-        graph.remove_node(node)
+    successors = full_graph.succ
+    is_action = set(actions)
+    reachable = _get_reachable_actions(successors, actions, is_action)
+    graph.add_edges_from(
+        (node, successor, data)
+        for node in actions
+        for successor, data in successors[node].items()
+        if successor in is_action
+    )
+    graph.add_edges_from(
+        (node, target, {"type": "effect"})
+        for node in actions
+        for successor in successors[node]
+        if successor not in is_action
+        for target in reachable[successor]
+    )
 
     return graph
+
+
+def _get_reachable_actions(successors, actions, is_action):
+    """
+    Find the actions that can be reached from each non-action node that an action
+    points to, through paths that do not go through other actions.
+
+    Nodes in a cycle reach the same actions, so Tarjan's algorithm finds the strongly
+    connected components of the non-action nodes. Each component's actions are found
+    once, from the components it points to, which were finished before it. A component
+    that only leads to one other component shares that component's actions instead of
+    copying them.
+
+    :param successors: the graph's adjacency, e.g. ``nx.DiGraph.succ``
+    :param list actions: the action nodes
+    :param set is_action: the action nodes, for fast lookups
+    :returns: node ID -> dict of action IDs (used as an ordered set)
+    :rtype: dict
+    """
+    reachable = dict()
+    # Tarjan's algorithm, without recursion so that long chains do not overflow the
+    # stack.
+    discovered = dict()
+    low = dict()
+    stack = list()
+    on_stack = set()
+
+    def discover(node):
+        discovered[node] = low[node] = len(discovered)
+        stack.append(node)
+        on_stack.add(node)
+        return node, iter(successors[node])
+
+    for action in actions:
+        for root in successors[action]:
+            if root in is_action or root in discovered:
+                continue
+            work = [discover(root)]
+            while work:
+                node, children = work[-1]
+                for child in children:
+                    if child in is_action:
+                        continue
+                    elif child not in discovered:
+                        work.append(discover(child))
+                        break
+                    elif child in on_stack:
+                        low[node] = min(low[node], discovered[child])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[node])
+                    if low[node] == discovered[node]:
+                        component = list()
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        component_actions = _merge_reachable(
+                            successors, is_action, reachable, component[::-1]
+                        )
+                        for member in component:
+                            reachable[member] = component_actions
+
+    return reachable
+
+
+def _merge_reachable(successors, is_action, reachable, component):
+    """Return the actions that a strongly connected component of non-actions reaches."""
+    members = set(component)
+    actions = dict()
+    children = dict()
+    for member in component:
+        for child in successors[member]:
+            if child in is_action:
+                actions[child] = None
+            elif child not in members:
+                children.setdefault(id(reachable[child]), reachable[child])
+    if not actions and len(children) == 1:
+        return next(iter(children.values()))
+    for child_actions in children.values():
+        actions.update(child_actions)
+    return actions
+
+
+class CompactGraph:
+    """
+    The topology of an Attack Flow, stored in arrays instead of NetworkX dicts.
+
+    The graph has the same nodes and edges as :func:`bundle_to_networkx`, in the same
+    order, but it only stores each node's type and technique ID and each edge's type,
+    rather than copying every property. Node ``i`` has the ID ``ids[i]``, and its
+    successors are ``targets[offsets[i]:offsets[i + 1]]`` in compressed sparse row
+    (CSR) format. The type of that edge ``e`` is ``edge_type_names[edge_types[e]]``.
+
+    Use :func:`bundle_to_compact` to build one.
+
+    :ivar list ids: node number -> node ID
+    :ivar dict index: node ID -> node number
+    :ivar array.array node_types: node number -> position in ``type_names``
+    :ivar list type_names: the distinct node types
+    :ivar array.array technique_ids: node number -> position in
+        ``technique_id_names``, or -1 if the node does not have a technique ID
+    :ivar list technique_id_names: the distinct technique IDs
+    :ivar array.array offsets: node number -> position of its first edge in
+        ``targets``, with one more item for the end of the last node's edges
+    :ivar array.array targets: edge number -> target node number
+    :ivar array.array edge_types: edge number -> position in ``edge_type_names``
+    :ivar list edge_type_names: the distinct edge types
+    """
+
+    def __init__(self, ids, types, technique_ids, edges, objects=None):
+        """
+        Constructor.
+
+        :param list[str] ids: the node IDs
+        :param list[str] types: the type of each node
+        :param list[str] technique_ids: the technique ID of each node, or ``None``
+        :param dict edges: ``(source number, target number)`` -> edge type, in order
+        :param list objects: the object for each node, or ``None`` if the node is only
+            referenced, to look up with :meth:`get_object`
+        """
+        self.ids = ids
+        self.index = {node_id: i for i, node_id in enumerate(ids)}
+        self.node_types, self.type_names = _encode(types, "H")
+        self.technique_ids, self.technique_id_names = _encode(technique_ids, "i")
+        self._objects = objects
+        self._reverse = None
+
+        # Sort the edges by source with a counting sort, which keeps each node's edges
+        # in the order they were added.
+        self.offsets = array("l", bytes(array("l").itemsize * (len(ids) + 1)))
+        for source, _ in edges:
+            self.offsets[source + 1] += 1
+        for i in range(len(ids)):
+            self.offsets[i + 1] += self.offsets[i]
+        next_edge = self.offsets[:-1]
+        self.targets = array("l", bytes(array("l").itemsize * len(edges)))
+        edge_types = [None] * len(edges)
+        for (source, target), edge_type in edges.items():
+            self.targets[next_edge[source]] = target
+            edge_types[next_edge[source]] = edge_type
+            next_edge[source] += 1
+        self.edge_types, self.edge_type_names = _encode(edge_types, "H")
+
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def num_edges(self):
+        return len(self.targets)
+
+    def successors(self, node):
+        """
+        Return the node numbers that ``node`` has edges to.
+
+        :param int node:
+        :rtype: array.array
+        """
+        return self.targets[self.offsets[node] : self.offsets[node + 1]]
+
+    def predecessors(self, node):
+        """
+        Return the node numbers that have edges to ``node``, in node order.
+
+        The reverse edges are built on the first call.
+
+        :param int node:
+        :rtype: array.array
+        """
+        if self._reverse is None:
+            self._reverse = self._build_reverse()
+        offsets, sources = self._reverse
+        return sources[offsets[node] : offsets[node + 1]]
+
+    def _build_reverse(self):
+        offsets = array("l", bytes(array("l").itemsize * (len(self.ids) + 1)))
+        for target in self.targets:
+            offsets[target + 1] += 1
+        for i in range(len(self.ids)):
+            offsets[i + 1] += offsets[i]
+        next_edge = offsets[:-1]
+        sources = array("l", bytes(array("l").itemsize * len(self.targets)))
+        for source in range(len(self.ids)):
+            for edge in range(self.offsets[source], self.offsets[source + 1]):
+                target = self.targets[edge]
+                sources[next_edge[target]] = source
+                next_edge[target] += 1
+        return offsets, sources
+
+    def edges(self):
+        """
+        Iterate over the edges in the same order as NetworkX.
+
+        :returns: ``(source number, target number, edge type)`` for each edge
+        :rtype: Iterator[tuple]
+        """
+        for source in range(len(self.ids)):
+            for edge in range(self.offsets[source], self.offsets[source + 1]):
+                yield (
+                    source,
+                    self.targets[edge],
+                    self.edge_type_names[self.edge_types[edge]],
+                )
+
+    def get_type(self, node):
+        """
+        Return a node's type.
+
+        :param int node:
+        :rtype: str
+        """
+        return self.type_names[self.node_types[node]]
+
+    def get_technique_id(self, node):
+        """
+        Return a node's technique ID.
+
+        :param int node:
+        :returns: the technique ID, or ``None``
+        :rtype: str
+        """
+        position = self.technique_ids[node]
+        return None if position < 0 else self.technique_id_names[position]
+
+    def get_object(self, node):
+        """
+        Return the STIX object for a node.
+
+        :param int node:
+        :returns: the object, or ``None`` if the node is only referenced
+        :raises ValueError: if the graph was built with ``keep_objects=False``
+        """
+        if self._objects is None:
+            raise ValueError("This graph does not keep its objects.")
+        return self._objects[node]
+
+    def get_nodes(self, node_type):
+        """
+        Return the numbers of the nodes with the given type.
+
+        :param str node_type:
+        :rtype: list[int]
+        """
+        try:
+            code = self.type_names.index(node_type)
+        except ValueError:
+            return []
+        return [i for i, c in enumerate(self.node_types) if c == code]
+
+    def get_action_edges(self):
+        """
+        Return the edges of the action graph that :func:`induce_action_graph` would
+        build from this graph, without building it.
+
+        :returns: ``(source number, target number)`` for each edge
+        :rtype: list[tuple[int, int]]
+        """
+        successors = [self.successors(i) for i in range(len(self.ids))]
+        actions = self.get_nodes("attack-action")
+        is_action = set(actions)
+        reachable = _get_reachable_actions(successors, actions, is_action)
+        edges = dict()
+        for node in actions:
+            for successor in successors[node]:
+                if successor in is_action:
+                    edges[(node, successor)] = None
+                else:
+                    for target in reachable[successor]:
+                        edges[(node, target)] = None
+        return list(edges)
+
+    def to_networkx(self):
+        """
+        Convert the graph to NetworkX.
+
+        If the graph keeps its objects, then the nodes have the same attributes as in
+        :func:`bundle_to_networkx`, otherwise they have ``type`` and ``technique_id``.
+        Edges only have a ``type`` attribute.
+
+        :rtype: nx.DiGraph
+        """
+        graph = nx.DiGraph()
+        for i, node_id in enumerate(self.ids):
+            if self._objects is not None:
+                graph.add_node(node_id, **(self._objects[i] or {}))
+            else:
+                graph.add_node(
+                    node_id,
+                    type=self.get_type(i),
+                    technique_id=self.get_technique_id(i),
+                )
+        for source, target, edge_type in self.edges():
+            graph.add_edge(self.ids[source], self.ids[target], type=edge_type)
+        return graph
+
+
+def bundle_to_compact(flow_bundle, index=None, keep_objects=True):
+    """
+    Convert an Attack Flow in STIX bundle format to a :class:`CompactGraph`.
+
+    The graph has the same nodes and edges as :func:`bundle_to_networkx`. A node that
+    is only referenced gets its type from its ID.
+
+    :param stix2.Bundle flow_bundle:
+    :param FlowIndex index: an index of ``flow_bundle``, if the caller already has one
+    :param bool keep_objects: keep references to the objects for
+        :meth:`CompactGraph.get_object`, which keeps them in memory as long as the graph
+    :rtype: CompactGraph
+    """
+    if index is None:
+        index = FlowIndex(flow_bundle)
+
+    # Node ID -> object, or ``None`` if the node is only referenced.
+    nodes = dict()
+    for obj in index.objects:
+        if obj["type"] != "relationship":
+            nodes[obj["id"]] = obj
+    # ``(source ID, target ID)`` -> edge type. A later edge between the same nodes
+    # replaces the type, like NetworkX does.
+    edges = dict()
+    for obj in index.objects:
+        if obj["type"] == "relationship":
+            edges[(obj["source_ref"], obj["target_ref"])] = "relationship"
+        else:
+            obj_id = obj["id"]
+            for property_name, target_ref in index.refs[obj_id]:
+                edges[(obj_id, target_ref)] = property_name.rsplit("_", 1)[0]
+    for source, target in edges:
+        nodes.setdefault(source, None)
+        nodes.setdefault(target, None)
+
+    for node_id in _get_removed_extensions(nodes, edges):
+        del nodes[node_id]
+
+    ids = list(nodes)
+    positions = {node_id: i for i, node_id in enumerate(ids)}
+    types = list()
+    technique_ids = list()
+    for node_id, obj in nodes.items():
+        if obj is None:
+            types.append(node_id.split("--")[0])
+            technique_ids.append(None)
+        else:
+            types.append(obj["type"])
+            technique_ids.append(obj.get("technique_id"))
+    numbered_edges = dict()
+    for (source, target), edge_type in edges.items():
+        if source in positions and target in positions:
+            numbered_edges[(positions[source], positions[target])] = edge_type
+
+    objects = list(nodes.values()) if keep_objects else None
+    return CompactGraph(ids, types, technique_ids, numbered_edges, objects)
+
+
+def get_technique_counts(flow_bundle, index=None):
+    """
+    Count the techniques of a flow's actions, and the edges between them in the flow's
+    action graph. Actions without a technique ID are left out.
+
+    :param stix2.Bundle flow_bundle:
+    :param FlowIndex index: an index of ``flow_bundle``, if the caller already has one
+    :returns: technique ID -> count, and ``(source technique ID, target technique ID)``
+        -> count
+    :rtype: tuple[Counter, Counter]
+    """
+    graph = bundle_to_compact(flow_bundle, index, keep_objects=False)
+    # Technique IDs are repeated in every flow, so keep one copy of each.
+    techniques = [
+        None if technique_id is None else sys.intern(technique_id)
+        for technique_id in map(graph.get_technique_id, range(len(graph)))
+    ]
+    node_counts = Counter(
+        techniques[node]
+        for node in graph.get_nodes("attack-action")
+        if techniques[node] is not None
+    )
+    edge_counts = Counter(
+        (techniques[source], techniques[target])
+        for source, target in graph.get_action_edges()
+        if techniques[source] is not None and techniques[target] is not None
+    )
+    return node_counts, edge_counts
+
+
+class CorpusGraph:
+    """
+    The action graphs of many flows, merged at the technique level.
+
+    Each node is a technique ID. There is an edge from one technique to another if, in
+    at least one flow, an action with the first technique leads to an action with the
+    second one in the action graph (see :func:`induce_action_graph`). Nodes and edges
+    record the flows they came from, so that a flow can be added or removed without
+    rebuilding the graph. Actions without a technique ID are left out.
+
+    :ivar dict nodes: technique ID -> dict of flow ID -> the number of the flow's actions
+        with that technique
+    :ivar dict edges: ``(source technique ID, target technique ID)`` -> dict of flow ID
+        -> the number of the flow's action graph edges between those techniques
+    """
+
+    def __init__(self):
+        self.nodes = dict()
+        self.edges = dict()
+        # Flow ID -> the node and edge keys that the flow was added to
+        self._flows = dict()
+
+    def __len__(self):
+        return len(self._flows)
+
+    def __contains__(self, flow_id):
+        return flow_id in self._flows
+
+    @property
+    def flow_ids(self):
+        return list(self._flows)
+
+    def add_flow(self, flow_bundle, flow_id=None, index=None):
+        """
+        Add a flow's techniques and the edges between them.
+
+        :param stix2.Bundle flow_bundle:
+        :param str flow_id: a unique name for the flow, by default the ID of its
+            ``attack-flow`` object, or the bundle's ID if it does not have one
+        :param FlowIndex index: an index of ``flow_bundle``, if the caller already has
+            one
+        :returns: the flow ID
+        :rtype: str
+        :raises ValueError: if a flow with the same ID was already added
+        """
+        if index is None:
+            index = FlowIndex(flow_bundle)
+        if flow_id is None:
+            flow_id = (index.flow or flow_bundle)["id"]
+        if flow_id in self._flows:
+            raise ValueError(f"The flow {flow_id} was already added.")
+
+        node_counts, edge_counts = get_technique_counts(flow_bundle, index)
+        for technique_id, count in node_counts.items():
+            self.nodes.setdefault(technique_id, dict())[flow_id] = count
+        for edge, count in edge_counts.items():
+            self.edges.setdefault(edge, dict())[flow_id] = count
+        self._flows[flow_id] = (tuple(node_counts), tuple(edge_counts))
+        return flow_id
+
+    def remove_flow(self, flow_id):
+        """
+        Remove a flow's techniques and edges, and any that no other flow has.
+
+        :param str flow_id:
+        :raises KeyError: if the flow was not added
+        """
+        try:
+            technique_ids, edges = self._flows.pop(flow_id)
+        except KeyError:
+            raise KeyError(f"The flow {flow_id} was not added.") from None
+        for table, keys in ((self.nodes, technique_ids), (self.edges, edges)):
+            for key in keys:
+                flows = table[key]
+                del flows[flow_id]
+                if not flows:
+                    del table[key]
+
+    def get_flows(self, technique_id):
+        """
+        Return the flows that have an action with the given technique.
+
+        :param str technique_id:
+        :rtype: list[str]
+        """
+        return list(self.nodes.get(technique_id, ()))
+
+    def get_edge_flows(self, source, target):
+        """
+        Return the flows where the ``source`` technique leads to the ``target``
+        technique.
+
+        :param str source: a technique ID
+        :param str target: a technique ID
+        :rtype: list[str]
+        """
+        return list(self.edges.get((source, target), ()))
+
+    def to_networkx(self):
+        """
+        Convert the graph to NetworkX.
+
+        Each node and edge has a ``flows`` attribute, which maps flow IDs to counts
+        like :attr:`nodes` and :attr:`edges`, and a ``weight`` attribute with the
+        number of flows.
+
+        :rtype: nx.DiGraph
+        """
+        graph = nx.DiGraph()
+        for technique_id, flows in self.nodes.items():
+            graph.add_node(technique_id, flows=dict(flows), weight=len(flows))
+        for (source, target), flows in self.edges.items():
+            graph.add_edge(source, target, flows=dict(flows), weight=len(flows))
+        return graph
+
+
+def load_corpus_graph(paths):
+    """
+    Load flows from files into a :class:`CorpusGraph`, where each flow's ID is its
+    path.
+
+    The files are read as plain JSON, without parsing them with the STIX library, which
+    is much faster. Validate them first if they are not trusted.
+
+    :param list[pathlib.Path] paths:
+    :rtype: CorpusGraph
+    """
+    corpus = CorpusGraph()
+    for path in paths:
+        with path.open("rb") as f:
+            corpus.add_flow(json.load(f), flow_id=str(path))
+    return corpus
+
+
+def _get_removed_extensions(nodes, edges):
+    """
+    Return the extension definitions, and their creators if they are not attached to
+    other nodes, which :func:`bundle_to_networkx` removes.
+
+    This is shared by the graphs that are built without networkx, so that they all
+    remove the same nodes.
+
+    :param nodes: the node IDs, in the graph's order
+    :param edges: the ``(source, target)`` of each edge, in the graph's order
+    :rtype: set[str]
+    """
+    ext_nodes = [n for n in nodes if n.startswith("extension-definition--")]
+    if not ext_nodes:
+        return set()
+    successors = {n: dict() for n in ext_nodes}
+    for source, target in edges:
+        if source in successors:
+            successors[source][target] = None
+    neighbors = {n for ext_node in ext_nodes for n in successors[ext_node]}
+    for n in neighbors - successors.keys():
+        successors[n] = dict()
+    for source, target in edges:
+        if source in neighbors:
+            successors[source][target] = None
+
+    removed = set()
+    for ext_node in ext_nodes:
+        if ext_node in removed:
+            continue
+        removed.add(ext_node)
+        for neighbor in successors[ext_node]:
+            if neighbor in removed:
+                continue
+            if not successors[neighbor].keys() - removed - {neighbor}:
+                removed.add(neighbor)
+    return removed
+
+
+def _encode(values, typecode):
+    """
+    Store a column of values as positions in a list of its distinct values.
+
+    :param list values: the values, where ``None`` is stored as -1
+    :param str typecode: the ``array`` type of the positions
+    :returns: a tuple of the positions and the distinct values
+    :rtype: tuple[array.array, list]
+    """
+    distinct = dict()
+    positions = array(typecode)
+    for value in values:
+        if value is None:
+            positions.append(-1)
+        else:
+            positions.append(distinct.setdefault(value, len(distinct)))
+    return positions, list(distinct)
@@ -6,8 +6,7 @@ import graphviz
 
 from .model import (
     confidence_num_to_label,
-    get_flow_object,
-    get_viz_ignored_ids,
+    FlowIndex,
     VIZ_IGNORE_COMMON_PROPERTIES,
 )
 
@@ -61,17 +60,20 @@ def html_label_wrap(text, width):
     return "<br/>".join(html_label_escape(line) for line in wrapped_lines)
 
 
-def convert_attack_flow(bundle):
+def convert_attack_flow(bundle, index=None):
     """
     Convert an Attack Flow STIX bundle into Graphviz format.
 
     :param stix2.Bundle flow:
+    :param FlowIndex index: an index of ``bundle``, if the caller already has one
     :rtype: str
     """
+    if index is None:
+        index = FlowIndex(bundle)
 
     gv = graphviz.Digraph()
-    gv.body = _get_body_label(bundle)
-    ignored_ids = get_viz_ignored_ids(bundle)
+    gv.body = _get_body_label(index)
+    ignored_ids = index.viz_ignored_ids
 
     for o in bundle.objects:
         logger.debug("Processing object id=%s", o.id)
@@ -119,17 +121,20 @@ def convert_attack_flow(bundle):
     return gv.source
 
 
-def convert_attack_tree(bundle):
+def convert_attack_tree(bundle, index=None):
     """
     Convert an Attack Flow STIX bundle into Graphviz format.
 
     :param stix2.Bundle flow:
+    :param FlowIndex index: an index of ``bundle``, if the caller already has one
     :rtype: str
     """
+    if index is None:
+        index = FlowIndex(bundle)
 
     gv = graphviz.Digraph(graph_attr={"rankdir": "BT"})
-    gv.body = _get_body_label(bundle)
-    ignored_ids = get_viz_ignored_ids(bundle)
+    gv.body = _get_body_label(index)
+    ignored_ids = index.viz_ignored_ids
 
     objects = bundle.objects
 
@@ -204,9 +209,9 @@ def convert_attack_tree(bundle):
     return gv.source
 
 
-def _get_body_label(bundle):
-    flow = get_flow_object(bundle)
-    author = bundle.get_obj(flow.created_by_ref)[0]
+def _get_body_label(index):
+    flow = index.flow
+    author = index.by_id[flow.created_by_ref]
 
     description = html_label_wrap(
         flow.get("description", "(missing description)"),
@@ -6,7 +6,7 @@ import textwrap
 
 from .model import (
     confidence_num_to_label,
-    get_viz_ignored_ids,
+    FlowIndex,
     VIZ_IGNORE_COMMON_PROPERTIES,
 )
 
@@ -71,19 +71,22 @@ class MermaidGraph:
         return "\n".join(lines)
 
 
-def convert_attack_flow(bundle):
+def convert_attack_flow(bundle, index=None):
     """
     Convert an Attack Flow STIX bundle into Mermaid format.
 
     :param stix2.Bundle flow:
+    :param FlowIndex index: an index of ``bundle``, if the caller already has one
     :rtype: str
     """
+    if index is None:
+        index = FlowIndex(bundle)
     graph = MermaidGraph()
     graph.add_class("action", "rect", "fill:#99ccff")
     graph.add_class("operator", "circle", "fill:#ff9900")
     graph.add_class("condition", "rect", "fill:#99ff99")
     graph.add_class("builtin", "rect", "fill:#cccccc")
-    ignored_ids = get_viz_ignored_ids(bundle)
+    ignored_ids = index.viz_ignored_ids
 
     for o in bundle.objects:
         if o.type == "attack-action":
@@ -132,13 +135,16 @@ def convert_attack_flow(bundle):
     return graph.render()
 
 
-def convert_attack_tree(bundle):
+def convert_attack_tree(bundle, index=None):
     """
     Convert an Attack Flow STIX bundle into Mermaid format.
 
     :param stix2.Bundle flow:
+    :param FlowIndex index: an index of ``bundle``, if the caller already has one
     :rtype: str
     """
+    if index is None:
+        index = FlowIndex(bundle)
     graph = MermaidGraph()
     graph.direction = "BT"
     graph.add_class("action", "rect", "fill:#B40000, color:white")
@@ -146,7 +152,7 @@ def convert_attack_tree(bundle):
     graph.add_class("OR", "trap", "fill:#9CE67E")
     graph.add_class("condition", "rect", "fill:#99ff99")
     graph.add_class("builtin", "rect", "fill:#cccccc")
-    ignored_ids = get_viz_ignored_ids(bundle)
+    ignored_ids = index.viz_ignored_ids
 
     objects = bundle.objects
     id_to_remove = []
@@ -6,8 +6,12 @@ sure how best to refactor: generate JSON schema from this code, or generate this
 from the JSON scheme?
 """
 
+from collections.abc import Mapping
+import json
+
 from stix2 import Bundle, CustomObject, parse
 from stix2.properties import ListProperty, ReferenceProperty, StringProperty
+from stix2.utils import parse_into_datetime
 
 ATTACK_FLOW_EXTENSION_ID = "extension-definition--fb9c968a-745b-4ade-9b25-c324172197f4"
 
@@ -25,6 +29,45 @@ VIZ_IGNORE_COMMON_PROPERTIES = (
     "type",
 )
 
+# Timestamp properties that the STIX library converts to datetimes. Raw objects convert
+# these lazily on access, the same way that the visualizations format them in STIX mode.
+RAW_TIMESTAMP_PROPERTIES = (
+    "created",
+    "first_observed",
+    "first_seen",
+    "last_observed",
+    "last_seen",
+    "modified",
+    "published",
+    "start_time",
+    "stop_time",
+    "valid_from",
+    "valid_until",
+)
+
+# STIX cyber-observable types. The STIX library sets ``defanged`` to false on these
+# when it is missing, and the visualizations render it, so raw mode sets it too.
+RAW_SCO_TYPES = (
+    "artifact",
+    "autonomous-system",
+    "directory",
+    "domain-name",
+    "email-addr",
+    "email-message",
+    "file",
+    "ipv4-addr",
+    "ipv6-addr",
+    "mac-addr",
+    "mutex",
+    "network-traffic",
+    "process",
+    "software",
+    "url",
+    "user-account",
+    "windows-registry-key",
+    "x509-certificate",
+)
+
 
 @CustomObject(
     "attack-flow",
@@ -128,15 +171,148 @@ class AttackOperator:
     pass
 
 
-def load_attack_flow_bundle(path):
+class RawStixObject(Mapping):
+    """
+    A lightweight, read-only STIX object built directly from parsed JSON.
+
+    This supports the same attribute, item, and ``.get()`` access as the STIX library's
+    objects, but skips object construction and validation entirely, so it does not
+    normalize objects the way the STIX library does:
+
+    * Properties are kept in document order instead of the order in the STIX spec.
+    * Empty lists and ``null`` values are kept instead of being dropped.
+    * Nested objects (e.g. a registry key's ``values``) are plain dicts and lists, so
+      they are formatted as Python literals instead of JSON.
+    * Optional defaults are not filled in, except for ``defanged`` on cyber-observables,
+      which ``RawBundle`` fills in because the visualizations render it. (The other
+      defaults, like ``revoked``, are not rendered.)
+
+    So visualizations of the same bundle have the same nodes and edges in both modes,
+    but their labels may list properties in a different order or format nested
+    objects differently.
+    """
+
+    __slots__ = ("_properties",)
+
+    def __init__(self, properties):
+        object.__setattr__(self, "_properties", properties)
+
+    def __getitem__(self, key):
+        value = self._properties[key]
+        if key in RAW_TIMESTAMP_PROPERTIES and isinstance(value, str):
+            value = parse_into_datetime(value)
+        return value
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{name}'"
+            ) from None
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Cannot modify '{name}' property: object is read-only")
+
+    def __iter__(self):
+        return iter(self._properties)
+
+    def __len__(self):
+        return len(self._properties)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._properties!r})"
+
+
+class RawBundle(RawStixObject):
+    """
+    A lightweight, read-only STIX bundle whose objects are ``RawStixObject`` instances.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, properties):
+        properties = dict(properties)
+        properties["objects"] = [
+            RawStixObject(_fill_raw_defaults(o)) for o in properties.get("objects", [])
+        ]
+        super().__init__(properties)
+
+    def get_obj(self, obj_id):
+        """
+        Return a list of objects with the given ID, matching ``stix2.Bundle.get_obj``.
+
+        :param str obj_id:
+        :rtype: list[RawStixObject]
+        """
+        found = [o for o in self._properties["objects"] if o.get("id") == obj_id]
+        if not found:
+            raise KeyError(
+                f"'{obj_id}' does not match the id property of any of the bundle's objects"
+            )
+        return found
+
+
+def _fill_raw_defaults(properties):
+    """
+    Fill in the optional defaults that the STIX library sets and visualizations render.
+
+    :param dict properties:
+    :rtype: dict
+    """
+    if properties.get("type") in RAW_SCO_TYPES and "defanged" not in properties:
+        return {**properties, "defanged": False}
+    return properties
+
+
+def load_attack_flow_bundle(path, raw=False, cache=None):
     """
     Load an Attack Flow STIX bundle from a given path.
 
+    In raw mode, the JSON is wrapped in lightweight ``RawStixObject`` instances instead
+    of being parsed into STIX objects. This is much faster, but it does not validate
+    the objects, so it should only be used on documents that are trusted or that have
+    already been validated.
+
+    If a cache is given, a bundle that was parsed before is reloaded from the cache
+    instead of being parsed again. Raw mode is already fast, so it does not use the
+    cache.
+
     :param pathlib.Path path:
+    :param bool raw: if true, return a ``RawBundle`` instead of a ``stix2.Bundle``
+    :param attack_flow.cache.BundleCache cache:
     :rtype: stix2.Bundle
     """
+    if raw:
+        with path.open() as f:
+            return load_raw_bundle(json.load(f))
+
+    if cache is not None:
+        return cache.load(path, _parse_bundle)
     with path.open() as f:
-        bundle = parse(f, allow_custom=True)
+        return _parse_bundle(f)
+
+
+def parse_attack_flow_bundle(flow_json):
+    """
+    Parse an Attack Flow STIX bundle that has already been loaded from JSON.
+
+    :param dict flow_json:
+    :rtype: stix2.Bundle
+    """
+    return _parse_bundle(flow_json)
+
+
+def _parse_bundle(data):
+    """
+    Parse a bundle with the STIX library.
+
+    :param data: a file-like object, ``str``, ``bytes``, or ``dict``
+    :rtype: stix2.Bundle
+    """
+    if isinstance(data, bytes):
+        data = data.decode("utf8")
+    bundle = parse(data, allow_custom=True)
     # The STIX library will not parse unknown objects; it just returns them as dict. We should
     # throw an error since it will break downstream code that expects real STIX objects.
     if isinstance(bundle, Bundle):
@@ -146,6 +322,132 @@ def load_attack_flow_bundle(path):
     return bundle
 
 
+def load_raw_bundle(bundle_json):
+    """
+    Wrap an already-parsed STIX bundle in lightweight read-only objects.
+
+    :param dict bundle_json:
+    :rtype: RawBundle
+    """
+    if bundle_json.get("type") == "bundle":
+        return RawBundle(bundle_json)
+    return RawStixObject(bundle_json)
+
+
+class FlowIndex:
+    """
+    Lookup tables for an Attack Flow bundle, built in a single pass over its objects.
+
+    Converters and validators need to look up objects by ID or type, follow references
+    in either direction, and find the flow object. Build the index once per bundle and
+    pass it around instead of rescanning ``bundle.objects`` for each lookup.
+
+    The bundle may be a ``stix2.Bundle``, a ``RawBundle``, or a bundle parsed from
+    JSON.
+
+    :ivar list objects: the bundle's objects in document order
+    :ivar dict by_id: object ID -> object (the first object with that ID)
+    :ivar dict by_type: object type -> list of objects in document order
+    :ivar dict refs: object ID -> list of ``(property_name, ref)`` for each ``*_ref``
+        and ``*_refs`` property
+    :ivar dict reverse_refs: referenced ID -> list of ``(object_id, property_name)``
+    :ivar flow: the ``attack-flow`` object, or ``None``
+    :ivar set viz_ignored_ids: IDs that visualizations should ignore (see
+        :func:`get_viz_ignored_ids`)
+    """
+
+    def __init__(self, flow_bundle=None):
+        self.objects = list()
+        self.by_id = dict()
+        self.by_type = dict()
+        self.refs = dict()
+        self.reverse_refs = dict()
+        self.flow = None
+        self.viz_ignored_ids = set()
+
+        # The STIX library returns objects of unknown types as plain dicts.
+        self._check_unparsed = flow_bundle is not None and not isinstance(
+            flow_bundle, dict
+        )
+        if flow_bundle is not None:
+            for obj in flow_bundle.get("objects") or []:
+                self.add_object(obj)
+
+    def add_object(self, obj):
+        """
+        Add an object to the index.
+
+        This builds an index one object at a time, e.g. from the objects of a bundle
+        that is read with :func:`attack_flow.stream.iter_bundle_objects`.
+
+        :param obj: a STIX object, a ``RawStixObject``, or an object parsed from JSON
+        """
+        self.objects.append(obj)
+        # The index is built before the bundle is validated, so skip anything that is
+        # malformed and leave it for the schema check to report.
+        if not isinstance(obj, Mapping):
+            return
+        obj_id = _get_string(obj, "id")
+        obj_type = _get_string(obj, "type")
+        self.by_id.setdefault(obj_id, obj)
+        self.by_type.setdefault(obj_type, []).append(obj)
+
+        # Objects can share an ID (e.g. versions of an object), so collect this
+        # object's refs before adding them to the ones for its ID.
+        obj_refs = list()
+        # Only look up the reference properties, because raw objects convert timestamps
+        # when they are looked up.
+        for property_name in obj:
+            if property_name.endswith("_ref"):
+                value = obj[property_name]
+                if isinstance(value, str):
+                    obj_refs.append((property_name, value))
+            elif property_name.endswith("_refs"):
+                value = obj[property_name]
+                if isinstance(value, list):
+                    obj_refs.extend(
+                        (property_name, ref) for ref in value if isinstance(ref, str)
+                    )
+        self.refs.setdefault(obj_id, []).extend(obj_refs)
+        for property_name, ref in obj_refs:
+            self.reverse_refs.setdefault(ref, []).append((obj_id, property_name))
+
+        if self._check_unparsed and isinstance(obj, dict):
+            self.viz_ignored_ids.add(obj_id)
+            return
+        if obj_type == "attack-flow" and self.flow is None:
+            self.flow = obj
+            if flow_creator := _get_string(obj, "created_by_ref"):
+                self.viz_ignored_ids.add(flow_creator)
+        if obj_type in VIZ_IGNORE_SDOS:
+            self.viz_ignored_ids.add(obj_id)
+        if obj_type == "extension-definition" and (
+            ext_creator := _get_string(obj, "created_by_ref")
+        ):
+            self.viz_ignored_ids.add(ext_creator)
+
+    def get_objects(self, obj_type):
+        """
+        Return the objects of the given type in document order.
+
+        :param str obj_type:
+        :rtype: list
+        """
+        return self.by_type.get(obj_type, [])
+
+
+def _get_string(obj, property_name):
+    """
+    Return a string property of an object, or ``None`` if it is missing or malformed.
+
+    :param obj:
+    :param str property_name:
+    :rtype: str
+    """
+    value = obj.get(property_name)
+    return value if isinstance(value, str) else None
+
+
 def get_flow_object(flow_bundle):
     """
     Given an Attack Flow STIX bundle, extract the ``attack-flow`` object.
@@ -198,28 +500,8 @@ def get_viz_ignored_ids(flow_bundle):
     """
     Process a flow bundle and return a set of IDs that the visualizer should ignore,
     e.g. the extension object, the extension creator identity, etc.
-    """
-    ignored = set()
-
-    # Ignore flow creator identity:
-    flow = get_flow_object(flow_bundle)
-    if flow_creator := flow.get("created_by_ref", None):
-        ignored.add(flow_creator)
-
-    # Ignore by SDO type:
-    for obj in flow_bundle.objects:
-        if isinstance(obj, dict):
-            # this could happen if the SDO type is unknown
-            ignored.add(obj["id"])
-            continue
 
-        if obj.type in VIZ_IGNORE_SDOS:
-            ignored.add(obj.id)
-
-        # Ignore extension creator identity:
-        if obj.type == "extension-definition" and (
-            ext_creator := obj.get("created_by_ref", None)
-        ):
-            ignored.add(ext_creator)
-
-    return ignored
+    If you also need other lookups on the same bundle, build a :class:`FlowIndex` and
+    use its ``viz_ignored_ids`` instead.
+    """
+    return FlowIndex(flow_bundle).viz_ignored_ids
@@ -0,0 +1,311 @@
+"""
+Enumerate the attack paths in an Attack Flow.
+
+A path starts at one of the flow's ``start_refs`` and follows ``effect_refs``,
+``on_true_refs``, and ``on_false_refs`` until it reaches a node that has no effects.
+At each fork it takes one branch, so a flow with many forks has many paths:
+
+* An action or operator with several effects forks into one path per effect.
+* A condition forks into its true and false outcomes. An outcome without refs ends the
+  path at the condition.
+* An ``OR`` operator continues when any of its inputs happens. An ``AND`` operator needs
+  all of its inputs, so a path that goes through it lists the other inputs in
+  ``requires``. If the other inputs can never happen, because they cannot be reached
+  from the start refs, then the path does not go through the operator at all.
+* A path ends when it would visit a node that it has already visited, so each loop is
+  followed once.
+
+The number of paths can grow exponentially with the number of forks, so paths are
+generated lazily, and :meth:`PathEnumerator.iter_paths` can stop after a number of paths
+or cut them off at a depth. :meth:`PathEnumerator.count_paths` counts the paths without
+generating them.
+"""
+
+from collections import deque, namedtuple
+
+from .model import FlowIndex
+
+# Suffixes are memoized for nodes with at most this many paths to the end of the flow.
+MEMO_LIMIT = 1000
+
+FLOW_NODE_TYPES = ("attack-action", "attack-condition", "attack-operator")
+
+# A node on a path. ``outcome`` is the branch taken at a condition, otherwise ``None``.
+PathStep = namedtuple("PathStep", ["id", "outcome"])
+
+# ``steps`` is a tuple of ``PathStep``, ``requires`` is a frozenset of the IDs of the
+# other inputs of ``AND`` operators on the path, and ``complete`` is false if the path
+# was cut off at the maximum depth.
+AttackPath = namedtuple("AttackPath", ["steps", "requires", "complete"])
+
+
+class PathEnumerator:
+    """
+    Enumerate the paths in one flow.
+
+    The forks, the ``AND`` operators that can never happen, and the number of paths
+    from each node are worked out once, so make one enumerator per flow and reuse it
+    for several queries.
+
+    :ivar list start_refs: the IDs of the nodes that paths start from
+    """
+
+    def __init__(self, flow_bundle, index=None, memo_limit=MEMO_LIMIT):
+        """
+        Constructor.
+
+        :param stix2.Bundle flow_bundle:
+        :param FlowIndex index: an index of ``flow_bundle``, if the caller already has
+            one
+        :param int memo_limit: memoize the paths from a node to the end of the flow if
+            there are at most this many, or 0 to turn memoization off
+        :raises ValueError: if the bundle does not have an ``attack-flow`` object
+        """
+        if index is None:
+            index = FlowIndex(flow_bundle)
+        if index.flow is None:
+            raise ValueError("The bundle does not have an attack-flow object.")
+        self.memo_limit = memo_limit
+
+        node_ids = {
+            obj.get("id") for obj in index.objects if obj.get("type") in FLOW_NODE_TYPES
+        }
+        # Node ID -> list of ``(outcome, target ID)``, leaving out effects that are not
+        # actions, conditions, or operators.
+        forks = dict()
+        for obj in index.objects:
+            if obj.get("type") not in FLOW_NODE_TYPES or obj["id"] in forks:
+                continue
+            if obj["type"] == "attack-condition":
+                refs = [
+                    (True, obj.get("on_true_refs")),
+                    (False, obj.get("on_false_refs")),
+                ]
+            else:
+                refs = [(None, obj.get("effect_refs"))]
+            forks[obj["id"]] = [
+                (outcome, ref)
+                for outcome, outcome_refs in refs
+                for ref in [r for r in outcome_refs or () if r in node_ids] or [None]
+            ]
+
+        self.start_refs = [
+            ref for ref in index.flow.get("start_refs") or [] if ref in forks
+        ]
+        and_inputs = dict()
+        for obj in index.objects:
+            if obj.get("type") == "attack-operator" and obj.get("operator") == "AND":
+                and_inputs[obj["id"]] = dict()
+        for node_id, node_forks in forks.items():
+            for _, ref in node_forks:
+                if ref in and_inputs:
+                    and_inputs[ref][node_id] = None
+        possible = _get_possible_nodes(forks, and_inputs, self.start_refs)
+
+        # Node ID -> tuple of ``(PathStep, next node ID or None, requires)``
+        self._branches = dict()
+        for node_id, node_forks in forks.items():
+            branches = list()
+            for outcome, ref in node_forks:
+                step = PathStep(node_id, outcome)
+                if ref is None:
+                    branches.append((step, None, frozenset()))
+                elif ref not in and_inputs:
+                    branches.append((step, ref, frozenset()))
+                elif ref in possible:
+                    requires = frozenset(and_inputs[ref]) - {node_id}
+                    branches.append((step, ref, requires))
+            if not branches:
+                # Every effect is an ``AND`` operator that cannot happen.
+                branches.append((PathStep(node_id, None), None, frozenset()))
+            self._branches[node_id] = tuple(branches)
+
+        self._counts, self._heights = self._count_paths()
+        self._suffixes = dict()
+
+    def count_paths(self):
+        """
+        Count the paths without generating them.
+
+        :rtype: int
+        :raises ValueError: if the flow has a loop, because the paths through a loop
+            depend on the nodes before it
+        """
+        if any(start not in self._counts for start in self.start_refs):
+            raise ValueError("Paths cannot be counted in a flow with loops.")
+        return sum(self._counts[start] for start in self.start_refs)
+
+    def iter_paths(self, max_paths=None, max_depth=None):
+        """
+        Generate the paths from each of the start refs, in depth-first order.
+
+        :param int max_paths: stop after this many paths
+        :param int max_depth: cut off paths after this many steps (at least 1), and
+            mark them as incomplete
+        :rtype: Iterator[AttackPath]
+        """
+        if max_paths is not None and max_paths < 1:
+            return
+        count = 0
+        for start in self.start_refs:
+            for path in self._iter_paths_from(start, max_depth):
+                yield path
+                count += 1
+                if count == max_paths:
+                    return
+
+    def _iter_paths_from(self, start, max_depth):
+        # Depth-first search without recursion, so that long flows do not overflow the
+        # stack. ``steps[i]`` is the step taken from the node in ``stack[i]``.
+        suffixes = self._get_suffixes(start, max_depth, 0)
+        if suffixes is not None:
+            for suffix, requires in suffixes:
+                yield AttackPath(suffix, requires, True)
+            return
+        stack = [(start, iter(self._branches[start]), frozenset())]
+        on_path = {start}
+        steps = list()
+        while stack:
+            node, branches, requires = stack[-1]
+            branch = next(branches, None)
+            if branch is None:
+                stack.pop()
+                on_path.discard(node)
+                continue
+            step, next_node, next_requires = branch
+            del steps[len(stack) - 1 :]
+            steps.append(step)
+            if next_node is None or next_node in on_path:
+                yield AttackPath(tuple(steps), requires, True)
+                continue
+            requires = requires | next_requires
+            if max_depth is not None and len(steps) >= max_depth:
+                yield AttackPath(tuple(steps), requires, False)
+                continue
+            suffixes = self._get_suffixes(next_node, max_depth, len(steps))
+            if suffixes is not None:
+                prefix = tuple(steps)
+                for suffix, suffix_requires in suffixes:
+                    yield AttackPath(prefix + suffix, requires | suffix_requires, True)
+                continue
+            stack.append((next_node, iter(self._branches[next_node]), requires))
+            on_path.add(next_node)
+
+    def _count_paths(self):
+        """
+        Count the paths from each node to the end of the flow, and the number of steps
+        in the longest one, for the nodes that cannot reach a loop.
+
+        :returns: node ID -> number of paths, and node ID -> longest path
+        :rtype: tuple[dict, dict]
+        """
+        counts = dict()
+        heights = dict()
+        # Nodes that are on the search stack, or that can reach a loop
+        visiting = set()
+        looping = set()
+        for start in self.start_refs:
+            if start in counts or start in looping:
+                continue
+            stack = [(start, iter(self._branches[start]))]
+            visiting.add(start)
+            while stack:
+                node, branches = stack[-1]
+                for _, next_node, _ in branches:
+                    if next_node is None or next_node in counts:
+                        continue
+                    elif next_node in visiting or next_node in looping:
+                        looping.add(node)
+                    else:
+                        stack.append((next_node, iter(self._branches[next_node])))
+                        visiting.add(next_node)
+                        break
+                else:
+                    stack.pop()
+                    visiting.discard(node)
+                    next_nodes = [
+                        n for _, n, _ in self._branches[node] if n is not None
+                    ]
+                    if node in looping or any(n in looping for n in next_nodes):
+                        looping.add(node)
+                        continue
+                    counts[node] = sum(
+                        1 if n is None else counts[n]
+                        for _, n, _ in self._branches[node]
+                    )
+                    heights[node] = 1 + max((heights[n] for n in next_nodes), default=0)
+        return counts, heights
+
+    def _get_suffixes(self, node, max_depth, depth):
+        """
+        Return the memoized paths from ``node`` to the end of the flow, or ``None`` if
+        they are not memoized.
+
+        :param str node:
+        :param int max_depth: the maximum number of steps in a path, or ``None``
+        :param int depth: the number of steps before ``node``
+        :returns: a list of ``(steps, requires)``
+        """
+        count = self._counts.get(node)
+        if count is None or count > self.memo_limit:
+            return None
+        if max_depth is not None and depth + self._heights[node] > max_depth:
+            return None
+        if node not in self._suffixes:
+            # Build the suffixes of the nodes after ``node`` first, without recursion.
+            stack = [node]
+            while stack:
+                current = stack[-1]
+                if current in self._suffixes:
+                    stack.pop()
+                    continue
+                missing = [
+                    n
+                    for _, n, _ in self._branches[current]
+                    if n is not None and n not in self._suffixes
+                ]
+                if missing:
+                    stack.extend(missing)
+                    continue
+                stack.pop()
+                suffixes = list()
+                for step, next_node, requires in self._branches[current]:
+                    if next_node is None:
+                        suffixes.append(((step,), requires))
+                    else:
+                        for suffix, suffix_requires in self._suffixes[next_node]:
+                            suffixes.append(
+                                ((step,) + suffix, requires | suffix_requires)
+                            )
+                self._suffixes[current] = suffixes
+        return self._suffixes[node]
+
+
+def _get_possible_nodes(forks, and_inputs, start_refs):
+    """
+    Find the nodes that can happen: the start refs, and the nodes that they lead to,
+    where an ``AND`` operator can only happen if all of its inputs can.
+
+    :param dict forks: node ID -> list of ``(outcome, target ID)``
+    :param dict and_inputs: ``AND`` operator ID -> dict of its input IDs
+    :param list start_refs:
+    :rtype: set
+    """
+    possible = set()
+    missing_inputs = {node_id: len(inputs) for node_id, inputs in and_inputs.items()}
+    queue = deque(start_refs)
+    while queue:
+        node_id = queue.popleft()
+        if node_id in possible:
+            continue
+        possible.add(node_id)
+        for ref in dict.fromkeys(ref for _, ref in forks[node_id]):
+            if ref is None:
+                continue
+            elif ref in missing_inputs:
+                missing_inputs[ref] -= 1
+                if missing_inputs[ref] == 0:
+                    queue.append(ref)
+            else:
+                queue.append(ref)
+    return possible
@@ -0,0 +1,458 @@
+"""
+Search a corpus for the flows that contain a sequence of techniques.
+
+A query is a list of technique IDs joined by arrows, which follow the edges of each
+flow's action graph (see :func:`attack_flow.graph.induce_action_graph`):
+
+* ``T1059 -> T1486`` finds an action with ``T1059`` that leads directly to an action
+  with ``T1486``.
+* ``T1059 ->2 T1486`` allows up to 2 hops between them, so there can be one other action
+  in between.
+* ``T1059 ->* T1486`` allows any number of hops.
+* ``T1566 -> T1204 ->* T1486`` finds a chain of three actions.
+* ``T1059`` finds the flows that have ``T1059`` at all.
+* ``"Custom technique" -> T1486`` quotes a technique ID that has spaces or other
+  characters in it. Technique IDs that are not quoted are not case sensitive.
+
+A technique ID without a sub-technique also matches its sub-techniques, so ``T1059``
+matches ``T1059.001``, but ``T1059.001`` only matches itself.
+
+The index keeps a posting list for each technique: the actions that have it, and the
+flows that have it, and one for each pair of techniques that an action graph edge
+joins. A query intersects the posting lists of its techniques, and of the pairs that
+must be joined directly, to find the flows that could match, and only follows the
+action graphs of those flows. The
+action graphs of all of the flows are stored together, in arrays, so flows can be
+added to the index at any time, and the index can be saved to a JSON file and loaded
+again without reading the flows.
+"""
+
+from array import array
+from bisect import bisect_left
+from collections import namedtuple
+import json
+import re
+
+from .graph import bundle_to_compact
+from .model import FlowIndex
+
+FORMAT_VERSION = 1
+
+# A step of a query. ``max_hops`` is the maximum number of action graph edges from the
+# previous step, or ``None`` for any number. It is 0 for the first step.
+QueryStep = namedtuple("QueryStep", ["technique_id", "max_hops"])
+
+# A flow that matches a query, and the IDs of the actions that match each step.
+QueryMatch = namedtuple("QueryMatch", ["flow_id", "action_ids"])
+
+# An arrow and its number of hops, a technique ID, or a quoted technique ID
+_TOKEN_RE = re.compile(
+    r'\s*(?:(->)(\*|\d+)?|([A-Za-z][A-Za-z0-9]*(?:\.[A-Za-z0-9]+)*)|"([^"]+)")'
+)
+
+
+def parse_query(query):
+    """
+    Parse a query, e.g. ``T1059 ->2 T1486``.
+
+    :param str query:
+    :rtype: list[QueryStep]
+    :raises ValueError: if the query is not valid
+    """
+    tokens = list()
+    position = 0
+    query = query.rstrip()
+    while position < len(query):
+        match = _TOKEN_RE.match(query, position)
+        if match is None:
+            rest = query[position:].lstrip()
+            raise ValueError(
+                f"Invalid query at position {len(query) - len(rest) + 1}: {rest!r}"
+            )
+        tokens.append(match.groups())
+        position = match.end()
+
+    steps = list()
+    max_hops = 0
+    expect_technique = True
+    for _, hops, technique_id, quoted_id in tokens:
+        if technique_id is not None or quoted_id is not None:
+            technique_id = quoted_id or technique_id.upper()
+            if not expect_technique:
+                raise ValueError(f"Expected -> before {technique_id}.")
+            steps.append(QueryStep(technique_id, max_hops))
+            expect_technique = False
+        elif expect_technique:
+            raise ValueError("Expected a technique ID before ->.")
+        else:
+            max_hops = None if hops == "*" else int(hops or 1)
+            if max_hops == 0:
+                raise ValueError("The number of hops must be at least 1.")
+            expect_technique = True
+    if expect_technique:
+        raise ValueError("Expected a technique ID at the end of the query.")
+    return steps
+
+
+class TechniqueIndex:
+    """
+    An inverted index from technique IDs to the actions and flows that have them.
+
+    The actions of all of the flows are numbered in the order that the flows were
+    added, so the actions of flow ``i`` are ``flow_starts[i]`` up to
+    ``flow_starts[i + 1]``, and the posting lists are in ascending order. The action
+    graph edges of action ``a`` go to the actions ``targets[offsets[a]:offsets[a + 1]]``
+    in compressed sparse row (CSR) format.
+
+    :ivar list flow_ids: flow number -> flow ID
+    :ivar array.array flow_starts: flow number -> the number of the flow's first action,
+        with one more item for the end of the last flow
+    :ivar list action_ids: action number -> action ID
+    :ivar array.array action_techniques: action number -> position in
+        ``technique_ids``, or -1 if the action does not have a technique ID
+    :ivar list technique_ids: the distinct technique IDs
+    :ivar array.array offsets: action number -> position of its first edge in
+        ``targets``, with one more item for the end of the last action's edges
+    :ivar array.array targets: edge number -> target action number
+    :ivar dict postings: technique ID -> the numbers of the actions that have it or one
+        of its sub-techniques
+    :ivar dict flow_postings: technique ID -> the numbers of the flows that have it or
+        one of its sub-techniques
+    :ivar dict edge_postings: ``(source technique ID, target technique ID)`` -> the
+        numbers of the flows that have an action graph edge between them, where
+        sub-techniques are posted under their parent techniques
+    """
+
+    def __init__(self):
+        self.flow_ids = list()
+        self.flow_starts = array("l", [0])
+        self.action_ids = list()
+        self.action_techniques = array("i")
+        self.technique_ids = list()
+        self.offsets = array("l", [0])
+        self.targets = array("l")
+        self.postings = dict()
+        self.flow_postings = dict()
+        self.edge_postings = dict()
+        self._flow_numbers = dict()
+        self._technique_numbers = dict()
+        # Technique number -> the IDs that the technique is posted under
+        self._technique_keys = list()
+
+    def __len__(self):
+        return len(self.flow_ids)
+
+    def __contains__(self, flow_id):
+        return flow_id in self._flow_numbers
+
+    def add_flow(self, flow_bundle, flow_id=None, index=None):
+        """
+        Add a flow's actions and action graph.
+
+        :param stix2.Bundle flow_bundle:
+        :param str flow_id: a unique name for the flow, by default the ID of its
+            ``attack-flow`` object, or the bundle's ID if it does not have one
+        :param FlowIndex index: an index of ``flow_bundle``, if the caller already has
+            one
+        :returns: the flow ID
+        :rtype: str
+        :raises ValueError: if a flow with the same ID was already added
+        """
+        if index is None:
+            index = FlowIndex(flow_bundle)
+        if flow_id is None:
+            flow_id = (index.flow or flow_bundle)["id"]
+        if flow_id in self._flow_numbers:
+            raise ValueError(f"The flow {flow_id} was already added.")
+
+        graph = bundle_to_compact(flow_bundle, index, keep_objects=False)
+        actions = graph.get_nodes("attack-action")
+        first = len(self.action_ids)
+        numbers = {node: first + i for i, node in enumerate(actions)}
+        successors = {node: list() for node in actions}
+        for source, target in graph.get_action_edges():
+            successors[source].append(numbers[target])
+
+        flow_number = len(self.flow_ids)
+        self._flow_numbers[flow_id] = flow_number
+        self.flow_ids.append(flow_id)
+        for node in actions:
+            technique_id = graph.get_technique_id(node)
+            if technique_id is None:
+                technique = -1
+            else:
+                technique = self._technique_numbers.get(technique_id)
+                if technique is None:
+                    technique = self._add_technique(technique_id)
+            self.action_ids.append(graph.ids[node])
+            self.action_techniques.append(technique)
+            self.targets.extend(successors[node])
+            self.offsets.append(len(self.targets))
+        self.flow_starts.append(len(self.action_ids))
+        self._index_flow(flow_number)
+        return flow_id
+
+    def _add_technique(self, technique_id):
+        """
+        Number a technique ID.
+
+        :param str technique_id:
+        :returns: the technique number
+        :rtype: int
+        """
+        number = len(self.technique_ids)
+        self.technique_ids.append(technique_id)
+        self._technique_numbers[technique_id] = number
+        # A sub-technique is also posted under its parent technique.
+        parent_id = _get_parent(technique_id)
+        if parent_id == technique_id:
+            self._technique_keys.append((technique_id,))
+        else:
+            self._technique_keys.append((technique_id, parent_id))
+        return number
+
+    def _index_flow(self, flow_number):
+        """
+        Add a flow's actions and edges to the posting lists.
+
+        :param int flow_number:
+        """
+        # The last key of each technique is its parent, or itself.
+        keys = self._technique_keys
+        techniques = self.action_techniques
+        offsets = self.offsets
+        edges = dict()
+        for action in range(
+            self.flow_starts[flow_number], self.flow_starts[flow_number + 1]
+        ):
+            technique = techniques[action]
+            if technique == -1:
+                continue
+            for key in keys[technique]:
+                postings = self.postings.get(key)
+                if postings is None:
+                    postings = self.postings[key] = array("l")
+                    self.flow_postings[key] = array("l")
+                postings.append(action)
+                flow_postings = self.flow_postings[key]
+                if not flow_postings or flow_postings[-1] != flow_number:
+                    flow_postings.append(flow_number)
+            for target in self.targets[offsets[action] : offsets[action + 1]]:
+                if techniques[target] != -1:
+                    edges[(keys[technique][-1], keys[techniques[target]][-1])] = None
+        for edge in edges:
+            postings = self.edge_postings.get(edge)
+            if postings is None:
+                postings = self.edge_postings[edge] = array("l")
+            postings.append(flow_number)
+
+    def get_flows(self, technique_id):
+        """
+        Return the flows that have a technique or one of its sub-techniques.
+
+        :param str technique_id:
+        :rtype: list[str]
+        """
+        return [self.flow_ids[i] for i in self.flow_postings.get(technique_id, ())]
+
+    def query(self, query, limit=None):
+        """
+        Find the flows that match a query.
+
+        :param query: a query string (see :func:`parse_query`), or a list of
+            :class:`QueryStep`
+        :param int limit: stop after this many flows
+        :returns: the flows that match, in the order they were added, with a chain of
+            actions that matches in each one
+        :rtype: list[QueryMatch]
+        :raises ValueError: if the query is not valid
+        """
+        steps = parse_query(query) if isinstance(query, str) else query
+        flow_postings = [self.flow_postings.get(step.technique_id) for step in steps]
+        # A step that directly follows the previous one also needs an edge between
+        # their techniques.
+        for previous, step in zip(steps, steps[1:]):
+            if step.max_hops == 1:
+                edge = (
+                    _get_parent(previous.technique_id),
+                    _get_parent(step.technique_id),
+                )
+                flow_postings.append(self.edge_postings.get(edge))
+        if any(postings is None for postings in flow_postings):
+            return []
+        matches = list()
+        for flow_number in _intersect(flow_postings):
+            chain = self._match_flow(flow_number, steps)
+            if chain is None:
+                continue
+            matches.append(
+                QueryMatch(
+                    self.flow_ids[flow_number],
+                    tuple(self.action_ids[action] for action in chain),
+                )
+            )
+            if len(matches) == limit:
+                break
+        return matches
+
+    def _match_flow(self, flow_number, steps):
+        """
+        Follow the action graph of one flow to find a chain of actions that matches
+        the steps.
+
+        :param int flow_number:
+        :param list[QueryStep] steps:
+        :returns: the action numbers of the chain, or ``None`` if the flow does not
+            match
+        :rtype: tuple[int]
+        """
+        start = self.flow_starts[flow_number]
+        end = self.flow_starts[flow_number + 1]
+
+        def get_actions(technique_id):
+            postings = self.postings[technique_id]
+            first = bisect_left(postings, start)
+            return postings[first : bisect_left(postings, end, first)]
+
+        first_actions = get_actions(steps[0].technique_id)
+        if not first_actions:
+            return None
+        # Action number -> the chain of actions that ends at it, for the actions that
+        # match the steps so far.
+        chains = {action: (action,) for action in first_actions}
+        for number, step in enumerate(steps[1:], 2):
+            wanted = set(get_actions(step.technique_id))
+            found = self._follow(chains, wanted, step.max_hops)
+            if number == len(steps):
+                # Any chain will do for the last step, so stop at the first one.
+                return next(found, (None, None))[1]
+            chains = dict()
+            for action, chain in found:
+                chains[action] = chain
+                if len(chains) == len(wanted):
+                    break
+            if not chains:
+                return None
+        return (first_actions[0],)
+
+    def _follow(self, chains, wanted, max_hops):
+        """
+        Search from the ends of the chains for the wanted actions.
+
+        The search starts from all of the chains at once, one hop at a time, so that
+        each action is only visited once. The ends of the chains are not marked as
+        visited, so that an action that leads back to itself can match.
+
+        :param dict chains: action number -> the chain of actions that ends at it
+        :param set wanted: action numbers
+        :param int max_hops: the maximum number of hops, or ``None`` for any number
+        :returns: ``(action number, chain)`` for each wanted action that is reached,
+            nearest first, where the chain ends at the action
+        :rtype: Iterator[tuple[int, tuple[int]]]
+        """
+        offsets = self.offsets
+        targets = self.targets
+        visited = set()
+        level = list(chains.items())
+        hops = 0
+        while level and (max_hops is None or hops < max_hops):
+            hops += 1
+            next_level = list()
+            for action, chain in level:
+                for target in targets[offsets[action] : offsets[action + 1]]:
+                    if target in visited:
+                        continue
+                    visited.add(target)
+                    next_level.append((target, chain))
+                    if target in wanted:
+                        yield target, chain + (target,)
+            level = next_level
+
+    def save(self, path):
+        """
+        Save the index to a JSON file.
+
+        The posting lists are not saved, because they are quick to rebuild from the
+        actions' techniques.
+
+        :param pathlib.Path path:
+        """
+        data = {
+            "format_version": FORMAT_VERSION,
+            "flow_ids": self.flow_ids,
+            "flow_starts": self.flow_starts.tolist(),
+            "action_ids": self.action_ids,
+            "action_techniques": self.action_techniques.tolist(),
+            "technique_ids": self.technique_ids,
+            "offsets": self.offsets.tolist(),
+            "targets": self.targets.tolist(),
+        }
+        with path.open("w") as f:
+            json.dump(data, f, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load an index that was saved with :meth:`save`.
+
+        :param pathlib.Path path:
+        :rtype: TechniqueIndex
+        :raises ValueError: if the file is not a saved index
+        """
+        with path.open("rb") as f:
+            data = json.load(f)
+        if not isinstance(data, dict) or data.get("format_version") != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a saved technique index.")
+        index = cls()
+        index.flow_ids = data["flow_ids"]
+        index._flow_numbers = {flow_id: i for i, flow_id in enumerate(index.flow_ids)}
+        index.flow_starts = array("l", data["flow_starts"])
+        index.action_ids = data["action_ids"]
+        index.action_techniques = array("i", data["action_techniques"])
+        for technique_id in data["technique_ids"]:
+            index._add_technique(technique_id)
+        index.offsets = array("l", data["offsets"])
+        index.targets = array("l", data["targets"])
+
+        for flow_number in range(len(index.flow_ids)):
+            index._index_flow(flow_number)
+        return index
+
+
+def _get_parent(technique_id):
+    """
+    Return the parent technique of a sub-technique, e.g. ``T1059`` for ``T1059.001``,
+    or the technique ID itself if it is not a sub-technique.
+
+    :param str technique_id:
+    :rtype: str
+    """
+    parent_id, _, sub_technique = technique_id.rpartition(".")
+    if parent_id and sub_technique.isdigit():
+        return parent_id
+    return technique_id
+
+
+def _intersect(postings):
+    """
+    Intersect sorted posting lists, starting from the shortest, and looking up each
+    remaining item in the longer lists with a binary search.
+
+    :param list[array.array] postings:
+    :rtype: list[int]
+    """
+    postings = sorted(postings, key=len)
+    result = list(postings[0])
+    for other in postings[1:]:
+        kept = list()
+        position = 0
+        for item in result:
+            position = bisect_left(other, item, position)
+            if position == len(other):
+                break
+            if other[position] == item:
+                kept.append(item)
+        result = kept
+        if not result:
+            break
+    return result
@@ -0,0 +1,167 @@
+"""
+Validation results.
+
+These are kept apart from the schema module, which imports the JSON schema, STIX, and
+graph libraries, so that cached results can be loaded and printed without them.
+"""
+
+from collections import Counter
+import contextlib
+import heapq
+import time
+
+
+class ValidationResult:
+    def __init__(self):
+        self.messages = list()
+
+    @property
+    def success(self):
+        return not any(f.type_ == "error" for f in self.messages)
+
+    @property
+    def strict_success(self):
+        return len(self.messages) == 0
+
+    def add_error(self, message):
+        self.messages.append(FlowValidationFailure("error", message))
+
+    def add_warning(self, message):
+        self.messages.append(FlowValidationFailure("warning", message))
+
+    def add_exc(self, message, exc):
+        self.messages.append(FlowValidationFailure("error", message, exc))
+
+    def to_json(self):
+        """
+        Convert to JSON-serializable data. Original exceptions are kept as text.
+
+        :rtype: dict
+        """
+        return {
+            "messages": [
+                {
+                    "type": m.type_,
+                    "message": m.message,
+                    "exc": None if m.exc is None else str(m.exc),
+                }
+                for m in self.messages
+            ]
+        }
+
+    @classmethod
+    def from_json(cls, result_json):
+        """
+        Create a result from the output of ``to_json()``.
+
+        :param dict result_json:
+        :rtype: ValidationResult
+        """
+        result = cls()
+        for m in result_json["messages"]:
+            exc = None if m["exc"] is None else Exception(m["exc"])
+            result.messages.append(FlowValidationFailure(m["type"], m["message"], exc))
+        return result
+
+
+class FlowValidationFailure(Exception):
+    """Generic error for validation failure."""
+
+    def __init__(self, type_, message, original_exc=None):
+        self.type_ = type_
+        self.message = message
+        self.exc = original_exc
+
+    def __str__(self):
+        return f"[{self.type_}] {self.message}"
+
+    def __reduce__(self):
+        # The original exception is not always picklable (e.g. jsonschema errors
+        # refer to the validator's type checker), so only its text is kept.
+        exc = None if self.exc is None else Exception(str(self.exc))
+        return self.__class__, (self.type_, self.message, exc)
+
+
+class ValidationProfile:
+    """
+    Where the time went while validating one document.
+
+    Pass an instance to ``validate_doc(profile=...)`` to fill it in.
+
+    :ivar dict phases: the wall time (in seconds) of each phase of validation, in the
+        order that they ran
+    :ivar collections.Counter counters: the number of objects checked against the
+        schema, and the hits and misses of the caches used while validating
+    :ivar int max_slowest: the number of slowest objects to keep
+    """
+
+    def __init__(self, max_slowest=10):
+        self.phases = dict()
+        self.counters = Counter()
+        self.max_slowest = max_slowest
+        # A min-heap of (seconds, object number, id, type), so that the fastest of the
+        # slowest objects is replaced first.
+        self._slowest = list()
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Add the time spent in the ``with`` block to the named phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed
+
+    def wrap_check(self, check_object):
+        """Time each object that ``check_object`` checks against the schema."""
+
+        def check_object_with_timer(item, result):
+            start = time.perf_counter()
+            try:
+                check_object(item, result)
+            finally:
+                self.add_object(item, time.perf_counter() - start)
+
+        return check_object_with_timer
+
+    def add_object(self, item, seconds):
+        """
+        Record the time taken to check one object.
+
+        :param dict item:
+        :param float seconds:
+        """
+        self.counters["objects"] += 1
+        if self.max_slowest < 1:
+            return
+        entry = (seconds, self.counters["objects"], item.get("id"), item.get("type"))
+        if len(self._slowest) < self.max_slowest:
+            heapq.heappush(self._slowest, entry)
+        elif seconds > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, entry)
+
+    @property
+    def slowest_objects(self):
+        """
+        The objects that took the longest to check, slowest first.
+
+        :rtype: list[dict]
+        """
+        return [
+            {"id": id_, "type": type_, "seconds": seconds}
+            for seconds, _, id_, type_ in sorted(self._slowest, reverse=True)
+        ]
+
+    def to_json(self):
+        """
+        Convert to JSON-serializable data.
+
+        :rtype: dict
+        """
+        return {
+            "phases": dict(self.phases),
+            "total_seconds": sum(self.phases.values()),
+            "counters": dict(self.counters),
+            "slowest_objects": self.slowest_objects,
+        }
@@ -2,18 +2,32 @@
 Tools for working with the Attack Flow schema.
 """
 
+from collections import OrderedDict
+from collections.abc import Mapping
+import contextlib
+import hashlib
+import importlib.metadata
 import json
 import functools
+import logging
 from pathlib import Path
 import re
+import time
 import urllib.parse
 
 import jsonschema
 import networkx as nx
 import stix2.exceptions
 
-from .graph import bundle_to_networkx
-from .model import load_attack_flow_bundle, get_flow_object, ATTACK_FLOW_EXTENSION_ID
+from .graph import _get_removed_extensions
+from .model import (
+    ATTACK_FLOW_EXTENSION_ID,
+    FlowIndex,
+    get_flow_object,
+    parse_attack_flow_bundle,
+)
+from .results import FlowValidationFailure, ValidationProfile, ValidationResult
+from .stream import iter_bundle_objects
 
 SCHEMA_DIR = Path(__file__).resolve().parents[2] / "stix"
 ATTACK_FLOW_SDOS = (
@@ -69,66 +83,384 @@ SROS = (
     "sighting",
 )
 COMMON = "extension-definition"
+OBJECT_MEMO_SIZE = 100_000
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
 
+logger = logging.getLogger(__name__)
 
-class ValidationResult:
-    def __init__(self):
-        self.messages = list()
-
-    @property
-    def success(self):
-        return not any(f.type_ == "error" for f in self.messages)
 
-    @property
-    def strict_success(self):
-        return len(self.messages) == 0
+def validate_doc_with_memo(flow_path, cache=None, profile=None, **options):
+    """
+    Validate an Attack Flow document, reusing the schema messages for objects that
+    this process has already checked in any document. See :func:`get_object_memo`.
 
-    def add_error(self, message):
-        self.messages.append(FlowValidationFailure("error", message))
+    :param Path flow_path: path to attack flow doc
+    :param attack_flow.cache.BundleCache cache:
+    :param ValidationProfile profile: passed to :func:`validate_doc`, with the object
+        memo's hits and misses added to its counters
+    :param options: passed to :func:`validate_doc`, e.g. ``max_errors``
+    :returns: a tuple of the ``ValidationResult``, the number of objects whose messages
+        were reused, the number of objects that were checked, and ``profile`` (which is
+        a copy when this is called in a worker process)
+    """
+    memo = get_object_memo()
+    hits, misses = memo.hits, memo.misses
+    result = validate_doc(
+        flow_path, cache, memo.check_object, profile=profile, **options
+    )
+    hits, misses = memo.hits - hits, memo.misses - misses
+    if profile is not None:
+        profile.counters.update(object_memo_hits=hits, object_memo_misses=misses)
+    return result, hits, misses, profile
+
+
+def validate_doc(
+    flow_path,
+    cache=None,
+    check_object=None,
+    parse_bundle=None,
+    max_errors=None,
+    structural_only=False,
+    time_budget=None,
+    profile=None,
+    stream=False,
+):
+    """
+    Validate an Attack Flow document.
 
-    def add_warning(self, message):
-        self.messages.append(FlowValidationFailure("warning", message))
+    The file is read and parsed once. The STIX library checks that the parsed JSON is
+    valid STIX 2.1, but the graph is checked with the JSON rather than with the STIX
+    objects.
 
-    def add_exc(self, message, exc):
-        self.messages.append(FlowValidationFailure("error", message, exc))
+    Validation can stop early, e.g. when the caller only needs to know whether a
+    document is acceptable. Limits are checked after each stage of validation and after
+    each object is checked against the schema. A stage that has started, like parsing
+    with the STIX library, is not interrupted.
 
+    :param Path flow_path: path to attack flow doc
+    :param attack_flow.cache.BundleCache cache: skip parsing with the STIX library if
+        this document was parsed before
+    :param check_object: a function with the same signature as
+        :func:`check_object_schema` to validate each object with, e.g. one that reuses
+        earlier results
+    :param parse_bundle: a function with the same signature as
+        :func:`attack_flow.model.parse_attack_flow_bundle` to parse the document with
+    :param int max_errors: stop after this many errors, and only report this many
+    :param bool structural_only: only check the bundle's essential objects and the
+        JSON schema, skipping the STIX library, the graph checks, and the best practice
+        checks (which only produce warnings)
+    :param float time_budget: stop with an error if validation takes longer than this
+        many seconds
+    :param ValidationProfile profile: record the time taken by each phase and by the
+        slowest objects, and the cache hits and misses, in this profile
+    :param bool stream: check each object as it is read with
+        :func:`attack_flow.stream.iter_bundle_objects` instead of reading the whole
+        document first. Only the objects' IDs, types, and references are kept for the
+        graph checks, so memory use does not grow with the size of the objects. The
+        document is not parsed with the STIX library, so ``cache`` and
+        ``parse_bundle`` are ignored.
+    :rtype: ValidationResult
+    :raises ValueError: if the document is not valid JSON or is not a JSON object
+    """
+    if stream:
+        return _validate_stream(
+            flow_path, check_object, max_errors, structural_only, time_budget, profile
+        )
+    return _validate(
+        lambda: _parse_json(flow_path.read_bytes()),
+        cache,
+        check_object,
+        parse_bundle,
+        max_errors,
+        structural_only,
+        time_budget,
+        profile,
+    )
 
-class FlowValidationFailure(Exception):
-    """Generic error for validation failure."""
 
-    def __init__(self, type_, message, original_exc=None):
-        self.type_ = type_
-        self.message = message
-        self.exc = original_exc
+def validate_data(data, cache=None, check_object=None, **options):
+    """
+    Validate the contents of an Attack Flow document, e.g. one that was uploaded.
 
-    def __str__(self):
-        return f"[{self.type_}] {self.message}"
+    :param bytes data: the document's JSON
+    :param attack_flow.cache.BundleCache cache:
+    :param check_object: see :func:`validate_doc`
+    :param options: the other keyword arguments of :func:`validate_doc`
+    :rtype: ValidationResult
+    :raises ValueError: if the document is not valid JSON or is not a JSON object
+    """
+    return _validate(lambda: _parse_json(data), cache, check_object, **options)
 
 
-def validate_doc(flow_path):
+def validate_json(flow_json, check_object=None, **options):
     """
-    Validate an Attack Flow document.
+    Validate an Attack Flow document that has already been parsed from JSON.
 
-    :param Path flow_path: path to attack flow doc
+    The document is not cached after it is parsed with the STIX library, because the
+    cache is keyed on the document's JSON text.
+
+    :param dict flow_json: the parsed document
+    :param check_object: see :func:`validate_doc`
+    :param options: the other keyword arguments of :func:`validate_doc`, except for
+        ``cache``
     :rtype: ValidationResult
     """
-    with flow_path.open() as flow_file:
-        flow_json = json.load(flow_file)
+    return _validate(lambda: (None, flow_json), None, check_object, **options)
+
+
+def _parse_json(data):
+    flow_json = json.loads(data)
+    if not isinstance(flow_json, dict):
+        raise ValueError("The document must be a JSON object.")
+    return data, flow_json
+
+
+def _validate(
+    load,
+    cache=None,
+    check_object=None,
+    parse_bundle=None,
+    max_errors=None,
+    structural_only=False,
+    time_budget=None,
+    profile=None,
+):
+    """
+    Validate a document. See :func:`validate_doc`.
 
+    :param load: a function that returns the document's JSON text (or ``None`` if it
+        is not available) and the parsed document
+    """
     result = ValidationResult()
-    check_objects(flow_json, result)
-    check_schema(flow_json, result)
+    limits = _ValidationLimits(result, max_errors, time_budget)
+    if profile is not None:
+        check_object = profile.wrap_check(check_object or check_object_schema)
+        phase = profile.phase
+        validators_before = get_validator_for_object.cache_info()
+        if cache is not None:
+            cache_hits, cache_misses = cache.hits, cache.misses
+    else:
+        phase = _untimed_phase
+    if limits.enabled:
+        check_object = limits.wrap_check(check_object or check_object_schema)
+
     try:
-        bundle = load_attack_flow_bundle(flow_path)
-        graph = bundle_to_networkx(bundle).to_undirected()
-        check_graph(graph, result)
-        check_best_practices(graph, result)
-    except stix2.exceptions.STIXError as e:
-        result.add_error(f"Unable to parse this flow as STIX 2.1: {e}")
+        with phase("read"):
+            data, flow_json = load()
+            index = FlowIndex(flow_json)
+        limits.check()
+
+        with phase("check_objects"):
+            check_objects(flow_json, result, index)
+        limits.check()
+        with phase("check_schema"):
+            check_schema(flow_json, result, check_object)
+        limits.check()
+        if structural_only:
+            return result
+
+        parse_bundle = parse_bundle or parse_attack_flow_bundle
+        try:
+            with phase("parse"):
+                if cache is None or data is None:
+                    bundle = parse_bundle(flow_json)
+                else:
+                    bundle = cache.get(data, lambda _: parse_bundle(flow_json))
+            limits.check()
+            with phase("check_graph"):
+                if None in index.by_id:
+                    # The STIX library generates IDs for objects that do not have one,
+                    # so the graph is checked with the parsed objects instead.
+                    index = FlowIndex(bundle)
+                # Free the parsed objects before checking the graph.
+                del bundle
+                check_flow_graph(index, result)
+        except stix2.exceptions.STIXError as e:
+            result.add_error(f"Unable to parse this flow as STIX 2.1: {e}")
+            limits.check()
+    except _StopValidation:
+        limits.stop()
+    finally:
+        if profile is not None:
+            # Objects that the generated validators cannot confirm are valid are
+            # checked with the generic validator, which is loaded once per type.
+            validators = get_validator_for_object.cache_info()
+            profile.counters.update(
+                validator_cache_hits=validators.hits - validators_before.hits,
+                validator_cache_misses=validators.misses - validators_before.misses,
+            )
+            if cache is not None:
+                profile.counters.update(
+                    bundle_cache_hits=cache.hits - cache_hits,
+                    bundle_cache_misses=cache.misses - cache_misses,
+                )
 
     return result
 
 
+def _validate_stream(
+    flow_path,
+    check_object=None,
+    max_errors=None,
+    structural_only=False,
+    time_budget=None,
+    profile=None,
+):
+    """
+    Validate a document while it is read. See :func:`validate_doc`.
+
+    The essential objects are checked after the schema, because the bundle's
+    ``attack-flow`` object and ``extension-definition`` may be anywhere in it.
+    """
+    result = ValidationResult()
+    limits = _ValidationLimits(result, max_errors, time_budget)
+    check_object = check_object or check_object_schema
+    if profile is not None:
+        check_object = profile.wrap_check(check_object)
+        phase = profile.phase
+        validators_before = get_validator_for_object.cache_info()
+    else:
+        phase = _untimed_phase
+    if limits.enabled:
+        check_object = limits.wrap_check(check_object)
+
+    properties = dict()
+    index = FlowIndex()
+    try:
+        with phase("check_schema"), flow_path.open(encoding="utf8") as flow_file:
+            for obj in iter_bundle_objects(flow_file, properties=properties):
+                check_object(obj, result)
+                index.add_object(_get_graph_properties(obj))
+        limits.check()
+        with phase("check_objects"):
+            check_objects(properties, result, index)
+        limits.check()
+        if not structural_only:
+            with phase("check_graph"):
+                check_flow_graph(index, result)
+    except _StopValidation:
+        limits.stop()
+    finally:
+        if profile is not None:
+            validators = get_validator_for_object.cache_info()
+            profile.counters.update(
+                validator_cache_hits=validators.hits - validators_before.hits,
+                validator_cache_misses=validators.misses - validators_before.misses,
+            )
+
+    return result
+
+
+def _get_graph_properties(obj):
+    """
+    Return the properties of an object that :func:`check_objects` and
+    :func:`check_flow_graph` use: its ID, type, and references, and the description of
+    an ``attack-flow``.
+    """
+    if not isinstance(obj, dict):
+        return obj
+    properties = {
+        key: value
+        for key, value in obj.items()
+        if key in ("id", "type") or key.endswith(("_ref", "_refs"))
+    }
+    if obj.get("type") == "attack-flow" and "description" in obj:
+        properties["description"] = obj["description"]
+    return properties
+
+
+def _untimed_phase(name):
+    return contextlib.nullcontext()
+
+
+class _StopValidation(Exception):
+    pass
+
+
+class _ValidationLimits:
+    """Track the errors and time that a document's validation is allowed."""
+
+    def __init__(self, result, max_errors, time_budget):
+        if max_errors is not None and max_errors < 1:
+            raise ValueError("max_errors must be at least 1")
+        self.result = result
+        self.max_errors = max_errors
+        self.time_budget = time_budget
+        self.deadline = None
+        if time_budget is not None:
+            self.deadline = time.monotonic() + time_budget
+        self.enabled = max_errors is not None or time_budget is not None
+        self._counted = 0
+        self._errors = 0
+
+    def wrap_check(self, check_object):
+        """Check the limits after each object is checked."""
+
+        def check_object_with_limits(item, result):
+            check_object(item, result)
+            self.check()
+
+        return check_object_with_limits
+
+    def check(self):
+        """Raise ``_StopValidation`` if a limit was reached."""
+        if self.max_errors is not None:
+            messages = self.result.messages
+            for message in messages[self._counted :]:
+                self._errors += message.type_ == "error"
+            self._counted = len(messages)
+            if self._errors >= self.max_errors:
+                raise _StopValidation()
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise _StopValidation()
+
+    def stop(self):
+        """Trim the messages to the error limit and explain why validation stopped."""
+        messages = self.result.messages
+        if self.max_errors is not None and self._errors >= self.max_errors:
+            errors = 0
+            for i, message in enumerate(messages):
+                errors += message.type_ == "error"
+                if errors == self.max_errors:
+                    del messages[i + 1 :]
+                    break
+            self.result.add_warning(
+                f"Validation stopped after {self.max_errors} error(s)."
+            )
+        else:
+            self.result.add_error(
+                f"Validation stopped after exceeding the time budget of "
+                f"{self.time_budget:g} seconds."
+            )
+
+
+@functools.lru_cache(maxsize=None)
+def get_compiled_validators():
+    """
+    Return the generated validity checks for common object types.
+
+    See :mod:`attack_flow.schema_compiler`. The checks are only used if they were
+    generated from the current schema files with the installed version of
+    ``jsonschema``.
+
+    :returns: a ``dict`` mapping object types to functions that return ``True`` if an
+        object is valid
+    """
+    from . import schema_validators
+
+    jsonschema_version = importlib.metadata.version("jsonschema")
+    if (
+        schema_validators.JSONSCHEMA_VERSION != jsonschema_version
+        or schema_validators.SCHEMA_DIGEST != get_schema_digest()
+    ):
+        logger.warning(
+            "The generated schema validators are out of date, so validation will be "
+            "slower. Run `python -m attack_flow.schema_compiler` to regenerate them."
+        )
+        return {}
+    return schema_validators.VALIDATORS
+
+
 @functools.lru_cache(maxsize=None)
 def get_validator_for_object(obj_type):
     """
@@ -139,38 +471,124 @@ def get_validator_for_object(obj_type):
     :param str obj_type:
     :rtype: jsonschema.protocols.Validator
     """
-    resolver = jsonschema.validators.RefResolver(
-        base_uri="",
-        referrer=True,
-        handlers={"https": resolve_url_to_local, "http": resolve_url_to_local},
-    )
+    if schema_path := get_schema_path(obj_type):
+        schema_json = get_schema_registry()[schema_path]
+        return jsonschema.Draft202012Validator(schema_json, resolver=get_resolver())
+    else:
+        return None
+
 
+def warm_validator_cache():
+    """
+    Load the validators for every object type that has a schema.
+
+    Validators are otherwise loaded the first time that each type is seen. This is
+    useful for a worker process that will validate many documents.
+    """
+    get_compiled_validators()
+    for obj_type in ATTACK_FLOW_SDOS + SDOS + SCOS + SROS + (COMMON,):
+        get_validator_for_object(obj_type)
+
+
+def get_schema_path(obj_type):
+    """
+    Return the path to the JSON schema for the given object type.
+
+    :param str obj_type:
+    :returns: a ``Path``, or ``None`` if there is no schema for this type
+    """
     if obj_type in ATTACK_FLOW_SDOS:
-        schema_path = SCHEMA_DIR / "attack-flow-schema-2.0.0.json"
+        return SCHEMA_DIR / "attack-flow-schema-2.0.0.json"
     elif obj_type in SDOS:
-        schema_path = SCHEMA_DIR / "oasis-open" / "sdos" / f"{obj_type}.json"
+        return SCHEMA_DIR / "oasis-open" / "sdos" / f"{obj_type}.json"
     elif obj_type in SCOS:
-        schema_path = SCHEMA_DIR / "oasis-open" / "observables" / f"{obj_type}.json"
+        return SCHEMA_DIR / "oasis-open" / "observables" / f"{obj_type}.json"
     elif obj_type in SROS:
-        schema_path = SCHEMA_DIR / "oasis-open" / "sros" / f"{obj_type}.json"
+        return SCHEMA_DIR / "oasis-open" / "sros" / f"{obj_type}.json"
     elif obj_type in COMMON:
-        schema_path = SCHEMA_DIR / "oasis-open" / "common" / f"{obj_type}.json"
-    else:
-        schema_path = None
-
-    if schema_path:
-        with schema_path.open() as schema_file:
-            schema_json = json.load(schema_file)
-        return jsonschema.Draft202012Validator(schema_json, resolver=resolver)
+        return SCHEMA_DIR / "oasis-open" / "common" / f"{obj_type}.json"
     else:
         return None
 
 
+def get_resolver():
+    """
+    Return a new resolver for the schemas in the registry.
+
+    Each validator needs its own resolver because a resolver tracks the scope of the
+    validation in progress, but all of them share the schemas in the registry.
+
+    :rtype: jsonschema.validators.RefResolver
+    """
+    return jsonschema.validators.RefResolver(
+        base_uri="",
+        referrer=True,
+        store=_get_schema_store(),
+        handlers={"https": resolve_url_to_local, "http": resolve_url_to_local},
+    )
+
+
+def get_schema_files():
+    """
+    Return the paths of all of the schema files.
+
+    :rtype: list[Path]
+    """
+    return [SCHEMA_DIR / "attack-flow-schema-2.0.0.json"] + sorted(
+        (SCHEMA_DIR / "oasis-open").glob("**/*.json")
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_schema_registry():
+    """
+    Return all of the schemas, parsed.
+
+    The schema files are read once per process, the first time that they are needed,
+    and every validator resolves references against the parsed schemas instead of
+    reading files.
+
+    :returns: a ``dict`` mapping each schema file's path to its parsed JSON
+    """
+    return {path: json.loads(data) for path, data in _read_schema_files().items()}
+
+
+def get_schema_digest():
+    """
+    Return a digest of all of the schema files.
+
+    :rtype: str
+    """
+    digest = hashlib.sha256()
+    for path, data in _read_schema_files().items():
+        digest.update(path.relative_to(SCHEMA_DIR).as_posix().encode())
+        digest.update(data)
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _read_schema_files():
+    return {path: path.read_bytes() for path in get_schema_files()}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_schema_store():
+    """Index the schemas by their ``$id`` URLs."""
+    return {
+        schema["$id"]: schema
+        for schema in get_schema_registry().values()
+        if "$id" in schema
+    }
+
+
 def resolve_url_to_local(url):
     """
     To avoid constantly downloading schemas from the internet, they are all stored
     locally and the URLs are mapped to filesystem paths.
 
+    Some references use a different URL for a schema than its ``$id``, so they are not
+    found in a resolver's store and are resolved here instead.
+
     :param str url:
     :returns: a `dict` containing the parsed JSON schema
     """
@@ -182,12 +600,14 @@ def resolve_url_to_local(url):
         local_path = oasis_schema.joinpath(*parsed.path.split("/")[-2:])
     else:
         raise RuntimeError(f"Cannot resolve schema URL to a local file path: {url}")
+    if (local_schema := get_schema_registry().get(local_path)) is not None:
+        return local_schema
     with local_path.open() as local_file:
         local_schema = json.load(local_file)
     return local_schema
 
 
-def check_objects(flow_json, result):
+def check_objects(flow_json, result, index=None):
     """
     Check the Attack Flow document contains some essential objects: a top-level
     ``bundle``, exactly one ``attack-flow`` instance, and the proper
@@ -195,6 +615,7 @@ def check_objects(flow_json, result):
 
     :param dict flow_json: The flow parsed from JSON
     :param ValidationResult result:
+    :param FlowIndex index: an index of ``flow_json``, if the caller already has one
     """
     if flow_json.get("type") != "bundle":
         result.add_error(
@@ -204,51 +625,158 @@ def check_objects(flow_json, result):
         result.add_error("The bundle ID must be a GUID starting with `bundle--`.")
     if not isinstance(flow_json.get("objects"), list):
         result.add_error("The bundle must contain an array called `objects`.")
-    flows = [o for o in flow_json.get("objects", []) if o["type"] == "attack-flow"]
-    if len(flows) != 1:
+    if index is None:
+        index = FlowIndex(flow_json)
+    if len(index.get_objects("attack-flow")) != 1:
         result.add_error("The bundle must contain exactly one `attack-flow` object.")
-    exts = [
-        o
-        for o in flow_json.get("objects", [])
-        if o["type"] == "extension-definition"
-        and o.get("id") == ATTACK_FLOW_EXTENSION_ID
-    ]
-    if not exts:
+    ext = index.by_id.get(ATTACK_FLOW_EXTENSION_ID)
+    if ext is None or ext["type"] != "extension-definition":
         result.add_error(
             "The bundle must include the Attack Flow `extension-definition`."
         )
 
 
-def check_schema(flow_json, result):
+def check_schema(flow_json, result, check_object=None):
     """
     Validate a document against the JSON schema.
 
     :param dict flow_json: The flow parsed from JSON
     :param ValidationResult result:
+    :param check_object: the function to validate each object with (default:
+        :func:`check_object_schema`)
     """
+    check_object = check_object or check_object_schema
     for item in flow_json.get("objects", []):
-        if not (validator := get_validator_for_object(item["type"])):
-            result.add_warning(f"Cannot validate objects of type: {item['type']}")
-            continue
-
-        for error in validator.iter_errors(item):
-            if isinstance(error.instance, dict):
-                obj_id = error.instance.get("id", "N/A")
-                message = f"Object id={obj_id}: "
-            else:
-                message = f"{error.instance}: "
-            if comment := error.schema.get("$comment"):
-                message += f"{comment} (Detail: {error.message})"
-            else:
-                message += error.message
-            result.add_exc(message, error)
+        check_object(item, result)
+
+
+def check_object_schema(item, result):
+    """
+    Validate a single STIX object against the JSON schema for its type.
+
+    This is useful for validating objects one at a time, e.g. when streaming them from
+    a large bundle with :func:`attack_flow.stream.iter_bundle_objects`.
+
+    :param dict item: The object parsed from JSON
+    :param ValidationResult result:
+    """
+    # Most objects are valid, and a generated check can confirm that much faster than
+    # the generic validator. The generic validator is still used to report errors.
+    if (is_valid := get_compiled_validators().get(item["type"])) and is_valid(item):
+        return
+    _report_schema_errors(item, result)
+
+
+def _report_schema_errors(item, result):
+    """Check an object with the generic validator and add a message for each error."""
+    if not (validator := get_validator_for_object(item["type"])):
+        result.add_warning(f"Cannot validate objects of type: {item['type']}")
+        return
+
+    for error in validator.iter_errors(item):
+        if isinstance(error.instance, dict):
+            obj_id = error.instance.get("id", "N/A")
+            message = f"Object id={obj_id}: "
+        else:
+            message = f"{error.instance}: "
+        if comment := error.schema.get("$comment"):
+            message += f"{comment} (Detail: {error.message})"
+        else:
+            message += error.message
+        result.add_exc(message, error)
+
+
+@functools.lru_cache(maxsize=None)
+def get_object_memo():
+    """
+    Return the object memo that is shared by every document validated in this process.
+
+    :rtype: ObjectMemo
+    """
+    return ObjectMemo()
+
+
+class ObjectMemo:
+    """
+    Memoize the schema messages for objects, keyed on their contents.
+
+    Many objects are repeated verbatim across flows (e.g. the author's identity and
+    common attack patterns), so each one only needs to be checked with the generic
+    validator once. Objects that a generated check confirms are valid are not
+    memoized, because the check is faster than hashing the object. The least recently
+    used entries are evicted when there are more than ``max_size``.
+
+    :ivar int hits: the number of objects whose messages were reused
+    :ivar int misses: the number of objects that were checked with the generic
+        validator
+    """
+
+    def __init__(self, max_size=OBJECT_MEMO_SIZE):
+        """
+        Constructor.
+
+        :param int max_size: the maximum number of objects to remember
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._messages = OrderedDict()
+
+    def __len__(self):
+        return len(self._messages)
+
+    def check_object(self, item, result):
+        """
+        Like :func:`check_object_schema`, but reuse the messages for an object that has
+        been checked before.
+
+        :param dict item: The object parsed from JSON
+        :param ValidationResult result:
+        """
+        result.messages.extend(self.get_messages(item))
+
+    def get_messages(self, item, key=None):
+        """
+        Return the schema messages for an object.
+
+        :param dict item: The object parsed from JSON
+        :param bytes key: the object's key, if the caller has already computed it with
+            :func:`get_object_key`
+        :rtype: list[FlowValidationFailure]
+        """
+        if (is_valid := get_compiled_validators().get(item["type"])) and is_valid(item):
+            return []
+
+        key = key or get_object_key(item)
+        if (messages := self._messages.get(key)) is not None:
+            self._messages.move_to_end(key)
+            self.hits += 1
+            return messages
+
+        object_result = ValidationResult()
+        _report_schema_errors(item, object_result)
+        self._messages[key] = messages = object_result.messages
+        self.misses += 1
+        if len(self._messages) > self.max_size:
+            self._messages.popitem(last=False)
+        return messages
+
+
+def get_object_key(item):
+    """
+    Return a digest of an object's contents that does not depend on key order.
+
+    :param dict item:
+    :rtype: bytes
+    """
+    return hashlib.sha256(_CANONICAL_ENCODER.encode(item).encode()).digest()
 
 
 def check_graph(graph, result):
     """
     Check characteristics of the Attack Flow graph.
 
-    :param nx.DiGraph graph:
+    :param nx.Graph graph: an undirected graph
     :param ValidationResult result:
     """
     # Check that all nodes are connected to the attack flow graph or one of the
@@ -278,6 +806,115 @@ def check_graph(graph, result):
             )
 
 
+def check_flow_graph(index, result):
+    """
+    Check the Attack Flow graph without building it.
+
+    This reports the same warnings as calling :func:`check_graph` and
+    :func:`check_best_practices` on the graph from
+    :func:`attack_flow.graph.bundle_to_networkx`, but it finds the connected nodes with
+    union-find over the objects' references, which takes close to linear time and much
+    less memory than a NetworkX graph.
+
+    :param FlowIndex index:
+    :param ValidationResult result:
+    """
+    graph = _ReferenceGraph(index)
+    for node in graph.get_disconnected():
+        if not re.match(r"^(threat-actor|campaign)--", node):
+            result.add_warning(f"Node id={node} is not connected to the main flow.")
+
+    # Check for dangling Attack Flow references.
+    for id_, obj in graph.nodes.items():
+        inferred_type = id_.split("--")[0]
+        if inferred_type in ATTACK_FLOW_SDOS and obj is None:
+            result.add_warning(
+                f"Node id={id_} is referenced in the flow but is not defined."
+            )
+
+    flow_id = next((n for n in graph.nodes if n.startswith("attack-flow--")), None)
+    if flow_id is not None and not (graph.nodes[flow_id] or {}).get("description"):
+        result.add_warning("The ``attack-flow`` object should have a description.")
+
+
+class _ReferenceGraph:
+    """
+    The nodes of the graph that :func:`attack_flow.graph.bundle_to_networkx` builds, and
+    which of them are connected when the edges are undirected.
+
+    :ivar dict nodes: node ID -> the object with that ID, or ``None`` if the node is
+        only referenced, in the same order as the graph's nodes
+    """
+
+    def __init__(self, index):
+        self.nodes = dict()
+        # The ``(source, target)`` of each edge in the graph's order
+        self._edges = list()
+        for obj in index.objects:
+            # A bundle that is validated as a stream is not parsed with the STIX
+            # library, so skip anything that the schema check reports as malformed.
+            if not isinstance(obj, Mapping):
+                continue
+            if obj.get("type") == "relationship":
+                edge = (obj.get("source_ref"), obj.get("target_ref"))
+                if all(isinstance(ref, str) for ref in edge):
+                    self._edges.append(edge)
+            elif isinstance(obj_id := obj.get("id"), str):
+                self.nodes[obj_id] = obj
+                self._edges.extend((obj_id, ref) for _, ref in index.refs[obj_id])
+        for source, target in self._edges:
+            self.nodes.setdefault(source, None)
+            self.nodes.setdefault(target, None)
+        self._remove_extensions()
+
+    def _remove_extensions(self):
+        """
+        Remove extension definitions, and their creators if they are not attached to
+        other nodes, in the same way as ``bundle_to_networkx()``.
+        """
+        for node in _get_removed_extensions(self.nodes, self._edges):
+            del self.nodes[node]
+
+    def get_disconnected(self):
+        """
+        Return the nodes that are not connected to the ``attack-flow`` object or to an
+        ``extension-definition``.
+
+        :rtype: list[str]
+        """
+        positions = {node: i for i, node in enumerate(self.nodes)}
+        parents = list(range(len(positions)))
+        sizes = [1] * len(positions)
+
+        def find(i):
+            while parents[i] != i:
+                # Path halving
+                parents[i] = parents[parents[i]]
+                i = parents[i]
+            return i
+
+        for source, target in self._edges:
+            i = positions.get(source)
+            j = positions.get(target)
+            if i is None or j is None:
+                # An edge of a removed node
+                continue
+            i, j = find(i), find(j)
+            if i != j:
+                if sizes[i] < sizes[j]:
+                    i, j = j, i
+                parents[j] = i
+                sizes[i] += sizes[j]
+
+        seeds = {
+            find(positions[node])
+            for node, obj in self.nodes.items()
+            if obj is not None
+            and obj.get("type") in ("attack-flow", "extension-definition")
+        }
+        return [node for node, i in positions.items() if find(i) not in seeds]
+
+
 def check_best_practices(graph, result):
     """
     Check for some best practices.
@@ -0,0 +1,519 @@
+"""
+Generate Python validity checks from the Attack Flow and STIX JSON schemas.
+
+The generic JSON schema validator walks the schema for every object it validates,
+resolving each ``$ref`` as it goes. This module walks the schemas once, ahead of time,
+and writes out a Python module containing one function per object type that answers
+the only question asked on the fast path: *is this object valid?* Objects that are
+not valid are passed to the generic validator, which produces the detailed error
+messages, so the generated code never has to reproduce them.
+
+The generated functions follow the semantics of the ``jsonschema`` version that they
+were generated with, including its handling of ``unevaluatedProperties``. A schema
+that uses a keyword this module does not support raises ``UnsupportedSchema``.
+
+To regenerate the validators after editing a schema::
+
+    $ python -m attack_flow.schema_compiler
+"""
+
+import importlib.metadata
+import json
+from pathlib import Path
+import sys
+import urllib.parse
+
+import jsonschema
+
+from .schema import (
+    ATTACK_FLOW_SDOS,
+    get_resolver,
+    get_schema_digest,
+    get_schema_path,
+)
+
+OUTPUT_PATH = Path(__file__).resolve().parent / "schema_validators.py"
+COMPILED_TYPES = ATTACK_FLOW_SDOS + (
+    "directory",
+    "extension-definition",
+    "file",
+    "identity",
+    "infrastructure",
+    "ipv4-addr",
+    "malware",
+    "note",
+    "process",
+    "relationship",
+    "threat-actor",
+    "tool",
+    "url",
+    "user-account",
+    "vulnerability",
+)
+
+# Keywords that jsonschema does not act on when validating without a format checker.
+IGNORED_KEYWORDS = frozenset(["format", "then", "else"])
+SUPPORTED_KEYWORDS = frozenset(
+    [
+        "$ref",
+        "additionalProperties",
+        "allOf",
+        "anyOf",
+        "const",
+        "contains",
+        "enum",
+        "if",
+        "items",
+        "maximum",
+        "maxLength",
+        "minimum",
+        "minItems",
+        "minLength",
+        "minProperties",
+        "not",
+        "oneOf",
+        "pattern",
+        "patternProperties",
+        "properties",
+        "propertyNames",
+        "required",
+        "type",
+        "unevaluatedProperties",
+    ]
+)
+TYPE_CHECKS = {
+    "array": "isinstance({0}, list)",
+    "boolean": "isinstance({0}, bool)",
+    "integer": (
+        "(isinstance({0}, int) and not isinstance({0}, bool)"
+        " or isinstance({0}, float) and {0}.is_integer())"
+    ),
+    "null": "{0} is None",
+    "number": "(isinstance({0}, _Number) and not isinstance({0}, bool))",
+    "object": "isinstance({0}, dict)",
+    "string": "isinstance({0}, str)",
+}
+INLINE_KEYWORDS = frozenset(
+    ["const", "enum", "maximum", "maxLength", "minimum", "minLength", "pattern", "type"]
+)
+
+HEADER = '''"""
+Validity checks generated from the Attack Flow and STIX JSON schemas.
+
+DO NOT EDIT. This file is generated by ``python -m attack_flow.schema_compiler``.
+"""
+
+from numbers import Number as _Number
+import re
+
+from jsonschema._utils import equal as _equal, unbool as _unbool
+
+JSONSCHEMA_VERSION = {jsonschema_version!r}
+SCHEMA_DIGEST = {schema_digest!r}
+
+
+def _enum(instance, enums):
+    if instance == 0 or instance == 1:
+        unbooled = _unbool(instance)
+        return not all(unbooled != _unbool(each) for each in enums)
+    return instance in enums
+'''
+
+
+class UnsupportedSchema(Exception):
+    """Raised for a schema that cannot be compiled."""
+
+
+class SchemaCompiler:
+    """
+    Compiles JSON schemas into the source code of a Python module.
+
+    Each distinct schema node becomes a function that returns ``True`` if its argument
+    is valid. Nodes that only contain simple keywords are inlined into the function
+    that uses them.
+    """
+
+    def __init__(self):
+        """Constructor."""
+        self.resolver = get_resolver()
+        self.constants = list()
+        self.functions = list()
+        self._constant_names = dict()
+        self._check_names = dict()
+        self._evaluated_names = dict()
+        # Keep every node alive so that ``id()`` keys are not reused.
+        self._nodes = list()
+
+    def compile_type(self, obj_type):
+        """
+        Compile the schema for an object type.
+
+        :param str obj_type:
+        :returns: the name of the generated function
+        :rtype: str
+        """
+        with get_schema_path(obj_type).open() as schema_file:
+            schema = json.load(schema_file)
+        return self._get_check_function(schema, "")
+
+    def get_source(self, validators):
+        """
+        Return the source code for the generated module.
+
+        :param dict[str,str] validators: maps object types to function names
+        :rtype: str
+        """
+        lines = [
+            HEADER.format(
+                jsonschema_version=importlib.metadata.version("jsonschema"),
+                schema_digest=get_schema_digest(),
+            )
+        ]
+        lines.extend(self.constants)
+        lines.append("")
+        for function in self.functions:
+            lines.append("")
+            lines.append(function)
+        lines.append("")
+        lines.append("VALIDATORS = {")
+        for obj_type, name in validators.items():
+            lines.append(f"    {obj_type!r}: {name},")
+        lines.append("}")
+        return "\n".join(lines) + "\n"
+
+    def _constant(self, prefix, value, expression):
+        key = (prefix, repr(value))
+        if key not in self._constant_names:
+            name = f"_{prefix}{len(self._constant_names)}"
+            self._constant_names[key] = name
+            self.constants.append(f"{name} = {expression}")
+        return self._constant_names[key]
+
+    def _regex(self, pattern):
+        return self._constant("re", pattern, f"re.compile({pattern!r}).search")
+
+    def _get_scope(self, schema, scope):
+        if isinstance(schema, dict) and "$id" in schema:
+            return urllib.parse.urljoin(scope, schema["$id"])
+        return scope
+
+    def _resolve(self, ref, scope):
+        self.resolver.push_scope(scope)
+        try:
+            return self.resolver.resolve(ref)
+        finally:
+            self.resolver.pop_scope()
+
+    def _node_key(self, schema, scope):
+        self._nodes.append(schema)
+        return (id(schema), urllib.parse.urldefrag(scope).url)
+
+    def _check(self, schema, scope, var):
+        """Return an expression that is true if ``var`` is valid against ``schema``."""
+        if schema is True:
+            return "True"
+        elif schema is False:
+            return "False"
+        elif not isinstance(schema, dict):
+            raise UnsupportedSchema(f"Not a schema: {schema!r}")
+        keywords = _get_keywords(schema)
+        if "$id" not in schema and keywords <= INLINE_KEYWORDS:
+            failures = [
+                failure
+                for keyword in schema
+                if keyword in keywords
+                for failure in self._inline_failures(keyword, schema[keyword], var)
+            ]
+            if not failures:
+                return "True"
+            return f"not ({' or '.join(failures)})"
+        return f"{self._get_check_function(schema, scope)}({var})"
+
+    def _inline_failures(self, keyword, value, var):
+        """Yield expressions that are true if ``var`` fails this keyword."""
+        if keyword == "type":
+            types = [value] if isinstance(value, str) else value
+            checks = " or ".join(TYPE_CHECKS[t].format(var) for t in types)
+            yield f"not ({checks})"
+        elif keyword == "const":
+            if isinstance(value, str):
+                yield f"not {var} == {value!r}"
+            else:
+                yield f"not _equal({var}, {value!r})"
+        elif keyword == "enum":
+            if all(isinstance(v, str) for v in value):
+                name = self._constant("enum", value, f"frozenset({value!r})")
+                yield f"not (isinstance({var}, str) and {var} in {name})"
+            else:
+                yield f"not _enum({var}, {value!r})"
+        elif keyword == "pattern":
+            yield f"(isinstance({var}, str) and not {self._regex(value)}({var}))"
+        elif keyword == "minLength":
+            yield f"(isinstance({var}, str) and len({var}) < {value!r})"
+        elif keyword == "maxLength":
+            yield f"(isinstance({var}, str) and len({var}) > {value!r})"
+        elif keyword in ("minimum", "maximum"):
+            op = "<" if keyword == "minimum" else ">"
+            number = TYPE_CHECKS["number"].format(var)
+            yield f"({number} and {var} {op} {value!r})"
+        else:
+            raise UnsupportedSchema(f"Cannot inline keyword: {keyword}")
+
+    def _get_check_function(self, schema, scope):
+        """Return the name of a function that checks ``schema``, generating it once."""
+        scope = self._get_scope(schema, scope)
+        key = self._node_key(schema, scope)
+        if key in self._check_names:
+            return self._check_names[key]
+        name = f"_check{len(self._check_names)}"
+        self._check_names[key] = name
+
+        if schema is True or schema is False:
+            self.functions.append(f"def {name}(i):\n    return {schema}\n")
+            return name
+
+        body = list()
+        object_body = list()
+        array_body = list()
+        keywords = _get_keywords(schema)
+        for keyword, value in schema.items():
+            if keyword not in keywords:
+                continue
+            elif keyword in INLINE_KEYWORDS:
+                for failure in self._inline_failures(keyword, value, "i"):
+                    body.append(f"if {failure}:\n    return False")
+            elif keyword == "$ref":
+                url, resolved = self._resolve(value, scope)
+                body.append(
+                    f"if not {self._check(resolved, url, 'i')}:\n    return False"
+                )
+            elif keyword == "required":
+                if value:
+                    missing = " or ".join(f"{p!r} not in i" for p in value)
+                    object_body.append(f"if {missing}:\n    return False")
+            elif keyword == "minProperties":
+                object_body.append(f"if len(i) < {value!r}:\n    return False")
+            elif keyword == "properties":
+                for prop, subschema in value.items():
+                    check = self._check(subschema, scope, "v")
+                    if check != "True":
+                        object_body.append(
+                            f"if {prop!r} in i:\n"
+                            f"    v = i[{prop!r}]\n"
+                            f"    if not {check}:\n"
+                            f"        return False"
+                        )
+            elif keyword == "patternProperties":
+                for pattern, subschema in value.items():
+                    check = self._check(subschema, scope, "v")
+                    object_body.append(
+                        f"for k, v in i.items():\n"
+                        f"    if {self._regex(pattern)}(k) and not {check}:\n"
+                        f"        return False"
+                    )
+            elif keyword == "additionalProperties":
+                object_body.extend(self._additional_properties(schema, scope))
+            elif keyword == "propertyNames":
+                check = self._check(value, scope, "k")
+                object_body.append(
+                    f"for k in i:\n    if not {check}:\n        return False"
+                )
+            elif keyword == "unevaluatedProperties":
+                evaluated = self._get_evaluated_function(schema, scope)
+                evaluated = f"{evaluated}(i)" if evaluated else "set()"
+                if value is False:
+                    object_body.append(
+                        f"if not {evaluated}.issuperset(i):\n    return False"
+                    )
+                elif value is not True:
+                    check = self._check(value, scope, "v")
+                    object_body.append(
+                        f"evaluated = {evaluated}\n"
+                        f"for k, v in i.items():\n"
+                        f"    if k not in evaluated and not {check}:\n"
+                        f"        return False"
+                    )
+            elif keyword == "minItems":
+                array_body.append(f"if len(i) < {value!r}:\n    return False")
+            elif keyword == "items":
+                if "prefixItems" in schema:
+                    raise UnsupportedSchema("prefixItems")
+                check = self._check(value, scope, "v")
+                array_body.append(
+                    f"for v in i:\n    if not {check}:\n        return False"
+                )
+            elif keyword == "contains":
+                if "minContains" in schema or "maxContains" in schema:
+                    raise UnsupportedSchema("minContains/maxContains")
+                check = self._check(value, scope, "v")
+                array_body.append(f"if not any({check} for v in i):\n    return False")
+            elif keyword == "allOf":
+                for subschema in value:
+                    check = self._check(subschema, scope, "i")
+                    body.append(f"if not {check}:\n    return False")
+            elif keyword == "anyOf":
+                checks = " or ".join(self._check(s, scope, "i") for s in value)
+                body.append(f"if not ({checks}):\n    return False")
+            elif keyword == "oneOf":
+                checks = " + ".join(f"({self._check(s, scope, 'i')})" for s in value)
+                body.append(f"if {checks} != 1:\n    return False")
+            elif keyword == "not":
+                body.append(f"if {self._check(value, scope, 'i')}:\n    return False")
+            elif keyword == "if":
+                then_check = self._check(schema.get("then", True), scope, "i")
+                else_check = self._check(schema.get("else", True), scope, "i")
+                body.append(
+                    f"if {self._check(value, scope, 'i')}:\n"
+                    f"    if not {then_check}:\n"
+                    f"        return False\n"
+                    f"elif not {else_check}:\n"
+                    f"    return False"
+                )
+            else:
+                raise UnsupportedSchema(f"Keyword not supported: {keyword}")
+
+        if object_body:
+            body.append(_block("if isinstance(i, dict):", object_body))
+        if array_body:
+            body.append(_block("if isinstance(i, list):", array_body))
+        body.append("return True")
+        self.functions.append(_block(f"def {name}(i):", body))
+        return name
+
+    def _additional_properties(self, schema, scope):
+        value = schema["additionalProperties"]
+        if value is True:
+            return []
+        extras = "i"
+        if properties := schema.get("properties"):
+            name = self._constant(
+                "props", list(properties), f"frozenset({list(properties)!r})"
+            )
+            extras = f"i.keys() - {name}"
+        if patterns := schema.get("patternProperties"):
+            regex = self._regex("|".join(patterns))
+            extras = f"(k for k in {extras} if not {regex}(k))"
+        if value is False:
+            return [f"for k in {extras}:\n    return False"]
+        check = self._check(value, scope, "i[k]")
+        return [f"for k in {extras}:\n    if not {check}:\n        return False"]
+
+    def _get_evaluated_function(self, schema, scope):
+        """
+        Return the name of a function that returns the set of properties evaluated by
+        ``schema``, or ``None`` if it never evaluates any properties.
+
+        This mirrors ``jsonschema._utils.find_evaluated_property_keys_by_schema``.
+        """
+        if not isinstance(schema, dict):
+            return None
+        # Unlike validation, this does not push the scope of ``$id``.
+        key = self._node_key(schema, scope)
+        if key in self._evaluated_names:
+            return self._evaluated_names[key]
+        name = f"_evaluated{len(self._evaluated_names)}"
+        self._evaluated_names[key] = name
+
+        body = list()
+        if "$ref" in schema:
+            url, resolved = self._resolve(schema["$ref"], scope)
+            if evaluated := self._get_evaluated_function(resolved, url):
+                body.append(f"keys |= {evaluated}(i)")
+        for keyword in ("properties", "additionalProperties", "unevaluatedProperties"):
+            if keyword not in schema:
+                continue
+            value = schema[keyword]
+            if value is True:
+                body.append("keys.update(i)")
+            elif value is False:
+                pass
+            elif keyword == "properties":
+                for prop, subschema in value.items():
+                    check = self._check(subschema, scope, f"i[{prop!r}]")
+                    body.append(
+                        f"if {prop!r} in i and {check}:\n    keys.add({prop!r})"
+                    )
+            else:
+                raise UnsupportedSchema(f"{keyword} with a schema")
+        if patterns := schema.get("patternProperties"):
+            if not patterns.keys().isdisjoint(
+                jsonschema.Draft202012Validator.VALIDATORS.keys() | {"$id"}
+            ):
+                raise UnsupportedSchema("patternProperties named like a keyword")
+            regex = " or ".join(f"{self._regex(p)}(k)" for p in patterns)
+            body.append(f"keys.update(k for k in i if {regex})")
+        if "dependentSchemas" in schema:
+            raise UnsupportedSchema("dependentSchemas")
+        for keyword in ("allOf", "oneOf", "anyOf"):
+            for subschema in schema.get(keyword, []):
+                if evaluated := self._get_evaluated_function(subschema, scope):
+                    check = self._check(subschema, scope, "i")
+                    body.append(f"if {check}:\n    keys |= {evaluated}(i)")
+        if "if" in schema:
+            if_evaluated = [
+                self._get_evaluated_function(schema[k], scope)
+                for k in ("if", "then")
+                if k in schema
+            ]
+            else_evaluated = self._get_evaluated_function(schema.get("else"), scope)
+            if any(if_evaluated) or else_evaluated:
+                if_body = [f"keys |= {e}(i)" for e in if_evaluated if e] or ["pass"]
+                body.append(
+                    _block(f"if {self._check(schema['if'], scope, 'i')}:", if_body)
+                )
+                if else_evaluated:
+                    body.append(_block("else:", [f"keys |= {else_evaluated}(i)"]))
+
+        if not body:
+            self._evaluated_names[key] = None
+            return None
+        body.insert(0, "keys = set()")
+        body.append("return keys")
+        self.functions.append(_block(f"def {name}(i):", body))
+        return name
+
+
+def _get_keywords(schema):
+    """Return the keywords in ``schema`` that affect validation."""
+    keywords = (
+        schema.keys() & jsonschema.Draft202012Validator.VALIDATORS.keys()
+    ) - IGNORED_KEYWORDS
+    if unsupported := keywords - SUPPORTED_KEYWORDS:
+        raise UnsupportedSchema(f"Keywords not supported: {sorted(unsupported)}")
+    return keywords
+
+
+def _block(header, statements):
+    lines = [header]
+    for statement in statements:
+        lines.extend(f"    {line}" for line in statement.split("\n"))
+    return "\n".join(lines)
+
+
+def generate_validators(types=COMPILED_TYPES):
+    """
+    Generate the source code for a module of validity checks.
+
+    :param tuple[str] types: the object types to compile
+    :rtype: str
+    """
+    compiler = SchemaCompiler()
+    validators = {obj_type: compiler.compile_type(obj_type) for obj_type in types}
+    return compiler.get_source(validators)
+
+
+def main(args):
+    """
+    Write the generated validators to a file.
+
+    :param list[str] args: an optional output path
+    :returns: exit code
+    """
+    output_path = Path(args[0]) if args else OUTPUT_PATH
+    output_path.write_text(generate_validators())
+    print(f"Generated validators: {output_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
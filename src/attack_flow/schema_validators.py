@@ -0,0 +1,5544 @@
+"""
+Validity checks generated from the Attack Flow and STIX JSON schemas.
+
+DO NOT EDIT. This file is generated by ``python -m attack_flow.schema_compiler``.
+"""
+
+from numbers import Number as _Number
+import re
+
+from jsonschema._utils import equal as _equal, unbool as _unbool
+
+JSONSCHEMA_VERSION = '4.17.3'
+SCHEMA_DIGEST = 'ac11e9883d940414849a7a184e82afb3b638d4e329dd42f91dd10c7fae8137eb'
+
+
+def _enum(instance, enums):
+    if instance == 0 or instance == 1:
+        unbooled = _unbool(instance)
+        return not all(unbooled != _unbool(each) for each in enums)
+    return instance in enums
+
+_re0 = re.compile('^([a-z][a-z0-9]*)+(-[a-z0-9]+)*\\-?$').search
+_enum1 = frozenset(['action'])
+_enum2 = frozenset(['2.0', '2.1'])
+_re3 = re.compile('^[a-z][a-z0-9-]+[a-z0-9]--[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[1-5][0-9a-fA-F]{3}-[89abAB][0-9a-fA-F]{3}-[0-9a-fA-F]{12}$').search
+_re4 = re.compile('^[0-9]{4}-(0[1-9]|1[012])-(0[1-9]|[12][0-9]|3[01])T([01][0-9]|2[0-3]):([0-5][0-9]):([0-5][0-9]|60)(\\.[0-9]+)?Z$').search
+_re5 = re.compile('T\\d{2}:\\d{2}:\\d{2}\\.\\d{3,}Z$').search
+_re6 = re.compile('^[a-zA-Z0-9_-]{0,250}$').search
+_re7 = re.compile('^[a-zA-Z0-9_-]{3,250}$').search
+_re8 = re.compile('^[a-fA-F0-9]{32}$').search
+_re9 = re.compile('^MD5$').search
+_re10 = re.compile('^[a-fA-F0-9]{40}$').search
+_re11 = re.compile('^SHA-1$').search
+_re12 = re.compile('^[a-fA-F0-9]{64}$').search
+_re13 = re.compile('^SHA-256$').search
+_re14 = re.compile('^[a-fA-F0-9]{128}$').search
+_re15 = re.compile('^SHA-512$').search
+_re16 = re.compile('^SHA3-256$').search
+_re17 = re.compile('^SHA3-512$').search
+_re18 = re.compile('^[a-zA-Z0-9/+:.]{1,128}$').search
+_re19 = re.compile('^SSDEEP$').search
+_re20 = re.compile('^[a-zA-Z0-9]{70}$').search
+_re21 = re.compile('^TLSH$').search
+_re22 = re.compile('^[a-zA-Z0-9_-]{3,250}$|^MD5$|^SHA-1$|^SHA-256$|^SHA-512$|^SHA3-256$|^SHA3-512$|^SSDEEP$|^TLSH$').search
+_re23 = re.compile('^MD5|SHA-1|SHA-256|SHA-512|SHA3-256|SHA3-512|SSDEEP|TLSH$').search
+_re24 = re.compile('^cve$').search
+_re25 = re.compile('^CVE-\\d{4}-(0\\d{3}|[1-9]\\d{3,})$').search
+_re26 = re.compile('^capec$').search
+_re27 = re.compile('^CAPEC-\\d+$').search
+_re28 = re.compile('^((cve)|(capec))$').search
+_re29 = re.compile('^((CVE-\\d{4}-(0\\d{3}|[1-9]\\d{3,}))|(CAPEC-\\d+))$').search
+_re30 = re.compile('^([a-z0-9_-]{3,249}(\\.(\\[\\d+\\]|[a-z0-9_-]{1,250}))*|id)$').search
+_re31 = re.compile('^marking-definition--').search
+_enum32 = frozenset(['new-sdo', 'new-sco', 'new-sro', 'property-extension', 'toplevel-property-extension'])
+_re33 = re.compile('^([A-Za-z0-9+/]{4})*([A-Za-z0-9+/]{4}|[A-Za-z0-9+/]{3}=|[A-Za-z0-9+/]{2}==)$').search
+_re34 = re.compile('^[a-z][a-z0-9_]{0,245}_bin$').search
+_re35 = re.compile('^([a-fA-F0-9]{2})+$').search
+_re36 = re.compile('^[a-z][a-z0-9_]{0,245}_hex$').search
+_re37 = re.compile('^([a-z][a-z0-9_]{2,249})|id$').search
+_re38 = re.compile('^[a-z][a-z0-9_]{0,245}_bin$|^[a-z][a-z0-9_]{0,245}_hex$|^([a-z][a-z0-9_]{2,249})|id$').search
+_re39 = re.compile('^extension-definition--[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[1-5][0-9a-fA-F]{3}-[89abAB][0-9a-fA-F]{3}-[0-9a-fA-F]{12}$').search
+_enum40 = frozenset(['incident', 'campaign', 'threat-actor', 'malware', 'emulation-plan', 'attack-tree', 'other'])
+_re41 = re.compile('^(attack-action|attack-condition)--').search
+_re42 = re.compile('^attack-pattern--').search
+_re43 = re.compile('^process--').search
+_re44 = re.compile('^(attack-asset)--').search
+_re45 = re.compile('^(attack-action|attack-operator|attack-condition)--').search
+_enum46 = frozenset(['AND', 'OR'])
+_re47 = re.compile('^([a-z][a-z0-9]*)+(-[a-z0-9]+)*\\-ext$').search
+_re48 = re.compile('^([a-z][a-z0-9]*)+(-[a-z0-9]+)*\\-ext$|^extension-definition--[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[1-5][0-9a-fA-F]{3}-[89abAB][0-9a-fA-F]{3}-[0-9a-fA-F]{12}$').search
+_enum49 = frozenset(['directory'])
+_re50 = re.compile('^directory--').search
+_re51 = re.compile('^[a-zA-Z0-9/\\.+_:-]{2,250}$').search
+_enum52 = frozenset(['extension-definition'])
+_re53 = re.compile('^extension-definition--').search
+_enum54 = frozenset(['file'])
+_re55 = re.compile('^file--').search
+_re56 = re.compile('^ntfs-ext$').search
+_re57 = re.compile('^[A-Z][a-zA-Z0-9_-]+$').search
+_re58 = re.compile('^raster-image-ext$').search
+_re59 = re.compile('^pdf-ext$').search
+_re60 = re.compile('^archive-ext$').search
+_re61 = re.compile('T\\d{2}:\\d{2}:\\d{2}Z$').search
+_props62 = frozenset(['magic_hex', 'major_linker_version', 'minor_linker_version', 'size_of_code', 'size_of_initialized_data', 'size_of_uninitialized_data', 'address_of_entry_point', 'base_of_code', 'base_of_data', 'image_base', 'section_alignment', 'file_alignment', 'major_os_version', 'minor_os_version', 'major_image_version', 'minor_image_version', 'major_subsystem_version', 'minor_subsystem_version', 'win32_version_value_hex', 'size_of_image', 'size_of_headers', 'checksum_hex', 'subsystem_hex', 'dll_characteristics_hex', 'size_of_stack_reserve', 'size_of_stack_commit', 'size_of_heap_reserve', 'size_of_heap_commit', 'loader_flags_hex', 'number_of_rva_and_sizes', 'hashes'])
+_re63 = re.compile('^windows-pebinary-ext$').search
+_re64 = re.compile('^ntfs-ext$|^raster-image-ext$|^pdf-ext$|^archive-ext$|^windows-pebinary-ext$').search
+_enum65 = frozenset(['identity'])
+_re66 = re.compile('^identity--').search
+_enum67 = frozenset(['infrastructure'])
+_re68 = re.compile('^infrastructure--').search
+_enum69 = frozenset(['ipv4-addr'])
+_re70 = re.compile('^ipv4-addr--').search
+_re71 = re.compile('^(([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])(\\/(3[0-2]|[1-2][0-9]|[0-9]))?$').search
+_enum72 = frozenset(['malware'])
+_re73 = re.compile('^malware--').search
+_re74 = re.compile('^software--').search
+_enum75 = frozenset(['note'])
+_re76 = re.compile('^note--').search
+_enum77 = frozenset(['process'])
+_re78 = re.compile('^lpDesktop|lpTitle|dwFillAttribute|dwFlags|wShowWindow|hStdInput|hStdOutput|hStdError$').search
+_re79 = re.compile('^lpReserved|lpReserved2$').search
+_re80 = re.compile('^cb|dwX|dwY|dwXSize|dwYSize|dwXCountChars|dwYCountChars$').search
+_re81 = re.compile('^cbReserved2$').search
+_re82 = re.compile('^lpDesktop|lpTitle|dwFillAttribute|dwFlags|wShowWindow|hStdInput|hStdOutput|hStdError$|^lpReserved|lpReserved2$|^cb|dwX|dwY|dwXSize|dwYSize|dwXCountChars|dwYCountChars$|^cbReserved2$').search
+_enum83 = frozenset(['low', 'medium', 'high', 'system'])
+_re84 = re.compile('^windows-process-ext$').search
+_enum85 = frozenset(['SERVICE_AUTO_START', 'SERVICE_BOOT_START', 'SERVICE_DEMAND_START', 'SERVICE_DISABLED', 'SERVICE_SYSTEM_ALERT'])
+_enum86 = frozenset(['SERVICE_KERNEL_DRIVER', 'SERVICE_FILE_SYSTEM_DRIVER', 'SERVICE_WIN32_OWN_PROCESS', 'SERVICE_WIN32_SHARE_PROCESS'])
+_enum87 = frozenset(['SERVICE_CONTINUE_PENDING', 'SERVICE_PAUSE_PENDING', 'SERVICE_PAUSED', 'SERVICE_RUNNING', 'SERVICE_START_PENDING', 'SERVICE_STOP_PENDING', 'SERVICE_STOPPED'])
+_re88 = re.compile('^windows-service-ext$').search
+_re89 = re.compile('^windows-process-ext$|^windows-service-ext$').search
+_enum90 = frozenset(['relationship'])
+_re91 = re.compile('^relationship--').search
+_re92 = re.compile('^[a-z0-9\\-]+$').search
+_re93 = re.compile('^(relationship|sighting|bundle|marking-definition|language-content)--.+$').search
+_enum94 = frozenset(['threat-actor'])
+_re95 = re.compile('^threat-actor--').search
+_enum96 = frozenset(['tool'])
+_re97 = re.compile('^tool--').search
+_enum98 = frozenset(['url'])
+_re99 = re.compile('^url--').search
+_enum100 = frozenset(['user-account'])
+_re101 = re.compile('^user-account--').search
+_re102 = re.compile('^unix-account-ext$').search
+_enum103 = frozenset(['vulnerability'])
+_re104 = re.compile('^vulnerability--').search
+
+
+def _check1(i):
+    if not (isinstance(i, str)):
+        return False
+    if (isinstance(i, str) and not _re0(i)):
+        return False
+    if (isinstance(i, str) and len(i) < 3):
+        return False
+    if (isinstance(i, str) and len(i) > 250):
+        return False
+    if not (not (isinstance(i, str) and i in _enum1)):
+        return False
+    return True
+
+def _check3(i):
+    if not (isinstance(i, str)):
+        return False
+    if (isinstance(i, str) and not _re3(i)):
+        return False
+    return True
+
+def _check2(i):
+    if not _check3(i):
+        return False
+    return True
+
+def _check4(i):
+    if not _check3(i):
+        return False
+    return True
+
+def _check5(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not not (not (isinstance(v, str))):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check8(i):
+    if not (isinstance(i, str)):
+        return False
+    if (isinstance(i, str) and not _re4(i)):
+        return False
+    return True
+
+def _check7(i):
+    if not _check8(i):
+        return False
+    return True
+
+def _check6(i):
+    if not _check7(i):
+        return False
+    if not not ((isinstance(i, str) and not _re5(i))):
+        return False
+    return True
+
+def _check10(i):
+    if not _check8(i):
+        return False
+    return True
+
+def _check9(i):
+    if not _check10(i):
+        return False
+    if not not ((isinstance(i, str) and not _re5(i))):
+        return False
+    return True
+
+def _check15(i):
+    if not (isinstance(i, str)):
+        return False
+    return True
+
+def _check14(i):
+    if not _check15(i):
+        return False
+    return True
+
+def _check22(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        if len(i) < 1:
+            return False
+    return True
+
+def _check21(i):
+    if not (_check22(i) or not (not (isinstance(i, str))) or not (not ((isinstance(i, int) and not isinstance(i, bool) or isinstance(i, float) and i.is_integer()))) or not (not (isinstance(i, bool))) or not (not ((isinstance(i, _Number) and not isinstance(i, bool)))) or not (not (isinstance(i, dict)))):
+        return False
+    return True
+
+def _check20(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if len(i) < 1:
+            return False
+        for k, v in i.items():
+            if _re6(k) and not _check21(v):
+                return False
+        for k in (k for k in i if not _re6(k)):
+            return False
+    return True
+
+def _check19(i):
+    if not _check20(i):
+        return False
+    return True
+
+def _check18(i):
+    if not (isinstance(i, dict)):
+        return False
+    if not _check19(i):
+        return False
+    if isinstance(i, dict):
+        for k, v in i.items():
+            if _re7(k) and not not (not (isinstance(v, str))):
+                return False
+        for k, v in i.items():
+            if _re9(k) and not not (not (isinstance(v, str)) or (isinstance(v, str) and not _re8(v))):
+                return False
+        for k, v in i.items():
+            if _re11(k) and not not (not (isinstance(v, str)) or (isinstance(v, str) and not _re10(v))):
+                return False
+        for k, v in i.items():
+            if _re13(k) and not not (not (isinstance(v, str)) or (isinstance(v, str) and not _re12(v))):
+                return False
+        for k, v in i.items():
+            if _re15(k) and not not (not (isinstance(v, str)) or (isinstance(v, str) and not _re14(v))):
+                return False
+        for k, v in i.items():
+            if _re16(k) and not not (not (isinstance(v, str)) or (isinstance(v, str) and not _re12(v))):
+                return False
+        for k, v in i.items():
+            if _re17(k) and not not (not (isinstance(v, str)) or (isinstance(v, str) and not _re14(v))):
+                return False
+        for k, v in i.items():
+            if _re19(k) and not not (not (isinstance(v, str)) or (isinstance(v, str) and not _re18(v))):
+                return False
+        for k, v in i.items():
+            if _re21(k) and not not (not (isinstance(v, str)) or (isinstance(v, str) and not _re20(v))):
+                return False
+        for k in (k for k in i if not _re22(k)):
+            return False
+    return True
+
+def _check17(i):
+    if not _check18(i):
+        return False
+    return True
+
+def _check23(i):
+    if isinstance(i, dict):
+        for k in i:
+            if not not ((isinstance(k, str) and not _re23(k))):
+                return False
+    return True
+
+def _check16(i):
+    if not _check17(i):
+        return False
+    if not _check23(i):
+        return False
+    return True
+
+def _check24(i):
+    if isinstance(i, dict):
+        if 'source_name' in i:
+            v = i['source_name']
+            if not not (not (isinstance(v, str)) or (isinstance(v, str) and not _re24(v))):
+                return False
+        if 'external_id' in i:
+            v = i['external_id']
+            if not not (not (isinstance(v, str)) or (isinstance(v, str) and not _re25(v))):
+                return False
+        if 'source_name' not in i or 'external_id' not in i:
+            return False
+    return True
+
+def _check25(i):
+    if isinstance(i, dict):
+        if 'source_name' in i:
+            v = i['source_name']
+            if not not (not (isinstance(v, str)) or (isinstance(v, str) and not _re26(v))):
+                return False
+        if 'external_id' in i:
+            v = i['external_id']
+            if not not (not (isinstance(v, str)) or (isinstance(v, str) and not _re27(v))):
+                return False
+        if 'source_name' not in i or 'external_id' not in i:
+            return False
+    return True
+
+def _check27(i):
+    if not (isinstance(i, str)):
+        return False
+    if not ((isinstance(i, str) and not _re28(i))):
+        return False
+    return True
+
+def _check28(i):
+    if not (isinstance(i, str)):
+        return False
+    if not ((isinstance(i, str) and not _re29(i))):
+        return False
+    return True
+
+def _check29(i):
+    if isinstance(i, dict):
+        if 'external_id' not in i:
+            return False
+    return True
+
+def _check30(i):
+    if isinstance(i, dict):
+        if 'description' not in i:
+            return False
+    return True
+
+def _check31(i):
+    if isinstance(i, dict):
+        if 'url' not in i:
+            return False
+    return True
+
+def _check26(i):
+    if not (_check29(i) or _check30(i) or _check31(i)):
+        return False
+    if isinstance(i, dict):
+        if 'source_name' in i:
+            v = i['source_name']
+            if not _check27(v):
+                return False
+        if 'external_id' in i:
+            v = i['external_id']
+            if not _check28(v):
+                return False
+        if 'source_name' not in i:
+            return False
+    return True
+
+def _check13(i):
+    if not (isinstance(i, dict)):
+        return False
+    if (_check24(i)) + (_check25(i)) + (_check26(i)) != 1:
+        return False
+    if isinstance(i, dict):
+        if 'description' in i:
+            v = i['description']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'url' in i:
+            v = i['url']
+            if not _check14(v):
+                return False
+        if 'hashes' in i:
+            v = i['hashes']
+            if not _check16(v):
+                return False
+    return True
+
+def _check12(i):
+    if not _check13(i):
+        return False
+    return True
+
+def _check11(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not _check12(v):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check33(i):
+    if not _check3(i):
+        return False
+    return True
+
+def _check32(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not _check33(v):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check37(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not not (not (isinstance(v, str)) or (isinstance(v, str) and not _re30(v))):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check39(i):
+    if not _check3(i):
+        return False
+    return True
+
+def _check38(i):
+    if not _check39(i):
+        return False
+    if not not ((isinstance(i, str) and not _re31(i))):
+        return False
+    return True
+
+def _check36(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'selectors' in i:
+            v = i['selectors']
+            if not _check37(v):
+                return False
+        if 'lang' in i:
+            v = i['lang']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'marking_ref' in i:
+            v = i['marking_ref']
+            if not _check38(v):
+                return False
+        if 'selectors' not in i or 'marking_ref' not in i:
+            return False
+    return True
+
+def _check35(i):
+    if not _check36(i):
+        return False
+    return True
+
+def _check34(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not _check35(v):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check44(i):
+    if not not (not (isinstance(i, str)) or not (isinstance(i, str) and i in _enum32)):
+        return False
+    return True
+
+def _check48(i):
+    if not (isinstance(i, str)):
+        return False
+    if (isinstance(i, str) and not _re33(i)):
+        return False
+    return True
+
+def _check47(i):
+    if not _check48(i):
+        return False
+    return True
+
+def _check50(i):
+    if not (isinstance(i, str)):
+        return False
+    if (isinstance(i, str) and not _re35(i)):
+        return False
+    return True
+
+def _check49(i):
+    if not _check50(i):
+        return False
+    return True
+
+def _check52(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        if len(i) < 1:
+            return False
+    return True
+
+def _check51(i):
+    if not (_check52(i) or not (not (isinstance(i, str))) or not (not ((isinstance(i, int) and not isinstance(i, bool) or isinstance(i, float) and i.is_integer()))) or not (not (isinstance(i, bool))) or not (not ((isinstance(i, _Number) and not isinstance(i, bool)))) or not (not (isinstance(i, dict)))):
+        return False
+    return True
+
+def _check46(i):
+    if isinstance(i, dict):
+        for k, v in i.items():
+            if _re34(k) and not _check47(v):
+                return False
+        for k, v in i.items():
+            if _re36(k) and not _check49(v):
+                return False
+        for k, v in i.items():
+            if _re37(k) and not _check51(v):
+                return False
+        for k in (k for k in i if not _re38(k)):
+            return False
+    return True
+
+def _check45(i):
+    if not _check46(i):
+        return False
+    return True
+
+def _check43(i):
+    if not (isinstance(i, dict)):
+        return False
+    if not _check45(i):
+        return False
+    if isinstance(i, dict):
+        if len(i) < 1:
+            return False
+        if 'extension_type' in i:
+            v = i['extension_type']
+            if not _check44(v):
+                return False
+        if 'extension_type' not in i:
+            return False
+    return True
+
+def _check42(i):
+    if not _check43(i):
+        return False
+    return True
+
+def _check41(i):
+    if not _check42(i):
+        return False
+    return True
+
+def _check40(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if len(i) < 1:
+            return False
+        for k, v in i.items():
+            if _re39(k) and not _check41(v):
+                return False
+        for k in (k for k in i if not _re39(k)):
+            return False
+    return True
+
+def _evaluated4(i):
+    keys = set()
+    keys.update(k for k in i if _re34(k) or _re36(k) or _re37(k))
+    return keys
+
+def _evaluated3(i):
+    keys = set()
+    keys |= _evaluated4(i)
+    return keys
+
+def _check53(i):
+    if not _check46(i):
+        return False
+    return True
+
+def _evaluated2(i):
+    keys = set()
+    if 'type' in i and _check1(i['type']):
+        keys.add('type')
+    if 'spec_version' in i and not (not (isinstance(i['spec_version'], str)) or not (isinstance(i['spec_version'], str) and i['spec_version'] in _enum2)):
+        keys.add('spec_version')
+    if 'id' in i and _check2(i['id']):
+        keys.add('id')
+    if 'created_by_ref' in i and _check4(i['created_by_ref']):
+        keys.add('created_by_ref')
+    if 'labels' in i and _check5(i['labels']):
+        keys.add('labels')
+    if 'created' in i and _check6(i['created']):
+        keys.add('created')
+    if 'modified' in i and _check9(i['modified']):
+        keys.add('modified')
+    if 'revoked' in i and not (not (isinstance(i['revoked'], bool))):
+        keys.add('revoked')
+    if 'confidence' in i and not (not ((isinstance(i['confidence'], int) and not isinstance(i['confidence'], bool) or isinstance(i['confidence'], float) and i['confidence'].is_integer())) or ((isinstance(i['confidence'], _Number) and not isinstance(i['confidence'], bool)) and i['confidence'] < 0) or ((isinstance(i['confidence'], _Number) and not isinstance(i['confidence'], bool)) and i['confidence'] > 100)):
+        keys.add('confidence')
+    if 'lang' in i and not (not (isinstance(i['lang'], str))):
+        keys.add('lang')
+    if 'external_references' in i and _check11(i['external_references']):
+        keys.add('external_references')
+    if 'object_marking_refs' in i and _check32(i['object_marking_refs']):
+        keys.add('object_marking_refs')
+    if 'granular_markings' in i and _check34(i['granular_markings']):
+        keys.add('granular_markings')
+    if 'extensions' in i and _check40(i['extensions']):
+        keys.add('extensions')
+    if _check53(i):
+        keys |= _evaluated3(i)
+    return keys
+
+def _evaluated1(i):
+    keys = set()
+    keys |= _evaluated2(i)
+    return keys
+
+def _check57(i):
+    if isinstance(i, dict):
+        if 'severity' not in i:
+            return False
+    return True
+
+def _check58(i):
+    if isinstance(i, dict):
+        if 'action' not in i:
+            return False
+    return True
+
+def _check59(i):
+    if isinstance(i, dict):
+        if 'username' not in i:
+            return False
+    return True
+
+def _check60(i):
+    if isinstance(i, dict):
+        if 'phone_numbers' not in i:
+            return False
+    return True
+
+def _check56(i):
+    if not (_check57(i) or _check58(i) or _check59(i) or _check60(i)):
+        return False
+    return True
+
+def _check55(i):
+    if not (isinstance(i, dict)):
+        return False
+    if not _check53(i):
+        return False
+    if _check56(i):
+        return False
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not _check1(v):
+                return False
+        if 'spec_version' in i:
+            v = i['spec_version']
+            if not not (not (isinstance(v, str)) or not (isinstance(v, str) and v in _enum2)):
+                return False
+        if 'id' in i:
+            v = i['id']
+            if not _check2(v):
+                return False
+        if 'created_by_ref' in i:
+            v = i['created_by_ref']
+            if not _check4(v):
+                return False
+        if 'labels' in i:
+            v = i['labels']
+            if not _check5(v):
+                return False
+        if 'created' in i:
+            v = i['created']
+            if not _check6(v):
+                return False
+        if 'modified' in i:
+            v = i['modified']
+            if not _check9(v):
+                return False
+        if 'revoked' in i:
+            v = i['revoked']
+            if not not (not (isinstance(v, bool))):
+                return False
+        if 'confidence' in i:
+            v = i['confidence']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer())) or ((isinstance(v, _Number) and not isinstance(v, bool)) and v < 0) or ((isinstance(v, _Number) and not isinstance(v, bool)) and v > 100)):
+                return False
+        if 'lang' in i:
+            v = i['lang']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'external_references' in i:
+            v = i['external_references']
+            if not _check11(v):
+                return False
+        if 'object_marking_refs' in i:
+            v = i['object_marking_refs']
+            if not _check32(v):
+                return False
+        if 'granular_markings' in i:
+            v = i['granular_markings']
+            if not _check34(v):
+                return False
+        if 'extensions' in i:
+            v = i['extensions']
+            if not _check40(v):
+                return False
+        if 'type' not in i or 'spec_version' not in i or 'id' not in i or 'created' not in i or 'modified' not in i:
+            return False
+    return True
+
+def _check54(i):
+    if not _check55(i):
+        return False
+    return True
+
+def _check62(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'extension_type' in i:
+            v = i['extension_type']
+            if not not (not (isinstance(v, str)) or not v == 'new-sdo'):
+                return False
+        if 'extension_type' not in i:
+            return False
+    return True
+
+def _check61(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'extension-definition--fb9c968a-745b-4ade-9b25-c324172197f4' in i:
+            v = i['extension-definition--fb9c968a-745b-4ade-9b25-c324172197f4']
+            if not _check62(v):
+                return False
+        if 'extension-definition--fb9c968a-745b-4ade-9b25-c324172197f4' not in i:
+            return False
+    return True
+
+def _evaluated5(i):
+    keys = set()
+    if 'extensions' in i and _check61(i['extensions']):
+        keys.add('extensions')
+    return keys
+
+def _check63(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'extensions' in i:
+            v = i['extensions']
+            if not _check61(v):
+                return False
+        if 'extensions' not in i:
+            return False
+    return True
+
+def _evaluated7(i):
+    keys = set()
+    if 'type' in i and not (not (isinstance(i['type'], str)) or not i['type'] == 'attack-flow'):
+        keys.add('type')
+    return keys
+
+def _check66(i):
+    if not _check3(i):
+        return False
+    return True
+
+def _check65(i):
+    if not _check66(i):
+        return False
+    if not not ((isinstance(i, str) and not _re41(i))):
+        return False
+    return True
+
+def _check64(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not _check65(v):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _evaluated9(i):
+    keys = set()
+    if 'type' in i and not (not (isinstance(i['type'], str)) or not i['type'] == 'attack-flow'):
+        keys.add('type')
+    if 'spec_version' in i and not (not (isinstance(i['spec_version'], str)) or not i['spec_version'] == '2.1'):
+        keys.add('spec_version')
+    if 'name' in i and not (not (isinstance(i['name'], str))):
+        keys.add('name')
+    if 'description' in i and not (not (isinstance(i['description'], str))):
+        keys.add('description')
+    if 'scope' in i and not (not (isinstance(i['scope'], str)) or not (isinstance(i['scope'], str) and i['scope'] in _enum40)):
+        keys.add('scope')
+    if 'start_refs' in i and _check64(i['start_refs']):
+        keys.add('start_refs')
+    return keys
+
+def _evaluated8(i):
+    keys = set()
+    keys |= _evaluated9(i)
+    return keys
+
+def _evaluated11(i):
+    keys = set()
+    if 'type' in i and not (not (isinstance(i['type'], str)) or not i['type'] == 'attack-action'):
+        keys.add('type')
+    return keys
+
+def _check68(i):
+    if not _check3(i):
+        return False
+    return True
+
+def _check67(i):
+    if not _check68(i):
+        return False
+    return True
+
+def _check70(i):
+    if not _check3(i):
+        return False
+    return True
+
+def _check69(i):
+    if not _check70(i):
+        return False
+    if not not ((isinstance(i, str) and not _re42(i))):
+        return False
+    return True
+
+def _check71(i):
+    if not _check8(i):
+        return False
+    return True
+
+def _check72(i):
+    if not _check8(i):
+        return False
+    return True
+
+def _check74(i):
+    if not _check3(i):
+        return False
+    return True
+
+def _check73(i):
+    if not _check74(i):
+        return False
+    if not not ((isinstance(i, str) and not _re43(i))):
+        return False
+    return True
+
+def _check77(i):
+    if not _check3(i):
+        return False
+    return True
+
+def _check76(i):
+    if not _check77(i):
+        return False
+    if not not ((isinstance(i, str) and not _re44(i))):
+        return False
+    return True
+
+def _check75(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not _check76(v):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check80(i):
+    if not _check3(i):
+        return False
+    return True
+
+def _check79(i):
+    if not _check80(i):
+        return False
+    if not not ((isinstance(i, str) and not _re45(i))):
+        return False
+    return True
+
+def _check78(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not _check79(v):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _evaluated13(i):
+    keys = set()
+    if 'type' in i and not (not (isinstance(i['type'], str)) or not i['type'] == 'attack-action'):
+        keys.add('type')
+    if 'spec_version' in i and not (not (isinstance(i['spec_version'], str)) or not i['spec_version'] == '2.1'):
+        keys.add('spec_version')
+    if 'name' in i and not (not (isinstance(i['name'], str))):
+        keys.add('name')
+    if 'tactic_id' in i and not (not (isinstance(i['tactic_id'], str))):
+        keys.add('tactic_id')
+    if 'tactic_ref' in i and _check67(i['tactic_ref']):
+        keys.add('tactic_ref')
+    if 'technique_id' in i and not (not (isinstance(i['technique_id'], str))):
+        keys.add('technique_id')
+    if 'technique_ref' in i and _check69(i['technique_ref']):
+        keys.add('technique_ref')
+    if 'description' in i and not (not (isinstance(i['description'], str))):
+        keys.add('description')
+    if 'execution_start' in i and _check71(i['execution_start']):
+        keys.add('execution_start')
+    if 'execution_end' in i and _check72(i['execution_end']):
+        keys.add('execution_end')
+    if 'command_ref' in i and _check73(i['command_ref']):
+        keys.add('command_ref')
+    if 'asset_refs' in i and _check75(i['asset_refs']):
+        keys.add('asset_refs')
+    if 'effect_refs' in i and _check78(i['effect_refs']):
+        keys.add('effect_refs')
+    return keys
+
+def _evaluated12(i):
+    keys = set()
+    keys |= _evaluated13(i)
+    return keys
+
+def _evaluated15(i):
+    keys = set()
+    if 'type' in i and not (not (isinstance(i['type'], str)) or not i['type'] == 'attack-condition'):
+        keys.add('type')
+    return keys
+
+def _check83(i):
+    if not _check3(i):
+        return False
+    return True
+
+def _check82(i):
+    if not _check83(i):
+        return False
+    if not not ((isinstance(i, str) and not _re45(i))):
+        return False
+    return True
+
+def _check81(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not _check82(v):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check86(i):
+    if not _check3(i):
+        return False
+    return True
+
+def _check85(i):
+    if not _check86(i):
+        return False
+    if not not ((isinstance(i, str) and not _re45(i))):
+        return False
+    return True
+
+def _check84(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not _check85(v):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _evaluated17(i):
+    keys = set()
+    if 'type' in i and not (not (isinstance(i['type'], str)) or not i['type'] == 'attack-condition'):
+        keys.add('type')
+    if 'spec_version' in i and not (not (isinstance(i['spec_version'], str)) or not i['spec_version'] == '2.1'):
+        keys.add('spec_version')
+    if 'description' in i and not (not (isinstance(i['description'], str))):
+        keys.add('description')
+    if 'pattern' in i and not (not (isinstance(i['pattern'], str))):
+        keys.add('pattern')
+    if 'pattern_type' in i and not (not (isinstance(i['pattern_type'], str))):
+        keys.add('pattern_type')
+    if 'pattern_version' in i and not (not (isinstance(i['pattern_version'], str))):
+        keys.add('pattern_version')
+    if 'on_true_refs' in i and _check81(i['on_true_refs']):
+        keys.add('on_true_refs')
+    if 'on_false_refs' in i and _check84(i['on_false_refs']):
+        keys.add('on_false_refs')
+    return keys
+
+def _evaluated16(i):
+    keys = set()
+    keys |= _evaluated17(i)
+    return keys
+
+def _evaluated19(i):
+    keys = set()
+    if 'type' in i and not (not (isinstance(i['type'], str)) or not i['type'] == 'attack-operator'):
+        keys.add('type')
+    return keys
+
+def _check89(i):
+    if not _check3(i):
+        return False
+    return True
+
+def _check88(i):
+    if not _check89(i):
+        return False
+    if not not ((isinstance(i, str) and not _re45(i))):
+        return False
+    return True
+
+def _check87(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not _check88(v):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _evaluated21(i):
+    keys = set()
+    if 'type' in i and not (not (isinstance(i['type'], str)) or not i['type'] == 'attack-operator'):
+        keys.add('type')
+    if 'spec_version' in i and not (not (isinstance(i['spec_version'], str)) or not i['spec_version'] == '2.1'):
+        keys.add('spec_version')
+    if 'operator' in i and not (not (isinstance(i['operator'], str)) or not (isinstance(i['operator'], str) and i['operator'] in _enum46)):
+        keys.add('operator')
+    if 'effect_refs' in i and _check87(i['effect_refs']):
+        keys.add('effect_refs')
+    return keys
+
+def _evaluated20(i):
+    keys = set()
+    keys |= _evaluated21(i)
+    return keys
+
+def _evaluated23(i):
+    keys = set()
+    if 'type' in i and not (not (isinstance(i['type'], str)) or not i['type'] == 'attack-asset'):
+        keys.add('type')
+    return keys
+
+def _check90(i):
+    if not _check3(i):
+        return False
+    return True
+
+def _evaluated25(i):
+    keys = set()
+    if 'type' in i and not (not (isinstance(i['type'], str)) or not i['type'] == 'attack-asset'):
+        keys.add('type')
+    if 'spec_version' in i and not (not (isinstance(i['spec_version'], str)) or not i['spec_version'] == '2.1'):
+        keys.add('spec_version')
+    if 'name' in i and not (not (isinstance(i['name'], str))):
+        keys.add('name')
+    if 'description' in i and not (not (isinstance(i['description'], str))):
+        keys.add('description')
+    if 'object_ref' in i and _check90(i['object_ref']):
+        keys.add('object_ref')
+    return keys
+
+def _evaluated24(i):
+    keys = set()
+    keys |= _evaluated25(i)
+    return keys
+
+def _check91(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not v == 'attack-asset'):
+                return False
+    return True
+
+def _evaluated22(i):
+    keys = set()
+    if _check91(i):
+        keys |= _evaluated23(i)
+        keys |= _evaluated24(i)
+    return keys
+
+def _check92(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not v == 'attack-operator'):
+                return False
+    return True
+
+def _evaluated18(i):
+    keys = set()
+    if _check92(i):
+        keys |= _evaluated19(i)
+        keys |= _evaluated20(i)
+    else:
+        keys |= _evaluated22(i)
+    return keys
+
+def _check93(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not v == 'attack-condition'):
+                return False
+    return True
+
+def _evaluated14(i):
+    keys = set()
+    if _check93(i):
+        keys |= _evaluated15(i)
+        keys |= _evaluated16(i)
+    else:
+        keys |= _evaluated18(i)
+    return keys
+
+def _check94(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not v == 'attack-action'):
+                return False
+    return True
+
+def _evaluated10(i):
+    keys = set()
+    if _check94(i):
+        keys |= _evaluated11(i)
+        keys |= _evaluated12(i)
+    else:
+        keys |= _evaluated14(i)
+    return keys
+
+def _check95(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not v == 'attack-flow'):
+                return False
+    return True
+
+def _evaluated6(i):
+    keys = set()
+    if _check95(i):
+        keys |= _evaluated7(i)
+        keys |= _evaluated8(i)
+    else:
+        keys |= _evaluated10(i)
+    return keys
+
+def _check98(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not v == 'attack-flow'):
+                return False
+        if 'spec_version' in i:
+            v = i['spec_version']
+            if not not (not (isinstance(v, str)) or not v == '2.1'):
+                return False
+        if 'name' in i:
+            v = i['name']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'description' in i:
+            v = i['description']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'scope' in i:
+            v = i['scope']
+            if not not (not (isinstance(v, str)) or not (isinstance(v, str) and v in _enum40)):
+                return False
+        if 'start_refs' in i:
+            v = i['start_refs']
+            if not _check64(v):
+                return False
+        if 'type' not in i or 'spec_version' not in i or 'name' not in i or 'start_refs' not in i or 'scope' not in i:
+            return False
+    return True
+
+def _check97(i):
+    if not _check98(i):
+        return False
+    return True
+
+def _check101(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not v == 'attack-action'):
+                return False
+        if 'spec_version' in i:
+            v = i['spec_version']
+            if not not (not (isinstance(v, str)) or not v == '2.1'):
+                return False
+        if 'name' in i:
+            v = i['name']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'tactic_id' in i:
+            v = i['tactic_id']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'tactic_ref' in i:
+            v = i['tactic_ref']
+            if not _check67(v):
+                return False
+        if 'technique_id' in i:
+            v = i['technique_id']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'technique_ref' in i:
+            v = i['technique_ref']
+            if not _check69(v):
+                return False
+        if 'description' in i:
+            v = i['description']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'execution_start' in i:
+            v = i['execution_start']
+            if not _check71(v):
+                return False
+        if 'execution_end' in i:
+            v = i['execution_end']
+            if not _check72(v):
+                return False
+        if 'command_ref' in i:
+            v = i['command_ref']
+            if not _check73(v):
+                return False
+        if 'asset_refs' in i:
+            v = i['asset_refs']
+            if not _check75(v):
+                return False
+        if 'effect_refs' in i:
+            v = i['effect_refs']
+            if not _check78(v):
+                return False
+        if 'type' not in i or 'spec_version' not in i or 'name' not in i:
+            return False
+    return True
+
+def _check100(i):
+    if not _check101(i):
+        return False
+    return True
+
+def _check104(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not v == 'attack-condition'):
+                return False
+        if 'spec_version' in i:
+            v = i['spec_version']
+            if not not (not (isinstance(v, str)) or not v == '2.1'):
+                return False
+        if 'description' in i:
+            v = i['description']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'pattern' in i:
+            v = i['pattern']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'pattern_type' in i:
+            v = i['pattern_type']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'pattern_version' in i:
+            v = i['pattern_version']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'on_true_refs' in i:
+            v = i['on_true_refs']
+            if not _check81(v):
+                return False
+        if 'on_false_refs' in i:
+            v = i['on_false_refs']
+            if not _check84(v):
+                return False
+        if 'type' not in i or 'spec_version' not in i or 'description' not in i:
+            return False
+    return True
+
+def _check103(i):
+    if not _check104(i):
+        return False
+    return True
+
+def _check107(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not v == 'attack-operator'):
+                return False
+        if 'spec_version' in i:
+            v = i['spec_version']
+            if not not (not (isinstance(v, str)) or not v == '2.1'):
+                return False
+        if 'operator' in i:
+            v = i['operator']
+            if not not (not (isinstance(v, str)) or not (isinstance(v, str) and v in _enum46)):
+                return False
+        if 'effect_refs' in i:
+            v = i['effect_refs']
+            if not _check87(v):
+                return False
+        if 'type' not in i or 'spec_version' not in i or 'operator' not in i:
+            return False
+    return True
+
+def _check106(i):
+    if not _check107(i):
+        return False
+    return True
+
+def _check110(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not v == 'attack-asset'):
+                return False
+        if 'spec_version' in i:
+            v = i['spec_version']
+            if not not (not (isinstance(v, str)) or not v == '2.1'):
+                return False
+        if 'name' in i:
+            v = i['name']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'description' in i:
+            v = i['description']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'object_ref' in i:
+            v = i['object_ref']
+            if not _check90(v):
+                return False
+        if 'type' not in i or 'spec_version' not in i or 'name' not in i:
+            return False
+    return True
+
+def _check109(i):
+    if not _check110(i):
+        return False
+    return True
+
+def _check108(i):
+    if _check91(i):
+        if not _check109(i):
+            return False
+    elif not True:
+        return False
+    return True
+
+def _check105(i):
+    if _check92(i):
+        if not _check106(i):
+            return False
+    elif not _check108(i):
+        return False
+    return True
+
+def _check102(i):
+    if _check93(i):
+        if not _check103(i):
+            return False
+    elif not _check105(i):
+        return False
+    return True
+
+def _check99(i):
+    if _check94(i):
+        if not _check100(i):
+            return False
+    elif not _check102(i):
+        return False
+    return True
+
+def _check96(i):
+    if _check95(i):
+        if not _check97(i):
+            return False
+    elif not _check99(i):
+        return False
+    return True
+
+def _evaluated0(i):
+    keys = set()
+    if _check54(i):
+        keys |= _evaluated1(i)
+    if _check63(i):
+        keys |= _evaluated5(i)
+    if _check96(i):
+        keys |= _evaluated6(i)
+    return keys
+
+def _check0(i):
+    if not (isinstance(i, dict)):
+        return False
+    if not _check54(i):
+        return False
+    if not _check63(i):
+        return False
+    if not _check96(i):
+        return False
+    if isinstance(i, dict):
+        if not _evaluated0(i).issuperset(i):
+            return False
+    return True
+
+def _evaluated27(i):
+    keys = set()
+    keys |= _evaluated2(i)
+    return keys
+
+def _check112(i):
+    if not _check55(i):
+        return False
+    return True
+
+def _check114(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'extension_type' in i:
+            v = i['extension_type']
+            if not not (not (isinstance(v, str)) or not v == 'new-sdo'):
+                return False
+        if 'extension_type' not in i:
+            return False
+    return True
+
+def _check113(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'extension-definition--fb9c968a-745b-4ade-9b25-c324172197f4' in i:
+            v = i['extension-definition--fb9c968a-745b-4ade-9b25-c324172197f4']
+            if not _check114(v):
+                return False
+        if 'extension-definition--fb9c968a-745b-4ade-9b25-c324172197f4' not in i:
+            return False
+    return True
+
+def _evaluated28(i):
+    keys = set()
+    if 'extensions' in i and _check113(i['extensions']):
+        keys.add('extensions')
+    return keys
+
+def _check115(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'extensions' in i:
+            v = i['extensions']
+            if not _check113(v):
+                return False
+        if 'extensions' not in i:
+            return False
+    return True
+
+def _evaluated30(i):
+    keys = set()
+    if 'type' in i and not (not (isinstance(i['type'], str)) or not i['type'] == 'attack-flow'):
+        keys.add('type')
+    return keys
+
+def _evaluated31(i):
+    keys = set()
+    keys |= _evaluated9(i)
+    return keys
+
+def _evaluated33(i):
+    keys = set()
+    if 'type' in i and not (not (isinstance(i['type'], str)) or not i['type'] == 'attack-action'):
+        keys.add('type')
+    return keys
+
+def _evaluated34(i):
+    keys = set()
+    keys |= _evaluated13(i)
+    return keys
+
+def _evaluated36(i):
+    keys = set()
+    if 'type' in i and not (not (isinstance(i['type'], str)) or not i['type'] == 'attack-condition'):
+        keys.add('type')
+    return keys
+
+def _evaluated37(i):
+    keys = set()
+    keys |= _evaluated17(i)
+    return keys
+
+def _evaluated39(i):
+    keys = set()
+    if 'type' in i and not (not (isinstance(i['type'], str)) or not i['type'] == 'attack-operator'):
+        keys.add('type')
+    return keys
+
+def _evaluated40(i):
+    keys = set()
+    keys |= _evaluated21(i)
+    return keys
+
+def _evaluated42(i):
+    keys = set()
+    if 'type' in i and not (not (isinstance(i['type'], str)) or not i['type'] == 'attack-asset'):
+        keys.add('type')
+    return keys
+
+def _evaluated43(i):
+    keys = set()
+    keys |= _evaluated25(i)
+    return keys
+
+def _check116(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not v == 'attack-asset'):
+                return False
+    return True
+
+def _evaluated41(i):
+    keys = set()
+    if _check116(i):
+        keys |= _evaluated42(i)
+        keys |= _evaluated43(i)
+    return keys
+
+def _check117(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not v == 'attack-operator'):
+                return False
+    return True
+
+def _evaluated38(i):
+    keys = set()
+    if _check117(i):
+        keys |= _evaluated39(i)
+        keys |= _evaluated40(i)
+    else:
+        keys |= _evaluated41(i)
+    return keys
+
+def _check118(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not v == 'attack-condition'):
+                return False
+    return True
+
+def _evaluated35(i):
+    keys = set()
+    if _check118(i):
+        keys |= _evaluated36(i)
+        keys |= _evaluated37(i)
+    else:
+        keys |= _evaluated38(i)
+    return keys
+
+def _check119(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not v == 'attack-action'):
+                return False
+    return True
+
+def _evaluated32(i):
+    keys = set()
+    if _check119(i):
+        keys |= _evaluated33(i)
+        keys |= _evaluated34(i)
+    else:
+        keys |= _evaluated35(i)
+    return keys
+
+def _check120(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not v == 'attack-flow'):
+                return False
+    return True
+
+def _evaluated29(i):
+    keys = set()
+    if _check120(i):
+        keys |= _evaluated30(i)
+        keys |= _evaluated31(i)
+    else:
+        keys |= _evaluated32(i)
+    return keys
+
+def _check122(i):
+    if not _check98(i):
+        return False
+    return True
+
+def _check124(i):
+    if not _check101(i):
+        return False
+    return True
+
+def _check126(i):
+    if not _check104(i):
+        return False
+    return True
+
+def _check128(i):
+    if not _check107(i):
+        return False
+    return True
+
+def _check130(i):
+    if not _check110(i):
+        return False
+    return True
+
+def _check129(i):
+    if _check116(i):
+        if not _check130(i):
+            return False
+    elif not True:
+        return False
+    return True
+
+def _check127(i):
+    if _check117(i):
+        if not _check128(i):
+            return False
+    elif not _check129(i):
+        return False
+    return True
+
+def _check125(i):
+    if _check118(i):
+        if not _check126(i):
+            return False
+    elif not _check127(i):
+        return False
+    return True
+
+def _check123(i):
+    if _check119(i):
+        if not _check124(i):
+            return False
+    elif not _check125(i):
+        return False
+    return True
+
+def _check121(i):
+    if _check120(i):
+        if not _check122(i):
+            return False
+    elif not _check123(i):
+        return False
+    return True
+
+def _evaluated26(i):
+    keys = set()
+    if _check112(i):
+        keys |= _evaluated27(i)
+    if _check115(i):
+        keys |= _evaluated28(i)
+    if _check121(i):
+        keys |= _evaluated29(i)
+    return keys
+
+def _check111(i):
+    if not (isinstance(i, dict)):
+        return False
+    if not _check112(i):
+        return False
+    if not _check115(i):
+        return False
+    if not _check121(i):
+        return False
+    if isinstance(i, dict):
+        if not _evaluated26(i).issuperset(i):
+            return False
+    return True
+
+def _evaluated45(i):
+    keys = set()
+    keys |= _evaluated2(i)
+    return keys
+
+def _check132(i):
+    if not _check55(i):
+        return False
+    return True
+
+def _check134(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'extension_type' in i:
+            v = i['extension_type']
+            if not not (not (isinstance(v, str)) or not v == 'new-sdo'):
+                return False
+        if 'extension_type' not in i:
+            return False
+    return True
+
+def _check133(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'extension-definition--fb9c968a-745b-4ade-9b25-c324172197f4' in i:
+            v = i['extension-definition--fb9c968a-745b-4ade-9b25-c324172197f4']
+            if not _check134(v):
+                return False
+        if 'extension-definition--fb9c968a-745b-4ade-9b25-c324172197f4' not in i:
+            return False
+    return True
+
+def _evaluated46(i):
+    keys = set()
+    if 'extensions' in i and _check133(i['extensions']):
+        keys.add('extensions')
+    return keys
+
+def _check135(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'extensions' in i:
+            v = i['extensions']
+            if not _check133(v):
+                return False
+        if 'extensions' not in i:
+            return False
+    return True
+
+def _evaluated48(i):
+    keys = set()
+    if 'type' in i and not (not (isinstance(i['type'], str)) or not i['type'] == 'attack-flow'):
+        keys.add('type')
+    return keys
+
+def _evaluated49(i):
+    keys = set()
+    keys |= _evaluated9(i)
+    return keys
+
+def _evaluated51(i):
+    keys = set()
+    if 'type' in i and not (not (isinstance(i['type'], str)) or not i['type'] == 'attack-action'):
+        keys.add('type')
+    return keys
+
+def _evaluated52(i):
+    keys = set()
+    keys |= _evaluated13(i)
+    return keys
+
+def _evaluated54(i):
+    keys = set()
+    if 'type' in i and not (not (isinstance(i['type'], str)) or not i['type'] == 'attack-condition'):
+        keys.add('type')
+    return keys
+
+def _evaluated55(i):
+    keys = set()
+    keys |= _evaluated17(i)
+    return keys
+
+def _evaluated57(i):
+    keys = set()
+    if 'type' in i and not (not (isinstance(i['type'], str)) or not i['type'] == 'attack-operator'):
+        keys.add('type')
+    return keys
+
+def _evaluated58(i):
+    keys = set()
+    keys |= _evaluated21(i)
+    return keys
+
+def _evaluated60(i):
+    keys = set()
+    if 'type' in i and not (not (isinstance(i['type'], str)) or not i['type'] == 'attack-asset'):
+        keys.add('type')
+    return keys
+
+def _evaluated61(i):
+    keys = set()
+    keys |= _evaluated25(i)
+    return keys
+
+def _check136(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not v == 'attack-asset'):
+                return False
+    return True
+
+def _evaluated59(i):
+    keys = set()
+    if _check136(i):
+        keys |= _evaluated60(i)
+        keys |= _evaluated61(i)
+    return keys
+
+def _check137(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not v == 'attack-operator'):
+                return False
+    return True
+
+def _evaluated56(i):
+    keys = set()
+    if _check137(i):
+        keys |= _evaluated57(i)
+        keys |= _evaluated58(i)
+    else:
+        keys |= _evaluated59(i)
+    return keys
+
+def _check138(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not v == 'attack-condition'):
+                return False
+    return True
+
+def _evaluated53(i):
+    keys = set()
+    if _check138(i):
+        keys |= _evaluated54(i)
+        keys |= _evaluated55(i)
+    else:
+        keys |= _evaluated56(i)
+    return keys
+
+def _check139(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not v == 'attack-action'):
+                return False
+    return True
+
+def _evaluated50(i):
+    keys = set()
+    if _check139(i):
+        keys |= _evaluated51(i)
+        keys |= _evaluated52(i)
+    else:
+        keys |= _evaluated53(i)
+    return keys
+
+def _check140(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not v == 'attack-flow'):
+                return False
+    return True
+
+def _evaluated47(i):
+    keys = set()
+    if _check140(i):
+        keys |= _evaluated48(i)
+        keys |= _evaluated49(i)
+    else:
+        keys |= _evaluated50(i)
+    return keys
+
+def _check142(i):
+    if not _check98(i):
+        return False
+    return True
+
+def _check144(i):
+    if not _check101(i):
+        return False
+    return True
+
+def _check146(i):
+    if not _check104(i):
+        return False
+    return True
+
+def _check148(i):
+    if not _check107(i):
+        return False
+    return True
+
+def _check150(i):
+    if not _check110(i):
+        return False
+    return True
+
+def _check149(i):
+    if _check136(i):
+        if not _check150(i):
+            return False
+    elif not True:
+        return False
+    return True
+
+def _check147(i):
+    if _check137(i):
+        if not _check148(i):
+            return False
+    elif not _check149(i):
+        return False
+    return True
+
+def _check145(i):
+    if _check138(i):
+        if not _check146(i):
+            return False
+    elif not _check147(i):
+        return False
+    return True
+
+def _check143(i):
+    if _check139(i):
+        if not _check144(i):
+            return False
+    elif not _check145(i):
+        return False
+    return True
+
+def _check141(i):
+    if _check140(i):
+        if not _check142(i):
+            return False
+    elif not _check143(i):
+        return False
+    return True
+
+def _evaluated44(i):
+    keys = set()
+    if _check132(i):
+        keys |= _evaluated45(i)
+    if _check135(i):
+        keys |= _evaluated46(i)
+    if _check141(i):
+        keys |= _evaluated47(i)
+    return keys
+
+def _check131(i):
+    if not (isinstance(i, dict)):
+        return False
+    if not _check132(i):
+        return False
+    if not _check135(i):
+        return False
+    if not _check141(i):
+        return False
+    if isinstance(i, dict):
+        if not _evaluated44(i).issuperset(i):
+            return False
+    return True
+
+def _evaluated63(i):
+    keys = set()
+    keys |= _evaluated2(i)
+    return keys
+
+def _check152(i):
+    if not _check55(i):
+        return False
+    return True
+
+def _check154(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'extension_type' in i:
+            v = i['extension_type']
+            if not not (not (isinstance(v, str)) or not v == 'new-sdo'):
+                return False
+        if 'extension_type' not in i:
+            return False
+    return True
+
+def _check153(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'extension-definition--fb9c968a-745b-4ade-9b25-c324172197f4' in i:
+            v = i['extension-definition--fb9c968a-745b-4ade-9b25-c324172197f4']
+            if not _check154(v):
+                return False
+        if 'extension-definition--fb9c968a-745b-4ade-9b25-c324172197f4' not in i:
+            return False
+    return True
+
+def _evaluated64(i):
+    keys = set()
+    if 'extensions' in i and _check153(i['extensions']):
+        keys.add('extensions')
+    return keys
+
+def _check155(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'extensions' in i:
+            v = i['extensions']
+            if not _check153(v):
+                return False
+        if 'extensions' not in i:
+            return False
+    return True
+
+def _evaluated66(i):
+    keys = set()
+    if 'type' in i and not (not (isinstance(i['type'], str)) or not i['type'] == 'attack-flow'):
+        keys.add('type')
+    return keys
+
+def _evaluated67(i):
+    keys = set()
+    keys |= _evaluated9(i)
+    return keys
+
+def _evaluated69(i):
+    keys = set()
+    if 'type' in i and not (not (isinstance(i['type'], str)) or not i['type'] == 'attack-action'):
+        keys.add('type')
+    return keys
+
+def _evaluated70(i):
+    keys = set()
+    keys |= _evaluated13(i)
+    return keys
+
+def _evaluated72(i):
+    keys = set()
+    if 'type' in i and not (not (isinstance(i['type'], str)) or not i['type'] == 'attack-condition'):
+        keys.add('type')
+    return keys
+
+def _evaluated73(i):
+    keys = set()
+    keys |= _evaluated17(i)
+    return keys
+
+def _evaluated75(i):
+    keys = set()
+    if 'type' in i and not (not (isinstance(i['type'], str)) or not i['type'] == 'attack-operator'):
+        keys.add('type')
+    return keys
+
+def _evaluated76(i):
+    keys = set()
+    keys |= _evaluated21(i)
+    return keys
+
+def _evaluated78(i):
+    keys = set()
+    if 'type' in i and not (not (isinstance(i['type'], str)) or not i['type'] == 'attack-asset'):
+        keys.add('type')
+    return keys
+
+def _evaluated79(i):
+    keys = set()
+    keys |= _evaluated25(i)
+    return keys
+
+def _check156(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not v == 'attack-asset'):
+                return False
+    return True
+
+def _evaluated77(i):
+    keys = set()
+    if _check156(i):
+        keys |= _evaluated78(i)
+        keys |= _evaluated79(i)
+    return keys
+
+def _check157(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not v == 'attack-operator'):
+                return False
+    return True
+
+def _evaluated74(i):
+    keys = set()
+    if _check157(i):
+        keys |= _evaluated75(i)
+        keys |= _evaluated76(i)
+    else:
+        keys |= _evaluated77(i)
+    return keys
+
+def _check158(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not v == 'attack-condition'):
+                return False
+    return True
+
+def _evaluated71(i):
+    keys = set()
+    if _check158(i):
+        keys |= _evaluated72(i)
+        keys |= _evaluated73(i)
+    else:
+        keys |= _evaluated74(i)
+    return keys
+
+def _check159(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not v == 'attack-action'):
+                return False
+    return True
+
+def _evaluated68(i):
+    keys = set()
+    if _check159(i):
+        keys |= _evaluated69(i)
+        keys |= _evaluated70(i)
+    else:
+        keys |= _evaluated71(i)
+    return keys
+
+def _check160(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not v == 'attack-flow'):
+                return False
+    return True
+
+def _evaluated65(i):
+    keys = set()
+    if _check160(i):
+        keys |= _evaluated66(i)
+        keys |= _evaluated67(i)
+    else:
+        keys |= _evaluated68(i)
+    return keys
+
+def _check162(i):
+    if not _check98(i):
+        return False
+    return True
+
+def _check164(i):
+    if not _check101(i):
+        return False
+    return True
+
+def _check166(i):
+    if not _check104(i):
+        return False
+    return True
+
+def _check168(i):
+    if not _check107(i):
+        return False
+    return True
+
+def _check170(i):
+    if not _check110(i):
+        return False
+    return True
+
+def _check169(i):
+    if _check156(i):
+        if not _check170(i):
+            return False
+    elif not True:
+        return False
+    return True
+
+def _check167(i):
+    if _check157(i):
+        if not _check168(i):
+            return False
+    elif not _check169(i):
+        return False
+    return True
+
+def _check165(i):
+    if _check158(i):
+        if not _check166(i):
+            return False
+    elif not _check167(i):
+        return False
+    return True
+
+def _check163(i):
+    if _check159(i):
+        if not _check164(i):
+            return False
+    elif not _check165(i):
+        return False
+    return True
+
+def _check161(i):
+    if _check160(i):
+        if not _check162(i):
+            return False
+    elif not _check163(i):
+        return False
+    return True
+
+def _evaluated62(i):
+    keys = set()
+    if _check152(i):
+        keys |= _evaluated63(i)
+    if _check155(i):
+        keys |= _evaluated64(i)
+    if _check161(i):
+        keys |= _evaluated65(i)
+    return keys
+
+def _check151(i):
+    if not (isinstance(i, dict)):
+        return False
+    if not _check152(i):
+        return False
+    if not _check155(i):
+        return False
+    if not _check161(i):
+        return False
+    if isinstance(i, dict):
+        if not _evaluated62(i).issuperset(i):
+            return False
+    return True
+
+def _evaluated81(i):
+    keys = set()
+    keys |= _evaluated2(i)
+    return keys
+
+def _check172(i):
+    if not _check55(i):
+        return False
+    return True
+
+def _check174(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'extension_type' in i:
+            v = i['extension_type']
+            if not not (not (isinstance(v, str)) or not v == 'new-sdo'):
+                return False
+        if 'extension_type' not in i:
+            return False
+    return True
+
+def _check173(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'extension-definition--fb9c968a-745b-4ade-9b25-c324172197f4' in i:
+            v = i['extension-definition--fb9c968a-745b-4ade-9b25-c324172197f4']
+            if not _check174(v):
+                return False
+        if 'extension-definition--fb9c968a-745b-4ade-9b25-c324172197f4' not in i:
+            return False
+    return True
+
+def _evaluated82(i):
+    keys = set()
+    if 'extensions' in i and _check173(i['extensions']):
+        keys.add('extensions')
+    return keys
+
+def _check175(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'extensions' in i:
+            v = i['extensions']
+            if not _check173(v):
+                return False
+        if 'extensions' not in i:
+            return False
+    return True
+
+def _evaluated84(i):
+    keys = set()
+    if 'type' in i and not (not (isinstance(i['type'], str)) or not i['type'] == 'attack-flow'):
+        keys.add('type')
+    return keys
+
+def _evaluated85(i):
+    keys = set()
+    keys |= _evaluated9(i)
+    return keys
+
+def _evaluated87(i):
+    keys = set()
+    if 'type' in i and not (not (isinstance(i['type'], str)) or not i['type'] == 'attack-action'):
+        keys.add('type')
+    return keys
+
+def _evaluated88(i):
+    keys = set()
+    keys |= _evaluated13(i)
+    return keys
+
+def _evaluated90(i):
+    keys = set()
+    if 'type' in i and not (not (isinstance(i['type'], str)) or not i['type'] == 'attack-condition'):
+        keys.add('type')
+    return keys
+
+def _evaluated91(i):
+    keys = set()
+    keys |= _evaluated17(i)
+    return keys
+
+def _evaluated93(i):
+    keys = set()
+    if 'type' in i and not (not (isinstance(i['type'], str)) or not i['type'] == 'attack-operator'):
+        keys.add('type')
+    return keys
+
+def _evaluated94(i):
+    keys = set()
+    keys |= _evaluated21(i)
+    return keys
+
+def _evaluated96(i):
+    keys = set()
+    if 'type' in i and not (not (isinstance(i['type'], str)) or not i['type'] == 'attack-asset'):
+        keys.add('type')
+    return keys
+
+def _evaluated97(i):
+    keys = set()
+    keys |= _evaluated25(i)
+    return keys
+
+def _check176(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not v == 'attack-asset'):
+                return False
+    return True
+
+def _evaluated95(i):
+    keys = set()
+    if _check176(i):
+        keys |= _evaluated96(i)
+        keys |= _evaluated97(i)
+    return keys
+
+def _check177(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not v == 'attack-operator'):
+                return False
+    return True
+
+def _evaluated92(i):
+    keys = set()
+    if _check177(i):
+        keys |= _evaluated93(i)
+        keys |= _evaluated94(i)
+    else:
+        keys |= _evaluated95(i)
+    return keys
+
+def _check178(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not v == 'attack-condition'):
+                return False
+    return True
+
+def _evaluated89(i):
+    keys = set()
+    if _check178(i):
+        keys |= _evaluated90(i)
+        keys |= _evaluated91(i)
+    else:
+        keys |= _evaluated92(i)
+    return keys
+
+def _check179(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not v == 'attack-action'):
+                return False
+    return True
+
+def _evaluated86(i):
+    keys = set()
+    if _check179(i):
+        keys |= _evaluated87(i)
+        keys |= _evaluated88(i)
+    else:
+        keys |= _evaluated89(i)
+    return keys
+
+def _check180(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not v == 'attack-flow'):
+                return False
+    return True
+
+def _evaluated83(i):
+    keys = set()
+    if _check180(i):
+        keys |= _evaluated84(i)
+        keys |= _evaluated85(i)
+    else:
+        keys |= _evaluated86(i)
+    return keys
+
+def _check182(i):
+    if not _check98(i):
+        return False
+    return True
+
+def _check184(i):
+    if not _check101(i):
+        return False
+    return True
+
+def _check186(i):
+    if not _check104(i):
+        return False
+    return True
+
+def _check188(i):
+    if not _check107(i):
+        return False
+    return True
+
+def _check190(i):
+    if not _check110(i):
+        return False
+    return True
+
+def _check189(i):
+    if _check176(i):
+        if not _check190(i):
+            return False
+    elif not True:
+        return False
+    return True
+
+def _check187(i):
+    if _check177(i):
+        if not _check188(i):
+            return False
+    elif not _check189(i):
+        return False
+    return True
+
+def _check185(i):
+    if _check178(i):
+        if not _check186(i):
+            return False
+    elif not _check187(i):
+        return False
+    return True
+
+def _check183(i):
+    if _check179(i):
+        if not _check184(i):
+            return False
+    elif not _check185(i):
+        return False
+    return True
+
+def _check181(i):
+    if _check180(i):
+        if not _check182(i):
+            return False
+    elif not _check183(i):
+        return False
+    return True
+
+def _evaluated80(i):
+    keys = set()
+    if _check172(i):
+        keys |= _evaluated81(i)
+    if _check175(i):
+        keys |= _evaluated82(i)
+    if _check181(i):
+        keys |= _evaluated83(i)
+    return keys
+
+def _check171(i):
+    if not (isinstance(i, dict)):
+        return False
+    if not _check172(i):
+        return False
+    if not _check175(i):
+        return False
+    if not _check181(i):
+        return False
+    if isinstance(i, dict):
+        if not _evaluated80(i).issuperset(i):
+            return False
+    return True
+
+def _check194(i):
+    if not (isinstance(i, str)):
+        return False
+    if (isinstance(i, str) and not _re0(i)):
+        return False
+    if (isinstance(i, str) and len(i) < 3):
+        return False
+    if (isinstance(i, str) and len(i) > 250):
+        return False
+    if not (not (isinstance(i, str) and i in _enum1)):
+        return False
+    return True
+
+def _check196(i):
+    if not _check3(i):
+        return False
+    return True
+
+def _check195(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not _check196(v):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check198(i):
+    if not _check36(i):
+        return False
+    return True
+
+def _check197(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not _check198(v):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check199(i):
+    if not _check3(i):
+        return False
+    return True
+
+def _check202(i):
+    if not _check46(i):
+        return False
+    return True
+
+def _check201(i):
+    if not (isinstance(i, dict)):
+        return False
+    if not _check202(i):
+        return False
+    if isinstance(i, dict):
+        if len(i) < 1:
+            return False
+    return True
+
+def _check204(i):
+    if not _check43(i):
+        return False
+    return True
+
+def _check203(i):
+    if not _check204(i):
+        return False
+    return True
+
+def _check200(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if len(i) < 1:
+            return False
+        for k, v in i.items():
+            if _re47(k) and not _check201(v):
+                return False
+        for k, v in i.items():
+            if _re39(k) and not _check203(v):
+                return False
+        for k in (k for k in i if not _re48(k)):
+            return False
+    return True
+
+def _check205(i):
+    if not _check46(i):
+        return False
+    return True
+
+def _check207(i):
+    if isinstance(i, dict):
+        if 'severity' not in i:
+            return False
+    return True
+
+def _check208(i):
+    if isinstance(i, dict):
+        if 'action' not in i:
+            return False
+    return True
+
+def _check209(i):
+    if isinstance(i, dict):
+        if 'username' not in i:
+            return False
+    return True
+
+def _check210(i):
+    if isinstance(i, dict):
+        if 'phone_numbers' not in i:
+            return False
+    return True
+
+def _check206(i):
+    if not (_check207(i) or _check208(i) or _check209(i) or _check210(i)):
+        return False
+    return True
+
+def _check193(i):
+    if not (isinstance(i, dict)):
+        return False
+    if not _check205(i):
+        return False
+    if _check206(i):
+        return False
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not _check194(v):
+                return False
+        if 'spec_version' in i:
+            v = i['spec_version']
+            if not not (not (isinstance(v, str)) or not (isinstance(v, str) and v in _enum2)):
+                return False
+        if 'object_marking_refs' in i:
+            v = i['object_marking_refs']
+            if not _check195(v):
+                return False
+        if 'granular_markings' in i:
+            v = i['granular_markings']
+            if not _check197(v):
+                return False
+        if 'defanged' in i:
+            v = i['defanged']
+            if not not (not (isinstance(v, bool))):
+                return False
+        if 'id' in i:
+            v = i['id']
+            if not _check199(v):
+                return False
+        if 'extensions' in i:
+            v = i['extensions']
+            if not _check200(v):
+                return False
+        if 'type' not in i or 'id' not in i:
+            return False
+    return True
+
+def _check192(i):
+    if not _check193(i):
+        return False
+    return True
+
+def _check212(i):
+    if not _check8(i):
+        return False
+    return True
+
+def _check213(i):
+    if not _check8(i):
+        return False
+    return True
+
+def _check214(i):
+    if not _check8(i):
+        return False
+    return True
+
+def _check215(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not not (not (isinstance(v, str))):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check211(i):
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not (isinstance(v, str) and v in _enum49)):
+                return False
+        if 'id' in i:
+            v = i['id']
+            if not not ((isinstance(v, str) and not _re50(v))):
+                return False
+        if 'path' in i:
+            v = i['path']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'path_enc' in i:
+            v = i['path_enc']
+            if not not (not (isinstance(v, str)) or (isinstance(v, str) and not _re51(v))):
+                return False
+        if 'ctime' in i:
+            v = i['ctime']
+            if not _check212(v):
+                return False
+        if 'mtime' in i:
+            v = i['mtime']
+            if not _check213(v):
+                return False
+        if 'atime' in i:
+            v = i['atime']
+            if not _check214(v):
+                return False
+        if 'contains_refs' in i:
+            v = i['contains_refs']
+            if not _check215(v):
+                return False
+        if 'path' not in i:
+            return False
+    return True
+
+def _check191(i):
+    if not (isinstance(i, dict)):
+        return False
+    if not _check192(i):
+        return False
+    if not _check211(i):
+        return False
+    return True
+
+def _check217(i):
+    if not _check55(i):
+        return False
+    return True
+
+def _check220(i):
+    if not not (not (isinstance(i, str)) or not (isinstance(i, str) and i in _enum32)):
+        return False
+    return True
+
+def _check219(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not _check220(v):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check221(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not not (not (isinstance(v, str))):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check218(i):
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not (isinstance(v, str) and v in _enum52)):
+                return False
+        if 'id' in i:
+            v = i['id']
+            if not not ((isinstance(v, str) and not _re53(v))):
+                return False
+        if 'name' in i:
+            v = i['name']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'description' in i:
+            v = i['description']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'schema' in i:
+            v = i['schema']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'version' in i:
+            v = i['version']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'extension_types' in i:
+            v = i['extension_types']
+            if not _check219(v):
+                return False
+        if 'extension_properties' in i:
+            v = i['extension_properties']
+            if not _check221(v):
+                return False
+    return True
+
+def _check224(i):
+    if isinstance(i, dict):
+        if 'extension_properties' not in i:
+            return False
+    return True
+
+def _check223(i):
+    if _check224(i):
+        return False
+    return True
+
+def _check227(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        if not any(not (not v == 'toplevel-property-extension') for v in i):
+            return False
+    return True
+
+def _check226(i):
+    if isinstance(i, dict):
+        if 'extension_types' in i:
+            v = i['extension_types']
+            if not _check227(v):
+                return False
+    return True
+
+def _check225(i):
+    if _check226(i):
+        return False
+    return True
+
+def _check222(i):
+    if _check225(i):
+        if not _check223(i):
+            return False
+    elif not True:
+        return False
+    return True
+
+def _check216(i):
+    if not (isinstance(i, dict)):
+        return False
+    if not _check217(i):
+        return False
+    if not _check218(i):
+        return False
+    if not _check222(i):
+        return False
+    if isinstance(i, dict):
+        if 'name' not in i or 'schema' not in i or 'version' not in i or 'extension_types' not in i:
+            return False
+    return True
+
+def _check229(i):
+    if not _check193(i):
+        return False
+    return True
+
+def _check233(i):
+    if not _check20(i):
+        return False
+    return True
+
+def _check238(i):
+    if not _check18(i):
+        return False
+    return True
+
+def _check237(i):
+    if isinstance(i, dict):
+        if 'name' in i:
+            v = i['name']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'hashes' in i:
+            v = i['hashes']
+            if not _check238(v):
+                return False
+        if 'size' in i:
+            v = i['size']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer())) or ((isinstance(v, _Number) and not isinstance(v, bool)) and v < 0)):
+                return False
+        if 'name' not in i:
+            return False
+    return True
+
+def _check236(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not _check237(v):
+                return False
+    return True
+
+def _check235(i):
+    if isinstance(i, dict):
+        if 'sid' in i:
+            v = i['sid']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'alternate_data_streams' in i:
+            v = i['alternate_data_streams']
+            if not _check236(v):
+                return False
+    return True
+
+def _check240(i):
+    if isinstance(i, dict):
+        if 'sid' not in i:
+            return False
+    return True
+
+def _check241(i):
+    if isinstance(i, dict):
+        if 'alternate_data_streams' not in i:
+            return False
+    return True
+
+def _check239(i):
+    if not (_check240(i) or _check241(i)):
+        return False
+    return True
+
+def _check234(i):
+    if not (isinstance(i, dict)):
+        return False
+    if not _check235(i):
+        return False
+    if not _check239(i):
+        return False
+    return True
+
+def _check245(i):
+    if not _check20(i):
+        return False
+    return True
+
+def _check246(i):
+    if (not (not (isinstance(i, str)))) + (not (not ((isinstance(i, int) and not isinstance(i, bool) or isinstance(i, float) and i.is_integer())))) != 1:
+        return False
+    return True
+
+def _check244(i):
+    if not _check245(i):
+        return False
+    if isinstance(i, dict):
+        for k, v in i.items():
+            if _re57(k) and not _check246(v):
+                return False
+        for k in (k for k in i if not _re57(k)):
+            return False
+    return True
+
+def _check243(i):
+    if isinstance(i, dict):
+        if 'image_height' in i:
+            v = i['image_height']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer()))):
+                return False
+        if 'image_width' in i:
+            v = i['image_width']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer()))):
+                return False
+        if 'bits_per_pixel' in i:
+            v = i['bits_per_pixel']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer()))):
+                return False
+        if 'exif_tags' in i:
+            v = i['exif_tags']
+            if not _check244(v):
+                return False
+    return True
+
+def _check248(i):
+    if isinstance(i, dict):
+        if 'image_height' not in i:
+            return False
+    return True
+
+def _check249(i):
+    if isinstance(i, dict):
+        if 'image_width' not in i:
+            return False
+    return True
+
+def _check250(i):
+    if isinstance(i, dict):
+        if 'bits_per_pixel' not in i:
+            return False
+    return True
+
+def _check251(i):
+    if isinstance(i, dict):
+        if 'image_compression_algorithm' not in i:
+            return False
+    return True
+
+def _check252(i):
+    if isinstance(i, dict):
+        if 'exif_tags' not in i:
+            return False
+    return True
+
+def _check247(i):
+    if not (_check248(i) or _check249(i) or _check250(i) or _check251(i) or _check252(i)):
+        return False
+    return True
+
+def _check242(i):
+    if not (isinstance(i, dict)):
+        return False
+    if not _check243(i):
+        return False
+    if not _check247(i):
+        return False
+    return True
+
+def _check256(i):
+    if not _check20(i):
+        return False
+    return True
+
+def _check255(i):
+    if not _check256(i):
+        return False
+    if isinstance(i, dict):
+        for k, v in i.items():
+            if _re6(k) and not not (not (isinstance(v, str))):
+                return False
+    return True
+
+def _check254(i):
+    if isinstance(i, dict):
+        if 'version' in i:
+            v = i['version']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'is_optimized' in i:
+            v = i['is_optimized']
+            if not not (not (isinstance(v, bool))):
+                return False
+        if 'document_info_dict' in i:
+            v = i['document_info_dict']
+            if not _check255(v):
+                return False
+        if 'pdfid0' in i:
+            v = i['pdfid0']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'pdfid1' in i:
+            v = i['pdfid1']
+            if not not (not (isinstance(v, str))):
+                return False
+    return True
+
+def _check258(i):
+    if isinstance(i, dict):
+        if 'version' not in i:
+            return False
+    return True
+
+def _check259(i):
+    if isinstance(i, dict):
+        if 'is_optimized' not in i:
+            return False
+    return True
+
+def _check260(i):
+    if isinstance(i, dict):
+        if 'document_info_dict' not in i:
+            return False
+    return True
+
+def _check261(i):
+    if isinstance(i, dict):
+        if 'pdfid0' not in i:
+            return False
+    return True
+
+def _check262(i):
+    if isinstance(i, dict):
+        if 'pdfid1' not in i:
+            return False
+    return True
+
+def _check257(i):
+    if not (_check258(i) or _check259(i) or _check260(i) or _check261(i) or _check262(i)):
+        return False
+    return True
+
+def _check253(i):
+    if not (isinstance(i, dict)):
+        return False
+    if not _check254(i):
+        return False
+    if not _check257(i):
+        return False
+    return True
+
+def _check264(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not not (not (isinstance(v, str))):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check263(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'contains_refs' in i:
+            v = i['contains_refs']
+            if not _check264(v):
+                return False
+        if 'comment' in i:
+            v = i['comment']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'contains_refs' not in i:
+            return False
+    return True
+
+def _check266(i):
+    if not _check50(i):
+        return False
+    return True
+
+def _check268(i):
+    if not _check8(i):
+        return False
+    return True
+
+def _check267(i):
+    if not (isinstance(i, str)):
+        return False
+    if not _check268(i):
+        return False
+    if not not ((isinstance(i, str) and not _re61(i))):
+        return False
+    return True
+
+def _check269(i):
+    if not _check50(i):
+        return False
+    return True
+
+def _check270(i):
+    if not _check50(i):
+        return False
+    return True
+
+def _check271(i):
+    if not _check18(i):
+        return False
+    return True
+
+def _check274(i):
+    if not _check50(i):
+        return False
+    return True
+
+def _check275(i):
+    if not _check50(i):
+        return False
+    return True
+
+def _check276(i):
+    if not _check50(i):
+        return False
+    return True
+
+def _check277(i):
+    if not _check50(i):
+        return False
+    return True
+
+def _check278(i):
+    if not _check50(i):
+        return False
+    return True
+
+def _check279(i):
+    if not _check50(i):
+        return False
+    return True
+
+def _check280(i):
+    if not _check18(i):
+        return False
+    return True
+
+def _check273(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if len(i) < 1:
+            return False
+        for k in i.keys() - _props62:
+            return False
+        if 'magic_hex' in i:
+            v = i['magic_hex']
+            if not _check274(v):
+                return False
+        if 'major_linker_version' in i:
+            v = i['major_linker_version']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer()))):
+                return False
+        if 'minor_linker_version' in i:
+            v = i['minor_linker_version']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer()))):
+                return False
+        if 'size_of_code' in i:
+            v = i['size_of_code']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer())) or ((isinstance(v, _Number) and not isinstance(v, bool)) and v < 0)):
+                return False
+        if 'size_of_initialized_data' in i:
+            v = i['size_of_initialized_data']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer())) or ((isinstance(v, _Number) and not isinstance(v, bool)) and v < 0)):
+                return False
+        if 'size_of_uninitialized_data' in i:
+            v = i['size_of_uninitialized_data']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer())) or ((isinstance(v, _Number) and not isinstance(v, bool)) and v < 0)):
+                return False
+        if 'address_of_entry_point' in i:
+            v = i['address_of_entry_point']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer()))):
+                return False
+        if 'base_of_code' in i:
+            v = i['base_of_code']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer()))):
+                return False
+        if 'base_of_data' in i:
+            v = i['base_of_data']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer()))):
+                return False
+        if 'image_base' in i:
+            v = i['image_base']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer()))):
+                return False
+        if 'section_alignment' in i:
+            v = i['section_alignment']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer()))):
+                return False
+        if 'file_alignment' in i:
+            v = i['file_alignment']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer()))):
+                return False
+        if 'major_os_version' in i:
+            v = i['major_os_version']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer()))):
+                return False
+        if 'minor_os_version' in i:
+            v = i['minor_os_version']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer()))):
+                return False
+        if 'major_image_version' in i:
+            v = i['major_image_version']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer()))):
+                return False
+        if 'minor_image_version' in i:
+            v = i['minor_image_version']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer()))):
+                return False
+        if 'major_subsystem_version' in i:
+            v = i['major_subsystem_version']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer()))):
+                return False
+        if 'minor_subsystem_version' in i:
+            v = i['minor_subsystem_version']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer()))):
+                return False
+        if 'win32_version_value_hex' in i:
+            v = i['win32_version_value_hex']
+            if not _check275(v):
+                return False
+        if 'size_of_image' in i:
+            v = i['size_of_image']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer())) or ((isinstance(v, _Number) and not isinstance(v, bool)) and v < 0)):
+                return False
+        if 'size_of_headers' in i:
+            v = i['size_of_headers']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer())) or ((isinstance(v, _Number) and not isinstance(v, bool)) and v < 0)):
+                return False
+        if 'checksum_hex' in i:
+            v = i['checksum_hex']
+            if not _check276(v):
+                return False
+        if 'subsystem_hex' in i:
+            v = i['subsystem_hex']
+            if not _check277(v):
+                return False
+        if 'dll_characteristics_hex' in i:
+            v = i['dll_characteristics_hex']
+            if not _check278(v):
+                return False
+        if 'size_of_stack_reserve' in i:
+            v = i['size_of_stack_reserve']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer())) or ((isinstance(v, _Number) and not isinstance(v, bool)) and v < 0)):
+                return False
+        if 'size_of_stack_commit' in i:
+            v = i['size_of_stack_commit']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer())) or ((isinstance(v, _Number) and not isinstance(v, bool)) and v < 0)):
+                return False
+        if 'size_of_heap_reserve' in i:
+            v = i['size_of_heap_reserve']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer())) or ((isinstance(v, _Number) and not isinstance(v, bool)) and v < 0)):
+                return False
+        if 'size_of_heap_commit' in i:
+            v = i['size_of_heap_commit']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer())) or ((isinstance(v, _Number) and not isinstance(v, bool)) and v < 0)):
+                return False
+        if 'loader_flags_hex' in i:
+            v = i['loader_flags_hex']
+            if not _check279(v):
+                return False
+        if 'number_of_rva_and_sizes' in i:
+            v = i['number_of_rva_and_sizes']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer()))):
+                return False
+        if 'hashes' in i:
+            v = i['hashes']
+            if not _check280(v):
+                return False
+    return True
+
+def _check272(i):
+    if not _check273(i):
+        return False
+    return True
+
+def _check284(i):
+    if not _check18(i):
+        return False
+    return True
+
+def _check283(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'name' in i:
+            v = i['name']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'size' in i:
+            v = i['size']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer())) or ((isinstance(v, _Number) and not isinstance(v, bool)) and v < 0)):
+                return False
+        if 'entropy' in i:
+            v = i['entropy']
+            if not not (not ((isinstance(v, _Number) and not isinstance(v, bool)))):
+                return False
+        if 'hashes' in i:
+            v = i['hashes']
+            if not _check284(v):
+                return False
+        if 'name' not in i:
+            return False
+    return True
+
+def _check282(i):
+    if not _check283(i):
+        return False
+    return True
+
+def _check281(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not _check282(v):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check285(i):
+    if isinstance(i, dict):
+        if 'imphash' not in i:
+            return False
+    return True
+
+def _check286(i):
+    if isinstance(i, dict):
+        if 'machine_hex' not in i:
+            return False
+    return True
+
+def _check287(i):
+    if isinstance(i, dict):
+        if 'number_of_sections' not in i:
+            return False
+    return True
+
+def _check288(i):
+    if isinstance(i, dict):
+        if 'time_date_stamp' not in i:
+            return False
+    return True
+
+def _check289(i):
+    if isinstance(i, dict):
+        if 'pointer_to_symbol_table_hex' not in i:
+            return False
+    return True
+
+def _check290(i):
+    if isinstance(i, dict):
+        if 'number_of_symbols' not in i:
+            return False
+    return True
+
+def _check291(i):
+    if isinstance(i, dict):
+        if 'size_of_optional_header' not in i:
+            return False
+    return True
+
+def _check292(i):
+    if isinstance(i, dict):
+        if 'characteristics_hex' not in i:
+            return False
+    return True
+
+def _check293(i):
+    if isinstance(i, dict):
+        if 'file_header_hashes' not in i:
+            return False
+    return True
+
+def _check294(i):
+    if isinstance(i, dict):
+        if 'optional_header' not in i:
+            return False
+    return True
+
+def _check295(i):
+    if isinstance(i, dict):
+        if 'sections' not in i:
+            return False
+    return True
+
+def _check265(i):
+    if not (isinstance(i, dict)):
+        return False
+    if not (_check285(i) or _check286(i) or _check287(i) or _check288(i) or _check289(i) or _check290(i) or _check291(i) or _check292(i) or _check293(i) or _check294(i) or _check295(i)):
+        return False
+    if isinstance(i, dict):
+        if 'pe_type' in i:
+            v = i['pe_type']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'imphash' in i:
+            v = i['imphash']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'machine_hex' in i:
+            v = i['machine_hex']
+            if not _check266(v):
+                return False
+        if 'number_of_sections' in i:
+            v = i['number_of_sections']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer())) or ((isinstance(v, _Number) and not isinstance(v, bool)) and v < 0)):
+                return False
+        if 'time_date_stamp' in i:
+            v = i['time_date_stamp']
+            if not _check267(v):
+                return False
+        if 'pointer_to_symbol_table_hex' in i:
+            v = i['pointer_to_symbol_table_hex']
+            if not _check269(v):
+                return False
+        if 'number_of_symbols' in i:
+            v = i['number_of_symbols']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer())) or ((isinstance(v, _Number) and not isinstance(v, bool)) and v < 0)):
+                return False
+        if 'size_of_optional_header' in i:
+            v = i['size_of_optional_header']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer())) or ((isinstance(v, _Number) and not isinstance(v, bool)) and v < 0)):
+                return False
+        if 'characteristics_hex' in i:
+            v = i['characteristics_hex']
+            if not _check270(v):
+                return False
+        if 'file_header_hashes' in i:
+            v = i['file_header_hashes']
+            if not _check271(v):
+                return False
+        if 'optional_header' in i:
+            v = i['optional_header']
+            if not _check272(v):
+                return False
+        if 'sections' in i:
+            v = i['sections']
+            if not _check281(v):
+                return False
+        if 'pe_type' not in i:
+            return False
+    return True
+
+def _check296(i):
+    if not _check20(i):
+        return False
+    return True
+
+def _check232(i):
+    if not _check233(i):
+        return False
+    if isinstance(i, dict):
+        for k, v in i.items():
+            if _re56(k) and not _check234(v):
+                return False
+        for k, v in i.items():
+            if _re58(k) and not _check242(v):
+                return False
+        for k, v in i.items():
+            if _re59(k) and not _check253(v):
+                return False
+        for k, v in i.items():
+            if _re60(k) and not _check263(v):
+                return False
+        for k, v in i.items():
+            if _re63(k) and not _check265(v):
+                return False
+        for k in (k for k in i if not _re64(k)):
+            if not _check296(i[k]):
+                return False
+    return True
+
+def _check231(i):
+    if not _check232(i):
+        return False
+    return True
+
+def _check297(i):
+    if not _check18(i):
+        return False
+    return True
+
+def _check298(i):
+    if not _check50(i):
+        return False
+    return True
+
+def _check299(i):
+    if not _check8(i):
+        return False
+    return True
+
+def _check300(i):
+    if not _check8(i):
+        return False
+    return True
+
+def _check301(i):
+    if not _check8(i):
+        return False
+    return True
+
+def _check302(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not not (not (isinstance(v, str))):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check230(i):
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not (isinstance(v, str) and v in _enum54)):
+                return False
+        if 'id' in i:
+            v = i['id']
+            if not not ((isinstance(v, str) and not _re55(v))):
+                return False
+        if 'extensions' in i:
+            v = i['extensions']
+            if not _check231(v):
+                return False
+        if 'hashes' in i:
+            v = i['hashes']
+            if not _check297(v):
+                return False
+        if 'size' in i:
+            v = i['size']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer())) or ((isinstance(v, _Number) and not isinstance(v, bool)) and v < 0)):
+                return False
+        if 'name' in i:
+            v = i['name']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'name_enc' in i:
+            v = i['name_enc']
+            if not not (not (isinstance(v, str)) or (isinstance(v, str) and not _re51(v))):
+                return False
+        if 'magic_number_hex' in i:
+            v = i['magic_number_hex']
+            if not _check298(v):
+                return False
+        if 'mime_type' in i:
+            v = i['mime_type']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'ctime' in i:
+            v = i['ctime']
+            if not _check299(v):
+                return False
+        if 'mtime' in i:
+            v = i['mtime']
+            if not _check300(v):
+                return False
+        if 'atime' in i:
+            v = i['atime']
+            if not _check301(v):
+                return False
+        if 'parent_directory_ref' in i:
+            v = i['parent_directory_ref']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'contains_refs' in i:
+            v = i['contains_refs']
+            if not _check302(v):
+                return False
+        if 'content_ref' in i:
+            v = i['content_ref']
+            if not not (not (isinstance(v, str))):
+                return False
+    return True
+
+def _check303(i):
+    if isinstance(i, dict):
+        if 'hashes' not in i:
+            return False
+    return True
+
+def _check304(i):
+    if isinstance(i, dict):
+        if 'name' not in i:
+            return False
+    return True
+
+def _check228(i):
+    if not (isinstance(i, dict)):
+        return False
+    if not _check229(i):
+        return False
+    if not _check230(i):
+        return False
+    if not (_check303(i) or _check304(i)):
+        return False
+    return True
+
+def _check306(i):
+    if not _check55(i):
+        return False
+    return True
+
+def _check308(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not not (not (isinstance(v, str))):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check309(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not not (not (isinstance(v, str))):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check307(i):
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not (isinstance(v, str) and v in _enum65)):
+                return False
+        if 'id' in i:
+            v = i['id']
+            if not not ((isinstance(v, str) and not _re66(v))):
+                return False
+        if 'roles' in i:
+            v = i['roles']
+            if not _check308(v):
+                return False
+        if 'name' in i:
+            v = i['name']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'description' in i:
+            v = i['description']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'identity_class' in i:
+            v = i['identity_class']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'sectors' in i:
+            v = i['sectors']
+            if not _check309(v):
+                return False
+        if 'contact_information' in i:
+            v = i['contact_information']
+            if not not (not (isinstance(v, str))):
+                return False
+    return True
+
+def _check305(i):
+    if not (isinstance(i, dict)):
+        return False
+    if not _check306(i):
+        return False
+    if not _check307(i):
+        return False
+    if isinstance(i, dict):
+        if 'name' not in i:
+            return False
+    return True
+
+def _check311(i):
+    if not _check55(i):
+        return False
+    return True
+
+def _check313(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not not (not (isinstance(v, str))):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check314(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not not (not (isinstance(v, str))):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check317(i):
+    if not (isinstance(i, dict)):
+        return False
+    if isinstance(i, dict):
+        if 'kill_chain_name' in i:
+            v = i['kill_chain_name']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'phase_name' in i:
+            v = i['phase_name']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'kill_chain_name' not in i or 'phase_name' not in i:
+            return False
+    return True
+
+def _check316(i):
+    if not _check317(i):
+        return False
+    return True
+
+def _check315(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not _check316(v):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check318(i):
+    if not _check8(i):
+        return False
+    return True
+
+def _check319(i):
+    if not _check8(i):
+        return False
+    return True
+
+def _check312(i):
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not (isinstance(v, str) and v in _enum67)):
+                return False
+        if 'id' in i:
+            v = i['id']
+            if not not ((isinstance(v, str) and not _re68(v))):
+                return False
+        if 'name' in i:
+            v = i['name']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'description' in i:
+            v = i['description']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'infrastructure_types' in i:
+            v = i['infrastructure_types']
+            if not _check313(v):
+                return False
+        if 'aliases' in i:
+            v = i['aliases']
+            if not _check314(v):
+                return False
+        if 'kill_chain_phases' in i:
+            v = i['kill_chain_phases']
+            if not _check315(v):
+                return False
+        if 'first_seen' in i:
+            v = i['first_seen']
+            if not _check318(v):
+                return False
+        if 'last_seen' in i:
+            v = i['last_seen']
+            if not _check319(v):
+                return False
+    return True
+
+def _check310(i):
+    if not (isinstance(i, dict)):
+        return False
+    if not _check311(i):
+        return False
+    if not _check312(i):
+        return False
+    if isinstance(i, dict):
+        if 'name' not in i:
+            return False
+    return True
+
+def _check321(i):
+    if not _check193(i):
+        return False
+    return True
+
+def _check323(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not not (not (isinstance(v, str))):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check324(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not not (not (isinstance(v, str))):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check322(i):
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not (isinstance(v, str) and v in _enum69)):
+                return False
+        if 'id' in i:
+            v = i['id']
+            if not not ((isinstance(v, str) and not _re70(v))):
+                return False
+        if 'value' in i:
+            v = i['value']
+            if not not (not (isinstance(v, str)) or (isinstance(v, str) and not _re71(v))):
+                return False
+        if 'resolves_to_refs' in i:
+            v = i['resolves_to_refs']
+            if not _check323(v):
+                return False
+        if 'belongs_to_refs' in i:
+            v = i['belongs_to_refs']
+            if not _check324(v):
+                return False
+        if 'value' not in i:
+            return False
+    return True
+
+def _check320(i):
+    if not (isinstance(i, dict)):
+        return False
+    if not _check321(i):
+        return False
+    if not _check322(i):
+        return False
+    return True
+
+def _check326(i):
+    if not _check55(i):
+        return False
+    return True
+
+def _check328(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not not (not (isinstance(v, str))):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check329(i):
+    if not _check8(i):
+        return False
+    return True
+
+def _check330(i):
+    if not _check8(i):
+        return False
+    return True
+
+def _check333(i):
+    if not _check3(i):
+        return False
+    return True
+
+def _check332(i):
+    if not _check333(i):
+        return False
+    if not not ((isinstance(i, str) and not _re74(i))):
+        return False
+    return True
+
+def _check331(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not _check332(v):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check334(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not not (not (isinstance(v, str))):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check335(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not not (not (isinstance(v, str))):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check336(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not not (not (isinstance(v, str))):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check337(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not not (not (isinstance(v, str))):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check338(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not not (not (isinstance(v, str))):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check340(i):
+    if not _check317(i):
+        return False
+    return True
+
+def _check339(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not _check340(v):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check327(i):
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not (isinstance(v, str) and v in _enum72)):
+                return False
+        if 'id' in i:
+            v = i['id']
+            if not not ((isinstance(v, str) and not _re73(v))):
+                return False
+        if 'aliases' in i:
+            v = i['aliases']
+            if not _check328(v):
+                return False
+        if 'first_seen' in i:
+            v = i['first_seen']
+            if not _check329(v):
+                return False
+        if 'last_seen' in i:
+            v = i['last_seen']
+            if not _check330(v):
+                return False
+        if 'operating_system_refs' in i:
+            v = i['operating_system_refs']
+            if not _check331(v):
+                return False
+        if 'architecture_execution_envs' in i:
+            v = i['architecture_execution_envs']
+            if not _check334(v):
+                return False
+        if 'implementation_languages' in i:
+            v = i['implementation_languages']
+            if not _check335(v):
+                return False
+        if 'capabilities' in i:
+            v = i['capabilities']
+            if not _check336(v):
+                return False
+        if 'sample_refs' in i:
+            v = i['sample_refs']
+            if not _check337(v):
+                return False
+        if 'malware_types' in i:
+            v = i['malware_types']
+            if not _check338(v):
+                return False
+        if 'name' in i:
+            v = i['name']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'description' in i:
+            v = i['description']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'kill_chain_phases' in i:
+            v = i['kill_chain_phases']
+            if not _check339(v):
+                return False
+    return True
+
+def _check341(i):
+    if isinstance(i, dict):
+        if 'is_family' in i:
+            v = i['is_family']
+            if not not (not (isinstance(v, bool)) or not _enum(v, [False])):
+                return False
+    return True
+
+def _check342(i):
+    if isinstance(i, dict):
+        if 'is_family' in i:
+            v = i['is_family']
+            if not not (not (isinstance(v, bool)) or not _enum(v, [True])):
+                return False
+        if 'name' not in i:
+            return False
+    return True
+
+def _check325(i):
+    if not (isinstance(i, dict)):
+        return False
+    if not _check326(i):
+        return False
+    if not _check327(i):
+        return False
+    if (_check341(i)) + (_check342(i)) != 1:
+        return False
+    if isinstance(i, dict):
+        if 'is_family' not in i:
+            return False
+    return True
+
+def _check344(i):
+    if not _check55(i):
+        return False
+    return True
+
+def _check346(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not not (not (isinstance(v, str))):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check348(i):
+    if not _check3(i):
+        return False
+    return True
+
+def _check347(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not _check348(v):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check345(i):
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not (isinstance(v, str) and v in _enum75)):
+                return False
+        if 'id' in i:
+            v = i['id']
+            if not not ((isinstance(v, str) and not _re76(v))):
+                return False
+        if 'abstract' in i:
+            v = i['abstract']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'content' in i:
+            v = i['content']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'authors' in i:
+            v = i['authors']
+            if not _check346(v):
+                return False
+        if 'object_refs' in i:
+            v = i['object_refs']
+            if not _check347(v):
+                return False
+    return True
+
+def _check343(i):
+    if not (isinstance(i, dict)):
+        return False
+    if not _check344(i):
+        return False
+    if not _check345(i):
+        return False
+    if isinstance(i, dict):
+        if 'content' not in i or 'object_refs' not in i:
+            return False
+    return True
+
+def _check350(i):
+    if not _check193(i):
+        return False
+    return True
+
+def _check354(i):
+    if not _check20(i):
+        return False
+    return True
+
+def _check359(i):
+    if not _check20(i):
+        return False
+    return True
+
+def _check358(i):
+    if not _check359(i):
+        return False
+    if isinstance(i, dict):
+        for k, v in i.items():
+            if _re78(k) and not not (not (isinstance(v, str))):
+                return False
+        for k, v in i.items():
+            if _re79(k) and not not (not (v is None)):
+                return False
+        for k, v in i.items():
+            if _re80(k) and not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer()))):
+                return False
+        for k, v in i.items():
+            if _re81(k) and not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer())) or ((isinstance(v, _Number) and not isinstance(v, bool)) and v < 0) or ((isinstance(v, _Number) and not isinstance(v, bool)) and v > 0)):
+                return False
+        for k in (k for k in i if not _re82(k)):
+            return False
+    return True
+
+def _check357(i):
+    if not _check358(i):
+        return False
+    return True
+
+def _check360(i):
+    if not not (not (isinstance(i, str)) or not (isinstance(i, str) and i in _enum83)):
+        return False
+    return True
+
+def _check356(i):
+    if isinstance(i, dict):
+        if 'aslr_enabled' in i:
+            v = i['aslr_enabled']
+            if not not (not (isinstance(v, bool))):
+                return False
+        if 'dep_enabled' in i:
+            v = i['dep_enabled']
+            if not not (not (isinstance(v, bool))):
+                return False
+        if 'priority' in i:
+            v = i['priority']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'owner_sid' in i:
+            v = i['owner_sid']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'window_title' in i:
+            v = i['window_title']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'startup_info' in i:
+            v = i['startup_info']
+            if not _check357(v):
+                return False
+        if 'integrity_level' in i:
+            v = i['integrity_level']
+            if not _check360(v):
+                return False
+    return True
+
+def _check362(i):
+    if isinstance(i, dict):
+        if 'aslr_enabled' not in i:
+            return False
+    return True
+
+def _check363(i):
+    if isinstance(i, dict):
+        if 'dep_enabled' not in i:
+            return False
+    return True
+
+def _check364(i):
+    if isinstance(i, dict):
+        if 'priority' not in i:
+            return False
+    return True
+
+def _check365(i):
+    if isinstance(i, dict):
+        if 'owner_sid' not in i:
+            return False
+    return True
+
+def _check366(i):
+    if isinstance(i, dict):
+        if 'window_title' not in i:
+            return False
+    return True
+
+def _check367(i):
+    if isinstance(i, dict):
+        if 'startup_info' not in i:
+            return False
+    return True
+
+def _check361(i):
+    if not (_check362(i) or _check363(i) or _check364(i) or _check365(i) or _check366(i) or _check367(i)):
+        return False
+    return True
+
+def _check355(i):
+    if not (isinstance(i, dict)):
+        return False
+    if not _check356(i):
+        return False
+    if not _check361(i):
+        return False
+    return True
+
+def _check369(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not not (not (isinstance(v, str))):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check370(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not not (not (isinstance(v, str))):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check371(i):
+    if isinstance(i, dict):
+        if 'service_name' not in i:
+            return False
+    return True
+
+def _check372(i):
+    if isinstance(i, dict):
+        if 'descriptions' not in i:
+            return False
+    return True
+
+def _check373(i):
+    if isinstance(i, dict):
+        if 'display_name' not in i:
+            return False
+    return True
+
+def _check374(i):
+    if isinstance(i, dict):
+        if 'group_name' not in i:
+            return False
+    return True
+
+def _check375(i):
+    if isinstance(i, dict):
+        if 'start_type' not in i:
+            return False
+    return True
+
+def _check376(i):
+    if isinstance(i, dict):
+        if 'service_dll_refs' not in i:
+            return False
+    return True
+
+def _check377(i):
+    if isinstance(i, dict):
+        if 'service_type' not in i:
+            return False
+    return True
+
+def _check378(i):
+    if isinstance(i, dict):
+        if 'service_status' not in i:
+            return False
+    return True
+
+def _check368(i):
+    if not (isinstance(i, dict)):
+        return False
+    if not (_check371(i) or _check372(i) or _check373(i) or _check374(i) or _check375(i) or _check376(i) or _check377(i) or _check378(i)):
+        return False
+    if isinstance(i, dict):
+        if 'service_name' in i:
+            v = i['service_name']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'descriptions' in i:
+            v = i['descriptions']
+            if not _check369(v):
+                return False
+        if 'display_name' in i:
+            v = i['display_name']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'group_name' in i:
+            v = i['group_name']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'start_type' in i:
+            v = i['start_type']
+            if not not (not (isinstance(v, str)) or not (isinstance(v, str) and v in _enum85)):
+                return False
+        if 'service_dll_refs' in i:
+            v = i['service_dll_refs']
+            if not _check370(v):
+                return False
+        if 'service_type' in i:
+            v = i['service_type']
+            if not not (not (isinstance(v, str)) or not (isinstance(v, str) and v in _enum86)):
+                return False
+        if 'service_status' in i:
+            v = i['service_status']
+            if not not (not (isinstance(v, str)) or not (isinstance(v, str) and v in _enum87)):
+                return False
+    return True
+
+def _check379(i):
+    if not _check20(i):
+        return False
+    return True
+
+def _check353(i):
+    if not _check354(i):
+        return False
+    if isinstance(i, dict):
+        for k, v in i.items():
+            if _re84(k) and not _check355(v):
+                return False
+        for k, v in i.items():
+            if _re88(k) and not _check368(v):
+                return False
+        for k in (k for k in i if not _re89(k)):
+            if not _check379(i[k]):
+                return False
+    return True
+
+def _check352(i):
+    if not _check353(i):
+        return False
+    return True
+
+def _check380(i):
+    if not _check8(i):
+        return False
+    return True
+
+def _check381(i):
+    if not _check20(i):
+        return False
+    return True
+
+def _check382(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not not (not (isinstance(v, str))):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check383(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not not (not (isinstance(v, str))):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check351(i):
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not (isinstance(v, str) and v in _enum77)):
+                return False
+        if 'id' in i:
+            v = i['id']
+            if not not ((isinstance(v, str) and not _re43(v))):
+                return False
+        if 'extensions' in i:
+            v = i['extensions']
+            if not _check352(v):
+                return False
+        if 'is_hidden' in i:
+            v = i['is_hidden']
+            if not not (not (isinstance(v, bool))):
+                return False
+        if 'pid' in i:
+            v = i['pid']
+            if not not (not ((isinstance(v, int) and not isinstance(v, bool) or isinstance(v, float) and v.is_integer()))):
+                return False
+        if 'created_time' in i:
+            v = i['created_time']
+            if not _check380(v):
+                return False
+        if 'cwd' in i:
+            v = i['cwd']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'command_line' in i:
+            v = i['command_line']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'environment_variables' in i:
+            v = i['environment_variables']
+            if not _check381(v):
+                return False
+        if 'opened_connection_refs' in i:
+            v = i['opened_connection_refs']
+            if not _check382(v):
+                return False
+        if 'creator_user_ref' in i:
+            v = i['creator_user_ref']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'image_ref' in i:
+            v = i['image_ref']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'parent_ref' in i:
+            v = i['parent_ref']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'child_refs' in i:
+            v = i['child_refs']
+            if not _check383(v):
+                return False
+    return True
+
+def _check384(i):
+    if isinstance(i, dict):
+        if 'extensions' not in i:
+            return False
+    return True
+
+def _check385(i):
+    if isinstance(i, dict):
+        if 'is_hidden' not in i:
+            return False
+    return True
+
+def _check386(i):
+    if isinstance(i, dict):
+        if 'pid' not in i:
+            return False
+    return True
+
+def _check387(i):
+    if isinstance(i, dict):
+        if 'name' not in i:
+            return False
+    return True
+
+def _check388(i):
+    if isinstance(i, dict):
+        if 'created' not in i:
+            return False
+    return True
+
+def _check389(i):
+    if isinstance(i, dict):
+        if 'cwd' not in i:
+            return False
+    return True
+
+def _check390(i):
+    if isinstance(i, dict):
+        if 'arguments' not in i:
+            return False
+    return True
+
+def _check391(i):
+    if isinstance(i, dict):
+        if 'command_line' not in i:
+            return False
+    return True
+
+def _check392(i):
+    if isinstance(i, dict):
+        if 'environment_variables' not in i:
+            return False
+    return True
+
+def _check393(i):
+    if isinstance(i, dict):
+        if 'opened_connection_refs' not in i:
+            return False
+    return True
+
+def _check394(i):
+    if isinstance(i, dict):
+        if 'creator_user_ref' not in i:
+            return False
+    return True
+
+def _check395(i):
+    if isinstance(i, dict):
+        if 'image_ref' not in i:
+            return False
+    return True
+
+def _check396(i):
+    if isinstance(i, dict):
+        if 'parent_ref' not in i:
+            return False
+    return True
+
+def _check397(i):
+    if isinstance(i, dict):
+        if 'child_refs' not in i:
+            return False
+    return True
+
+def _check349(i):
+    if not (isinstance(i, dict)):
+        return False
+    if not _check350(i):
+        return False
+    if not _check351(i):
+        return False
+    if not (_check384(i) or _check385(i) or _check386(i) or _check387(i) or _check388(i) or _check389(i) or _check390(i) or _check391(i) or _check392(i) or _check393(i) or _check394(i) or _check395(i) or _check396(i) or _check397(i)):
+        return False
+    return True
+
+def _check399(i):
+    if not _check55(i):
+        return False
+    return True
+
+def _check402(i):
+    if not _check3(i):
+        return False
+    return True
+
+def _check403(i):
+    if not ((isinstance(i, str) and not _re93(i))):
+        return False
+    return True
+
+def _check401(i):
+    if not _check402(i):
+        return False
+    if not _check403(i):
+        return False
+    return True
+
+def _check405(i):
+    if not _check3(i):
+        return False
+    return True
+
+def _check406(i):
+    if not ((isinstance(i, str) and not _re93(i))):
+        return False
+    return True
+
+def _check404(i):
+    if not _check405(i):
+        return False
+    if not _check406(i):
+        return False
+    return True
+
+def _check407(i):
+    if not _check8(i):
+        return False
+    return True
+
+def _check408(i):
+    if not _check8(i):
+        return False
+    return True
+
+def _check400(i):
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not (isinstance(v, str) and v in _enum90)):
+                return False
+        if 'id' in i:
+            v = i['id']
+            if not not ((isinstance(v, str) and not _re91(v))):
+                return False
+        if 'relationship_type' in i:
+            v = i['relationship_type']
+            if not not (not (isinstance(v, str)) or (isinstance(v, str) and not _re92(v))):
+                return False
+        if 'description' in i:
+            v = i['description']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'source_ref' in i:
+            v = i['source_ref']
+            if not _check401(v):
+                return False
+        if 'target_ref' in i:
+            v = i['target_ref']
+            if not _check404(v):
+                return False
+        if 'start_time' in i:
+            v = i['start_time']
+            if not _check407(v):
+                return False
+        if 'stop_time' in i:
+            v = i['stop_time']
+            if not _check408(v):
+                return False
+    return True
+
+def _check398(i):
+    if not (isinstance(i, dict)):
+        return False
+    if not _check399(i):
+        return False
+    if not _check400(i):
+        return False
+    if isinstance(i, dict):
+        if 'relationship_type' not in i or 'source_ref' not in i or 'target_ref' not in i:
+            return False
+    return True
+
+def _check410(i):
+    if not _check55(i):
+        return False
+    return True
+
+def _check412(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not not (not (isinstance(v, str))):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check413(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not not (not (isinstance(v, str))):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check414(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not not (not (isinstance(v, str))):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check415(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not not (not (isinstance(v, str))):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check416(i):
+    if not _check8(i):
+        return False
+    return True
+
+def _check417(i):
+    if not _check8(i):
+        return False
+    return True
+
+def _check418(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not not (not (isinstance(v, str))):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check419(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not not (not (isinstance(v, str))):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check411(i):
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not (isinstance(v, str) and v in _enum94)):
+                return False
+        if 'id' in i:
+            v = i['id']
+            if not not ((isinstance(v, str) and not _re95(v))):
+                return False
+        if 'threat_actor_types' in i:
+            v = i['threat_actor_types']
+            if not _check412(v):
+                return False
+        if 'name' in i:
+            v = i['name']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'description' in i:
+            v = i['description']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'aliases' in i:
+            v = i['aliases']
+            if not _check413(v):
+                return False
+        if 'roles' in i:
+            v = i['roles']
+            if not _check414(v):
+                return False
+        if 'goals' in i:
+            v = i['goals']
+            if not _check415(v):
+                return False
+        if 'first_seen' in i:
+            v = i['first_seen']
+            if not _check416(v):
+                return False
+        if 'last_seen' in i:
+            v = i['last_seen']
+            if not _check417(v):
+                return False
+        if 'sophistication' in i:
+            v = i['sophistication']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'resource_level' in i:
+            v = i['resource_level']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'primary_motivation' in i:
+            v = i['primary_motivation']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'secondary_motivations' in i:
+            v = i['secondary_motivations']
+            if not _check418(v):
+                return False
+        if 'personal_motivations' in i:
+            v = i['personal_motivations']
+            if not _check419(v):
+                return False
+    return True
+
+def _check409(i):
+    if not (isinstance(i, dict)):
+        return False
+    if not _check410(i):
+        return False
+    if not _check411(i):
+        return False
+    if isinstance(i, dict):
+        if 'name' not in i:
+            return False
+    return True
+
+def _check421(i):
+    if not _check55(i):
+        return False
+    return True
+
+def _check423(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not not (not (isinstance(v, str))):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check424(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not not (not (isinstance(v, str))):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check426(i):
+    if not _check317(i):
+        return False
+    return True
+
+def _check425(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not _check426(v):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check422(i):
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not (isinstance(v, str) and v in _enum96)):
+                return False
+        if 'id' in i:
+            v = i['id']
+            if not not ((isinstance(v, str) and not _re97(v))):
+                return False
+        if 'aliases' in i:
+            v = i['aliases']
+            if not _check423(v):
+                return False
+        if 'tool_types' in i:
+            v = i['tool_types']
+            if not _check424(v):
+                return False
+        if 'name' in i:
+            v = i['name']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'description' in i:
+            v = i['description']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'tool_version' in i:
+            v = i['tool_version']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'kill_chain_phases' in i:
+            v = i['kill_chain_phases']
+            if not _check425(v):
+                return False
+    return True
+
+def _check420(i):
+    if not (isinstance(i, dict)):
+        return False
+    if not _check421(i):
+        return False
+    if not _check422(i):
+        return False
+    if isinstance(i, dict):
+        if 'name' not in i:
+            return False
+    return True
+
+def _check428(i):
+    if not _check193(i):
+        return False
+    return True
+
+def _check430(i):
+    if not _check15(i):
+        return False
+    return True
+
+def _check429(i):
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not (isinstance(v, str) and v in _enum98)):
+                return False
+        if 'id' in i:
+            v = i['id']
+            if not not ((isinstance(v, str) and not _re99(v))):
+                return False
+        if 'value' in i:
+            v = i['value']
+            if not _check430(v):
+                return False
+    return True
+
+def _check427(i):
+    if not (isinstance(i, dict)):
+        return False
+    if not _check428(i):
+        return False
+    if not _check429(i):
+        return False
+    if isinstance(i, dict):
+        if 'value' not in i:
+            return False
+    return True
+
+def _check432(i):
+    if not _check193(i):
+        return False
+    return True
+
+def _check436(i):
+    if not _check20(i):
+        return False
+    return True
+
+def _check439(i):
+    if not (isinstance(i, list)):
+        return False
+    if isinstance(i, list):
+        for v in i:
+            if not not (not (isinstance(v, str))):
+                return False
+        if len(i) < 1:
+            return False
+    return True
+
+def _check438(i):
+    if isinstance(i, dict):
+        if 'gid' in i:
+            v = i['gid']
+            if not not (not ((isinstance(v, _Number) and not isinstance(v, bool)))):
+                return False
+        if 'groups' in i:
+            v = i['groups']
+            if not _check439(v):
+                return False
+        if 'home_dir' in i:
+            v = i['home_dir']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'shell' in i:
+            v = i['shell']
+            if not not (not (isinstance(v, str))):
+                return False
+    return True
+
+def _check441(i):
+    if isinstance(i, dict):
+        if 'gid' not in i:
+            return False
+    return True
+
+def _check442(i):
+    if isinstance(i, dict):
+        if 'groups' not in i:
+            return False
+    return True
+
+def _check443(i):
+    if isinstance(i, dict):
+        if 'home_dir' not in i:
+            return False
+    return True
+
+def _check444(i):
+    if isinstance(i, dict):
+        if 'shell' not in i:
+            return False
+    return True
+
+def _check440(i):
+    if not (_check441(i) or _check442(i) or _check443(i) or _check444(i)):
+        return False
+    return True
+
+def _check437(i):
+    if not (isinstance(i, dict)):
+        return False
+    if not _check438(i):
+        return False
+    if not _check440(i):
+        return False
+    return True
+
+def _check445(i):
+    if not _check20(i):
+        return False
+    return True
+
+def _check435(i):
+    if not _check436(i):
+        return False
+    if isinstance(i, dict):
+        for k, v in i.items():
+            if _re102(k) and not _check437(v):
+                return False
+        for k in (k for k in i if not _re102(k)):
+            if not _check445(i[k]):
+                return False
+    return True
+
+def _check434(i):
+    if not _check435(i):
+        return False
+    return True
+
+def _check446(i):
+    if not _check8(i):
+        return False
+    return True
+
+def _check447(i):
+    if not _check8(i):
+        return False
+    return True
+
+def _check448(i):
+    if not _check8(i):
+        return False
+    return True
+
+def _check449(i):
+    if not _check8(i):
+        return False
+    return True
+
+def _check450(i):
+    if not _check8(i):
+        return False
+    return True
+
+def _check433(i):
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not (isinstance(v, str) and v in _enum100)):
+                return False
+        if 'id' in i:
+            v = i['id']
+            if not not ((isinstance(v, str) and not _re101(v))):
+                return False
+        if 'extensions' in i:
+            v = i['extensions']
+            if not _check434(v):
+                return False
+        if 'user_id' in i:
+            v = i['user_id']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'credential' in i:
+            v = i['credential']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'account_login' in i:
+            v = i['account_login']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'account_type' in i:
+            v = i['account_type']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'display_name' in i:
+            v = i['display_name']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'is_service_account' in i:
+            v = i['is_service_account']
+            if not not (not (isinstance(v, bool))):
+                return False
+        if 'is_privileged' in i:
+            v = i['is_privileged']
+            if not not (not (isinstance(v, bool))):
+                return False
+        if 'can_escalate_privs' in i:
+            v = i['can_escalate_privs']
+            if not not (not (isinstance(v, bool))):
+                return False
+        if 'is_disabled' in i:
+            v = i['is_disabled']
+            if not not (not (isinstance(v, bool))):
+                return False
+        if 'account_created' in i:
+            v = i['account_created']
+            if not _check446(v):
+                return False
+        if 'account_expires' in i:
+            v = i['account_expires']
+            if not _check447(v):
+                return False
+        if 'credential_last_changed' in i:
+            v = i['credential_last_changed']
+            if not _check448(v):
+                return False
+        if 'account_first_login' in i:
+            v = i['account_first_login']
+            if not _check449(v):
+                return False
+        if 'account_last_login' in i:
+            v = i['account_last_login']
+            if not _check450(v):
+                return False
+    return True
+
+def _check451(i):
+    if isinstance(i, dict):
+        if 'extensions' not in i:
+            return False
+    return True
+
+def _check452(i):
+    if isinstance(i, dict):
+        if 'user_id' not in i:
+            return False
+    return True
+
+def _check453(i):
+    if isinstance(i, dict):
+        if 'credential' not in i:
+            return False
+    return True
+
+def _check454(i):
+    if isinstance(i, dict):
+        if 'account_login' not in i:
+            return False
+    return True
+
+def _check455(i):
+    if isinstance(i, dict):
+        if 'account_type' not in i:
+            return False
+    return True
+
+def _check456(i):
+    if isinstance(i, dict):
+        if 'display_name' not in i:
+            return False
+    return True
+
+def _check457(i):
+    if isinstance(i, dict):
+        if 'is_service_account' not in i:
+            return False
+    return True
+
+def _check458(i):
+    if isinstance(i, dict):
+        if 'is_privileged' not in i:
+            return False
+    return True
+
+def _check459(i):
+    if isinstance(i, dict):
+        if 'can_escalate_privs' not in i:
+            return False
+    return True
+
+def _check460(i):
+    if isinstance(i, dict):
+        if 'is_disabled' not in i:
+            return False
+    return True
+
+def _check461(i):
+    if isinstance(i, dict):
+        if 'account_created' not in i:
+            return False
+    return True
+
+def _check462(i):
+    if isinstance(i, dict):
+        if 'account_expires' not in i:
+            return False
+    return True
+
+def _check463(i):
+    if isinstance(i, dict):
+        if 'credential_last_changed' not in i:
+            return False
+    return True
+
+def _check464(i):
+    if isinstance(i, dict):
+        if 'account_first_login' not in i:
+            return False
+    return True
+
+def _check465(i):
+    if isinstance(i, dict):
+        if 'account_last_login' not in i:
+            return False
+    return True
+
+def _check431(i):
+    if not (isinstance(i, dict)):
+        return False
+    if not _check432(i):
+        return False
+    if not _check433(i):
+        return False
+    if not (_check451(i) or _check452(i) or _check453(i) or _check454(i) or _check455(i) or _check456(i) or _check457(i) or _check458(i) or _check459(i) or _check460(i) or _check461(i) or _check462(i) or _check463(i) or _check464(i) or _check465(i)):
+        return False
+    return True
+
+def _check467(i):
+    if not _check55(i):
+        return False
+    return True
+
+def _check468(i):
+    if isinstance(i, dict):
+        if 'type' in i:
+            v = i['type']
+            if not not (not (isinstance(v, str)) or not (isinstance(v, str) and v in _enum103)):
+                return False
+        if 'id' in i:
+            v = i['id']
+            if not not ((isinstance(v, str) and not _re104(v))):
+                return False
+        if 'name' in i:
+            v = i['name']
+            if not not (not (isinstance(v, str))):
+                return False
+        if 'description' in i:
+            v = i['description']
+            if not not (not (isinstance(v, str))):
+                return False
+    return True
+
+def _check466(i):
+    if not (isinstance(i, dict)):
+        return False
+    if not _check467(i):
+        return False
+    if not _check468(i):
+        return False
+    if isinstance(i, dict):
+        if 'name' not in i:
+            return False
+    return True
+
+VALIDATORS = {
+    'attack-flow': _check0,
+    'attack-action': _check111,
+    'attack-asset': _check131,
+    'attack-condition': _check151,
+    'attack-operator': _check171,
+    'directory': _check191,
+    'extension-definition': _check216,
+    'file': _check228,
+    'identity': _check305,
+    'infrastructure': _check310,
+    'ipv4-addr': _check320,
+    'malware': _check325,
+    'note': _check343,
+    'process': _check349,
+    'relationship': _check398,
+    'threat-actor': _check409,
+    'tool': _check420,
+    'url': _check427,
+    'user-account': _check431,
+    'vulnerability': _check466,
+}
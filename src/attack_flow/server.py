@@ -0,0 +1,289 @@
+"""
+Validate Attack Flow documents over HTTP.
+
+``af serve`` keeps the schemas and validators loaded between requests, so that each
+validation does not pay for starting Python, importing the libraries, and loading the
+schemas the way that running ``af validate`` once per document does.
+
+The service has two endpoints:
+
+* ``POST /validate`` validates the bundle in the request body and responds with the
+  result as JSON. The query string may set ``max_errors``, ``fail_fast``,
+  ``structural_only``, and ``time_budget``, which work like the ``af validate`` options.
+* ``GET /health`` responds with ``{"status": "ok"}``.
+
+Requests are handled in threads, but the validators are not thread safe, so documents
+are validated one at a time unless a pool of worker processes is used.
+"""
+
+import concurrent.futures
+import http.server
+import io
+import json
+import logging
+import os
+from pathlib import Path
+import socketserver
+import stat
+import threading
+import urllib.parse
+
+from .schema import get_object_memo, validate_data, warm_validator_cache
+
+MAX_BODY_SIZE = 64 * 2**20
+logger = logging.getLogger(__name__)
+
+
+def make_server(
+    host="127.0.0.1", port=8000, unix_socket=None, jobs=1, max_body_size=MAX_BODY_SIZE
+):
+    """
+    Create a validation server, and load the validators.
+
+    Call ``serve_forever()`` to handle requests and ``server_close()`` to stop.
+
+    :param str host: the address to listen on
+    :param int port: the TCP port to listen on, or 0 to pick a free port
+    :param str unix_socket: listen on this Unix socket path instead of a TCP port
+    :param int jobs: the number of worker processes to validate documents in, or 1 to
+        validate them in this process
+    :param int max_body_size: reject requests that are larger than this many bytes
+    :rtype: ValidationServer
+    """
+    validator = FlowValidator(jobs)
+    try:
+        if unix_socket is not None:
+            _remove_stale_socket(Path(unix_socket))
+            server = UnixValidationServer(str(unix_socket), validator, max_body_size)
+        else:
+            server = ValidationServer((host, port), validator, max_body_size)
+    except OSError:
+        validator.close()
+        raise
+    return server
+
+
+class FlowValidator:
+    """
+    Validate documents with warm validators, either in this process or in a pool of
+    worker processes.
+
+    Each process reuses the schema messages of objects that it has already checked in
+    earlier requests (see :func:`attack_flow.schema.get_object_memo`).
+    """
+
+    def __init__(self, jobs=1):
+        """
+        Constructor.
+
+        :param int jobs: the number of worker processes, or 1 to validate documents in
+            this process
+        """
+        self._lock = threading.Lock()
+        self._executor = None
+        warm_validator_cache()
+        if jobs > 1:
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=jobs, initializer=warm_validator_cache
+            )
+            # Start the workers now, rather than when the first requests arrive.
+            for future in [self._executor.submit(int) for _ in range(jobs)]:
+                future.result()
+
+    def validate(self, data, **options):
+        """
+        Validate a document.
+
+        :param bytes data: the document's JSON
+        :param options: keyword arguments for :func:`attack_flow.schema.validate_doc`
+        :rtype: ValidationResult
+        :raises ValueError: if the document is not valid JSON or is not a JSON object
+        """
+        if self._executor is not None:
+            return self._executor.submit(_validate_with_memo, data, options).result()
+        with self._lock:
+            return _validate_with_memo(data, options)
+
+    def close(self):
+        """Stop the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown()
+
+
+def _validate_with_memo(data, options):
+    return validate_data(data, check_object=get_object_memo().check_object, **options)
+
+
+class _ValidationServerMixin:
+    daemon_threads = True
+
+    def __init__(self, address, validator, max_body_size):
+        self.validator = validator
+        self.max_body_size = max_body_size
+        super().__init__(address, ValidationRequestHandler)
+
+    def server_close(self):
+        super().server_close()
+        self.validator.close()
+
+
+class ValidationServer(_ValidationServerMixin, http.server.ThreadingHTTPServer):
+    """A validation server that listens on a TCP port."""
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+class UnixValidationServer(
+    _ValidationServerMixin, socketserver.ThreadingMixIn, socketserver.UnixStreamServer
+):
+    """A validation server that listens on a Unix socket."""
+
+    @property
+    def url(self):
+        return f"unix:{self.server_address}"
+
+    def server_close(self):
+        super().server_close()
+        try:
+            os.unlink(self.server_address)
+        except FileNotFoundError:
+            pass
+
+
+def _remove_stale_socket(path):
+    """Remove a socket file that was left behind by a server that did not stop."""
+    try:
+        if stat.S_ISSOCK(path.stat().st_mode):
+            path.unlink()
+    except FileNotFoundError:
+        pass
+
+
+class ValidationRequestHandler(http.server.BaseHTTPRequestHandler):
+    # Keep connections open between requests.
+    protocol_version = "HTTP/1.1"
+    # Buffer each response and send it when the request has been handled. Sending the
+    # headers and the body separately makes the client delay its ACK of the headers,
+    # and Nagle's algorithm then holds the body back until that ACK arrives.
+    wbufsize = io.DEFAULT_BUFFER_SIZE
+
+    def do_GET(self):
+        if urllib.parse.urlsplit(self.path).path == "/health":
+            self._send_json(200, {"status": "ok"})
+        else:
+            self._send_json(404, {"error": "Not found"})
+
+    def do_POST(self):
+        # If a request is rejected before its body is read, then the connection cannot
+        # be reused.
+        close_connection, self.close_connection = self.close_connection, True
+        url = urllib.parse.urlsplit(self.path)
+        if url.path != "/validate":
+            self._send_json(404, {"error": "Not found"})
+            return
+        try:
+            options = parse_options(url.query)
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+            return
+
+        try:
+            length = int(self.headers["Content-Length"])
+            if length < 0:
+                raise ValueError()
+        except (TypeError, ValueError):
+            self._send_json(411, {"error": "Content-Length is required"})
+            return
+        if length > self.server.max_body_size:
+            self._send_json(413, {"error": "The document is too large"})
+            return
+        data = self.rfile.read(length)
+        self.close_connection = close_connection
+
+        try:
+            result = self.server.validator.validate(data, **options)
+        except json.JSONDecodeError as e:
+            self._send_json(400, {"error": f"Unable to parse JSON: {e}"})
+            return
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        except Exception as e:
+            logger.exception("Unable to validate a document")
+            self._send_json(500, {"error": f"Unable to validate this document: {e}"})
+            return
+        self._send_json(
+            200,
+            {
+                "success": result.success,
+                "strict_success": result.strict_success,
+                **result.to_json(),
+            },
+        )
+
+    def handle_expect_100(self):
+        # Send the interim response now instead of buffering it with the final one.
+        result = super().handle_expect_100()
+        self.wfile.flush()
+        return result
+
+    def _send_json(self, status, body):
+        content = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def address_string(self):
+        # Unix socket clients do not have an address.
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+def parse_options(query):
+    """
+    Convert a request's query string to keyword arguments for ``validate_doc()``.
+
+    :param str query: e.g. ``max_errors=5&structural_only=true``
+    :rtype: dict
+    :raises ValueError: for unknown options or invalid values
+    """
+    options = dict()
+    for name, value in urllib.parse.parse_qsl(query, keep_blank_values=True):
+        if name == "max_errors":
+            options["max_errors"] = _parse_number(name, value, int)
+            if options["max_errors"] < 1:
+                raise ValueError("max_errors must be at least 1")
+        elif name == "fail_fast":
+            if _parse_bool(name, value):
+                options["max_errors"] = 1
+        elif name == "structural_only":
+            options["structural_only"] = _parse_bool(name, value)
+        elif name == "time_budget":
+            options["time_budget"] = _parse_number(name, value, float)
+            if not options["time_budget"] > 0:
+                raise ValueError("time_budget must be greater than 0")
+        else:
+            raise ValueError(f"Unknown option: {name}")
+    return options
+
+
+def _parse_number(name, value, type_):
+    try:
+        return type_(value)
+    except ValueError:
+        raise ValueError(f"Invalid value for {name}: {value}") from None
+
+
+def _parse_bool(name, value):
+    if value.lower() in ("", "1", "true", "yes"):
+        return True
+    elif value.lower() in ("0", "false", "no"):
+        return False
+    raise ValueError(f"Invalid value for {name}: {value}")
@@ -0,0 +1,320 @@
+"""
+Find the flows in a corpus that are most similar to a flow.
+
+The similarity of two flows is the Jaccard similarity of their features: the
+techniques of their actions, and the technique bigrams, which are the pairs of
+techniques joined by an edge in the flow's action graph (see
+:func:`attack_flow.graph.get_technique_counts`).
+
+Comparing a flow with every flow in a large corpus is slow, so the index keeps a
+MinHash signature of each flow's features, and splits the signatures into bands for
+locality-sensitive hashing (LSH). Flows that share a band are candidates, and only the
+candidates are compared with the exact Jaccard similarity. Flows that are very similar
+are almost certain to share a band, while flows that are not similar rarely do, so the
+results are approximate: a flow that is less similar than about
+:attr:`SimilarityIndex.threshold` is likely to be missed. Use more bands with fewer
+rows each to lower the threshold, at the cost of more candidates.
+
+The signatures use one permutation hashing: each feature is hashed once, into one of
+``num_perm`` bins, and each bin keeps its smallest hash. Empty bins take the hash of
+the next bin that is not empty ("densification by rotation"), which keeps the chance of
+two flows having the same value in a bin equal to their Jaccard similarity. This needs
+one hash per feature, instead of ``num_perm`` hashes per feature for classic MinHash.
+
+The index can be saved to a JSON file and loaded again, and flows can be added to it
+at any time.
+"""
+
+from hashlib import blake2b
+import heapq
+import json
+
+from .graph import get_technique_counts
+from .model import FlowIndex
+
+FORMAT_VERSION = 1
+NUM_PERM = 120
+NUM_BANDS = 40
+
+# Added to the hash of an empty bin for each bin between it and the bin that it takes
+# its hash from, so that it does not collide with the hash of that bin. It is larger
+# than any hash.
+_ROTATION_OFFSET = 1 << 64
+
+
+def get_flow_features(flow_bundle, index=None):
+    """
+    Return the techniques and technique bigrams of a flow. A bigram is written as its
+    two technique IDs joined by ``>``, e.g. ``T1566>T1204``.
+
+    :param stix2.Bundle flow_bundle:
+    :param FlowIndex index: an index of ``flow_bundle``, if the caller already has one
+    :rtype: frozenset[str]
+    """
+    technique_counts, edge_counts = get_technique_counts(flow_bundle, index)
+    return frozenset(technique_counts).union(
+        f"{source}>{target}" for source, target in edge_counts
+    )
+
+
+def jaccard(features1, features2):
+    """
+    Return the Jaccard similarity of two sets: the size of their intersection divided
+    by the size of their union, or 0 if both are empty.
+
+    :param frozenset features1:
+    :param frozenset features2:
+    :rtype: float
+    """
+    intersection = len(features1 & features2)
+    if intersection == 0:
+        return 0.0
+    return intersection / (len(features1) + len(features2) - intersection)
+
+
+class SimilarityIndex:
+    """
+    A MinHash/LSH index of the features of many flows.
+
+    :ivar int num_perm: the number of bins, which is the length of each signature
+    :ivar int num_bands: the number of bands that each signature is split into
+    :ivar dict features: flow ID -> the flow's features
+    """
+
+    def __init__(self, num_perm=NUM_PERM, num_bands=NUM_BANDS, seed=0):
+        """
+        Constructor.
+
+        :param int num_perm: the number of bins in each signature
+        :param int num_bands: must divide ``num_perm``
+        :param int seed: the seed for the hash function
+        :raises ValueError: if ``num_bands`` does not divide ``num_perm``
+        """
+        if num_bands < 1 or num_perm % num_bands != 0:
+            raise ValueError(
+                f"The number of bands ({num_bands}) must divide the number of bins "
+                f"({num_perm})."
+            )
+        self.num_perm = num_perm
+        self.num_bands = num_bands
+        self.seed = seed
+        self.features = dict()
+        self._rows = num_perm // num_bands
+        self._key = str(seed).encode("utf8")
+        self._rotation_offsets = [
+            distance * _ROTATION_OFFSET for distance in range(num_perm)
+        ]
+        # Band number -> hash of the band's part of a signature -> list of flow IDs
+        self._buckets = [dict() for _ in range(num_bands)]
+        # Feature -> the feature's hash. Flows share most of their features, so this
+        # stays small while saving most of the hashing.
+        self._feature_hashes = dict()
+
+    @property
+    def threshold(self):
+        """
+        The similarity at which two flows have an even chance of sharing a band.
+
+        :rtype: float
+        """
+        return (1 / self.num_bands) ** (1 / self._rows)
+
+    def __len__(self):
+        return len(self.features)
+
+    def __contains__(self, flow_id):
+        return flow_id in self.features
+
+    def get_signature(self, features):
+        """
+        Return the MinHash signature of a set of features.
+
+        :param frozenset[str] features:
+        :returns: the smallest hash in each bin, after filling the empty bins, or
+            ``None`` if there are no features
+        :rtype: tuple[int]
+        """
+        if not features:
+            return None
+        num_perm = self.num_perm
+        bins = [None] * num_perm
+        for feature in features:
+            value, bin_number = divmod(self._hash_feature(feature), num_perm)
+            current = bins[bin_number]
+            if current is None or value < current:
+                bins[bin_number] = value
+        if None not in bins:
+            return tuple(bins)
+
+        # Fill each empty bin from the next bin that is not empty, wrapping around.
+        signature = list(bins)
+        offsets = self._rotation_offsets
+        filled = [position for position, value in enumerate(bins) if value is not None]
+        ends = filled[1:] + [filled[0] + num_perm]
+        for start, end in zip(filled, ends):
+            value = bins[end % num_perm]
+            for position in range(start + 1, end):
+                signature[position % num_perm] = value + offsets[end - position]
+        return tuple(signature)
+
+    def _hash_feature(self, feature):
+        hashed = self._feature_hashes.get(feature)
+        if hashed is None:
+            # The built-in ``hash()`` of a string changes from one run to the next, so
+            # it cannot be used in an index that is saved.
+            digest = blake2b(
+                feature.encode("utf8"), digest_size=8, key=self._key
+            ).digest()
+            hashed = int.from_bytes(digest, "little")
+            self._feature_hashes[feature] = hashed
+        return hashed
+
+    def _get_band_keys(self, signature):
+        # Band ``i`` is every ``num_bands``-th bin, starting at bin ``i``. An empty bin
+        # has the same hash as the bins after it, so a band of neighboring bins would
+        # often be one hash repeated, and flows would share it far more often than
+        # their similarity says.
+        num_bands = self.num_bands
+        return [hash(signature[start::num_bands]) for start in range(num_bands)]
+
+    def add(self, flow_id, features):
+        """
+        Add a flow's features.
+
+        :param str flow_id:
+        :param frozenset[str] features:
+        :raises ValueError: if a flow with the same ID was already added
+        """
+        if flow_id in self.features:
+            raise ValueError(f"The flow {flow_id} was already added.")
+        features = frozenset(features)
+        self.features[flow_id] = features
+        signature = self.get_signature(features)
+        if signature is None:
+            return
+        for buckets, key in zip(self._buckets, self._get_band_keys(signature)):
+            bucket = buckets.get(key)
+            if bucket is None:
+                buckets[key] = [flow_id]
+            else:
+                bucket.append(flow_id)
+
+    def add_flow(self, flow_bundle, flow_id=None, index=None):
+        """
+        Add a flow.
+
+        :param stix2.Bundle flow_bundle:
+        :param str flow_id: a unique name for the flow, by default the ID of its
+            ``attack-flow`` object, or the bundle's ID if it does not have one
+        :param FlowIndex index: an index of ``flow_bundle``, if the caller already has
+            one
+        :returns: the flow ID
+        :rtype: str
+        :raises ValueError: if a flow with the same ID was already added
+        """
+        if index is None:
+            index = FlowIndex(flow_bundle)
+        if flow_id is None:
+            flow_id = (index.flow or flow_bundle)["id"]
+        self.add(flow_id, get_flow_features(flow_bundle, index))
+        return flow_id
+
+    def query(self, features, k=5, exclude=()):
+        """
+        Return the flows that are most similar to a set of features, using LSH to find
+        the candidates.
+
+        :param frozenset[str] features:
+        :param int k: the maximum number of flows to return
+        :param exclude: flow IDs to leave out of the results, e.g. the query's own ID
+        :returns: ``(flow ID, similarity)`` for each flow, most similar first, with ties
+            in order of flow ID, leaving out flows that have nothing in common with the
+            query
+        :rtype: list[tuple[str, float]]
+        """
+        features = frozenset(features)
+        signature = self.get_signature(features)
+        if signature is None:
+            return []
+        candidates = set()
+        for buckets, key in zip(self._buckets, self._get_band_keys(signature)):
+            candidates.update(buckets.get(key, ()))
+        return self._rank(features, candidates.difference(exclude), k)
+
+    def query_exact(self, features, k=5, exclude=()):
+        """
+        Return the flows that are most similar to a set of features, by comparing them
+        with every flow. This is slower than :meth:`query`, but does not miss any
+        flows.
+
+        :param frozenset[str] features:
+        :param int k: the maximum number of flows to return
+        :param exclude: flow IDs to leave out of the results
+        :returns: the same as :meth:`query`
+        :rtype: list[tuple[str, float]]
+        """
+        exclude = set(exclude)
+        candidates = [flow_id for flow_id in self.features if flow_id not in exclude]
+        return self._rank(frozenset(features), candidates, k)
+
+    def query_flow(self, flow_bundle, k=5, exclude=(), index=None):
+        """
+        Return the flows that are most similar to a flow. See :meth:`query`.
+
+        :param stix2.Bundle flow_bundle:
+        :param int k: the maximum number of flows to return
+        :param exclude: flow IDs to leave out of the results
+        :param FlowIndex index: an index of ``flow_bundle``, if the caller already has
+            one
+        :rtype: list[tuple[str, float]]
+        """
+        return self.query(get_flow_features(flow_bundle, index), k, exclude)
+
+    def _rank(self, features, candidates, k):
+        scored = list()
+        for flow_id in candidates:
+            similarity = jaccard(features, self.features[flow_id])
+            if similarity > 0:
+                scored.append((-similarity, flow_id))
+        return [
+            (flow_id, -similarity) for similarity, flow_id in heapq.nsmallest(k, scored)
+        ]
+
+    def save(self, path):
+        """
+        Save the index to a JSON file.
+
+        The signatures are not saved, because they are quick to compute from the
+        features, and would make the file several times larger.
+
+        :param pathlib.Path path:
+        """
+        data = {
+            "format_version": FORMAT_VERSION,
+            "num_perm": self.num_perm,
+            "num_bands": self.num_bands,
+            "seed": self.seed,
+            "flows": {
+                flow_id: sorted(features) for flow_id, features in self.features.items()
+            },
+        }
+        with path.open("w") as f:
+            json.dump(data, f, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load an index that was saved with :meth:`save`.
+
+        :param pathlib.Path path:
+        :rtype: SimilarityIndex
+        :raises ValueError: if the file is not a saved index
+        """
+        with path.open("rb") as f:
+            data = json.load(f)
+        if not isinstance(data, dict) or data.get("format_version") != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a saved similarity index.")
+        index = cls(data["num_perm"], data["num_bands"], data["seed"])
+        for flow_id, features in data["flows"].items():
+            index.add(flow_id, features)
+        return index
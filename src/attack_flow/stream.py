@@ -0,0 +1,160 @@
+"""
+Incremental reader for very large STIX bundles.
+
+The standard library ``json`` module (and the STIX library, which uses it) must read an
+entire document into memory before returning anything. This module scans a bundle in
+fixed-size chunks and yields the members of ``bundle.objects`` one at a time, so that
+memory use is bounded by the size of the largest object rather than the whole document.
+"""
+
+import json
+import re
+
+CHUNK_SIZE = 64 * 1024
+WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+DECODER = json.JSONDecoder()
+# A literal that is cut off at the end of the buffer is reported at its start, so a
+# decoding error this close to the end might just be a truncated value. The longest
+# literal is ``-Infinity``.
+MAX_LITERAL_LENGTH = len("-Infinity")
+
+
+def iter_bundle_objects(flow_file, types=None, chunk_size=CHUNK_SIZE, properties=None):
+    """
+    Yield each object in a STIX bundle's ``objects`` array without loading the whole
+    bundle into memory.
+
+    Other top-level properties of the bundle are skipped, unless ``properties`` is
+    given. Objects are parsed with the standard library ``json`` module, so each one is
+    a plain ``dict``.
+
+    :param flow_file: a file-like object opened in text mode
+    :param types: if given, only yield objects whose ``type`` is in this collection
+    :param int chunk_size: the number of characters to read at a time
+    :param dict properties: if given, the bundle's other top-level properties are
+        stored in this dict as they are read, and an ``objects`` array is stored as an
+        empty list (since its members are yielded instead)
+    :rtype: Iterator[dict]
+    """
+    if types is not None:
+        types = frozenset(types)
+    reader = _BundleReader(flow_file, chunk_size, properties)
+    for obj in reader.iter_objects():
+        if types is None or obj.get("type") in types:
+            yield obj
+
+
+class _BundleReader:
+    """
+    Helper class that reads the top level of a JSON document in chunks.
+
+    The consumed part of the buffer is discarded whenever more of the file is read, so
+    the buffer only holds the value currently being read plus some lookahead.
+    """
+
+    def __init__(self, flow_file, chunk_size, properties=None):
+        self.file = flow_file
+        self.chunk_size = chunk_size
+        self.properties = properties
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def iter_objects(self):
+        self._expect("{")
+        if self._peek() == "}":
+            return
+        while True:
+            key = self._decode_value()
+            if not isinstance(key, str):
+                raise ValueError("Expected a property name in JSON document.")
+            self._expect(":")
+            if key == "objects" and self._peek() == "[":
+                if self.properties is not None:
+                    self.properties[key] = []
+                yield from self._iter_array()
+            else:
+                value = self._decode_value()
+                if self.properties is not None:
+                    self.properties[key] = value
+            if self._expect(",}") == "}":
+                return
+
+    def _iter_array(self):
+        self._expect("[")
+        if self._peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self._decode_value()
+            if self._expect(",]") == "]":
+                return
+
+    def _fill(self):
+        """
+        Read more of the file into the buffer. Returns False at end of file.
+
+        The read size grows with the buffer so that a value much larger than one chunk
+        is decoded a logarithmic number of times rather than once per chunk.
+        """
+        if self.eof:
+            return False
+        self._compact()
+        chunk = self.file.read(max(self.chunk_size, len(self.buf) - self.pos))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf += chunk
+        return True
+
+    def _compact(self):
+        """Discard the consumed part of the buffer."""
+        if self.pos:
+            self.buf = self.buf[self.pos :]
+            self.pos = 0
+
+    def _peek(self):
+        """Skip whitespace and return the next character without consuming it."""
+        while True:
+            self.pos = WHITESPACE_RE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON document.")
+
+    def _expect(self, chars):
+        """Consume the next character, which must be one of ``chars``."""
+        char = self._peek()
+        if char not in chars:
+            raise ValueError(f"Expected one of {chars!r} but found {char!r}.")
+        self.pos += 1
+        return char
+
+    def _decode_value(self):
+        """
+        Decode and consume the next JSON value.
+
+        If the value is cut off at the end of the buffer, more of the file is read and
+        decoding is retried. A value that is followed by the end of the buffer might
+        also be a truncated number, so that case is retried too. Any other error is
+        raised right away, without reading the rest of the file.
+        """
+        self._peek()
+        while True:
+            try:
+                value, end = DECODER.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as e:
+                if not self._is_truncated(e) or not self._fill():
+                    raise
+                continue
+            if end == len(self.buf) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def _is_truncated(self, error):
+        """Return True if a decoding error might be caused by the end of the buffer."""
+        # An unterminated string runs to the end of the buffer.
+        return error.msg.startswith("Unterminated string") or (
+            error.pos > len(self.buf) - MAX_LITERAL_LENGTH
+        )
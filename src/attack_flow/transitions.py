@@ -0,0 +1,195 @@
+"""
+Count how often one technique leads to another across a corpus of flows, and predict
+the techniques that are likely to come next.
+
+The counts are a sparse matrix in compressed sparse row (CSR) format, built from the
+edges of each flow's action graph (see :class:`attack_flow.graph.CorpusGraph`). Each
+row is sorted by count, so that the most likely next techniques are the first items in
+the row. The matrix can be saved to a JSON file, so that it can be loaded without
+reading the corpus again.
+"""
+
+from array import array
+import json
+
+FORMAT_VERSION = 1
+
+
+class TransitionMatrix:
+    """
+    Technique-to-technique transition counts.
+
+    Row and column ``i`` are the technique ``technique_ids[i]``, and the technique IDs
+    are sorted so that the numbers do not depend on the order the flows were added in.
+    Row ``i`` has the columns ``columns[offsets[i]:offsets[i + 1]]``, in descending
+    order of count, with ties in column order.
+
+    :ivar list technique_ids: technique number -> technique ID
+    :ivar dict index: technique ID -> technique number
+    :ivar array.array offsets: row number -> position of the row's first item in
+        ``columns``, with one more item for the end of the last row
+    :ivar array.array columns: the column number of each item
+    :ivar array.array counts: the count of each item
+    :ivar array.array probabilities: the count of each item divided by the total count
+        of its row
+    """
+
+    def __init__(self, technique_ids, offsets, columns, counts):
+        """
+        Constructor.
+
+        Use :meth:`from_counts`, :meth:`from_corpus`, or :meth:`load` to make a
+        matrix.
+
+        :param list[str] technique_ids:
+        :param array.array offsets:
+        :param array.array columns:
+        :param array.array counts:
+        """
+        self.technique_ids = technique_ids
+        self.index = {technique_id: i for i, technique_id in enumerate(technique_ids)}
+        self.offsets = offsets
+        self.columns = columns
+        self.counts = counts
+        self.probabilities = array("d", bytes(array("d").itemsize * len(counts)))
+        for row in range(len(technique_ids)):
+            start, end = offsets[row], offsets[row + 1]
+            total = sum(counts[start:end])
+            for item in range(start, end):
+                self.probabilities[item] = counts[item] / total
+
+    @classmethod
+    def from_counts(cls, counts, technique_ids=()):
+        """
+        Make a matrix from a table of counts.
+
+        :param dict counts: ``(source technique ID, target technique ID)`` -> count
+        :param technique_ids: more technique IDs to include, which do not have counts
+        :rtype: TransitionMatrix
+        """
+        technique_ids = sorted(
+            {t for edge in counts for t in edge}.union(technique_ids)
+        )
+        index = {technique_id: i for i, technique_id in enumerate(technique_ids)}
+        rows = [list() for _ in technique_ids]
+        for (source, target), count in counts.items():
+            if count > 0:
+                rows[index[source]].append((-count, index[target]))
+
+        offsets = array("l", [0])
+        columns = array("l")
+        row_counts = array("q")
+        for row in rows:
+            row.sort()
+            columns.extend(column for _, column in row)
+            row_counts.extend(-count for count, _ in row)
+            offsets.append(len(columns))
+        return cls(technique_ids, offsets, columns, row_counts)
+
+    @classmethod
+    def from_corpus(cls, corpus):
+        """
+        Make a matrix from the action graph edges of every flow in a corpus.
+
+        Each count is the number of action graph edges between the two techniques, in
+        all of the flows. Techniques that are never followed by another one have empty
+        rows.
+
+        :param attack_flow.graph.CorpusGraph corpus:
+        :rtype: TransitionMatrix
+        """
+        return cls.from_counts(
+            {edge: sum(flows.values()) for edge, flows in corpus.edges.items()},
+            corpus.nodes,
+        )
+
+    def __len__(self):
+        return len(self.technique_ids)
+
+    def get_count(self, source, target):
+        """
+        Return how many times one technique leads to another.
+
+        :param str source: a technique ID
+        :param str target: a technique ID
+        :rtype: int
+        """
+        row = self.index.get(source)
+        column = self.index.get(target)
+        if row is None or column is None:
+            return 0
+        for item in range(self.offsets[row], self.offsets[row + 1]):
+            if self.columns[item] == column:
+                return self.counts[item]
+        return 0
+
+    def get_probabilities(self, technique_id):
+        """
+        Return the probability of each technique coming next.
+
+        :param str technique_id:
+        :returns: technique ID -> probability, with the most likely first, or an empty
+            dict if the technique is not in the matrix or is never followed by another
+        :rtype: dict
+        """
+        return dict(self.predict_next(technique_id, k=None))
+
+    def predict_next(self, technique_id, k=5):
+        """
+        Return the techniques that most often come after a technique.
+
+        :param str technique_id:
+        :param int k: the maximum number of techniques to return, or ``None`` for all
+        :returns: ``(technique ID, probability)`` for each technique, with the most
+            likely first, or an empty list if the technique is not in the matrix
+        :rtype: list[tuple[str, float]]
+        """
+        row = self.index.get(technique_id)
+        if row is None:
+            return []
+        start, end = self.offsets[row], self.offsets[row + 1]
+        if k is not None:
+            end = min(end, start + k)
+        technique_ids = self.technique_ids
+        return [
+            (technique_ids[column], probability)
+            for column, probability in zip(
+                self.columns[start:end], self.probabilities[start:end]
+            )
+        ]
+
+    def save(self, path):
+        """
+        Save the matrix to a JSON file.
+
+        :param pathlib.Path path:
+        """
+        data = {
+            "format_version": FORMAT_VERSION,
+            "technique_ids": self.technique_ids,
+            "offsets": self.offsets.tolist(),
+            "columns": self.columns.tolist(),
+            "counts": self.counts.tolist(),
+        }
+        with path.open("w") as f:
+            json.dump(data, f, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a matrix that was saved with :meth:`save`.
+
+        :param pathlib.Path path:
+        :rtype: TransitionMatrix
+        :raises ValueError: if the file is not a saved matrix
+        """
+        with path.open("rb") as f:
+            data = json.load(f)
+        if not isinstance(data, dict) or data.get("format_version") != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a saved transition matrix.")
+        return cls(
+            data["technique_ids"],
+            array("l", data["offsets"]),
+            array("l", data["columns"]),
+            array("q", data["counts"]),
+        )
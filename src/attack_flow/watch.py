@@ -0,0 +1,146 @@
+"""
+Watch a directory of Attack Flow JSON files and validate them again when they change.
+
+Changes are found by polling the files' modification times, so this works the same way
+on every platform. Only the files that changed are validated again. Within a changed
+file, only the objects whose contents changed are checked against the JSON schema and
+parsed with the STIX library again. The checks that span the whole document (references
+and the graph checks) still run on every changed file.
+"""
+
+from collections import namedtuple
+import hashlib
+from pathlib import Path
+
+from .model import parse_attack_flow_bundle
+from .results import ValidationResult
+from .schema import get_object_key, get_object_memo, validate_doc
+
+FlowChange = namedtuple("FlowChange", ["path", "result", "previous"])
+
+
+class FlowWatcher:
+    """
+    Validate the JSON files in a directory, and validate them again after they change.
+
+    The validators are loaded once and reused by every poll.
+
+    :ivar int objects_checked: the number of objects that were new or changed since the
+        previous version of their file
+    :ivar int objects_reused: the number of unchanged objects whose earlier results
+        were reused
+    """
+
+    def __init__(self, flow_dir, cache=None, **options):
+        """
+        Constructor.
+
+        :param pathlib.Path flow_dir: the directory containing ``.json`` files
+        :param attack_flow.cache.BundleCache cache: passed to ``validate_doc()``
+        :param options: keyword arguments for ``validate_doc()``, such as
+            ``max_errors``
+        """
+        self.flow_dir = Path(flow_dir)
+        self.cache = cache
+        self.options = options
+        self.objects_checked = 0
+        self.objects_reused = 0
+        self._files = dict()
+
+    def poll(self):
+        """
+        Validate each file that was added or changed since the last poll.
+
+        The first poll validates every file. A file whose modification time changed
+        but whose contents did not is not validated again.
+
+        :returns: a list of ``FlowChange(path, result, previous)`` sorted by path, where
+            ``result`` is ``None`` if the file was deleted and ``previous`` is ``None``
+            if the file is new
+        """
+        changes = list()
+        paths = sorted(self.flow_dir.glob("*.json"))
+        for path in paths:
+            try:
+                stat = path.stat()
+                signature = (stat.st_mtime_ns, stat.st_size)
+                watched = self._files.get(path)
+                if watched and watched.signature == signature:
+                    continue
+                digest = hashlib.sha256(path.read_bytes()).digest()
+            except FileNotFoundError:
+                continue
+            if watched and watched.digest == digest:
+                watched.signature = signature
+                continue
+
+            memo = _ObjectMemo(self, watched.memo if watched else None)
+            try:
+                result = validate_doc(
+                    path,
+                    self.cache,
+                    memo.check_object,
+                    memo.parse_bundle,
+                    **self.options,
+                )
+            except (OSError, ValueError) as e:
+                # E.g. a file that an editor has not finished writing.
+                result = ValidationResult()
+                result.add_exc(f"Unable to read this file: {e}", e)
+            self._files[path] = _WatchedFile(signature, digest, result, memo)
+            changes.append(FlowChange(path, result, watched and watched.result))
+
+        for path in self._files.keys() - set(paths):
+            changes.append(FlowChange(path, None, self._files.pop(path).result))
+        changes.sort(key=lambda change: change.path)
+        return changes
+
+
+class _WatchedFile:
+    def __init__(self, signature, digest, result, memo):
+        self.signature = signature
+        self.digest = digest
+        self.result = result
+        self.memo = memo
+
+
+class _ObjectMemo:
+    """
+    The schema messages and parsed STIX objects for one version of a file, keyed on
+    each object's contents. Results are reused from the previous version of the file.
+    """
+
+    def __init__(self, watcher, previous):
+        self._watcher = watcher
+        self._previous = previous
+        # Each object is hashed once, when it is checked against the schema.
+        self._keys = dict()
+        self.messages = dict()
+        self.stix_objects = dict()
+
+    def check_object(self, item, result):
+        """Like ``check_object_schema()``, but reuse the result for an unchanged object."""
+        key = self._keys[id(item)] = get_object_key(item)
+        previous = self._previous.messages if self._previous else dict()
+        if (messages := previous.get(key)) is not None:
+            self._watcher.objects_reused += 1
+        else:
+            # The object may still be in another file that was already checked.
+            messages = get_object_memo().get_messages(item, key)
+            self._watcher.objects_checked += 1
+        self.messages[key] = messages
+        result.messages.extend(messages)
+
+    def parse_bundle(self, flow_json):
+        """Like ``parse_attack_flow_bundle()``, but reuse unchanged parsed objects."""
+        items = flow_json.get("objects")
+        if not isinstance(items, list):
+            return parse_attack_flow_bundle(flow_json)
+
+        previous = self._previous.stix_objects if self._previous else dict()
+        keys = [self._keys.get(id(item)) or get_object_key(item) for item in items]
+        # The STIX library does not validate objects that it has already parsed.
+        objects = [previous.get(key, item) for key, item in zip(keys, items)]
+        bundle = parse_attack_flow_bundle({**flow_json, "objects": objects})
+        self.stix_objects = dict(zip(keys, bundle.objects))
+        return bundle
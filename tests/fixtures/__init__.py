@@ -1,7 +1,11 @@
+import copy
 from datetime import datetime
+import functools
+from pathlib import Path
 
 import stix2
 
+from attack_flow.afb import convert_afb_to_stix, dumps_stix, load_afb
 from attack_flow.model import (
     AttackAction,
     AttackAsset,
@@ -10,6 +14,42 @@ from attack_flow.model import (
     AttackOperator,
 )
 
+# The corpus is checked in as Attack Flow Builder files. Tests that need STIX bundles
+# export them with ``attack_flow.afb`` instead of relying on an exported corpus.
+CORPUS_DIR = Path(__file__).resolve().parents[2] / "corpus"
+CORPUS_AFB_PATHS = sorted(CORPUS_DIR.glob("*.afb"))
+
+
+def get_corpus_bundle(afb_path):
+    """
+    Export a corpus file to a STIX bundle.
+
+    :param Path afb_path: one of ``CORPUS_AFB_PATHS``
+    :rtype: dict
+    """
+    return copy.deepcopy(_export_corpus_bundle(afb_path))
+
+
+def write_corpus(directory):
+    """
+    Export every corpus file to a STIX bundle in ``directory``.
+
+    :param Path directory:
+    :returns: the paths of the bundles, in the same order as ``CORPUS_AFB_PATHS``
+    :rtype: list[Path]
+    """
+    paths = list()
+    for afb_path in CORPUS_AFB_PATHS:
+        path = directory / f"{afb_path.stem}.json"
+        path.write_text(dumps_stix(_export_corpus_bundle(afb_path)), encoding="utf8")
+        paths.append(path)
+    return paths
+
+
+@functools.cache
+def _export_corpus_bundle(afb_path):
+    return convert_afb_to_stix(load_afb(afb_path))
+
 
 def get_flow_bundle():
     asset_obj = stix2.Infrastructure(
@@ -0,0 +1,286 @@
+import json
+
+import pytest
+
+from attack_flow.afb import (
+    BuilderEnums,
+    convert_afb_to_stix,
+    CURRENT_TIME,
+    export_stix,
+    load_afb,
+    load_builder_enums,
+    load_builder_templates,
+    TEMPLATE_TYPES,
+)
+from attack_flow.schema import check_schema, ValidationResult
+
+from .fixtures import CORPUS_AFB_PATHS
+
+ENUMS = BuilderEnums(
+    stix_ids={
+        "TA0002": "x-mitre-tactic--4ca45d45-df4d-4613-8980-bac22d278fa5",
+        "T1059": "attack-pattern--7385dfaf-6886-4229-9ecd-6fd678040830",
+    },
+    technique_tactics={"T1059": {"TA0002"}, "T1078": {"TA0001", "TA0003"}},
+)
+
+
+class Diagram:
+    """Helper for building .afb documents in tests."""
+
+    def __init__(self, **properties):
+        self.canvas = {
+            "id": "flow",
+            "instance": "9f9e6d3b-0c1d-4c1b-8f38-5c4d1f8b0000",
+            "properties": list(properties.items()),
+            "objects": [],
+        }
+        self.objects = [self.canvas]
+        self.count = 0
+
+    def _instance(self):
+        self.count += 1
+        return f"00000000-0000-4000-8000-{self.count:012d}"
+
+    def block(self, template, positions=("0", "180"), **properties):
+        instance = self._instance()
+        block = {
+            "id": template,
+            "instance": instance,
+            "properties": list(properties.items()),
+            "anchors": {},
+        }
+        self.canvas["objects"].append(instance)
+        self.objects.append(block)
+        for position in positions:
+            anchor = {"id": "vertical_anchor", "instance": self._instance()}
+            anchor["latches"] = []
+            block["anchors"][position] = anchor["instance"]
+            self.objects.append(anchor)
+        return block
+
+    def line(self, source, target, source_position="0", target_position="180"):
+        line = {"id": "dynamic_line", "instance": self._instance(), "handles": []}
+        for end, block, position in (
+            ("source", source, source_position),
+            ("target", target, target_position),
+        ):
+            latch = {"id": "generic_latch", "instance": self._instance()}
+            line[end] = latch["instance"]
+            anchor_instance = block["anchors"][position]
+            anchor = next(o for o in self.objects if o["instance"] == anchor_instance)
+            anchor["latches"].append(latch["instance"])
+            self.objects.append(latch)
+        self.canvas["objects"].append(line["instance"])
+        self.objects.append(line)
+        return line
+
+    def to_json(self):
+        return {
+            "schema": "attack_flow_v2",
+            "theme": "dark_theme",
+            "objects": self.objects,
+            "layout": {},
+            "camera": {"x": 0, "y": 0, "k": 1},
+        }
+
+
+def get_objects_by_type(bundle, stix_type):
+    return [o for o in bundle["objects"] if o["type"] == stix_type]
+
+
+def test_convert_afb_to_stix():
+    diagram = Diagram(
+        name="Test Flow",
+        description="A flow for testing.",
+        author=[["name", " Jane Doe "], ["identity_class", "individual"]],
+        scope="campaign",
+        external_references=[
+            ["a1", [["source_name", "Example"], ["url", "https://example.com"]]]
+        ],
+        created={"time": "2023-09-06T09:15:34.481-04:00", "zone": "America/New_York"},
+    )
+    action1 = diagram.block(
+        "action",
+        name=" Run Script ",
+        tactic_id="TA9999",
+        ttp=[["tactic", None], ["technique", "T1059"]],
+        confidence="very-probable",
+        execution_start="2024-01-04T10:00:00.000Z",
+    )
+    asset = diagram.block("asset", name="Server")
+    operator = diagram.block("OR_operator", operator="OR")
+    action2 = diagram.block("action", name="Log In", ttp=[["technique", "T1078"]])
+    diagram.line(action1, asset)
+    diagram.line(action1, operator)
+    diagram.line(operator, action2)
+
+    bundle = convert_afb_to_stix(diagram.to_json(), ENUMS)
+
+    extension, creator, flow, author = bundle["objects"][:4]
+    assert extension["id"] == (
+        "extension-definition--fb9c968a-745b-4ade-9b25-c324172197f4"
+    )
+    assert creator["id"] == "identity--fb9c968a-745b-4ade-9b25-c324172197f4"
+    assert flow["id"] == "attack-flow--9f9e6d3b-0c1d-4c1b-8f38-5c4d1f8b0000"
+    assert flow["name"] == "Test Flow"
+    assert flow["scope"] == "campaign"
+    assert flow["created"] == "2023-09-06T13:15:34.481Z"
+    assert flow["external_references"] == [
+        {"source_name": "Example", "url": "https://example.com"}
+    ]
+    assert flow["created_by_ref"] == author["id"]
+    assert flow["start_refs"] == [f"attack-action--{action1['instance']}"]
+    assert author["name"] == "Jane Doe"
+    assert author["identity_class"] == "individual"
+
+    actions = get_objects_by_type(bundle, "attack-action")
+    assert actions[0] == {
+        "type": "attack-action",
+        "id": f"attack-action--{action1['instance']}",
+        "spec_version": "2.1",
+        "created": actions[0]["created"],
+        "modified": actions[0]["modified"],
+        "extensions": {
+            "extension-definition--fb9c968a-745b-4ade-9b25-c324172197f4": {
+                "extension_type": "new-sdo"
+            }
+        },
+        "name": "Run Script",
+        "tactic_id": "TA0002",
+        "tactic_ref": "x-mitre-tactic--4ca45d45-df4d-4613-8980-bac22d278fa5",
+        "technique_id": "T1059",
+        "technique_ref": "attack-pattern--7385dfaf-6886-4229-9ecd-6fd678040830",
+        "confidence": 90,
+        "execution_start": "2024-01-04T10:00:00.000Z",
+        "asset_refs": [f"attack-asset--{asset['instance']}"],
+        "effect_refs": [f"attack-operator--{operator['instance']}"],
+    }
+    assert actions[1]["technique_id"] == "T1078"
+    assert "tactic_id" not in actions[1]
+    (operator_sdo,) = get_objects_by_type(bundle, "attack-operator")
+    assert operator_sdo["operator"] == "OR"
+    assert operator_sdo["effect_refs"] == [f"attack-action--{action2['instance']}"]
+    assert get_objects_by_type(bundle, "relationship") == []
+
+
+def test_convert_observables():
+    diagram = Diagram(name="Observables")
+    action = diagram.block("action", name="Drop Malware")
+    malware = diagram.block(
+        "malware",
+        name="Evil",
+        malware_types=[["a", " remote-access-trojan "], ["b", None]],
+        is_family="false",
+        aliases=[],
+    )
+    ip = diagram.block("ipv4_addr", value="10.0.0.1")
+    traffic = diagram.block("network_traffic", dst_port="99999", is_active="maybe")
+    process = diagram.block("process", command_line="cmd.exe")
+    file = diagram.block(
+        "file",
+        name="evil.exe",
+        hashes=[["h1", [["hash_type", "md5"], ["hash_value", "abcd"]]]],
+        mime_type="application/x-dosexec",
+    )
+    diagram.line(action, malware)
+    diagram.line(action, process)
+    diagram.line(ip, traffic)
+    diagram.line(malware, file)
+
+    bundle = convert_afb_to_stix(diagram.to_json(), ENUMS)
+
+    (malware_sdo,) = get_objects_by_type(bundle, "malware")
+    assert malware_sdo["malware_types"] == ["remote-access-trojan"]
+    assert malware_sdo["is_family"] is False
+    assert "aliases" not in malware_sdo
+    (traffic_sdo,) = get_objects_by_type(bundle, "network-traffic")
+    assert traffic_sdo["dst_port"] == 65535
+    assert "is_active" not in traffic_sdo
+    (ip_sdo,) = get_objects_by_type(bundle, "ipv4-addr")
+    assert traffic_sdo["src_ref"] == ip_sdo["id"]
+    (action_sdo,) = get_objects_by_type(bundle, "attack-action")
+    assert action_sdo["command_ref"] == f"process--{process['instance']}"
+    (file_sdo,) = get_objects_by_type(bundle, "file")
+    assert file_sdo["hashes"] == {"md5": "abcd"}
+    # Like the builder, the file's properties after "hashes" are not exported.
+    assert "mime_type" not in file_sdo
+
+    relationships = get_objects_by_type(bundle, "relationship")
+    assert [(r["source_ref"], r["target_ref"]) for r in relationships] == [
+        (action_sdo["id"], malware_sdo["id"]),
+        (malware_sdo["id"], file_sdo["id"]),
+    ]
+
+
+def test_convert_cycle():
+    diagram = Diagram(name="Cycle")
+    action1 = diagram.block("action", name="One")
+    action2 = diagram.block("action", name="Two")
+    diagram.line(action1, action2)
+    diagram.line(action2, action1)
+    with pytest.raises(ValueError):
+        convert_afb_to_stix(diagram.to_json(), ENUMS)
+
+
+def test_convert_unknown_template():
+    diagram = Diagram(name="Unknown")
+    diagram.block("not_a_template")
+    with pytest.raises(ValueError):
+        convert_afb_to_stix(diagram.to_json(), ENUMS)
+
+
+def test_load_afb_v2(tmp_path):
+    afb_path = tmp_path / "old.afb"
+    afb_path.write_text(json.dumps({"version": "2.0.0", "objects": []}))
+    with pytest.raises(ValueError):
+        load_afb(afb_path)
+
+
+def test_load_builder_enums():
+    enums = load_builder_enums()
+    assert enums.stix_ids["T1059"].startswith("attack-pattern--")
+    assert enums.stix_ids["TA0002"].startswith("x-mitre-tactic--")
+    assert "TA0002" in enums.technique_tactics["T1059"]
+
+
+def test_load_builder_templates():
+    templates = load_builder_templates()
+    assert set(TEMPLATE_TYPES) <= set(templates)
+    flow = templates["flow"]
+    assert flow["name"] == {"type": "string", "default": "Untitled Document"}
+    assert flow["created"] == {"type": "date", "default": CURRENT_TIME}
+    assert flow["author"]["representative"] == "name"
+    assert flow["scope"]["default"] == "incident"
+    action = templates["action"]
+    assert action["ttp"]["combinations"] == "ttp"
+    assert action["confidence"]["options"]["probable"]["value"] == 70
+    # The boolean enum is spread into the property.
+    assert set(templates["malware"]["is_family"]["options"]) == {"true", "false"}
+    network_traffic = templates["network_traffic"]
+    assert network_traffic["dst_port"] == {"type": "int", "min": 0, "max": 65535}
+    registry_values = templates["windows_registry_key"]["values"]["form"]
+    assert registry_values["representative"] == "data"
+    assert "REG_QWORD" in registry_values["form"]["data_type"]["options"]
+
+
+def test_export_stix(tmp_path):
+    afb_path = tmp_path / "flow.afb"
+    diagram = Diagram(name="Export")
+    diagram.block("action", name="Only Action")
+    afb_path.write_text(json.dumps(diagram.to_json()))
+
+    stix_path = export_stix(afb_path, enums=ENUMS)
+
+    assert stix_path == tmp_path / "flow.json"
+    text = stix_path.read_text()
+    assert text.startswith('{\n  "type": "bundle",')
+    assert json.loads(text)["objects"][2]["name"] == "Export"
+
+
+@pytest.mark.parametrize("afb_path", CORPUS_AFB_PATHS[:5], ids=lambda p: p.stem)
+def test_export_corpus_matches_schema(afb_path):
+    bundle = convert_afb_to_stix(load_afb(afb_path))
+    result = ValidationResult()
+    check_schema(bundle, result)
+    assert result.success, [str(m) for m in result.messages]
@@ -0,0 +1,139 @@
+import json
+import os
+from pathlib import Path
+import shutil
+from unittest.mock import patch
+
+import pytest
+
+from attack_flow.cache import (
+    _get_result_version_tag,
+    BundleCache,
+    get_cache,
+    get_result_cache,
+    get_result_key,
+    ResultCache,
+)
+from attack_flow.graphviz import convert_attack_flow
+from attack_flow.model import load_attack_flow_bundle
+from attack_flow.schema import SCHEMA_DIR, validate_doc
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def test_load_from_cache(tmp_path):
+    cache = BundleCache(tmp_path / "cache")
+    path = FIXTURES_DIR / "flow1.json"
+    parsed = load_attack_flow_bundle(path, cache=cache)
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    cached = load_attack_flow_bundle(path, cache=cache)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cached is not parsed
+    assert cached == parsed
+    assert cached.serialize() == parsed.serialize()
+    assert type(cached.objects[3]) is type(parsed.objects[3])
+    assert cached.objects[3].created.precision == parsed.objects[3].created.precision
+    assert convert_attack_flow(cached) == convert_attack_flow(parsed)
+
+
+def test_cache_key_uses_contents(tmp_path):
+    cache = BundleCache(tmp_path / "cache")
+    path = tmp_path / "flow.json"
+    shutil.copy(FIXTURES_DIR / "flow1.json", path)
+    load_attack_flow_bundle(path, cache=cache)
+    # A copy at another path is a hit; changing the contents is a miss.
+    shutil.copy(path, tmp_path / "copy.json")
+    load_attack_flow_bundle(tmp_path / "copy.json", cache=cache)
+    path.write_text(path.read_text().replace("Test Flow 1", "Test Flow 2"))
+    flow_bundle = load_attack_flow_bundle(path, cache=cache)
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert flow_bundle.objects[3].name == "Test Flow 2"
+
+
+def test_cache_eviction(tmp_path):
+    cache = BundleCache(tmp_path / "cache")
+    path1 = FIXTURES_DIR / "flow1.json"
+    path2 = FIXTURES_DIR / "flow2.json"
+    load_attack_flow_bundle(path1, cache=cache)
+    load_attack_flow_bundle(path2, cache=cache)
+    entries = sorted(cache.cache_dir.iterdir())
+    for entry in entries:
+        os.utime(entry, (0, 0))
+
+    # Reading flow1 makes flow2 the least recently used entry.
+    load_attack_flow_bundle(path1, cache=cache)
+    cache.max_size = max(entry.stat().st_size for entry in entries)
+    cache.evict()
+    assert len(list(cache.cache_dir.iterdir())) == 1
+    load_attack_flow_bundle(path1, cache=cache)
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_corrupt_cache_entry(tmp_path):
+    cache = BundleCache(tmp_path / "cache")
+    path = FIXTURES_DIR / "flow1.json"
+    load_attack_flow_bundle(path, cache=cache)
+    (entry,) = cache.cache_dir.iterdir()
+    entry.write_bytes(b"not a pickle")
+    flow_bundle = load_attack_flow_bundle(path, cache=cache)
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert flow_bundle.objects[3].name == "Test Flow 1"
+
+
+def test_get_cache(tmp_path, monkeypatch):
+    monkeypatch.delenv("AF_CACHE_DIR", raising=False)
+    assert get_cache() is None
+    assert get_cache(str(tmp_path)).cache_dir == tmp_path
+    monkeypatch.setenv("AF_CACHE_DIR", str(tmp_path))
+    assert get_cache().cache_dir == tmp_path
+
+
+def test_result_cache(tmp_path):
+    cache = ResultCache(tmp_path / "cache")
+    path = tmp_path / "flow.json"
+    flow_json = json.loads((FIXTURES_DIR / "flow1.json").read_text())
+    flow_json["objects"][2]["name"] = 5
+    path.write_text(json.dumps(flow_json))
+    key = get_result_key(path.read_bytes())
+    assert cache.get(key) is None
+
+    result = validate_doc(path)
+    cache.put(key, result)
+    cached = cache.get(key)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cached.success is result.success is False
+    assert [str(m) for m in cached.messages] == [str(m) for m in result.messages]
+    assert [str(m.exc) for m in cached.messages] == [
+        str(m.exc) for m in result.messages
+    ]
+
+    (entry,) = cache.cache_dir.iterdir()
+    entry.write_text("not json")
+    assert cache.get(key) is None
+    assert not entry.exists()
+
+
+def test_result_key_uses_schemas(tmp_path):
+    key = get_result_key(b"{}")
+    assert get_result_key(b"[]") != key
+    assert get_result_key(b"{}", {}) == key
+    assert get_result_key(b"{}", {"max_errors": 1}) != key
+    shutil.copytree(SCHEMA_DIR, tmp_path / "stix")
+    schema_path = tmp_path / "stix" / "oasis-open" / "common" / "timestamp.json"
+    schema_path.write_text(schema_path.read_text().replace("timestamp", "time"))
+    _get_result_version_tag.cache_clear()
+    try:
+        with patch("attack_flow.cache.SCHEMA_DIR", tmp_path / "stix"):
+            assert get_result_key(b"{}") != key
+    finally:
+        _get_result_version_tag.cache_clear()
+
+
+def test_get_result_cache(tmp_path, monkeypatch):
+    monkeypatch.delenv("AF_CACHE_DIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    assert get_result_cache().cache_dir == tmp_path / "xdg" / "attack-flow" / "results"
+    assert get_result_cache(str(tmp_path)).cache_dir == tmp_path / "results"
+    monkeypatch.setenv("AF_CACHE_DIR", str(tmp_path))
+    assert get_result_cache().cache_dir == tmp_path / "results"
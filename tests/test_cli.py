@@ -4,13 +4,17 @@ Test entry points for command line tools.
 These tests are minimal: checking basic argument parsing and making sure that
 the entrypoints call into the appropriate places in the package.
 """
+import io
+import json
 import os
 from pathlib import Path
+import re
 import runpy
+import subprocess
 import sys
 from tempfile import NamedTemporaryFile, TemporaryDirectory
 from textwrap import dedent
-from unittest.mock import call, patch
+from unittest.mock import ANY, call, patch
 
 import pytest
 import stix2
@@ -19,6 +23,11 @@ import attack_flow.schema
 from attack_flow.model import AttackFlow
 from datetime import datetime
 
+# The time to import the CLI module, not counting interpreter startup. See
+# benchmarks/bench_import.py for the time spent in each subcommand.
+IMPORT_TIME_BUDGET_MS = 100
+HEAVY_MODULES = ("defusedxml", "graphviz", "jsonschema", "networkx", "stix2")
+
 
 @patch("sys.exit")
 @patch("attack_flow.schema.validate_doc")
@@ -26,13 +35,30 @@ def test_validate(validate_mock, exit_mock, capsys):
     validate_mock.return_value = attack_flow.schema.ValidationResult()
     sys.argv = ["af", "validate", "doc.json", "doc2.json"]
     runpy.run_module("attack_flow.cli", run_name="__main__")
-    validate_mock.assert_has_calls([call(Path("doc.json")), call(Path("doc2.json"))])
+    validate_mock.assert_has_calls(
+        [
+            call(Path("doc.json"), ANY, ANY, profile=None),
+            call(Path("doc2.json"), ANY, ANY, profile=None),
+        ]
+    )
     captured = capsys.readouterr()
     assert "doc.json: OK" in captured.out
     assert "doc2.json: OK" in captured.out
     exit_mock.assert_called_with(0)
 
 
+@patch("sys.exit")
+@patch("attack_flow.schema.validate_doc")
+def test_validate_cache_dir(validate_mock, exit_mock):
+    validate_mock.return_value = attack_flow.schema.ValidationResult()
+    with TemporaryDirectory() as cache_dir:
+        sys.argv = ["af", "--cache-dir", cache_dir, "validate", "doc.json"]
+        runpy.run_module("attack_flow.cli", run_name="__main__")
+    cache = validate_mock.call_args[0][1]
+    assert cache.cache_dir == Path(cache_dir)
+    exit_mock.assert_called_with(0)
+
+
 @patch("sys.exit")
 @patch("attack_flow.schema.validate_doc")
 def test_validate_fail(validate_mock, exit_mock, capsys):
@@ -42,7 +68,12 @@ def test_validate_fail(validate_mock, exit_mock, capsys):
     validate_mock.side_effect = [vr1, vr2]
     sys.argv = ["af", "validate", "doc.json", "doc2.json"]
     runpy.run_module("attack_flow.cli", run_name="__main__")
-    validate_mock.assert_has_calls([call(Path("doc.json")), call(Path("doc2.json"))])
+    validate_mock.assert_has_calls(
+        [
+            call(Path("doc.json"), ANY, ANY, profile=None),
+            call(Path("doc2.json"), ANY, ANY, profile=None),
+        ]
+    )
     captured = capsys.readouterr()
     assert "doc.json: OK" in captured.out
     assert "doc2.json: FAIL" in captured.out
@@ -59,7 +90,12 @@ def test_validate_fail_verbose(validate_mock, exit_mock, capsys):
     validate_mock.side_effect = [vr1, vr2]
     sys.argv = ["af", "validate", "--verbose", "doc.json", "doc2.json"]
     runpy.run_module("attack_flow.cli", run_name="__main__")
-    validate_mock.assert_has_calls([call(Path("doc.json")), call(Path("doc2.json"))])
+    validate_mock.assert_has_calls(
+        [
+            call(Path("doc.json"), ANY, ANY, profile=None),
+            call(Path("doc2.json"), ANY, ANY, profile=None),
+        ]
+    )
     captured = capsys.readouterr()
     assert "doc.json: OK" in captured.out
     assert "doc2.json: FAIL" in captured.out
@@ -67,6 +103,308 @@ def test_validate_fail_verbose(validate_mock, exit_mock, capsys):
     exit_mock.assert_called_with(1)
 
 
+@patch("sys.exit")
+def test_validate_jobs(exit_mock, capsys, tmp_path):
+    fixtures = Path(__file__).parent / "fixtures"
+    bad_flow = json.loads((fixtures / "flow1.json").read_text())
+    bad_flow["objects"][2]["name"] = 5
+    bad_path = tmp_path / "bad.json"
+    bad_path.write_text(json.dumps(bad_flow))
+    docs = [
+        str(fixtures / "flow1.json"),
+        str(bad_path),
+        str(fixtures / "badflow2.json"),
+        str(fixtures / "flow2.json"),
+    ]
+
+    outputs = list()
+    for jobs in ("1", "3"):
+        sys.argv = ["af", "validate", "--verbose", "--no-cache", "-j", jobs, *docs]
+        runpy.run_module("attack_flow.cli", run_name="__main__")
+        exit_mock.assert_called_with(1)
+        outputs.append(capsys.readouterr().out)
+
+    assert outputs[0] == outputs[1]
+    statuses = [
+        line.split(": ", 1)
+        for line in outputs[1].splitlines()
+        if line.split(": ", 1)[0] in docs
+    ]
+    assert statuses == [
+        [docs[0], "OK"],
+        [docs[1], "FAIL"],
+        [docs[2], "OK (with warnings)"],
+        [docs[3], "OK"],
+    ]
+
+
+@patch("sys.exit")
+def test_validate_result_cache(exit_mock, capsys, tmp_path):
+    fixtures = Path(__file__).parent / "fixtures"
+    flow_path = tmp_path / "flow.json"
+    flow_path.write_bytes((fixtures / "flow1.json").read_bytes())
+    docs = [str(flow_path), str(fixtures / "badflow2.json")]
+    argv = ["af", "--cache-dir", str(tmp_path / "cache"), "validate", "--verbose"]
+
+    outputs = list()
+    for _ in range(2):
+        sys.argv = [*argv, *docs]
+        runpy.run_module("attack_flow.cli", run_name="__main__")
+        outputs.append(capsys.readouterr())
+    assert outputs[0].out == outputs[1].out
+    assert "0 hits, 2 misses" in outputs[0].err
+    assert "2 hits, 0 misses" in outputs[1].err
+
+    # An edited file is validated again.
+    flow_json = json.loads(flow_path.read_text())
+    flow_json["objects"][2]["name"] = 5
+    flow_path.write_text(json.dumps(flow_json))
+    with patch("attack_flow.schema.validate_doc") as validate_mock:
+        validate_mock.return_value = attack_flow.schema.ValidationResult()
+        runpy.run_module("attack_flow.cli", run_name="__main__")
+    validate_mock.assert_called_once_with(flow_path, ANY, ANY, profile=None)
+    assert "1 hits, 1 misses" in capsys.readouterr().err
+
+    sys.argv = [*argv, "--no-cache", *docs]
+    runpy.run_module("attack_flow.cli", run_name="__main__")
+    captured = capsys.readouterr()
+    assert f"{flow_path}: FAIL" in captured.out
+    assert "Validation cache" not in captured.err
+
+
+@patch("sys.exit")
+def test_validate_object_memo(exit_mock, capsys, tmp_path):
+    fixtures = Path(__file__).parent / "fixtures"
+    flow_json = json.loads((fixtures / "flow1.json").read_text())
+    # The memo is shared by the whole process, so use a value that no other test uses.
+    flow_json["objects"][2]["name"] = 7357
+    docs = list()
+    for name in ("a.json", "b.json"):
+        docs.append(tmp_path / name)
+        docs[-1].write_text(json.dumps(flow_json))
+
+    sys.argv = ["af", "validate", "--no-cache", *map(str, docs)]
+    runpy.run_module("attack_flow.cli", run_name="__main__")
+    exit_mock.assert_called_with(1)
+    # The invalid object in the second file is served from the memo.
+    assert "Object memo: 1 of 2 object validations" in capsys.readouterr().err
+
+
+@patch("sys.exit")
+def test_validate_fail_fast(exit_mock, capsys, tmp_path):
+    fixtures = Path(__file__).parent / "fixtures"
+    flow_json = json.loads((fixtures / "flow1.json").read_text())
+    for item in flow_json["objects"]:
+        item.pop("name", None)
+    flow_path = tmp_path / "flow.json"
+    flow_path.write_text(json.dumps(flow_json))
+    argv = ["af", "--cache-dir", str(tmp_path / "cache"), "validate"]
+
+    sys.argv = [*argv, "--verbose", str(flow_path)]
+    runpy.run_module("attack_flow.cli", run_name="__main__")
+    full = capsys.readouterr().out
+    sys.argv = [*argv, "--verbose", "--fail-fast", str(flow_path)]
+    runpy.run_module("attack_flow.cli", run_name="__main__")
+    exit_mock.assert_called_with(1)
+    captured = capsys.readouterr()
+    assert "Validation stopped after 1 error(s)." in captured.out
+    assert len(captured.out) < len(full)
+    # The full results in the cache are not reused for --fail-fast.
+    assert "0 hits, 1 misses" in captured.err
+
+    with patch("attack_flow.schema.validate_doc") as validate_mock:
+        validate_mock.return_value = attack_flow.schema.ValidationResult()
+        sys.argv = [*argv, "--structural-only", "--time-budget", "5", str(flow_path)]
+        runpy.run_module("attack_flow.cli", run_name="__main__")
+    validate_mock.assert_called_once_with(
+        flow_path, ANY, ANY, profile=None, structural_only=True, time_budget=5.0
+    )
+    assert "Validation cache" not in capsys.readouterr().err
+
+
+@patch("sys.exit")
+def test_validate_profile(exit_mock, capsys, tmp_path):
+    fixtures = Path(__file__).parent / "fixtures"
+    docs = [str(fixtures / "flow1.json"), str(fixtures / "flow2.json")]
+    profile_path = tmp_path / "profile.json"
+    argv = ["af", "--cache-dir", str(tmp_path / "cache"), "validate"]
+    for _ in range(2):
+        sys.argv = [*argv, "--profile", "--profile-output", str(profile_path), *docs]
+        runpy.run_module("attack_flow.cli", run_name="__main__")
+        exit_mock.assert_called_with(0)
+        summary = json.loads(profile_path.read_text())
+        # Cached results are not reused when profiling.
+        assert [f["path"] for f in summary["files"]] == docs
+    total = summary["total"]
+    assert total["counters"]["objects"] == sum(
+        f["counters"]["objects"] for f in summary["files"]
+    )
+    assert "check_schema" in total["phases"]
+    assert len(total["slowest_objects"]) == 10
+    assert total["slowest_objects"][0]["path"] in docs
+
+    sys.argv = [*argv, "--profile", *docs]
+    runpy.run_module("attack_flow.cli", run_name="__main__")
+    err = capsys.readouterr().err
+    assert json.loads(err[err.index("{") :])["files"][0]["path"] == docs[0]
+
+    sys.argv = [*argv, "--profile-output", str(profile_path), *docs]
+    runpy.run_module("attack_flow.cli", run_name="__main__")
+    assert "--profile-output requires --profile" in capsys.readouterr().err
+    exit_mock.assert_called_with(1)
+
+
+@patch("sys.exit")
+def test_validate_limit_errors(exit_mock, capsys):
+    for args, error in (
+        (["--max-errors", "0"], "--max-errors must be at least 1"),
+        (["--fail-fast", "--max-errors", "2"], "either --fail-fast or --max-errors"),
+        (["--time-budget", "0"], "--time-budget must be greater than 0"),
+    ):
+        sys.argv = ["af", "validate", *args, "flow.json"]
+        runpy.run_module("attack_flow.cli", run_name="__main__")
+        assert error in capsys.readouterr().err
+        exit_mock.assert_called_with(1)
+
+
+@patch("sys.exit")
+def test_validate_stream(exit_mock, capsys, tmp_path):
+    fixtures = Path(__file__).parent / "fixtures"
+    flow_json = json.loads((fixtures / "flow1.json").read_text())
+    flow_json["objects"][2]["name"] = 5
+    flow_path = tmp_path / "flow.json"
+    flow_path.write_text(json.dumps(flow_json))
+    argv = ["af", "--cache-dir", str(tmp_path / "cache"), "validate", "--verbose"]
+
+    sys.argv = [*argv, "--stream", str(fixtures / "flow1.json"), str(flow_path)]
+    runpy.run_module("attack_flow.cli", run_name="__main__")
+    exit_mock.assert_called_with(1)
+    captured = capsys.readouterr()
+    assert f"{fixtures / 'flow1.json'}: OK" in captured.out
+    assert f"{flow_path}: FAIL" in captured.out
+    assert "5 is not of type 'string'" in captured.out
+    # The caches need the whole file, so they are not used.
+    assert "Validation cache" not in captured.err
+    assert not (tmp_path / "cache").exists()
+
+    with patch("attack_flow.schema.validate_doc") as validate_mock:
+        validate_mock.return_value = attack_flow.schema.ValidationResult()
+        sys.argv = [*argv, "--stream", str(flow_path)]
+        runpy.run_module("attack_flow.cli", run_name="__main__")
+    validate_mock.assert_called_once_with(
+        flow_path, None, ANY, profile=None, stream=True
+    )
+
+    sys.argv = [*argv, "--stream", "--watch", str(tmp_path)]
+    runpy.run_module("attack_flow.cli", run_name="__main__")
+    assert "--stream cannot be used" in capsys.readouterr().err
+    exit_mock.assert_called_with(1)
+
+
+@patch("sys.exit")
+def test_validate_ndjson(exit_mock, capsys, tmp_path):
+    fixtures = Path(__file__).parent / "fixtures"
+    flow_json = json.loads((fixtures / "flow1.json").read_text())
+    lines = [json.dumps(flow_json)]
+    flow_json["objects"][2]["name"] = 5
+    lines.append(json.dumps(flow_json))
+    # Bundles that make the validator fail outright
+    del flow_json["objects"][2]["type"]
+    lines.append(json.dumps(flow_json))
+    flow_json["objects"][2]["type"] = "x-unknown"
+    lines.append(json.dumps(flow_json))
+    ndjson = "\n".join([lines[0], "", lines[1], "[1]", *lines[2:], lines[0]]) + "\n"
+
+    stdin = io.TextIOWrapper(io.BytesIO(ndjson.encode()))
+    sys.argv = ["af", "validate", "--ndjson", "-"]
+    with patch("sys.stdin", stdin):
+        runpy.run_module("attack_flow.cli", run_name="__main__")
+    exit_mock.assert_called_with(1)
+    results = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(r["line"], r["success"]) for r in results] == [
+        (1, True),
+        (3, False),
+        (4, False),
+        (5, False),
+        (6, False),
+        (7, True),
+    ]
+    assert results[0]["id"] == json.loads(lines[0])["id"]
+    assert results[2]["messages"][0]["message"].startswith("Unable to parse JSON")
+    for result in results[3:5]:
+        assert result["messages"][0]["message"].startswith(
+            "Unable to validate this document"
+        )
+
+    ndjson_path = tmp_path / "flows.ndjson"
+    ndjson_path.write_text(lines[0] + "\n")
+    sys.argv = ["af", "validate", "--ndjson", str(ndjson_path)]
+    runpy.run_module("attack_flow.cli", run_name="__main__")
+    exit_mock.assert_called_with(0)
+    assert json.loads(capsys.readouterr().out)["success"]
+
+    sys.argv = ["af", "validate", "--ndjson", "-", str(ndjson_path)]
+    runpy.run_module("attack_flow.cli", run_name="__main__")
+    assert "--ndjson cannot be used" in capsys.readouterr().err
+    exit_mock.assert_called_with(1)
+
+
+@patch("sys.exit")
+def test_serve(exit_mock, capsys):
+    sys.argv = ["af", "serve", "--port", "0"]
+    with patch(
+        "attack_flow.server.ValidationServer.serve_forever",
+        side_effect=KeyboardInterrupt,
+    ) as serve_mock:
+        runpy.run_module("attack_flow.cli", run_name="__main__")
+    serve_mock.assert_called_once()
+    exit_mock.assert_called_with(0)
+    assert capsys.readouterr().out.startswith("Serving on http://127.0.0.1:")
+
+
+@patch("sys.exit")
+def test_validate_watch(exit_mock, capsys, tmp_path):
+    fixtures = Path(__file__).parent / "fixtures"
+    flow_path = tmp_path / "flow.json"
+    flow_path.write_bytes((fixtures / "flow1.json").read_bytes())
+    flow_json = json.loads(flow_path.read_text())
+
+    def edit_flow(_):
+        # Make one object invalid after the first poll, then stop watching.
+        if flow_json["objects"][2]["name"] != 5:
+            flow_json["objects"][2]["name"] = 5
+            flow_path.write_text(json.dumps(flow_json))
+            mtime_ns = flow_path.stat().st_mtime_ns + 1_000_000_000
+            os.utime(flow_path, ns=(mtime_ns, mtime_ns))
+        else:
+            raise KeyboardInterrupt()
+
+    sys.argv = ["af", "validate", "--no-cache", "--watch", str(tmp_path)]
+    with patch("time.sleep", side_effect=edit_flow):
+        runpy.run_module("attack_flow.cli", run_name="__main__")
+    exit_mock.assert_called_with(0)
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[1:3] == [f"{flow_path}: OK", f"{flow_path}: FAIL"]
+    assert len(lines) == 4
+    assert lines[3].startswith(" + [error] ") and "5 is not of type" in lines[3]
+
+
+@patch("sys.exit")
+def test_validate_watch_and_files(exit_mock, capsys):
+    sys.argv = ["af", "validate", "--watch", ".", "doc.json"]
+    runpy.run_module("attack_flow.cli", run_name="__main__")
+    assert "not both" in capsys.readouterr().err
+    exit_mock.assert_called_with(1)
+
+
+@patch("sys.exit")
+def test_validate_jobs_invalid(exit_mock, capsys):
+    sys.argv = ["af", "validate", "-j", "0", "doc.json"]
+    runpy.run_module("attack_flow.cli", run_name="__main__")
+    assert "--jobs must be at least 1" in capsys.readouterr().err
+    exit_mock.assert_called_with(1)
+
+
 @patch("sys.exit")
 @patch("attack_flow.docs.insert_docs")
 @patch("attack_flow.docs.generate_schema_docs")
@@ -119,9 +457,26 @@ def test_graphviz_attack_flow(load_mock, convert_mock, exit_mock):
         runpy.run_module("attack_flow.cli", run_name="__main__")
     load_mock.assert_called()
     assert str(load_mock.call_args[0][0]) == flow.name
-    convert_mock.assert_called_with(bundle)
+    convert_mock.assert_called_with(bundle, ANY)
     exit_mock.assert_called_with(0)
 
+
+@patch("sys.exit")
+@patch("attack_flow.graphviz.convert_attack_flow")
+@patch("attack_flow.model.load_attack_flow_bundle")
+def test_graphviz_raw(load_mock, convert_mock, exit_mock):
+    """
+    Test that the --raw option is passed through to the bundle loader.
+    """
+    convert_mock.return_value = "digraph {}"
+    load_mock.return_value = stix2.Bundle()
+    with NamedTemporaryFile() as flow, NamedTemporaryFile() as graphviz:
+        sys.argv = ["af", "graphviz", "--raw", flow.name, graphviz.name]
+        runpy.run_module("attack_flow.cli", run_name="__main__")
+    assert load_mock.call_args[1]["raw"] is True
+    exit_mock.assert_called_with(0)
+
+
 @patch("sys.exit")
 @patch("attack_flow.graphviz.convert_attack_tree")
 @patch("attack_flow.model.load_attack_flow_bundle")
@@ -155,7 +510,7 @@ def test_graphviz_attack_tree(load_mock, convert_mock, exit_mock):
         runpy.run_module("attack_flow.cli", run_name="__main__")
     load_mock.assert_called()
     assert str(load_mock.call_args[0][0]) == flow.name
-    convert_mock.assert_called_with(bundle)
+    convert_mock.assert_called_with(bundle, ANY)
     exit_mock.assert_called_with(0)
 
 @patch("sys.exit")
@@ -179,7 +534,7 @@ def test_mermaid_attack_flow(load_mock, convert_mock, exit_mock):
         runpy.run_module("attack_flow.cli", run_name="__main__")
     load_mock.assert_called()
     assert str(load_mock.call_args[0][0]) == flow.name
-    convert_mock.assert_called_with(bundle)
+    convert_mock.assert_called_with(bundle, ANY)
     exit_mock.assert_called_with(0)
 
 @patch("sys.exit")
@@ -212,7 +567,7 @@ def test_mermaid_attack_tree(load_mock, convert_mock, exit_mock):
         runpy.run_module("attack_flow.cli", run_name="__main__")
     load_mock.assert_called()
     assert str(load_mock.call_args[0][0]) == flow.name
-    convert_mock.assert_called_with(bundle)
+    convert_mock.assert_called_with(bundle, ANY)
     exit_mock.assert_called_with(0)
 
 @patch("sys.exit")
@@ -233,6 +588,141 @@ def test_matrix(load_mock, render_mock, exit_mock):
     exit_mock.assert_called_with(0)
 
 
+@patch("sys.exit")
+def test_similar(exit_mock, capsys):
+    """
+    Test that flows are added to the index, and that a query does not find the flow
+    itself.
+    """
+    with TemporaryDirectory() as tmp_dir:
+        index_path = os.path.join(tmp_dir, "index.json")
+        flow_paths = []
+        for i, technique_ids in enumerate([["T1", "T2"], ["T1", "T2", "T3"], ["T4"]]):
+            objects = [
+                {"type": "attack-action", "id": f"attack-action--{j}", "technique_id": t}
+                for j, t in enumerate(technique_ids)
+            ]
+            flow_paths.append(os.path.join(tmp_dir, f"flow{i}.json"))
+            with open(flow_paths[-1], "w") as f:
+                json.dump({"type": "bundle", "id": f"bundle--{i}", "objects": objects}, f)
+
+        sys.argv = ["af", "similar", "--add", index_path] + flow_paths
+        runpy.run_module("attack_flow.cli", run_name="__main__")
+        exit_mock.assert_called_with(0)
+        assert "Saved 3 flows" in capsys.readouterr().out
+
+        sys.argv = ["af", "similar", "--exact", index_path, flow_paths[0], flow_paths[2]]
+        runpy.run_module("attack_flow.cli", run_name="__main__")
+        exit_mock.assert_called_with(0)
+        assert capsys.readouterr().out.splitlines() == [
+            flow_paths[0],
+            f"  0.667  {flow_paths[1]}",
+            flow_paths[2],
+            "  No similar flows found.",
+        ]
+
+        sys.argv = ["af", "similar", os.path.join(tmp_dir, "missing.json"), flow_paths[0]]
+        runpy.run_module("attack_flow.cli", run_name="__main__")
+        exit_mock.assert_called_with(1)
+
+
+@patch("sys.exit")
+def test_query(exit_mock, capsys):
+    """
+    Test that flows are added to the index, and that a query prints the flows that
+    match it.
+    """
+    with TemporaryDirectory() as tmp_dir:
+        index_path = os.path.join(tmp_dir, "index.json")
+        flow_paths = []
+        for i, technique_ids in enumerate([["T1059", "T1486"], ["T1486", "T1059"]]):
+            objects = [
+                {
+                    "type": "attack-action",
+                    "id": f"attack-action--{j}",
+                    "technique_id": t,
+                    "effect_refs": [f"attack-action--{j + 1}"] if j == 0 else [],
+                }
+                for j, t in enumerate(technique_ids)
+            ]
+            flow_paths.append(os.path.join(tmp_dir, f"flow{i}.json"))
+            with open(flow_paths[-1], "w") as f:
+                json.dump({"type": "bundle", "id": f"bundle--{i}", "objects": objects}, f)
+
+        sys.argv = ["af", "query", "--add", index_path] + flow_paths
+        runpy.run_module("attack_flow.cli", run_name="__main__")
+        exit_mock.assert_called_with(0)
+        assert "Saved 2 flows" in capsys.readouterr().out
+
+        sys.argv = ["af", "query", "--verbose", index_path, "T1059 ->2 T1486"]
+        runpy.run_module("attack_flow.cli", run_name="__main__")
+        exit_mock.assert_called_with(0)
+        assert capsys.readouterr().out.splitlines() == [
+            flow_paths[0],
+            "  attack-action--0 -> attack-action--1",
+        ]
+
+        sys.argv = ["af", "query", index_path, "T1059 ->"]
+        runpy.run_module("attack_flow.cli", run_name="__main__")
+        exit_mock.assert_called_with(1)
+
+
+@pytest.mark.parametrize("command", ["query", "similar"])
+@pytest.mark.parametrize(
+    "document, error",
+    [
+        ("[1]", "expected a bundle with an `objects` array"),
+        ('{"objects": 1}', "expected a bundle with an `objects` array"),
+        ('{"objects": [1]}', "objects[0] is not an object"),
+        ('{"objects": [{"type": "relationship"}]}', "objects[0] needs a string `source_ref`"),
+        ('{"objects": [{"type": "note", "id": []}]}', "objects[0] needs a string `id`"),
+        (
+            '{"objects": [{"type": "attack-action", "id": "x", "technique_id": [1]}]}',
+            "objects[0] has a `technique_id` that is not a string",
+        ),
+    ],
+)
+@patch("sys.exit")
+def test_index_malformed_bundle(exit_mock, capsys, tmp_path, command, document, error):
+    flow_path = tmp_path / "flow.json"
+    flow_path.write_text(document)
+    sys.argv = ["af", command, "--add", str(tmp_path / "index.json"), str(flow_path)]
+    runpy.run_module("attack_flow.cli", run_name="__main__")
+    exit_mock.assert_called_with(1)
+    assert f"Unable to read {flow_path}: {error}" in capsys.readouterr().err
+    assert not (tmp_path / "index.json").exists()
+
+
+@patch("sys.exit")
+@patch("attack_flow.afb.export_stix")
+def test_export_stix(export_mock, exit_mock):
+    """
+    Test that each .afb file is exported next to itself and other files are skipped.
+    """
+    with TemporaryDirectory() as corpus_dir:
+        sys.argv = [
+            "af",
+            "export-stix",
+            os.path.join(corpus_dir, "flow1.afb"),
+            os.path.join(corpus_dir, "flow2.json"),
+        ]
+        runpy.run_module("attack_flow.cli", run_name="__main__")
+    export_mock.assert_called_once()
+    afb_path, stix_path, _ = export_mock.call_args[0]
+    assert afb_path == Path(corpus_dir) / "flow1.afb"
+    assert stix_path == Path(corpus_dir) / "flow1.json"
+    exit_mock.assert_called_with(0)
+
+
+@patch("sys.exit")
+@patch("attack_flow.afb.export_stix")
+def test_export_stix_error(export_mock, exit_mock):
+    export_mock.side_effect = ValueError("appears to be a v2 file (expected v3)")
+    sys.argv = ["af", "export-stix", "flow1.afb"]
+    runpy.run_module("attack_flow.cli", run_name="__main__")
+    exit_mock.assert_called_with(1)
+
+
 @patch("sys.exit")
 @patch("attack_flow.docs.generate_example_flows")
 @patch("attack_flow.docs.insert_docs")
@@ -277,3 +767,22 @@ def test_reraises_in_debug_mode(get_dist_mock, exit_mock):
     with pytest.raises(ValueError):
         runpy.run_module("attack_flow.cli", run_name="__main__")
     exit_mock.assert_not_called()
+
+
+def test_import_time():
+    """
+    Importing the CLI should not load any heavy dependencies, since those are imported
+    by the subcommands that use them.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import attack_flow.cli"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times = dict()
+    for line in process.stderr.splitlines():
+        if match := re.match(r"^import time:\s+\d+ \|\s+(\d+) \|\s+(\S+)$", line):
+            import_times[match.group(2)] = int(match.group(1))
+    assert not set(HEAVY_MODULES) & set(import_times)
+    assert import_times["attack_flow.cli"] / 1000 < IMPORT_TIME_BUDGET_MS
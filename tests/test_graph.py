@@ -1,7 +1,16 @@
 from datetime import datetime
+import json
+
+import networkx as nx
+import pytest
 
 import attack_flow.graph
-from .fixtures import get_flow_bundle
+from .fixtures import (
+    CORPUS_AFB_PATHS,
+    get_corpus_bundle,
+    get_flow_bundle,
+    write_corpus,
+)
 
 
 def test_convert_flow_to_graph():
@@ -58,3 +67,168 @@ def test_induce_action_graph():
 
     assert len(graph.nodes) == 4
     assert len(graph.edges) == 3
+
+
+def induce_action_graph_by_elimination(full_graph):
+    """The previous version of ``induce_action_graph()``, to compare with."""
+    graph = full_graph.copy()
+    remove_nodes = [id for id in graph.nodes() if not id.startswith("attack-action")]
+
+    for node in remove_nodes:
+        for source, _ in graph.in_edges(node):
+            for _, target in graph.out_edges(node):
+                graph.add_edge(source, target, type="effect")
+        graph.remove_node(node)
+
+    return graph
+
+
+def assert_same_action_graph(full_graph):
+    expected = induce_action_graph_by_elimination(full_graph)
+    graph = attack_flow.graph.induce_action_graph(full_graph)
+    assert list(graph.nodes(data=True)) == list(expected.nodes(data=True))
+    assert {(u, v): data for u, v, data in graph.edges(data=True)} == {
+        (u, v): data for u, v, data in expected.edges(data=True)
+    }
+
+
+@pytest.mark.parametrize("afb_path", CORPUS_AFB_PATHS, ids=lambda p: p.stem)
+def test_induce_action_graph_matches_elimination(afb_path):
+    flow_json = get_corpus_bundle(afb_path)
+    broken_json = {**flow_json, "objects": flow_json["objects"][::2]}
+    for bundle in (flow_json, broken_json):
+        assert_same_action_graph(attack_flow.graph.bundle_to_networkx(bundle))
+
+
+def test_induce_action_graph_cycles():
+    graph = nx.DiGraph()
+    graph.add_edge("attack-action--1", "attack-operator--1", type="effect")
+    # A cycle of conditions, which leads to two actions and back to the first one
+    graph.add_edge("attack-operator--1", "attack-condition--1", type="effect")
+    graph.add_edge("attack-condition--1", "attack-condition--2", type="on_true")
+    graph.add_edge("attack-condition--2", "attack-condition--1", type="on_false")
+    graph.add_edge("attack-condition--2", "attack-action--2", type="on_true")
+    graph.add_edge("attack-condition--1", "attack-action--3", type="on_false")
+    graph.add_edge("attack-condition--1", "attack-action--1", type="on_true")
+    # A direct edge that is also an indirect one
+    graph.add_edge("attack-action--1", "attack-action--2", type="related-to")
+    graph.add_edge("attack-action--2", "attack-asset--1", type="asset")
+    graph.add_edge("attack-action--3", "attack-asset--1", type="asset")
+    assert_same_action_graph(graph)
+
+    action_graph = attack_flow.graph.induce_action_graph(graph)
+    assert sorted(action_graph.edges) == [
+        ("attack-action--1", "attack-action--1"),
+        ("attack-action--1", "attack-action--2"),
+        ("attack-action--1", "attack-action--3"),
+    ]
+    # The direct edge's type is overwritten by the indirect one.
+    assert action_graph.edges["attack-action--1", "attack-action--2"] == {
+        "type": "effect"
+    }
+
+
+def test_compact_graph():
+    flow_bundle = get_flow_bundle()
+    graph = attack_flow.graph.bundle_to_compact(flow_bundle)
+
+    assert len(graph) == 11
+    assert graph.num_edges == 10
+    action = graph.index["attack-action--dd3820fa-bae3-4270-8000-5c4642fa780c"]
+    assert graph.get_type(action) == "attack-action"
+    assert graph.get_object(action)["name"] == "Action 2"
+    assert sorted(graph.get_type(n) for n in graph.successors(action)) == [
+        "attack-asset",
+        "infrastructure",
+    ]
+    assert len(graph.get_nodes("attack-action")) == 4
+    assert graph.get_nodes("no-such-type") == []
+    for node in graph.successors(action):
+        assert action in graph.predecessors(node)
+
+    graph = attack_flow.graph.bundle_to_compact(flow_bundle, keep_objects=False)
+    with pytest.raises(ValueError):
+        graph.get_object(action)
+    assert graph.to_networkx().nodes[graph.ids[action]] == {
+        "type": "attack-action",
+        "technique_id": None,
+    }
+
+
+@pytest.mark.parametrize("afb_path", CORPUS_AFB_PATHS, ids=lambda p: p.stem)
+def test_compact_graph_matches_networkx(afb_path):
+    flow_json = get_corpus_bundle(afb_path)
+    # Also remove some objects to create dangling references.
+    broken_json = {**flow_json, "objects": flow_json["objects"][::2]}
+    for bundle in (flow_json, broken_json):
+        expected = attack_flow.graph.bundle_to_networkx(bundle)
+        compact = attack_flow.graph.bundle_to_compact(bundle)
+        graph = compact.to_networkx()
+        assert list(graph.nodes(data=True)) == list(expected.nodes(data=True))
+        assert list(graph.edges) == list(expected.edges)
+        for source, target, edge_type in graph.edges(data="type"):
+            assert edge_type == expected.edges[source, target]["type"]
+        for node, node_id in enumerate(compact.ids):
+            assert compact.get_technique_id(node) == expected.nodes[node_id].get(
+                "technique_id"
+            )
+
+
+def test_compact_graph_action_edges():
+    flow_bundle = get_flow_bundle()
+    compact = attack_flow.graph.bundle_to_compact(flow_bundle)
+    expected = attack_flow.graph.induce_action_graph(
+        attack_flow.graph.bundle_to_networkx(flow_bundle)
+    )
+    edges = [(compact.ids[s], compact.ids[t]) for s, t in compact.get_action_edges()]
+    assert sorted(edges) == sorted(expected.edges)
+
+
+def test_corpus_graph(tmp_path):
+    paths = write_corpus(tmp_path)
+    corpus = attack_flow.graph.load_corpus_graph(paths)
+    assert len(corpus) == len(paths)
+
+    # Merge the flows' action graphs by hand.
+    nodes = dict()
+    edges = dict()
+    for path in paths:
+        full_graph = attack_flow.graph.bundle_to_networkx(json.loads(path.read_text()))
+        graph = attack_flow.graph.induce_action_graph(full_graph)
+        for node, technique_id in graph.nodes(data="technique_id"):
+            if technique_id is not None:
+                flows = nodes.setdefault(technique_id, dict())
+                flows[str(path)] = flows.get(str(path), 0) + 1
+        for source, target in graph.edges:
+            edge = (
+                graph.nodes[source].get("technique_id"),
+                graph.nodes[target].get("technique_id"),
+            )
+            if None not in edge:
+                flows = edges.setdefault(edge, dict())
+                flows[str(path)] = flows.get(str(path), 0) + 1
+    assert corpus.nodes == nodes
+    assert corpus.edges == edges
+
+    # Removing a flow and adding it back gives the same graph.
+    removed = str(paths[0])
+    corpus.remove_flow(removed)
+    assert removed not in corpus
+    rebuilt = attack_flow.graph.load_corpus_graph(paths[1:])
+    assert corpus.nodes == rebuilt.nodes
+    assert corpus.edges == rebuilt.edges
+    corpus.add_flow(json.loads(paths[0].read_text()), flow_id=removed)
+    assert corpus.nodes == nodes
+    assert corpus.edges == edges
+
+    with pytest.raises(ValueError):
+        corpus.add_flow(json.loads(paths[0].read_text()), flow_id=removed)
+    with pytest.raises(KeyError):
+        corpus.remove_flow("no-such-flow")
+
+    technique_id, flows = next(iter(corpus.nodes.items()))
+    assert corpus.get_flows(technique_id) == list(flows)
+    assert corpus.get_flows("T0000") == []
+    graph = corpus.to_networkx()
+    assert graph.nodes[technique_id]["weight"] == len(flows)
+    assert graph.number_of_edges() == len(edges)
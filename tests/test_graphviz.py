@@ -1,8 +1,10 @@
+from pathlib import Path
 from textwrap import dedent
 import attack_flow.graphviz
 from attack_flow.model import (
     AttackAction,
     AttackCondition,
+    load_attack_flow_bundle,
 )
 from .fixtures import get_flow_bundle, get_tree_bundle
 
@@ -104,6 +106,7 @@ def test_action_label():
         == '<<TABLE BORDER="0" CELLBORDER="1" CELLSPACING="0" CELLPADDING="5"><TR><TD BGCOLOR="#99ccff" COLSPAN="2"><B>Action</B></TD></TR><TR><TD ALIGN="LEFT" BALIGN="LEFT"><B>Name</B></TD><TD ALIGN="LEFT" BALIGN="LEFT">My technique</TD></TR><TR><TD ALIGN="LEFT" BALIGN="LEFT"><B>Description</B></TD><TD ALIGN="LEFT" BALIGN="LEFT">This technique has no ID to render in<br/>the header.</TD></TR><TR><TD ALIGN="LEFT" BALIGN="LEFT"><B>Confidence</B></TD><TD ALIGN="LEFT" BALIGN="LEFT">Very Probable</TD></TR></TABLE>>'
     )
 
+
 def test_get_operator_label():
     action = AttackAction(
         id="attack-action--b5696498-66e8-41b6-87e1-19d2657ac48b",
@@ -115,6 +118,7 @@ def test_get_operator_label():
         == '<<TABLE BORDER="0" CELLBORDER="1" CELLSPACING="0" CELLPADDING="5"><TR><TD BGCOLOR="#99ccff" COLSPAN="2"><B>AND</B></TD></TR><TR><TD ALIGN="LEFT" BALIGN="LEFT"><B>Name</B></TD><TD ALIGN="LEFT" BALIGN="LEFT">My technique</TD></TR><TR><TD ALIGN="LEFT" BALIGN="LEFT"><B>Description</B></TD><TD ALIGN="LEFT" BALIGN="LEFT">This technique has no ID to render in<br/>the header.</TD></TR><TR><TD ALIGN="LEFT" BALIGN="LEFT"><B>Confidence</B></TD><TD ALIGN="LEFT" BALIGN="LEFT">Very Probable</TD></TR></TABLE>>'
     )
 
+
 def test_get_attack_tree_action_label():
     action = AttackAction(
         id="attack-action--b5696498-66e8-41b6-87e1-19d2657ac48b",
@@ -125,3 +129,14 @@ def test_get_attack_tree_action_label():
         attack_flow.graphviz._get_attack_tree_action_label(action)
         == '<<TABLE BORDER="0" CELLBORDER="1" CELLSPACING="0" CELLPADDING="5"><TR><TD BGCOLOR="#B40000" COLSPAN="2"><font color="white"><B>Action</B></font></TD></TR><TR><TD ALIGN="LEFT" BALIGN="LEFT"><B>Name</B></TD><TD ALIGN="LEFT" BALIGN="LEFT">My technique</TD></TR><TR><TD ALIGN="LEFT" BALIGN="LEFT"><B>Description</B></TD><TD ALIGN="LEFT" BALIGN="LEFT">This technique has no ID to render in<br/>the header.</TD></TR><TR><TD ALIGN="LEFT" BALIGN="LEFT"><B>Confidence</B></TD><TD ALIGN="LEFT" BALIGN="LEFT">Very Probable</TD></TR></TABLE>>'
     )
+
+
+def test_convert_raw_bundle_to_graphviz():
+    path = Path(__file__).parent / "fixtures" / "flow1.json"
+    stix_output = attack_flow.graphviz.convert_attack_flow(
+        load_attack_flow_bundle(path)
+    )
+    raw_output = attack_flow.graphviz.convert_attack_flow(
+        load_attack_flow_bundle(path, raw=True)
+    )
+    assert raw_output == stix_output
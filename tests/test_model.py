@@ -67,3 +67,162 @@ def test_get_flow_object():
     )
     flow = attack_flow.model.get_flow_object(bundle)
     assert flow.id == "attack-flow--0c545a6f-3da2-4fa8-9789-68fd98257d10"
+
+
+def test_load_attack_flow_bundle_raw():
+    path = Path(__file__).parent / "fixtures" / "flow1.json"
+    flow_bundle = attack_flow.model.load_attack_flow_bundle(path, raw=True)
+    assert isinstance(flow_bundle, attack_flow.model.RawBundle)
+    assert flow_bundle.id == "bundle--e8d6416b-feb8-4e3b-833c-cb6b79dfd922"
+    assert flow_bundle.get("objects")
+
+    flow = attack_flow.model.get_flow_object(flow_bundle)
+    assert flow.name == "Test Flow 1"
+    assert flow["scope"] == "incident"
+    assert flow.get("missing", "default") == "default"
+    assert str(flow.created) == "2022-08-02 19:34:35.143000+00:00"
+    with pytest.raises(AttributeError):
+        flow.missing
+
+    author = flow_bundle.get_obj(flow.created_by_ref)[0]
+    assert author.name == "John Doe"
+    with pytest.raises(KeyError):
+        flow_bundle.get_obj("identity--00000000-0000-0000-0000-000000000000")
+
+
+def test_raw_object_is_read_only():
+    obj = attack_flow.model.RawStixObject({"type": "identity", "name": "Jane Doe"})
+    with pytest.raises(AttributeError):
+        obj.name = "John Doe"
+    assert dict(obj) == {"type": "identity", "name": "Jane Doe"}
+
+
+def test_raw_and_stix_modes_match():
+    path = Path(__file__).parent / "fixtures" / "flow1.json"
+    stix_bundle = attack_flow.model.load_attack_flow_bundle(path)
+    raw_bundle = attack_flow.model.load_attack_flow_bundle(path, raw=True)
+    assert attack_flow.model.get_viz_ignored_ids(
+        stix_bundle
+    ) == attack_flow.model.get_viz_ignored_ids(raw_bundle)
+    assert [o.id for o in stix_bundle.objects] == [o.id for o in raw_bundle.objects]
+
+
+def test_raw_mode_fills_defanged():
+    raw_bundle = attack_flow.model.load_raw_bundle(
+        {
+            "type": "bundle",
+            "id": "bundle--e8d6416b-feb8-4e3b-833c-cb6b79dfd922",
+            "objects": [
+                {"type": "ipv4-addr", "value": "10.0.0.1"},
+                {"type": "ipv4-addr", "value": "10.0.0.2", "defanged": True},
+                {"type": "identity", "name": "John Doe"},
+            ],
+        }
+    )
+    assert [o.get("defanged") for o in raw_bundle.objects] == [False, True, None]
+
+
+@pytest.mark.parametrize("raw", [False, True])
+def test_flow_index(raw):
+    path = Path(__file__).parent / "fixtures" / "flow1.json"
+    flow_bundle = attack_flow.model.load_attack_flow_bundle(path, raw=raw)
+    index = attack_flow.model.FlowIndex(flow_bundle)
+
+    flow_id = "attack-flow--9526d08b-c98a-46e6-8109-35e92fb62038"
+    action1_id = "attack-action--0d54aaa2-1cd9-4de6-8bb1-bd95ae6eb3cd"
+    action2_id = "attack-action--a80be4f5-be42-48eb-8ade-b10820015e96"
+    assert index.flow.id == flow_id
+    assert index.by_id[action1_id] is index.get_objects("attack-action")[0]
+    assert [o.id for o in index.get_objects("attack-action")] == [
+        action1_id,
+        action2_id,
+    ]
+    assert index.get_objects("malware") == []
+    assert ("start_refs", action1_id) in index.refs[flow_id]
+    assert index.refs[action1_id] == [("effect_refs", action2_id)]
+    assert index.reverse_refs[action2_id] == [(action1_id, "effect_refs")]
+    assert index.viz_ignored_ids == {
+        "extension-definition--fb9c968a-745b-4ade-9b25-c324172197f4",
+        "identity--d673f8cb-c168-42da-8ed4-0cb26725f86c",
+        flow_id,
+        index.flow.created_by_ref,
+    }
+    assert index.viz_ignored_ids == attack_flow.model.get_viz_ignored_ids(flow_bundle)
+
+
+def test_flow_index_json():
+    bundle = {
+        "type": "bundle",
+        "id": "bundle--e8d6416b-feb8-4e3b-833c-cb6b79dfd922",
+        "objects": [
+            {
+                "type": "attack-flow",
+                "id": "attack-flow--1",
+                "start_refs": [],
+                "created_by_ref": None,
+            },
+            {"type": "attack-flow", "id": "attack-flow--2"},
+        ],
+    }
+    index = attack_flow.model.FlowIndex(bundle)
+    assert index.flow["id"] == "attack-flow--1"
+    assert len(index.get_objects("attack-flow")) == 2
+    assert index.refs["attack-flow--1"] == []
+    assert index.viz_ignored_ids == {"attack-flow--1", "attack-flow--2"}
+
+
+def test_flow_index_duplicate_ids():
+    bundle = {
+        "type": "bundle",
+        "id": "bundle--e8d6416b-feb8-4e3b-833c-cb6b79dfd922",
+        "objects": [
+            {
+                "type": "attack-action",
+                "id": "attack-action--a",
+                "effect_refs": ["attack-action--b"],
+            },
+            {
+                "type": "attack-action",
+                "id": "attack-action--a",
+                "effect_refs": ["attack-action--b", "attack-action--c"],
+            },
+        ],
+    }
+    index = attack_flow.model.FlowIndex(bundle)
+    assert index.by_id["attack-action--a"] is bundle["objects"][0]
+    assert index.refs["attack-action--a"] == [
+        ("effect_refs", "attack-action--b"),
+        ("effect_refs", "attack-action--b"),
+        ("effect_refs", "attack-action--c"),
+    ]
+    # Each object's refs are added to the reverse refs once.
+    assert index.reverse_refs["attack-action--b"] == [
+        ("attack-action--a", "effect_refs"),
+        ("attack-action--a", "effect_refs"),
+    ]
+    assert index.reverse_refs["attack-action--c"] == [
+        ("attack-action--a", "effect_refs")
+    ]
+
+
+def test_flow_index_skips_malformed_values():
+    bundle = {
+        "type": "bundle",
+        "id": "bundle--e8d6416b-feb8-4e3b-833c-cb6b79dfd922",
+        "objects": [
+            {
+                "type": "attack-action",
+                "id": "attack-action--1",
+                "effect_refs": ["attack-action--2", ["attack-action--3"], 4],
+                "asset_refs": 5,
+                "created_by_ref": ["identity--1"],
+            },
+            {"type": "attack-action", "id": ["attack-action--2"]},
+            5,
+        ],
+    }
+    index = attack_flow.model.FlowIndex(bundle)
+    assert len(index.objects) == 3
+    assert index.refs["attack-action--1"] == [("effect_refs", "attack-action--2")]
+    assert index.by_id[None]["id"] == ["attack-action--2"]
+    assert len(index.get_objects("attack-action")) == 2
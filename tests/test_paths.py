@@ -0,0 +1,121 @@
+import pytest
+
+from attack_flow.paths import AttackPath, PathEnumerator, PathStep
+from .fixtures import CORPUS_AFB_PATHS, get_corpus_bundle
+
+
+def make_bundle(start_refs, *objects):
+    flow = {"type": "attack-flow", "id": "attack-flow--1", "start_refs": start_refs}
+    return {"type": "bundle", "id": "bundle--1", "objects": [flow, *objects]}
+
+
+def action(name, *effect_refs):
+    return {
+        "type": "attack-action",
+        "id": f"attack-action--{name}",
+        "effect_refs": effect_refs,
+    }
+
+
+def names(path):
+    return [step.id.split("--")[1] for step in path.steps]
+
+
+def test_conditions_and_operators():
+    bundle = make_bundle(
+        ["attack-action--a1", "attack-action--a4"],
+        action("a1", "attack-condition--c1"),
+        {
+            "type": "attack-condition",
+            "id": "attack-condition--c1",
+            "on_true_refs": ["attack-action--a2"],
+        },
+        action("a2", "attack-operator--and"),
+        action("a3"),
+        action("a4", "attack-operator--and", "attack-operator--or"),
+        {
+            "type": "attack-operator",
+            "id": "attack-operator--and",
+            "operator": "AND",
+            "effect_refs": ["attack-action--a3"],
+        },
+        {
+            "type": "attack-operator",
+            "id": "attack-operator--or",
+            "operator": "OR",
+            "effect_refs": ["attack-action--a3"],
+        },
+    )
+    enumerator = PathEnumerator(bundle)
+    paths = list(enumerator.iter_paths())
+    assert [names(path) for path in paths] == [
+        ["a1", "c1", "a2", "and", "a3"],
+        ["a1", "c1"],
+        ["a4", "and", "a3"],
+        ["a4", "or", "a3"],
+    ]
+    assert [step.outcome for step in paths[0].steps[:2]] == [None, True]
+    assert paths[1].steps[1] == PathStep("attack-condition--c1", False)
+    assert paths[0].requires == {"attack-action--a4"}
+    assert paths[2].requires == {"attack-action--a2"}
+    assert paths[3].requires == frozenset()
+    assert all(path.complete for path in paths)
+    assert enumerator.count_paths() == 4
+
+    assert list(enumerator.iter_paths(max_paths=2)) == paths[:2]
+    assert list(enumerator.iter_paths(max_depth=2))[0] == AttackPath(
+        paths[0].steps[:2], frozenset(), False
+    )
+
+
+def test_impossible_and_operator():
+    # The AND operator's other input is not connected to the start refs.
+    bundle = make_bundle(
+        ["attack-action--a1"],
+        action("a1", "attack-operator--and", "attack-action--a2"),
+        action("a2"),
+        action("a3", "attack-operator--and"),
+        {
+            "type": "attack-operator",
+            "id": "attack-operator--and",
+            "operator": "AND",
+            "effect_refs": ["attack-action--a2"],
+        },
+    )
+    paths = list(PathEnumerator(bundle).iter_paths())
+    assert [names(path) for path in paths] == [["a1", "a2"]]
+
+
+def test_loop():
+    bundle = make_bundle(
+        ["attack-action--a1"],
+        action("a1", "attack-action--a2"),
+        action("a2", "attack-action--a1", "attack-action--a3"),
+        action("a3"),
+    )
+    enumerator = PathEnumerator(bundle)
+    assert [names(path) for path in enumerator.iter_paths()] == [
+        ["a1", "a2"],
+        ["a1", "a2", "a3"],
+    ]
+    with pytest.raises(ValueError):
+        enumerator.count_paths()
+
+
+def test_no_flow():
+    with pytest.raises(ValueError):
+        PathEnumerator({"type": "bundle", "id": "bundle--1", "objects": [action("a1")]})
+
+
+@pytest.mark.parametrize("afb_path", CORPUS_AFB_PATHS, ids=lambda p: p.stem)
+def test_memoized_paths_match(afb_path):
+    bundle = get_corpus_bundle(afb_path)
+    enumerator = PathEnumerator(bundle)
+    unmemoized = PathEnumerator(bundle, memo_limit=0)
+    for max_depth in (3, None):
+        paths = list(enumerator.iter_paths(max_depth=max_depth))
+        assert paths == list(unmemoized.iter_paths(max_depth=max_depth))
+    try:
+        assert enumerator.count_paths() == len(paths)
+    except ValueError:
+        pass
@@ -0,0 +1,206 @@
+import json
+import re
+
+import networkx as nx
+import pytest
+
+from attack_flow.graph import bundle_to_networkx, induce_action_graph, load_corpus_graph
+from attack_flow.query import QueryMatch, QueryStep, TechniqueIndex, parse_query
+from .fixtures import write_corpus
+
+
+def make_flow(flow_id, actions, operators=()):
+    """
+    Make a flow bundle.
+
+    :param str flow_id:
+    :param list actions: ``(name, technique ID, effect names)`` for each action, where
+        an action's ID is ``attack-action--<name>``
+    :param list operators: ``(name, effect names)`` for each operator, where an
+        operator's ID is ``attack-operator--<name>``
+    :rtype: dict
+    """
+
+    def make_ref(name):
+        if name.startswith("op"):
+            return f"attack-operator--{name}"
+        return f"attack-action--{name}"
+
+    objects = [
+        {
+            "type": "attack-flow",
+            "id": f"attack-flow--{flow_id}",
+            "start_refs": [make_ref(actions[0][0])],
+        }
+    ]
+    for name, technique_id, effects in actions:
+        action = {
+            "type": "attack-action",
+            "id": make_ref(name),
+            "effect_refs": [make_ref(effect) for effect in effects],
+        }
+        if technique_id is not None:
+            action["technique_id"] = technique_id
+        objects.append(action)
+    for name, effects in operators:
+        objects.append(
+            {
+                "type": "attack-operator",
+                "id": make_ref(name),
+                "operator": "OR",
+                "effect_refs": [make_ref(effect) for effect in effects],
+            }
+        )
+    return {"type": "bundle", "id": f"bundle--{flow_id}", "objects": objects}
+
+
+def test_parse_query():
+    assert parse_query(
+        'T1059 -> t1105 ->2 T1486->*T1490.001 -> aml.T0008 -> "[ATL] My Technique"'
+    ) == [
+        QueryStep("T1059", 0),
+        QueryStep("T1105", 1),
+        QueryStep("T1486", 2),
+        QueryStep("T1490.001", None),
+        QueryStep("AML.T0008", 1),
+        QueryStep("[ATL] My Technique", 1),
+    ]
+    for query in ["", "-> T1059", "T1059 T1105", "T1059 ->", "T1059 ->0 T1105"]:
+        with pytest.raises(ValueError):
+            parse_query(query)
+    with pytest.raises(ValueError, match="position 10"):
+        parse_query("T1059 -> $")
+
+
+def test_query():
+    index = TechniqueIndex()
+    index.add_flow(
+        make_flow(
+            "1",
+            [
+                ("a", "T1566.001", ["op1"]),
+                ("b", None, ["c"]),
+                ("c", "T1059.001", ["d"]),
+                ("d", "T1486", ["a"]),
+            ],
+            operators=[("op1", ["b"])],
+        )
+    )
+    index.add_flow(
+        make_flow("2", [("a", "T1059", ["b"]), ("b", "T1486", [])]),
+        flow_id="second",
+    )
+    assert len(index) == 2
+    assert "second" in index
+    assert index.get_flows("T1059") == ["attack-flow--1", "second"]
+    assert index.get_flows("T1059.001") == ["attack-flow--1"]
+
+    def flows(query):
+        return [match.flow_id for match in index.query(query)]
+
+    assert flows("T1059 -> T1486") == ["attack-flow--1", "second"]
+    assert flows("T1059.001 -> T1486") == ["attack-flow--1"]
+    # The operator does not count as a hop, but the action without a technique does.
+    assert flows("T1566 -> T1059") == []
+    assert flows("T1566 ->2 T1059") == ["attack-flow--1"]
+    # The flow loops back to the first action.
+    assert flows("T1486 ->* T1566 ->* T1486") == ["attack-flow--1"]
+    assert flows("T1486 -> T1059") == []
+    assert flows("T9999") == []
+    assert index.query("T1566 ->* T1059 -> T1486") == [
+        QueryMatch(
+            "attack-flow--1",
+            ("attack-action--a", "attack-action--c", "attack-action--d"),
+        )
+    ]
+    assert index.query("T1486", limit=1) == [
+        QueryMatch("attack-flow--1", ("attack-action--d",))
+    ]
+    with pytest.raises(ValueError):
+        index.add_flow(make_flow("3", [("a", "T1059", [])]), flow_id="second")
+
+
+def find_flows_by_bfs(graphs, source, target, max_hops):
+    """
+    Find the flows where an action that matches ``source`` leads to an action that
+    matches ``target`` within ``max_hops`` hops, by searching each action graph.
+
+    :param dict graphs: flow ID -> action graph
+    :param str source: a technique ID, which also matches its sub-techniques
+    :param str target: a technique ID, which also matches its sub-techniques
+    :param int max_hops: or ``None`` for any number of hops
+    :rtype: list[str]
+    """
+
+    def matches(graph, node, technique_id):
+        node_technique = graph.nodes[node].get("technique_id")
+        if node_technique is None:
+            return False
+        parent, _, sub_technique = node_technique.rpartition(".")
+        return technique_id == node_technique or (
+            technique_id == parent and sub_technique.isdigit()
+        )
+
+    flows = list()
+    for flow_id, graph in graphs.items():
+        cutoff = None if max_hops is None else max_hops - 1
+        if any(
+            matches(graph, node, target)
+            for start in graph.nodes
+            if matches(graph, start, source)
+            for successor in graph.successors(start)
+            for node in nx.single_source_shortest_path_length(
+                graph, successor, cutoff=cutoff
+            )
+        ):
+            flows.append(flow_id)
+    return flows
+
+
+def test_query_corpus(tmp_path):
+    paths = write_corpus(tmp_path)
+    index = TechniqueIndex()
+    graphs = dict()
+    for path in paths:
+        with path.open("rb") as f:
+            flow_bundle = json.load(f)
+        index.add_flow(flow_bundle, flow_id=str(path))
+        graphs[str(path)] = induce_action_graph(bundle_to_networkx(flow_bundle))
+    corpus = load_corpus_graph(paths)
+    assert corpus.edges
+
+    # Sub-technique IDs only match themselves, so the index finds the same flows and
+    # edges as the corpus graph.
+    def is_sub_technique(technique_id):
+        return re.fullmatch(r"T\d+\.\d+", technique_id) is not None
+
+    for technique_id in filter(is_sub_technique, corpus.nodes):
+        assert index.get_flows(technique_id) == list(corpus.get_flows(technique_id))
+    for (source, target), edge_flows in corpus.edges.items():
+        matches = index.query(f'"{source}" -> "{target}"')
+        if is_sub_technique(source) and is_sub_technique(target):
+            assert sorted(m.flow_id for m in matches) == sorted(edge_flows)
+        else:
+            assert set(edge_flows) <= {m.flow_id for m in matches}
+
+    # Multi-hop queries, and parent techniques, find the same flows as a search of each
+    # flow's action graph.
+    for source, target in corpus.edges:
+        parent = source.split(".")[0] if is_sub_technique(source) else source
+        for arrow, max_hops in (("->", 1), ("->2", 2), ("->*", None)):
+            matches = index.query(f'"{parent}" {arrow} "{target}"')
+            assert sorted(m.flow_id for m in matches) == sorted(
+                find_flows_by_bfs(graphs, parent, target, max_hops)
+            )
+
+    path = tmp_path / "index.json"
+    index.save(path)
+    loaded = TechniqueIndex.load(path)
+    assert loaded.postings == index.postings
+    assert loaded.edge_postings == index.edge_postings
+    for query in ["T1059 ->2 T1486", "T1566 ->* T1105", "T1105"]:
+        assert loaded.query(query) == index.query(query)
+
+    path.write_text("{}")
+    with pytest.raises(ValueError):
+        TechniqueIndex.load(path)
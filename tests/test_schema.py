@@ -1,17 +1,33 @@
 from contextlib import contextmanager
 import json
 from pathlib import Path
+import pickle
 from tempfile import NamedTemporaryFile
+from unittest.mock import patch
 
 import pytest
 
+from attack_flow.cache import BundleCache
+from attack_flow.graph import bundle_to_networkx
+from attack_flow.model import FlowIndex
 from attack_flow.schema import (
+    check_best_practices,
+    check_flow_graph,
+    check_graph,
+    check_object_schema,
+    get_object_key,
+    get_schema_registry,
     get_validator_for_object,
+    ObjectMemo,
     resolve_url_to_local,
     SCHEMA_DIR,
+    validate_data,
     validate_doc,
+    validate_json,
+    ValidationProfile,
     ValidationResult,
 )
+from .fixtures import CORPUS_AFB_PATHS, get_corpus_bundle
 
 
 def test_validation_result():
@@ -43,6 +59,18 @@ def test_validation_result_exc():
     assert r.messages[0].exc is exc
 
 
+def test_validation_result_pickle():
+    r = ValidationResult()
+    r.add_warning("my warning")
+    r.add_exc("my exc", Exception("foobar"))
+
+    r2 = pickle.loads(pickle.dumps(r))
+    assert [str(m) for m in r2.messages] == [str(m) for m in r.messages]
+    assert r2.messages[0].exc is None
+    assert str(r2.messages[1].exc) == "foobar"
+    assert r2.success == False
+
+
 EXTENSION_DEFINITION = {
     "type": "extension-definition",
     "id": "extension-definition--fb9c968a-745b-4ade-9b25-c324172197f4",
@@ -122,6 +150,145 @@ def test_validate_doc():
     assert len(result.messages) == 0
 
 
+def test_validate_doc_reads_file_once(tmp_path):
+    flow_path = tmp_path / "flow.json"
+    flow_path.write_bytes((SCHEMA_DIR / "attack-flow-example.json").read_bytes())
+    cache = BundleCache(tmp_path / "cache")
+    with patch.object(Path, "open", autospec=True, side_effect=Path.open) as open_mock:
+        for _ in range(2):
+            result = validate_doc(flow_path, cache)
+            assert result.success
+            assert len(result.messages) == 0
+    paths = [c.args[0] for c in open_mock.call_args_list]
+    assert paths.count(flow_path) == 2
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_validate_json_and_data(tmp_path):
+    flow_json = json.loads((SCHEMA_DIR / "attack-flow-example.json").read_text())
+    for item in flow_json["objects"][::3]:
+        item.pop("name", None)
+    flow_path = tmp_path / "flow.json"
+    flow_path.write_text(json.dumps(flow_json))
+    expected = [str(m) for m in validate_doc(flow_path).messages]
+    assert len(expected) > 1
+    assert [str(m) for m in validate_json(flow_json).messages] == expected
+    data = flow_path.read_bytes()
+    assert [str(m) for m in validate_data(data).messages] == expected
+    result = validate_json(flow_json, max_errors=1)
+    assert [str(m) for m in result.messages][0] == expected[0]
+
+
+def test_validation_profile():
+    profile = ValidationProfile(max_slowest=2)
+    for i, seconds in enumerate((0.3, 0.1, 0.5, 0.2)):
+        profile.add_object({"id": f"x--{i}", "type": "x"}, seconds)
+    with profile.phase("read"):
+        pass
+    assert profile.counters["objects"] == 4
+    assert profile.slowest_objects == [
+        {"id": "x--2", "type": "x", "seconds": 0.5},
+        {"id": "x--0", "type": "x", "seconds": 0.3},
+    ]
+    profile_json = pickle.loads(pickle.dumps(profile)).to_json()
+    assert profile_json == json.loads(json.dumps(profile.to_json()))
+    assert list(profile_json["phases"]) == ["read"]
+
+
+def test_validate_doc_profile(tmp_path):
+    flow_path = tmp_path / "flow.json"
+    flow_path.write_bytes((SCHEMA_DIR / "attack-flow-example.json").read_bytes())
+    cache = BundleCache(tmp_path / "cache")
+    profile = ValidationProfile(max_slowest=3)
+    result = validate_doc(flow_path, cache, profile=profile)
+    assert result.success
+    assert list(profile.phases) == [
+        "read",
+        "check_objects",
+        "check_schema",
+        "parse",
+        "check_graph",
+    ]
+    num_objects = len(json.loads(flow_path.read_text())["objects"])
+    assert profile.counters["objects"] == num_objects
+    assert profile.counters["bundle_cache_misses"] == 1
+    assert len(profile.slowest_objects) == 3
+    seconds = [obj["seconds"] for obj in profile.slowest_objects]
+    assert seconds == sorted(seconds, reverse=True)
+
+    # Structural validation stops after the schema.
+    profile = ValidationProfile()
+    validate_doc(flow_path, structural_only=True, profile=profile)
+    assert list(profile.phases) == ["read", "check_objects", "check_schema"]
+
+
+def test_validate_doc_limits(tmp_path):
+    flow_json = json.loads((SCHEMA_DIR / "attack-flow-example.json").read_text())
+    for item in flow_json["objects"]:
+        item.pop("name", None)
+    flow_path = tmp_path / "flow.json"
+    flow_path.write_text(json.dumps(flow_json))
+    full = validate_doc(flow_path)
+    errors = [str(m) for m in full.messages if m.type_ == "error"]
+    assert len(errors) > 3
+    assert errors[-1].startswith("[error] Unable to parse this flow as STIX 2.1")
+
+    result = validate_doc(flow_path, max_errors=2)
+    assert not result.success
+    assert [str(m) for m in result.messages] == errors[:2] + [
+        "[warning] Validation stopped after 2 error(s)."
+    ]
+
+    # The STIX library is skipped, so its error is not reported.
+    result = validate_doc(flow_path, structural_only=True)
+    assert [str(m) for m in result.messages] == errors[:-1]
+
+    result = validate_doc(flow_path, time_budget=0)
+    assert [str(m) for m in result.messages] == [
+        "[error] Validation stopped after exceeding the time budget of 0 seconds."
+    ]
+
+    # The limits do not change the results of a document that is within them.
+    example_path = SCHEMA_DIR / "attack-flow-example.json"
+    result = validate_doc(example_path, max_errors=1, time_budget=60)
+    assert result.success
+    assert len(result.messages) == 0
+
+    with pytest.raises(ValueError):
+        validate_doc(flow_path, max_errors=0)
+
+
+def test_object_memo():
+    valid = json.loads((SCHEMA_DIR / "attack-flow-example.json").read_text())[
+        "objects"
+    ][0]
+    invalid = {**valid, "confidence": 101}
+    memo = ObjectMemo(max_size=2)
+    for item in (valid, invalid, dict(reversed(invalid.items()))):
+        result = ValidationResult()
+        memo.check_object(item, result)
+        expected = ValidationResult()
+        check_object_schema(item, expected)
+        assert [str(m) for m in result.messages] == [str(m) for m in expected.messages]
+    # Valid objects are not memoized.
+    assert (memo.hits, memo.misses, len(memo)) == (1, 1, 1)
+
+    # The least recently used object is evicted.
+    memo.get_messages({**valid, "confidence": 102})
+    memo.get_messages({**valid, "confidence": 103})
+    assert len(memo) == 2
+    memo.get_messages({**valid, "confidence": 103})
+    memo.get_messages(invalid)
+    assert (memo.hits, memo.misses) == (2, 4)
+
+
+def test_object_key():
+    assert get_object_key({"a": 1, "b": [1, 2]}) == get_object_key(
+        {"b": [1, 2], "a": 1}
+    )
+    assert get_object_key({"a": 1}) != get_object_key({"a": "1"})
+
+
 def test_dangling_reference():
     flow_json = [
         {
@@ -226,6 +393,36 @@ def test_resolve_url_to_local():
         resolve_url_to_local("https://company.example/bogus/path.json")
 
 
+def test_resolve_url_to_local_uses_registry():
+    url = (
+        "https://raw.githubusercontent.com/oasis-open/cti-stix2-json-schemas/master"
+        "/schemas/common/timestamp.json"
+    )
+    schema_path = SCHEMA_DIR / "oasis-open" / "common" / "timestamp.json"
+    assert resolve_url_to_local(url) is get_schema_registry()[schema_path]
+
+
+def test_schema_registry_reads_files_once():
+    """After the registry is loaded, validators never read schema files."""
+    get_schema_registry()
+    get_validator_for_object.cache_clear()
+    try:
+        with patch.object(
+            Path, "open", autospec=True, side_effect=Path.open
+        ) as open_mock:
+            validator = get_validator_for_object("attack-action")
+            errors = list(
+                validator.iter_errors(
+                    {"type": "attack-action", "created": "bogus", "confidence": 101}
+                )
+            )
+        assert len(errors) > 0
+        paths = [c.args[0] for c in open_mock.call_args_list]
+        assert not any(SCHEMA_DIR in path.parents for path in paths)
+    finally:
+        get_validator_for_object.cache_clear()
+
+
 def test_top_level_bundle():
     """This test has an attack-flow object at the top level, which is not allowed."""
     json_obj = {
@@ -354,6 +551,43 @@ def test_invalid_ref():
         )
 
 
+@pytest.mark.parametrize(
+    "start_refs,error",
+    [
+        (5, "[error] 5: 5 is not of type 'array'"),
+        ([["a"]], "[error] ['a']: ['a'] is not of type 'string'"),
+    ],
+)
+def test_malformed_refs(start_refs, error):
+    """Malformed references are reported as errors instead of crashing."""
+    flow_json = [
+        {
+            "type": "attack-flow",
+            "spec_version": "2.1",
+            "id": "attack-flow--e9ec3a4b-f787-4e81-a3d9-4cfe017ebc2f",
+            "created": "2022-08-02T19:34:35.143Z",
+            "modified": "2022-08-02T19:34:35.143Z",
+            "created_by_ref": ["identity--d673f8cb-c168-42da-8ed4-0cb26725f86c"],
+            "name": "Example Flow",
+            "scope": "incident",
+            "start_refs": start_refs,
+            "extensions": {
+                "extension-definition--fb9c968a-745b-4ade-9b25-c324172197f4": {
+                    "extension_type": "new-sdo"
+                }
+            },
+        },
+    ]
+
+    with temporary_flow_file(flow_json) as flow_path:
+        result = validate_doc(flow_path)
+        assert not result.success
+        assert error in [str(m) for m in result.messages]
+        assert str(result.messages[-1]).startswith(
+            "[error] Unable to parse this flow as STIX 2.1: "
+        )
+
+
 def test_missing_required_property():
     flow_json = [
         {
@@ -483,6 +717,61 @@ def test_a_node_is_not_connected_to_the_main_graph():
         )
 
 
+@pytest.mark.parametrize("afb_path", CORPUS_AFB_PATHS, ids=lambda p: p.stem)
+def test_check_flow_graph_matches_networkx(afb_path):
+    flow_json = get_corpus_bundle(afb_path)
+    # Also remove some objects to create disconnected nodes and dangling references.
+    broken_json = {**flow_json, "objects": flow_json["objects"][::2]}
+    broken_json["objects"][0].pop("description", None)
+    for bundle in (flow_json, broken_json):
+        index = FlowIndex(bundle)
+        expected = ValidationResult()
+        graph = bundle_to_networkx(bundle, index).to_undirected(as_view=True)
+        check_graph(graph, expected)
+        check_best_practices(graph, expected)
+        result = ValidationResult()
+        check_flow_graph(index, result)
+        # ``check_graph()`` reports disconnected nodes in an arbitrary order.
+        assert sorted(map(str, result.messages)) == sorted(map(str, expected.messages))
+
+
+@pytest.mark.parametrize("afb_path", CORPUS_AFB_PATHS, ids=lambda p: p.stem)
+def test_validate_doc_stream(afb_path, tmp_path):
+    flow_json = get_corpus_bundle(afb_path)
+    # The STIX library rejects the bundle's ``spec_version``, which would skip the
+    # graph checks.
+    del flow_json["spec_version"]
+    broken_json = {**flow_json, "objects": flow_json["objects"][::2]}
+    broken_json["objects"][0].pop("description", None)
+    flow_path = tmp_path / "flow.json"
+    for bundle in (flow_json, broken_json):
+        flow_path.write_text(json.dumps(bundle))
+        expected = validate_doc(flow_path)
+        result = validate_doc(flow_path, stream=True)
+        # The essential objects are checked after the schema.
+        assert sorted(map(str, result.messages)) == sorted(map(str, expected.messages))
+
+
+def test_validate_doc_stream_malformed(tmp_path):
+    flow_json = json.loads((SCHEMA_DIR / "attack-flow-example.json").read_text())
+    flow_json["objects"][1].pop("id")
+    flow_json["objects"].append({"type": "relationship", "source_ref": ["x--1"]})
+    flow_path = tmp_path / "flow.json"
+    flow_path.write_text(json.dumps(flow_json))
+    profile = ValidationProfile()
+    result = validate_doc(flow_path, stream=True, profile=profile)
+    assert not result.success
+    assert list(profile.phases) == ["check_schema", "check_objects", "check_graph"]
+    assert profile.counters["objects"] == len(flow_json["objects"])
+
+    result = validate_doc(flow_path, stream=True, max_errors=1)
+    assert str(result.messages[-1]) == "[warning] Validation stopped after 1 error(s)."
+
+    flow_path.write_text('{"type": "bundle", "objects": []')
+    with pytest.raises(ValueError):
+        validate_doc(flow_path, stream=True)
+
+
 def test_best_practices():
     flow_json = [
         {
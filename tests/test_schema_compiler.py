@@ -0,0 +1,111 @@
+import copy
+import json
+import logging
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from attack_flow.schema import (
+    check_object_schema,
+    get_compiled_validators,
+    get_validator_for_object,
+    SCHEMA_DIR,
+    ValidationResult,
+)
+from attack_flow.schema_compiler import (
+    COMPILED_TYPES,
+    generate_validators,
+    OUTPUT_PATH,
+    SchemaCompiler,
+    UnsupportedSchema,
+)
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+FLOW_PATHS = (
+    [SCHEMA_DIR / "attack-flow-example.json"]
+    + sorted((ROOT_DIR / "tests" / "fixtures").glob("*flow*.json"))
+    + sorted((ROOT_DIR / "corpus").glob("*.json"))
+)
+INVALID_VALUES = (None, True, 0, 1.5, "", "x", [], ["x"], {}, {"x": 1})
+
+
+def get_objects():
+    """Return the first object of each compiled type."""
+    seen = set()
+    for path in FLOW_PATHS:
+        bundle = json.loads(path.read_text())
+        for obj in bundle.get("objects", []):
+            if obj.get("type") in COMPILED_TYPES and obj["type"] not in seen:
+                seen.add(obj["type"])
+                yield obj
+
+
+def get_mutations(obj):
+    """Yield copies of ``obj`` that each have one property removed or replaced."""
+    for prop in obj:
+        mutated = dict(obj)
+        del mutated[prop]
+        yield mutated
+        for value in INVALID_VALUES:
+            yield {**obj, prop: value}
+    for prop in ("x_custom", "custom", "X"):
+        yield {**obj, prop: "value"}
+
+
+def test_validators_are_up_to_date():
+    assert OUTPUT_PATH.read_text() == generate_validators(), (
+        "The generated validators are out of date. Run "
+        "`python -m attack_flow.schema_compiler` to regenerate them."
+    )
+
+
+def test_compiled_validators_match_jsonschema():
+    validators = get_compiled_validators()
+    assert set(validators) == set(COMPILED_TYPES)
+    count = 0
+    for obj in get_objects():
+        validator = get_validator_for_object(obj["type"])
+        is_valid = validators[obj["type"]]
+        for candidate in (obj, *get_mutations(copy.deepcopy(obj))):
+            assert is_valid(candidate) == validator.is_valid(candidate), candidate
+            count += 1
+    assert count > 1000
+
+
+def test_check_object_schema_messages():
+    obj = {
+        "type": "attack-action",
+        "spec_version": "2.1",
+        "id": "attack-action--a8b4d2c1-4a1e-4f5c-9a0b-1c2d3e4f5a6b",
+        "created": "2022-08-25T19:26:31.000Z",
+        "modified": "2022-08-25T19:26:31.000Z",
+        "name": "Action",
+        "confidence": 101,
+    }
+    result = ValidationResult()
+    check_object_schema(obj, result)
+    assert result.success is False
+
+    with patch("attack_flow.schema.get_compiled_validators", return_value={}):
+        expected = ValidationResult()
+        check_object_schema(obj, expected)
+    assert [str(m) for m in result.messages] == [str(m) for m in expected.messages]
+    assert any("must reference the extension" in m.message for m in result.messages)
+
+
+def test_out_of_date_validators(caplog):
+    get_compiled_validators.cache_clear()
+    try:
+        with patch("attack_flow.schema_validators.SCHEMA_DIGEST", "stale"):
+            with caplog.at_level(logging.WARNING):
+                assert get_compiled_validators() == {}
+        assert "out of date" in caplog.text
+    finally:
+        get_compiled_validators.cache_clear()
+
+
+def test_unsupported_keyword():
+    compiler = SchemaCompiler()
+    with pytest.raises(UnsupportedSchema):
+        compiler._get_check_function({"type": "array", "uniqueItems": True}, "")
@@ -0,0 +1,157 @@
+from concurrent.futures import ThreadPoolExecutor
+import contextlib
+import http.client
+import json
+from pathlib import Path
+import socket
+import threading
+
+import pytest
+
+from attack_flow.schema import SCHEMA_DIR
+from attack_flow.server import make_server, parse_options
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+EXAMPLE_DATA = (SCHEMA_DIR / "attack-flow-example.json").read_bytes()
+
+
+@contextlib.contextmanager
+def running_server(**kwargs):
+    server = make_server(port=0, **kwargs)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        thread.join()
+        server.server_close()
+
+
+def post(server, path, data):
+    host, port = server.server_address[:2]
+    connection = http.client.HTTPConnection(host, port)
+    try:
+        connection.request("POST", path, data)
+        response = connection.getresponse()
+        return response.status, json.loads(response.read())
+    finally:
+        connection.close()
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path):
+        super().__init__("localhost")
+        self.path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.path)
+
+
+def test_validate():
+    invalid = json.loads(EXAMPLE_DATA)
+    for item in invalid["objects"]:
+        item.pop("name", None)
+    invalid_data = json.dumps(invalid).encode()
+
+    with running_server() as server:
+        status, body = post(server, "/validate", EXAMPLE_DATA)
+        assert status == 200
+        assert body == {"success": True, "strict_success": True, "messages": []}
+
+        status, body = post(server, "/validate", invalid_data)
+        assert status == 200
+        assert not body["success"]
+        assert len(body["messages"]) > 2
+
+        status, body = post(server, "/validate?fail_fast=1", invalid_data)
+        assert status == 200
+        assert [m["type"] for m in body["messages"]] == ["error", "warning"]
+        assert body["messages"][1]["message"] == "Validation stopped after 1 error(s)."
+
+        status, body = post(server, "/validate", b"not json")
+        assert status == 400
+        assert body["error"].startswith("Unable to parse JSON")
+        status, body = post(server, "/validate", b"[1]")
+        assert status == 400
+        assert body["error"] == "The document must be a JSON object."
+
+        assert post(server, "/validate?max_errors=0", EXAMPLE_DATA)[0] == 400
+        assert post(server, "/nope", EXAMPLE_DATA)[0] == 404
+
+
+def test_keep_alive_and_health():
+    with running_server() as server:
+        host, port = server.server_address[:2]
+        connection = http.client.HTTPConnection(host, port)
+        for _ in range(3):
+            connection.request(
+                "POST", "/validate", (FIXTURES_DIR / "flow1.json").read_bytes()
+            )
+            response = connection.getresponse()
+            assert json.loads(response.read())["success"]
+        connection.request("GET", "/health")
+        assert json.loads(connection.getresponse().read()) == {"status": "ok"}
+        connection.close()
+
+
+def test_expect_100_continue():
+    with running_server() as server:
+        with socket.create_connection(server.server_address[:2], timeout=5) as sock:
+            sock.sendall(
+                b"POST /validate HTTP/1.1\r\nHost: localhost\r\n"
+                b"Content-Length: %d\r\nExpect: 100-continue\r\n\r\n"
+                % len(EXAMPLE_DATA)
+            )
+            # The interim response is sent before the body, not with the response.
+            assert sock.recv(1024).startswith(b"HTTP/1.1 100 Continue\r\n")
+            sock.sendall(EXAMPLE_DATA)
+            response = http.client.HTTPResponse(sock)
+            response.begin()
+            assert json.loads(response.read())["success"]
+
+
+def test_body_too_large():
+    with running_server(max_body_size=100) as server:
+        status, body = post(server, "/validate", EXAMPLE_DATA)
+        assert status == 413
+
+
+def test_concurrent_requests():
+    docs = [EXAMPLE_DATA, (FIXTURES_DIR / "badflow2.json").read_bytes()] * 8
+    with running_server() as server:
+        expected = [post(server, "/validate", data) for data in docs[:2]] * 8
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            responses = list(
+                executor.map(lambda data: post(server, "/validate", data), docs)
+            )
+    assert responses == expected
+
+
+def test_unix_socket(tmp_path):
+    socket_path = tmp_path / "af.sock"
+    with running_server(unix_socket=socket_path) as server:
+        assert server.url == f"unix:{socket_path}"
+        connection = UnixHTTPConnection(str(socket_path))
+        connection.request("POST", "/validate", EXAMPLE_DATA)
+        response = connection.getresponse()
+        assert response.status == 200
+        assert json.loads(response.read())["success"]
+        connection.close()
+    assert not socket_path.exists()
+
+
+def test_parse_options():
+    assert parse_options("") == {}
+    assert parse_options("fail_fast=true&structural_only") == {
+        "max_errors": 1,
+        "structural_only": True,
+    }
+    assert parse_options("max_errors=3&time_budget=0.5") == {
+        "max_errors": 3,
+        "time_budget": 0.5,
+    }
+    for query in ("max_errors=x", "time_budget=0", "structural_only=maybe", "x=1"):
+        with pytest.raises(ValueError):
+            parse_options(query)
@@ -0,0 +1,102 @@
+import pytest
+
+from attack_flow.similarity import SimilarityIndex, get_flow_features, jaccard
+from .fixtures import CORPUS_AFB_PATHS, get_corpus_bundle
+
+
+def test_get_flow_features():
+    bundle = {
+        "type": "bundle",
+        "id": "bundle--0",
+        "objects": [
+            {
+                "type": "attack-flow",
+                "id": "attack-flow--0",
+                "start_refs": ["attack-action--1"],
+            },
+            {
+                "type": "attack-action",
+                "id": "attack-action--1",
+                "technique_id": "T1566",
+                "effect_refs": ["attack-operator--1"],
+            },
+            {
+                "type": "attack-operator",
+                "id": "attack-operator--1",
+                "operator": "OR",
+                "effect_refs": ["attack-action--2", "attack-action--3"],
+            },
+            {
+                "type": "attack-action",
+                "id": "attack-action--2",
+                "technique_id": "T1204",
+                "effect_refs": ["attack-action--3"],
+            },
+            {
+                "type": "attack-action",
+                "id": "attack-action--3",
+            },
+        ],
+    }
+    assert get_flow_features(bundle) == {"T1566", "T1204", "T1566>T1204"}
+
+
+def test_jaccard():
+    assert jaccard(frozenset("abc"), frozenset("bcd")) == 0.5
+    assert jaccard(frozenset("abc"), frozenset("xyz")) == 0
+    assert jaccard(frozenset(), frozenset()) == 0
+
+
+def test_similarity_index():
+    index = SimilarityIndex()
+    base = {f"T{i}" for i in range(20)}
+    index.add("same", base)
+    index.add("close", base - {"T0"} | {"T99"})
+    index.add("far", {"T0", "T50", "T51", "T52"})
+    index.add("empty", set())
+    assert len(index) == 4
+    assert "close" in index
+
+    assert index.query(base) == [("same", 1.0), ("close", pytest.approx(19 / 21))]
+    assert index.query(base, k=1, exclude=["same"]) == [
+        ("close", pytest.approx(19 / 21))
+    ]
+    assert index.query(set()) == []
+    assert [flow_id for flow_id, _ in index.query_exact(base)] == [
+        "same",
+        "close",
+        "far",
+    ]
+    with pytest.raises(ValueError):
+        index.add("same", base)
+    with pytest.raises(ValueError):
+        SimilarityIndex(num_perm=120, num_bands=7)
+
+
+def test_similarity_index_corpus(tmp_path):
+    index = SimilarityIndex()
+    for afb_path in CORPUS_AFB_PATHS:
+        index.add_flow(get_corpus_bundle(afb_path), flow_id=afb_path.stem)
+    assert len(index) == len(CORPUS_AFB_PATHS) > 0
+
+    for flow_id, features in index.features.items():
+        exact = index.query_exact(features, k=len(index))
+        if features:
+            assert exact[0] == (flow_id, 1.0)
+        # The approximate results are a subset of the exact ones, in the same order,
+        # and they always include the flow itself.
+        approximate = index.query(features, k=len(index))
+        assert approximate == [result for result in exact if result in approximate]
+        if features:
+            assert (flow_id, 1.0) in approximate
+
+    path = tmp_path / "index.json"
+    index.save(path)
+    loaded = SimilarityIndex.load(path)
+    assert loaded.features == index.features
+    for features in index.features.values():
+        assert loaded.query(features) == index.query(features)
+
+    path.write_text("{}")
+    with pytest.raises(ValueError):
+        SimilarityIndex.load(path)
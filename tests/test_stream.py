@@ -0,0 +1,93 @@
+from io import StringIO
+import json
+
+import pytest
+
+from attack_flow.schema import check_object_schema, SCHEMA_DIR, ValidationResult
+from attack_flow.stream import iter_bundle_objects
+
+
+def test_iter_bundle_objects():
+    with (SCHEMA_DIR / "attack-flow-example.json").open() as flow_file:
+        expected = json.load(flow_file)["objects"]
+        flow_file.seek(0)
+        objects = list(iter_bundle_objects(flow_file))
+    assert objects == expected
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64])
+def test_iter_bundle_objects_small_chunks(chunk_size):
+    bundle = {
+        "type": "bundle",
+        "id": "bundle--9c9f68aa-0a4b-4c4a-a4a6-43c0b9e3a1f1",
+        "meta": {"objects": [{"type": "not-an-object"}], "nums": [1, -2.5e3]},
+        "objects": [
+            {"type": "note", "content": 'Tricky "quotes" and {braces} [brackets] \\'},
+            {"type": "identity", "name": "Jane Doe", "confidence": 100, "x": None},
+            {"type": "note", "content": "Unicode ☃ and escapes \n\t"},
+        ],
+        "trailer": True,
+    }
+    text = json.dumps(bundle, indent=2)
+    properties = dict()
+    objects = list(
+        iter_bundle_objects(
+            StringIO(text), chunk_size=chunk_size, properties=properties
+        )
+    )
+    assert objects == bundle["objects"]
+    assert properties == {**bundle, "objects": []}
+
+
+def test_iter_bundle_objects_filter_by_type():
+    with (SCHEMA_DIR / "attack-flow-example.json").open() as flow_file:
+        actions = list(iter_bundle_objects(flow_file, types=["attack-action"]))
+    assert actions
+    assert all(a["type"] == "attack-action" for a in actions)
+
+
+def test_iter_bundle_objects_empty():
+    assert list(iter_bundle_objects(StringIO("{}"))) == []
+    assert list(iter_bundle_objects(StringIO('{"objects": []}'))) == []
+    assert list(iter_bundle_objects(StringIO('{"type": "bundle"}'))) == []
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "[]",
+        '{"objects": [{"type": "note"}',
+        '{"objects": [{"type": "note"} {"type": "note"}]}',
+        '{"objects": [{"type": "note", "content": "unterminated}]}',
+    ],
+)
+def test_iter_bundle_objects_malformed(text):
+    with pytest.raises(ValueError):
+        list(iter_bundle_objects(StringIO(text)))
+
+
+def test_iter_bundle_objects_stops_at_error():
+    class CountingReader(StringIO):
+        chars_read = 0
+
+        def read(self, size=-1):
+            chunk = super().read(size)
+            self.chars_read += len(chunk)
+            return chunk
+
+    tail = ", ".join(['{"type": "note", "content": "padding"}'] * 50_000)
+    text = f'{{"objects": [{{"type": "note", "content": bad}}, {tail}]}}'
+    flow_file = CountingReader(text)
+    with pytest.raises(ValueError):
+        list(iter_bundle_objects(flow_file, chunk_size=1024))
+    # The error is raised without reading the rest of the document.
+    assert flow_file.chars_read <= 2048 < len(text)
+
+
+def test_stream_schema_validation():
+    result = ValidationResult()
+    with (SCHEMA_DIR / "attack-flow-example.json").open() as flow_file:
+        for obj in iter_bundle_objects(flow_file):
+            check_object_schema(obj, result)
+    assert result.success
@@ -0,0 +1,47 @@
+import pytest
+
+from attack_flow.graph import load_corpus_graph
+from attack_flow.transitions import TransitionMatrix
+from .fixtures import write_corpus
+
+
+def test_transition_matrix():
+    matrix = TransitionMatrix.from_counts(
+        {("T1", "T2"): 3, ("T1", "T3"): 1, ("T2", "T3"): 2, ("T3", "T1"): 0},
+        technique_ids=["T4"],
+    )
+    assert matrix.technique_ids == ["T1", "T2", "T3", "T4"]
+    assert matrix.get_count("T1", "T2") == 3
+    assert matrix.get_count("T2", "T1") == 0
+    assert matrix.get_count("T9", "T1") == 0
+    assert matrix.predict_next("T1") == [("T2", 0.75), ("T3", 0.25)]
+    assert matrix.predict_next("T1", k=1) == [("T2", 0.75)]
+    assert matrix.predict_next("T3") == []
+    assert matrix.predict_next("T9") == []
+    assert matrix.get_probabilities("T2") == {"T3": 1.0}
+
+
+def test_transition_matrix_from_corpus(tmp_path):
+    corpus = load_corpus_graph(write_corpus(tmp_path))
+    matrix = TransitionMatrix.from_corpus(corpus)
+    assert corpus.edges
+    assert sorted(matrix.technique_ids) == sorted(corpus.nodes)
+    for (source, target), flows in corpus.edges.items():
+        assert matrix.get_count(source, target) == sum(flows.values())
+    for technique_id in matrix.technique_ids:
+        predictions = matrix.predict_next(technique_id, k=None)
+        if predictions:
+            assert sum(p for _, p in predictions) == pytest.approx(1)
+            probabilities = [p for _, p in predictions]
+            assert probabilities == sorted(probabilities, reverse=True)
+
+    path = tmp_path / "transitions.json"
+    matrix.save(path)
+    loaded = TransitionMatrix.load(path)
+    assert loaded.technique_ids == matrix.technique_ids
+    for technique_id in matrix.technique_ids:
+        assert loaded.predict_next(technique_id) == matrix.predict_next(technique_id)
+
+    path.write_text("{}")
+    with pytest.raises(ValueError):
+        TransitionMatrix.load(path)
@@ -0,0 +1,62 @@
+import json
+import os
+from pathlib import Path
+import shutil
+
+from attack_flow.schema import validate_doc
+from attack_flow.watch import FlowWatcher
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def write_json(path, data):
+    """Write a file and make sure that its modification time changes."""
+    mtime_ns = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text(json.dumps(data))
+    os.utime(path, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+
+
+def test_poll(tmp_path):
+    flow1 = tmp_path / "flow1.json"
+    flow2 = tmp_path / "flow2.json"
+    shutil.copy(FIXTURES_DIR / "flow1.json", flow1)
+    shutil.copy(FIXTURES_DIR / "flow2.json", flow2)
+    (tmp_path / "notes.txt").write_text("not a flow")
+    watcher = FlowWatcher(tmp_path)
+
+    changes = watcher.poll()
+    assert [(c.path, c.previous) for c in changes] == [(flow1, None), (flow2, None)]
+    assert all(c.result.success for c in changes)
+    checked = watcher.objects_checked
+    assert watcher.poll() == []
+
+    # Only the edited object is checked against the schema again.
+    flow_json = json.loads(flow1.read_text())
+    flow_json["objects"][2]["name"] = 5
+    write_json(flow1, flow_json)
+    ((path, result, previous),) = watcher.poll()
+    assert path == flow1
+    assert previous.success
+    assert not result.success
+    assert watcher.objects_checked == checked + 1
+    assert watcher.objects_reused == len(flow_json["objects"]) - 1
+    expected = validate_doc(flow1)
+    assert [str(m) for m in result.messages] == [str(m) for m in expected.messages]
+
+    # A file that is touched but not changed is not validated again.
+    os.utime(flow2, ns=(0, 0))
+    assert watcher.poll() == []
+
+    flow2.unlink()
+    ((path, result, previous),) = watcher.poll()
+    assert (path, result) == (flow2, None)
+    assert previous.success
+
+
+def test_poll_unreadable(tmp_path):
+    flow = tmp_path / "flow.json"
+    flow.write_text('{"type": "bundle", "objects": [')
+    watcher = FlowWatcher(tmp_path)
+    ((_, result, _),) = watcher.poll()
+    assert not result.success
+    assert "Unable to read this file" in result.messages[0].message